@@ -26,6 +26,7 @@ Note:
 from .enricher import (
     DependencyEnricher,
     create_default_registry,
+    expand_document_dependencies,
     expand_sbom_dependencies,
     supports_dependency_expansion,
 )
@@ -36,6 +37,7 @@ from .registry import ExpanderRegistry
 __all__ = [
     # Main API
     "expand_sbom_dependencies",
+    "expand_document_dependencies",
     "supports_dependency_expansion",
     # Classes for advanced usage
     "DependencyEnricher",
@@ -1,17 +1,15 @@
 """Dependency expansion orchestration for SBOMs."""
 
-import json
 import re
 from pathlib import Path
-from typing import Any
 
 from cyclonedx.model.bom import Bom
 from cyclonedx.model.component import Component, ComponentType
 from packageurl import PackageURL
 
 from ..console import get_audit_trail
+from ..document import SBOMDocument
 from ..logging_config import logger
-from ..serialization import serialize_cyclonedx_bom
 from ..spdx3 import is_spdx3
 from .expanders.pipdeptree import PipdeptreeExpander
 from .models import DiscoveredDependency, ExpansionResult, normalize_python_package_name
@@ -64,14 +62,31 @@ class DependencyEnricher:
         Returns:
             ExpansionResult with statistics
         """
-        sbom_path = Path(sbom_file)
-        lock_path = Path(lock_file)
-
         # Load SBOM early so we can report accurate original_count
         # even when no transitive dependencies are discovered or
         # expansion is skipped entirely.
-        with sbom_path.open("r") as f:
-            sbom_data = json.load(f)
+        document = SBOMDocument.from_file(sbom_file)
+        result = self.expand_document(document, lock_file)
+        if document.modified:
+            document.write(sbom_file)
+        return result
+
+    def expand_document(
+        self,
+        document: SBOMDocument,
+        lock_file: str,
+    ) -> ExpansionResult:
+        """Expand an in-memory SBOM document with discovered transitive dependencies.
+
+        Args:
+            document: SBOM document (modified in place)
+            lock_file: Path to lockfile that was used for generation
+
+        Returns:
+            ExpansionResult with statistics
+        """
+        lock_path = Path(lock_file)
+        sbom_data = document.data
 
         # Find applicable expander
         expander = self._registry.get_expander_for(lock_path)
@@ -114,9 +129,9 @@ class DependencyEnricher:
             )
 
         if sbom_data.get("bomFormat") == "CycloneDX":
-            result = self._enrich_cyclonedx(sbom_path, sbom_data, discovered, expander.name)
+            result = self._enrich_cyclonedx(document, discovered, expander.name)
         elif sbom_data.get("spdxVersion"):
-            result = self._enrich_spdx(sbom_path, sbom_data, discovered, expander.name)
+            result = self._enrich_spdx(document, discovered, expander.name)
         elif is_spdx3(sbom_data):
             # SPDX 3 dependency expansion - pass through for now
             logger.debug("SPDX 3 dependency expansion: skipping (not yet supported)")
@@ -141,13 +156,12 @@ class DependencyEnricher:
 
     def _enrich_cyclonedx(
         self,
-        sbom_path: Path,
-        sbom_data: dict[str, Any],
+        document: SBOMDocument,
         discovered: list[DiscoveredDependency],
         source: str,
     ) -> ExpansionResult:
         """Add discovered dependencies to CycloneDX SBOM."""
-        bom = Bom.from_json(sbom_data)
+        bom = document.bom
         original_count = len(bom.components) if bom.components else 0
 
         # Ensure components collection is initialized in case Bom.from_json
@@ -196,11 +210,8 @@ class DependencyEnricher:
                 source=source,
             )
 
-        # Serialize back
-        spec_version = sbom_data.get("specVersion", "1.6")
-        serialized = serialize_cyclonedx_bom(bom, spec_version)
-        with sbom_path.open("w") as f:
-            f.write(serialized)
+        if added_count > 0:
+            document.update_bom()
 
         logger.info(
             f"Dependency expansion: added {added_count} transitive dependencies "
@@ -217,12 +228,12 @@ class DependencyEnricher:
 
     def _enrich_spdx(
         self,
-        sbom_path: Path,
-        sbom_data: dict[str, Any],
+        document: SBOMDocument,
         discovered: list[DiscoveredDependency],
         source: str,
     ) -> ExpansionResult:
         """Add discovered dependencies to SPDX SBOM."""
+        sbom_data = document.data
         packages = sbom_data.get("packages", [])
         original_count = len(packages)
 
@@ -331,10 +342,7 @@ class DependencyEnricher:
 
         sbom_data["packages"] = packages
         sbom_data["relationships"] = relationships
-
-        # Write back
-        with sbom_path.open("w") as f:
-            json.dump(sbom_data, f, indent=2)
+        document.update_data()
 
         logger.info(
             f"Dependency expansion: added {added_count} transitive dependencies "
@@ -369,6 +377,23 @@ def expand_sbom_dependencies(
     return enricher.expand_sbom(sbom_file, lock_file)
 
 
+def expand_document_dependencies(
+    document: SBOMDocument,
+    lock_file: str,
+) -> ExpansionResult:
+    """Expand an in-memory SBOM document with transitive dependencies.
+
+    Args:
+        document: SBOM document (modified in place)
+        lock_file: Path to lockfile used for generation
+
+    Returns:
+        ExpansionResult with statistics
+    """
+    enricher = DependencyEnricher()
+    return enricher.expand_document(document, lock_file)
+
+
 def supports_dependency_expansion(lock_file: str) -> bool:
     """Check if dependency expansion is supported for this lockfile.
 
@@ -8,7 +8,9 @@ References:
     Schema Crosswalk: https://sbomify.com/compliance/schema-crosswalk/
 """
 
-from typing import Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 import requests
 from packageurl import PackageURL
@@ -105,6 +107,10 @@ class Enricher:
             "pkg:pypi/requests@2.31.0",
             "pkg:deb/debian/bash@5.1",
         ])
+
+    Results are remembered per Enricher, so each PURL is only looked up
+    once; an Enricher shared across several SBOMs (and prefetched with
+    fetch_all_metadata) serves repeated PURLs without further requests.
     """
 
     def __init__(self, registry: Optional[SourceRegistry] = None) -> None:
@@ -117,6 +123,8 @@ class Enricher:
         """
         self._registry = registry or create_default_registry()
         self._session: Optional[requests.Session] = None
+        self._results: Dict[Tuple[str, bool], Optional[NormalizedMetadata]] = {}
+        self._session_lock = threading.Lock()
 
     @property
     def registry(self) -> SourceRegistry:
@@ -125,10 +133,11 @@ class Enricher:
 
     def _get_session(self) -> requests.Session:
         """Get or create a requests session."""
-        if self._session is None:
-            self._session = requests.Session()
-            self._session.headers.update({"User-Agent": USER_AGENT})
-        return self._session
+        with self._session_lock:
+            if self._session is None:
+                self._session = requests.Session()
+                self._session.headers.update({"User-Agent": USER_AGENT})
+            return self._session
 
     def close(self) -> None:
         """Close the requests session."""
@@ -155,42 +164,50 @@ class Enricher:
         Returns:
             NormalizedMetadata if any source returned data, None otherwise
         """
+        key = (purl_str, merge_results)
+        if key in self._results:
+            return self._results[key]
+
         purl = self._parse_purl(purl_str)
         if not purl:
             return None
 
         session = self._get_session()
-        return self._registry.fetch_metadata(purl, session, merge_results)
+        metadata = self._registry.fetch_metadata(purl, session, merge_results)
+        self._results[key] = metadata
+        return metadata
 
     def fetch_all_metadata(
-        self, purl_strs: List[str], merge_results: bool = True
+        self, purl_strs: List[str], merge_results: bool = True, max_workers: int = 1
     ) -> Dict[str, Optional[NormalizedMetadata]]:
         """
         Fetch metadata for multiple PURLs.
 
+        Duplicate PURLs are looked up once. With max_workers > 1 the lookups
+        run concurrently, sharing this Enricher's session.
+
         Args:
             purl_strs: List of Package URL strings
             merge_results: If True, merge results from multiple sources
+            max_workers: Maximum number of concurrent lookups
 
         Returns:
             Dictionary mapping PURL string to NormalizedMetadata (or None)
         """
-        results: Dict[str, Optional[NormalizedMetadata]] = {}
-        session = self._get_session()
-
-        for purl_str in purl_strs:
-            purl = self._parse_purl(purl_str)
-            if purl:
-                try:
-                    metadata = self._registry.fetch_metadata(purl, session, merge_results)
-                    results[purl_str] = metadata
-                except Exception as e:
-                    logger.error(f"Unexpected error fetching metadata for {purl_str}: {e}")
-                    results[purl_str] = None
-            else:
-                results[purl_str] = None
-
-        return results
+        unique_purls = list(dict.fromkeys(purl_strs))
+
+        def fetch(purl_str: str) -> Optional[NormalizedMetadata]:
+            try:
+                return self.fetch_metadata(purl_str, merge_results)
+            except Exception as e:
+                logger.error(f"Unexpected error fetching metadata for {purl_str}: {e}")
+                self._results[(purl_str, merge_results)] = None
+                return None
+
+        if max_workers > 1 and len(unique_purls) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="enrich") as executor:
+                return dict(zip(unique_purls, executor.map(fetch, unique_purls)))
+        return {purl_str: fetch(purl_str) for purl_str in unique_purls}
 
     def get_enrichment_stats(self, metadata_map: Dict[str, Optional[NormalizedMetadata]]) -> Dict[str, int]:
         """
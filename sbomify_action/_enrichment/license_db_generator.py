@@ -26,25 +26,23 @@ Usage:
 import argparse
 import gzip
 import io
-import json
 import lzma
 import os
 import re
-import subprocess
 import sys
 import tarfile
-import tempfile
 import xml.etree.ElementTree as ET
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterator, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
 from packageurl import PackageURL
 
+from .. import jsonio
 from ..http_client import USER_AGENT
 from ..logging_config import setup_logging
 from .license_normalizer import (
@@ -563,64 +561,152 @@ def fetch_copyright_http(filename: str, distro: str = "ubuntu") -> Optional[str]
     return None
 
 
+# ar(1) archive layout used by .deb packages
+AR_MAGIC = b"!<arch>\n"
+AR_HEADER_SIZE = 60
+# Global header, debian-binary member ("2.0\n") and the control.tar member header
+DEB_PROBE_SIZE = len(AR_MAGIC) + AR_HEADER_SIZE + 4 + AR_HEADER_SIZE
+
+
+class _BoundedReader(io.RawIOBase):
+    """Read-only view of the next ``size`` bytes of an underlying stream."""
+
+    def __init__(self, stream: Any, size: int) -> None:
+        self._stream = stream
+        self._remaining = size
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        if self._remaining <= 0:
+            return 0
+        data = self._stream.read(min(len(buffer), self._remaining))
+        buffer[: len(data)] = data
+        self._remaining -= len(data)
+        return len(data)
+
+
+def _read_exact(stream: Any, size: int) -> bytes:
+    """Read exactly ``size`` bytes from a stream."""
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = stream.read(size - len(buf))
+        if not chunk:
+            raise EOFError(f"Unexpected end of stream ({len(buf)}/{size} bytes)")
+        buf += chunk
+    return bytes(buf)
+
+
+def _skip(stream: Any, size: int) -> None:
+    """Discard ``size`` bytes from a stream."""
+    while size > 0:
+        chunk = stream.read(min(size, 65536))
+        if not chunk:
+            raise EOFError("Unexpected end of stream while skipping")
+        size -= len(chunk)
+
+
+def parse_ar_header(header: bytes) -> Tuple[str, int]:
+    """Parse an ar member header into (member name, member size)."""
+    if len(header) != AR_HEADER_SIZE or header[58:60] != b"`\n":
+        raise ValueError("Invalid ar member header")
+    name = header[0:16].decode("ascii").strip().rstrip("/")
+    size = int(header[48:58].decode("ascii").strip())
+    return name, size
+
+
+def extract_copyright_from_data_tar(stream: Any, member_name: str, package_name: str) -> Optional[str]:
+    """Stream a data.tar.* member and return the package's copyright file.
+
+    Iteration stops at the first matching entry, so the rest of the archive is
+    never decompressed.
+    """
+    base_name = package_name.split(":")[0]
+    candidates = {f"usr/share/doc/{package_name}/copyright", f"usr/share/doc/{base_name}/copyright"}
+
+    mode = "r|*"
+    if member_name.endswith(".zst"):
+        import zstandard as zstd
+
+        stream = zstd.ZstdDecompressor().stream_reader(stream)
+        mode = "r|"
+    elif member_name == "data.tar":
+        mode = "r|"
+
+    with tarfile.open(fileobj=stream, mode=mode) as tar:
+        for member in tar:
+            name = member.name[2:] if member.name.startswith("./") else member.name
+            if name in candidates and member.isfile():
+                extracted = tar.extractfile(member)
+                if extracted is None:
+                    return None
+                return extracted.read().decode("utf-8", errors="replace")
+
+    return None
+
+
+def read_deb_copyright(url: str, package_name: str) -> Optional[str]:
+    """Read the copyright file out of a remote .deb without downloading all of it.
+
+    The archive is parsed in-process as it streams. When the mirror honours
+    Range requests, only the ar headers are probed and the download resumes
+    directly at the data.tar member, skipping control.tar entirely.
+    """
+    headers = {"Range": f"bytes=0-{DEB_PROBE_SIZE - 1}", "Accept-Encoding": "identity"}
+    response = SESSION.get(url, headers=headers, timeout=DOWNLOAD_TIMEOUT, stream=True)
+    try:
+        response.raise_for_status()
+        stream = response.raw
+        # Bytes available in the current response; unbounded once we read a full body
+        available = DEB_PROBE_SIZE if response.status_code == 206 else None
+
+        if _read_exact(stream, len(AR_MAGIC)) != AR_MAGIC:
+            raise ValueError("Not a Debian archive")
+        offset = len(AR_MAGIC)
+
+        while True:
+            name, size = parse_ar_header(_read_exact(stream, AR_HEADER_SIZE))
+            offset += AR_HEADER_SIZE
+            if name.startswith("data.tar"):
+                return extract_copyright_from_data_tar(_BoundedReader(stream, size), name, package_name)
+
+            # ar members are padded to an even size
+            next_offset = offset + size + (size % 2)
+            if available is not None and next_offset + AR_HEADER_SIZE > available:
+                # Resume at the next member header instead of reading this member
+                response.close()
+                headers = {"Range": f"bytes={next_offset}-", "Accept-Encoding": "identity"}
+                response = SESSION.get(url, headers=headers, timeout=DOWNLOAD_TIMEOUT, stream=True)
+                response.raise_for_status()
+                stream = response.raw
+                available = None
+                if response.status_code != 206:
+                    _skip(stream, next_offset)
+            else:
+                _skip(stream, next_offset - offset)
+            offset = next_offset
+    finally:
+        response.close()
+
+
 def download_and_extract_deb(
     filename: str, package_name: str, archive_base: str = UBUNTU_ARCHIVE_BASE, distro: str = "ubuntu"
 ) -> Optional[str]:
     """Get copyright file, trying HTTP first, then .deb extraction as fallback.
 
-    The HTTP method uses zero disk space. Fallback extracts only the copyright file.
+    The HTTP method uses zero disk space. The fallback streams the .deb and
+    reads only as far as the copyright file.
     """
     # Try HTTP first (fast, no disk usage)
     copyright_text = fetch_copyright_http(filename, distro)
     if copyright_text:
         return copyright_text
 
-    # Fallback: download and extract from .deb
+    # Fallback: stream the .deb and extract the copyright member in-process
     url = urljoin(archive_base, filename)
-    base_name = package_name.split(":")[0]
-
     try:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            deb_path = Path(tmpdir) / "package.deb"
-
-            response = SESSION.get(url, timeout=DOWNLOAD_TIMEOUT, stream=True)
-            response.raise_for_status()
-
-            with open(deb_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-
-            subprocess.run(
-                ["ar", "x", str(deb_path)],
-                cwd=tmpdir,
-                check=True,
-                capture_output=True,
-                timeout=30,
-            )
-
-            data_tar = None
-            for matches in [list(Path(tmpdir).glob("data.tar.*"))]:
-                if matches:
-                    data_tar = matches[0]
-                    break
-
-            if not data_tar:
-                return None
-
-            # Extract copyright directly to stdout
-            for cp_path in [f"./usr/share/doc/{package_name}/copyright", f"./usr/share/doc/{base_name}/copyright"]:
-                try:
-                    result = subprocess.run(
-                        ["tar", "xf", str(data_tar), "-O", cp_path],
-                        cwd=tmpdir,
-                        capture_output=True,
-                        timeout=30,
-                    )
-                    if result.returncode == 0 and result.stdout:
-                        return result.stdout.decode("utf-8", errors="replace")
-                except subprocess.TimeoutExpired:
-                    pass
-
+        return read_deb_copyright(url, package_name)
     except Exception as e:
         logger.debug(f"Failed to extract copyright from {package_name}: {e}")
 
@@ -639,28 +725,77 @@ def parse_maintainer(maintainer: Optional[str]) -> tuple[Optional[str], Optional
     return maintainer.strip(), None
 
 
-def process_ubuntu_package(
+def parse_deb_source(pkg_info: Dict[str, str]) -> Tuple[str, str]:
+    """Return the (source name, source version) a binary package was built from.
+
+    The ``Source:`` field is omitted when the source and binary names match, and
+    only carries a ``(version)`` suffix when the versions differ (e.g. binNMUs).
+    """
+    name = pkg_info.get("Package", "")
+    version = pkg_info.get("Version", "")
+    source = pkg_info.get("Source", "").strip()
+    if not source:
+        return name, version
+
+    match = re.match(r"^(\S+)(?:\s+\(([^)]+)\))?", source)
+    if not match:
+        return name, version
+    return match.group(1), match.group(2) or version
+
+
+def group_deb_packages_by_source(
+    all_packages: List[Dict[str, str]],
+) -> Dict[Tuple[str, str], List[Dict[str, str]]]:
+    """Group binary package stanzas by (source name, source version).
+
+    Within each group the binary named after the source comes first, since its
+    ``/usr/share/doc`` directory is the least likely to be a symlink.
+    """
+    groups: Dict[Tuple[str, str], List[Dict[str, str]]] = {}
+    for pkg_info in all_packages:
+        groups.setdefault(parse_deb_source(pkg_info), []).append(pkg_info)
+
+    for (source_name, _), members in groups.items():
+        members.sort(key=lambda pkg: pkg.get("Package") != source_name)
+
+    return groups
+
+
+def fetch_source_license(
+    members: List[Dict[str, str]],
+    archive_base: str = UBUNTU_ARCHIVE_BASE,
+    distro: str = "ubuntu",
+) -> Optional[str]:
+    """Fetch and parse the copyright file shared by binaries of one source package.
+
+    Members are tried in order until one yields a copyright file; the parsed
+    license is then valid for the whole group.
+    """
+    for pkg_info in members:
+        name = pkg_info.get("Package")
+        filename = pkg_info.get("Filename")
+        if not name or not filename:
+            continue
+        copyright_text = download_and_extract_deb(filename, name, archive_base, distro=distro)
+        if copyright_text:
+            return extract_dep5_license(copyright_text)
+    return None
+
+
+def build_deb_package_metadata(
     pkg_info: Dict[str, str],
+    spdx: Optional[str],
+    distro: str,
     distro_version: str,
-    codename: str,
+    archive_base: str,
 ) -> Optional[PackageMetadata]:
-    """Process a single Ubuntu package and extract all metadata."""
+    """Build package metadata for a Debian/Ubuntu binary from its Packages stanza."""
     name = pkg_info.get("Package")
     version = pkg_info.get("Version")
     filename = pkg_info.get("Filename")
 
-    if not name or not version:
-        return None
-
-    # Extract license from copyright file
-    spdx = None
-    if filename:
-        copyright_text = download_and_extract_deb(filename, name)
-        if copyright_text:
-            spdx = extract_dep5_license(copyright_text)
-
     # We still require a valid license for inclusion
-    if not spdx:
+    if not name or not version or not spdx:
         return None
 
     # Extract other metadata from Packages.gz
@@ -677,12 +812,12 @@ def process_ubuntu_package(
     # Construct download URL
     download_url = None
     if filename:
-        download_url = urljoin(UBUNTU_ARCHIVE_BASE, filename)
+        download_url = urljoin(archive_base, filename)
 
     purl = make_deb_purl(
         name=name,
         version=version,
-        distro="ubuntu",
+        distro=distro,
         distro_version=distro_version,
     )
 
@@ -703,6 +838,35 @@ def process_ubuntu_package(
     )
 
 
+def process_deb_source_group(
+    members: List[Dict[str, str]],
+    distro: str,
+    distro_version: str,
+    archive_base: str,
+) -> List[Optional[PackageMetadata]]:
+    """Process all binaries built from one source package.
+
+    The copyright file is fetched and parsed once and the resulting license is
+    applied to every binary in the group. Returns one entry per member, with
+    ``None`` for binaries that could not be included.
+    """
+    spdx = fetch_source_license(members, archive_base, distro=distro)
+    return [build_deb_package_metadata(pkg_info, spdx, distro, distro_version, archive_base) for pkg_info in members]
+
+
+def process_ubuntu_package(
+    pkg_info: Dict[str, str],
+    distro_version: str,
+    codename: str,
+) -> Optional[PackageMetadata]:
+    """Process a single Ubuntu package and extract all metadata."""
+    if not pkg_info.get("Package") or not pkg_info.get("Version"):
+        return None
+
+    spdx = fetch_source_license([pkg_info], UBUNTU_ARCHIVE_BASE, distro="ubuntu")
+    return build_deb_package_metadata(pkg_info, spdx, "ubuntu", distro_version, UBUNTU_ARCHIVE_BASE)
+
+
 def fetch_debian_packages(
     codename: str,
     component: str = "main",
@@ -749,62 +913,11 @@ def process_debian_package(
     codename: str,
 ) -> Optional[PackageMetadata]:
     """Process a single Debian package and extract all metadata."""
-    name = pkg_info.get("Package")
-    version = pkg_info.get("Version")
-    filename = pkg_info.get("Filename")
-
-    if not name or not version:
-        return None
-
-    # Extract license from copyright file
-    spdx = None
-    if filename:
-        copyright_text = download_and_extract_deb(filename, name, DEBIAN_ARCHIVE_BASE, distro="debian")
-        if copyright_text:
-            spdx = extract_dep5_license(copyright_text)
-
-    # We still require a valid license for inclusion
-    if not spdx:
+    if not pkg_info.get("Package") or not pkg_info.get("Version"):
         return None
 
-    # Extract other metadata from Packages.gz
-    description = pkg_info.get("Description")
-    if description:
-        # Take first line only (rest is long description)
-        description = description.split("\n")[0].strip()
-
-    maintainer = pkg_info.get("Maintainer")
-    maintainer_name, maintainer_email = parse_maintainer(maintainer)
-
-    homepage = pkg_info.get("Homepage")
-
-    # Construct download URL
-    download_url = None
-    if filename:
-        download_url = urljoin(DEBIAN_ARCHIVE_BASE, filename)
-
-    purl = make_deb_purl(
-        name=name,
-        version=version,
-        distro="debian",
-        distro_version=distro_version,
-    )
-
-    return PackageMetadata(
-        purl=purl,
-        name=name,
-        version=version,
-        spdx=spdx,
-        license_raw=spdx,
-        description=description,
-        supplier=maintainer,
-        maintainer_name=maintainer_name,
-        maintainer_email=maintainer_email,
-        homepage=homepage,
-        download_url=download_url,
-        confidence="high",
-        source="deb_metadata",
-    )
+    spdx = fetch_source_license([pkg_info], DEBIAN_ARCHIVE_BASE, distro="debian")
+    return build_deb_package_metadata(pkg_info, spdx, "debian", distro_version, DEBIAN_ARCHIVE_BASE)
 
 
 # =============================================================================
@@ -1146,7 +1259,7 @@ def generate_alpine_db(
     }
 
     with gzip.open(output_path, "wt", encoding="utf-8") as f:
-        json.dump(db, f, separators=(",", ":"))
+        jsonio.dump(db, f, separators=(",", ":"))
 
     logger.info(f"Wrote {len(packages)} packages to {output_path}")
     logger.info(f"Skipped: {skipped} (license not validated)")
@@ -1224,7 +1337,7 @@ def generate_wolfi_db(
     }
 
     with gzip.open(output_path, "wt", encoding="utf-8") as f:
-        json.dump(db, f, separators=(",", ":"))
+        jsonio.dump(db, f, separators=(",", ":"))
 
     logger.info(f"Wrote {len(packages)} packages to {output_path}")
     logger.info(f"Skipped: {skipped} (license not validated)")
@@ -1260,7 +1373,9 @@ def generate_ubuntu_db(
         all_packages = all_packages[:max_packages]
         total = len(all_packages)
 
-    logger.info(f"Found {total} unique packages to process")
+    # Binaries built from the same source share one copyright file
+    groups = group_deb_packages_by_source(all_packages)
+    logger.info(f"Found {total} unique packages to process ({len(groups)} source packages)")
 
     packages: Dict[str, Dict[str, Any]] = {}
     count = 0
@@ -1272,45 +1387,37 @@ def generate_ubuntu_db(
     max_workers = int(os.environ.get("SBOMIFY_LICENSE_DB_WORKERS", "5"))
     logger.info(f"Using {max_workers} parallel workers")
 
-    def process_one(pkg_info: Dict[str, str]) -> Optional[Tuple[str, Dict[str, Any]]]:
-        """Process a single package and return (purl, data) or None."""
-        result = process_ubuntu_package(pkg_info, distro_version, codename)
-        if result:
-            return (
-                result.purl,
-                {
-                    "name": result.name,
-                    "version": result.version,
-                    "spdx": result.spdx,
-                    "license_raw": result.license_raw,
-                    "description": result.description,
-                    "supplier": result.supplier,
-                    "maintainer_name": result.maintainer_name,
-                    "maintainer_email": result.maintainer_email,
-                    "homepage": result.homepage,
-                    "download_url": result.download_url,
-                    "confidence": result.confidence,
-                    "source": result.source,
-                },
-            )
-        return None
-
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(process_one, pkg): pkg for pkg in all_packages}
+        futures = [
+            executor.submit(process_deb_source_group, members, "ubuntu", distro_version, UBUNTU_ARCHIVE_BASE)
+            for members in groups.values()
+        ]
 
         for future in as_completed(futures):
-            processed += 1
-            result = future.result()
-            if result:
-                purl, data = result
-                packages[purl] = data
-                count += 1
-            else:
-                skipped += 1
-
-            if processed % 100 == 0 or processed == total:
-                pct = (processed / total) * 100
-                logger.info(f"Processed {processed}/{total} ({pct:.1f}%) - {count} valid licenses...")
+            for result in future.result():
+                processed += 1
+                if result:
+                    packages[result.purl] = {
+                        "name": result.name,
+                        "version": result.version,
+                        "spdx": result.spdx,
+                        "license_raw": result.license_raw,
+                        "description": result.description,
+                        "supplier": result.supplier,
+                        "maintainer_name": result.maintainer_name,
+                        "maintainer_email": result.maintainer_email,
+                        "homepage": result.homepage,
+                        "download_url": result.download_url,
+                        "confidence": result.confidence,
+                        "source": result.source,
+                    }
+                    count += 1
+                else:
+                    skipped += 1
+
+                if processed % 100 == 0 or processed == total:
+                    pct = (processed / total) * 100
+                    logger.info(f"Processed {processed}/{total} ({pct:.1f}%) - {count} valid licenses...")
 
     # Get CLE lifecycle data
     lifecycle = DISTRO_LIFECYCLE.get("ubuntu", {}).get(distro_version, {})
@@ -1332,7 +1439,7 @@ def generate_ubuntu_db(
     }
 
     with gzip.open(output_path, "wt", encoding="utf-8") as f:
-        json.dump(db, f, separators=(",", ":"))
+        jsonio.dump(db, f, separators=(",", ":"))
 
     logger.info(f"Wrote {len(packages)} packages to {output_path}")
     logger.info(f"Skipped: {skipped} (license not validated)")
@@ -1368,7 +1475,9 @@ def generate_debian_db(
         all_packages = all_packages[:max_packages]
         total = len(all_packages)
 
-    logger.info(f"Found {total} unique packages to process")
+    # Binaries built from the same source share one copyright file
+    groups = group_deb_packages_by_source(all_packages)
+    logger.info(f"Found {total} unique packages to process ({len(groups)} source packages)")
 
     packages: Dict[str, Dict[str, Any]] = {}
     count = 0
@@ -1380,45 +1489,37 @@ def generate_debian_db(
     max_workers = int(os.environ.get("SBOMIFY_LICENSE_DB_WORKERS", "5"))
     logger.info(f"Using {max_workers} parallel workers")
 
-    def process_one(pkg_info: Dict[str, str]) -> Optional[Tuple[str, Dict[str, Any]]]:
-        """Process a single package and return (purl, data) or None."""
-        result = process_debian_package(pkg_info, distro_version, codename)
-        if result:
-            return (
-                result.purl,
-                {
-                    "name": result.name,
-                    "version": result.version,
-                    "spdx": result.spdx,
-                    "license_raw": result.license_raw,
-                    "description": result.description,
-                    "supplier": result.supplier,
-                    "maintainer_name": result.maintainer_name,
-                    "maintainer_email": result.maintainer_email,
-                    "homepage": result.homepage,
-                    "download_url": result.download_url,
-                    "confidence": result.confidence,
-                    "source": result.source,
-                },
-            )
-        return None
-
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(process_one, pkg): pkg for pkg in all_packages}
+        futures = [
+            executor.submit(process_deb_source_group, members, "debian", distro_version, DEBIAN_ARCHIVE_BASE)
+            for members in groups.values()
+        ]
 
         for future in as_completed(futures):
-            processed += 1
-            result = future.result()
-            if result:
-                purl, data = result
-                packages[purl] = data
-                count += 1
-            else:
-                skipped += 1
-
-            if processed % 100 == 0 or processed == total:
-                pct = (processed / total) * 100
-                logger.info(f"Processed {processed}/{total} ({pct:.1f}%) - {count} valid licenses...")
+            for result in future.result():
+                processed += 1
+                if result:
+                    packages[result.purl] = {
+                        "name": result.name,
+                        "version": result.version,
+                        "spdx": result.spdx,
+                        "license_raw": result.license_raw,
+                        "description": result.description,
+                        "supplier": result.supplier,
+                        "maintainer_name": result.maintainer_name,
+                        "maintainer_email": result.maintainer_email,
+                        "homepage": result.homepage,
+                        "download_url": result.download_url,
+                        "confidence": result.confidence,
+                        "source": result.source,
+                    }
+                    count += 1
+                else:
+                    skipped += 1
+
+                if processed % 100 == 0 or processed == total:
+                    pct = (processed / total) * 100
+                    logger.info(f"Processed {processed}/{total} ({pct:.1f}%) - {count} valid licenses...")
 
     # Get CLE lifecycle data
     lifecycle = DISTRO_LIFECYCLE.get("debian", {}).get(distro_version, {})
@@ -1440,7 +1541,7 @@ def generate_debian_db(
     }
 
     with gzip.open(output_path, "wt", encoding="utf-8") as f:
-        json.dump(db, f, separators=(",", ":"))
+        jsonio.dump(db, f, separators=(",", ":"))
 
     logger.info(f"Wrote {len(packages)} packages to {output_path}")
     logger.info(f"Skipped: {skipped} (license not validated)")
@@ -1565,7 +1666,7 @@ def generate_rpm_db(
     }
 
     with gzip.open(output_path, "wt", encoding="utf-8") as f:
-        json.dump(db, f, separators=(",", ":"))
+        jsonio.dump(db, f, separators=(",", ":"))
 
     logger.info(f"Wrote {len(packages)} packages to {output_path}")
     logger.info(f"Skipped: {skipped} (license not validated)")
@@ -0,0 +1,107 @@
+"""Shared, memoized SPDX license-expression engine.
+
+Parsing with the `license-expression` library is expensive, yet real SBOMs
+repeat the same few license strings ("MIT", "Apache-2.0", ...) thousands of
+times. This module is the single place where license expressions are parsed:
+
+1. A frozenset fast path answers plain SPDX identifiers without parsing.
+2. A bounded LRU memo caches parsed expressions and their unknown keys.
+3. A batch API resolves many strings at once, parsing each distinct one once.
+
+Used by license_utils, license_normalizer and serialization.
+"""
+
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, NamedTuple, Optional
+
+from license_expression import ExpressionError, LicenseExpression, get_spdx_licensing
+
+# Shared SPDX licensing instance (contains all official SPDX license IDs)
+spdx_licensing = get_spdx_licensing()
+
+# Canonical license and exception keys; a plain key never needs parsing
+SPDX_LICENSE_KEYS: FrozenSet[str] = frozenset(spdx_licensing.known_symbols)
+
+# Maximum number of distinct expressions kept in the parse memo
+EXPRESSION_CACHE_SIZE = 8192
+
+
+class ParsedLicenseExpression(NamedTuple):
+    """A parsed license expression and the license keys the SPDX list doesn't know."""
+
+    expression: LicenseExpression
+    unknown_keys: FrozenSet[str]
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def parse_license_expression(expression: str) -> Optional[ParsedLicenseExpression]:
+    """
+    Parse a license expression, memoizing the result.
+
+    The returned expression object is shared between callers and must not be
+    mutated (license-expression methods such as subs() return new objects).
+
+    Args:
+        expression: License expression string
+
+    Returns:
+        ParsedLicenseExpression, or None if the string cannot be parsed
+    """
+    try:
+        parsed = spdx_licensing.parse(expression, validate=False)
+    except ExpressionError:
+        return None
+    return ParsedLicenseExpression(parsed, frozenset(spdx_licensing.unknown_license_keys(parsed)))
+
+
+def unknown_license_keys(expression: str) -> Optional[FrozenSet[str]]:
+    """
+    Get the license keys in an expression that are not on the SPDX list.
+
+    Args:
+        expression: License expression string
+
+    Returns:
+        Frozenset of unknown keys (empty if all are known), or None if unparseable
+    """
+    if expression in SPDX_LICENSE_KEYS:
+        return frozenset()
+    parsed = parse_license_expression(expression)
+    if parsed is None:
+        return None
+    return parsed.unknown_keys
+
+
+def is_known_license_expression(expression: str) -> bool:
+    """
+    Check whether an expression parses and only uses known SPDX license keys.
+
+    Args:
+        expression: License expression string
+
+    Returns:
+        True if every license key in the expression is known
+    """
+    if not expression:
+        return False
+    return unknown_license_keys(expression) == frozenset()
+
+
+def check_license_expressions(expressions: Iterable[str]) -> Dict[str, bool]:
+    """
+    Check many license expressions at once.
+
+    Each distinct string is resolved once, regardless of how often it repeats.
+
+    Args:
+        expressions: License expression strings (duplicates allowed)
+
+    Returns:
+        Dict mapping each distinct expression to is_known_license_expression()
+    """
+    return {expression: is_known_license_expression(expression) for expression in set(expressions)}
+
+
+def clear_license_expression_cache() -> None:
+    """Clear the parse memo (mainly for tests)."""
+    parse_license_expression.cache_clear()
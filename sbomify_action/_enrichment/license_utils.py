@@ -6,21 +6,19 @@ guess or use fuzzy matching. When in doubt, we preserve the original and let
 humans review.
 
 This module validates licenses against the official SPDX license list using
-the `license-expression` library, ensuring compliance with CycloneDX and SPDX
-schema requirements across all versions.
+the shared, memoized engine in `license_expressions`, ensuring compliance with
+CycloneDX and SPDX schema requirements across all versions.
 """
 
 import logging
 import re
 from typing import Optional, Tuple
 
-from license_expression import ExpressionError, get_spdx_licensing
+from .license_expressions import is_known_license_expression, parse_license_expression
+from .license_expressions import spdx_licensing as _spdx_licensing
 
 logger = logging.getLogger(__name__)
 
-# Get the SPDX licensing instance (contains all official SPDX license IDs)
-_spdx_licensing = get_spdx_licensing()
-
 # SPDX special values that are always valid
 SPDX_SPECIAL_VALUES = {"NOASSERTION", "NONE"}
 
@@ -144,14 +142,7 @@ def validate_spdx_expression(license_str: str) -> bool:
             return True
         return False
 
-    try:
-        # Parse without validation first
-        parsed = _spdx_licensing.parse(license_str, validate=False)
-        # Check for unknown license keys
-        unknown = _spdx_licensing.unknown_license_keys(parsed)
-        return len(unknown) == 0
-    except ExpressionError:
-        return False
+    return is_known_license_expression(license_str)
 
 
 def is_spdx_identifier(license_str: str) -> bool:
@@ -270,14 +261,10 @@ def normalize_license(license_str: str) -> Tuple[str, Optional[str]]:
     # 3. Something like "non-standard" or "proprietary"
     #
     # Try to parse it as SPDX (case-insensitive)
-    try:
-        parsed = _spdx_licensing.parse(stripped, validate=False)
-        unknown = _spdx_licensing.unknown_license_keys(parsed)
-        if not unknown:
-            # It's a valid SPDX expression! Return the canonical form
-            return (str(parsed), None)
-    except ExpressionError:
-        pass
+    parsed = parse_license_expression(stripped)
+    if parsed is not None and not parsed.unknown_keys:
+        # It's a valid SPDX expression! Return the canonical form
+        return (str(parsed.expression), None)
 
     # Not a valid SPDX - return as-is and let the SBOM consumer handle it
     # This preserves the original information without guessing
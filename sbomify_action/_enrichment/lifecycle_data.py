@@ -14,7 +14,10 @@ See: https://sbomify.com/compliance/cle/
 Data last updated: 2026-01-18
 """
 
-from typing import Dict, List, Optional, TypedDict
+import fnmatch
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Tuple, TypedDict
 
 
 class LifecycleDates(TypedDict, total=False):
@@ -816,6 +819,100 @@ PACKAGE_LIFECYCLE: Dict[str, PackageLifecycleEntry] = {
 }
 
 
+# =============================================================================
+# Compiled lookup index
+# =============================================================================
+
+
+class LifecycleIndex:
+    """
+    PACKAGE_LIFECYCLE compiled for constant-time name lookups.
+
+    Literal name patterns go into an exact-name dict; glob patterns are
+    combined into a single regex used as a fast negative check. Candidate
+    entries are memoised per distinct name, so repeated lookups never rescan
+    the table. Entry order in PACKAGE_LIFECYCLE is preserved as match priority.
+    """
+
+    def __init__(self, table: Dict[str, PackageLifecycleEntry]) -> None:
+        self._entries: List[PackageLifecycleEntry] = list(table.values())
+        self._purl_types: List[Optional[FrozenSet[str]]] = []
+        self._exact: Dict[str, List[int]] = {}
+        self._globs: List[Tuple[int, Pattern[str]]] = []
+        self._candidates: Dict[str, Tuple[int, ...]] = {}
+
+        glob_sources: List[str] = []
+        for idx, entry in enumerate(self._entries):
+            allowed_types = entry.get("purl_types")
+            self._purl_types.append(None if allowed_types is None else frozenset(t.lower() for t in allowed_types))
+
+            for pattern in entry.get("name_patterns", []):
+                pattern_lower = pattern.lower()
+                if any(char in pattern_lower for char in "*?["):
+                    translated = fnmatch.translate(pattern_lower)
+                    self._globs.append((idx, re.compile(translated)))
+                    glob_sources.append(f"(?:{translated})")
+                elif idx not in self._exact.get(pattern_lower, []):
+                    self._exact.setdefault(pattern_lower, []).append(idx)
+
+        self._any_glob: Optional[Pattern[str]] = re.compile("|".join(glob_sources)) if glob_sources else None
+
+    def candidates(self, name: str) -> Tuple[int, ...]:
+        """Return indices of entries whose name patterns match, in priority order."""
+        name_lower = name.lower()
+        cached = self._candidates.get(name_lower)
+        if cached is not None:
+            return cached
+
+        indices = set(self._exact.get(name_lower, ()))
+        if self._any_glob is not None and self._any_glob.match(name_lower):
+            indices.update(idx for idx, regex in self._globs if regex.match(name_lower))
+
+        result = tuple(sorted(indices))
+        self._candidates[name_lower] = result
+        return result
+
+    def find(self, names: Iterable[str], purl_type: Optional[str] = None) -> Optional[PackageLifecycleEntry]:
+        """
+        Find the highest-priority entry matching any of the given names.
+
+        Args:
+            names: Name variants to match (e.g. name, namespace, namespace/name)
+            purl_type: If given, skip entries whose purl_types exclude it
+
+        Returns:
+            PackageLifecycleEntry or None if no match found
+        """
+        indices = sorted({idx for name in names for idx in self.candidates(name)})
+        purl_type_lower = purl_type.lower() if purl_type is not None else None
+
+        for idx in indices:
+            allowed_types = self._purl_types[idx]
+            if purl_type_lower is None or allowed_types is None or purl_type_lower in allowed_types:
+                return self._entries[idx]
+
+        return None
+
+
+_lifecycle_index: Optional[LifecycleIndex] = None
+
+
+def get_lifecycle_index() -> LifecycleIndex:
+    """Return the compiled PACKAGE_LIFECYCLE index, building it on first use."""
+    global _lifecycle_index
+    if _lifecycle_index is None:
+        _lifecycle_index = LifecycleIndex(PACKAGE_LIFECYCLE)
+    return _lifecycle_index
+
+
+def reset_lifecycle_index() -> None:
+    """Discard the compiled index and memoised lookups (call after editing PACKAGE_LIFECYCLE)."""
+    global _lifecycle_index
+    _lifecycle_index = None
+    extract_version_cycle.cache_clear()
+    get_package_lifecycle.cache_clear()
+
+
 def get_package_lifecycle_entry(package_name: str) -> Optional[PackageLifecycleEntry]:
     """
     Find the lifecycle entry that matches a package name.
@@ -826,19 +923,10 @@ def get_package_lifecycle_entry(package_name: str) -> Optional[PackageLifecycleE
     Returns:
         PackageLifecycleEntry or None if no match found
     """
-    import fnmatch
-
-    name_lower = package_name.lower()
-
-    for entry_key, entry in PACKAGE_LIFECYCLE.items():
-        patterns = entry.get("name_patterns", [])
-        for pattern in patterns:
-            if fnmatch.fnmatch(name_lower, pattern.lower()):
-                return entry
-
-    return None
+    return get_lifecycle_index().find([package_name])
 
 
+@lru_cache(maxsize=4096)
 def extract_version_cycle(version: str, version_extract: Optional[str] = None) -> Optional[str]:
     """
     Extract the version cycle from a full version string.
@@ -882,6 +970,7 @@ def extract_version_cycle(version: str, version_extract: Optional[str] = None) -
     return None
 
 
+@lru_cache(maxsize=4096)
 def get_package_lifecycle(
     package_name: str,
     version: str,
@@ -930,8 +1019,6 @@ def get_distro_lifecycle(distro_name: str, version: str) -> Optional[LifecycleDa
     Returns:
         LifecycleDates dict or None if not found
     """
-    import re
-
     distro_lower = distro_name.lower()
 
     # Map common OS name variations to our canonical names
@@ -16,7 +16,6 @@ Strategy:
 
 import gzip
 import io
-import json
 import os
 import re
 import threading
@@ -26,6 +25,7 @@ from typing import Any, Dict, Optional, Tuple
 import requests
 from packageurl import PackageURL
 
+from sbomify_action import jsonio
 from sbomify_action.logging_config import logger
 
 from ..metadata import NormalizedMetadata
@@ -428,13 +428,13 @@ class LicenseDBSource:
     def _load_from_file(self, path: Path) -> Dict[str, Any]:
         """Load a gzipped JSON database from file."""
         with gzip.open(path, "rt", encoding="utf-8") as f:
-            return json.load(f)
+            return jsonio.load(f)
 
     def _save_to_file(self, path: Path, db: Dict[str, Any]) -> None:
         """Save a database to gzipped JSON file."""
         path.parent.mkdir(parents=True, exist_ok=True)
         with gzip.open(path, "wt", encoding="utf-8") as f:
-            json.dump(db, f)
+            jsonio.dump(db, f)
 
     def _download_from_release(self, distro: str, version: str, session: requests.Session) -> Optional[Dict[str, Any]]:
         """
@@ -537,7 +537,7 @@ class LicenseDBSource:
 
             # Decompress and parse using BytesIO for reliability
             with gzip.GzipFile(fileobj=io.BytesIO(response.content)) as gz:
-                return json.load(gz)
+                return jsonio.load(gz)
 
         except Exception as e:
             logger.warning(f"Failed to download license database: {e}")
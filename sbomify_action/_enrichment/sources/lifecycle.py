@@ -13,7 +13,6 @@ Priority: 5 (high priority - local data, no API calls)
 Supports: Packages matching PACKAGE_LIFECYCLE patterns only
 """
 
-import fnmatch
 from typing import Dict, Optional
 
 import requests
@@ -22,9 +21,9 @@ from packageurl import PackageURL
 from sbomify_action.logging_config import logger
 
 from ..lifecycle_data import (
-    PACKAGE_LIFECYCLE,
     PackageLifecycleEntry,
     extract_version_cycle,
+    get_lifecycle_index,
 )
 from ..metadata import NormalizedMetadata
 
@@ -164,7 +163,8 @@ class LifecycleSource:
         """
         Find the PACKAGE_LIFECYCLE entry matching the given PURL.
 
-        Checks name patterns, namespace (for composer packages), and PURL type filters.
+        Checks name patterns, namespace (for composer packages), and PURL type filters
+        using the compiled lifecycle index, so lookups don't scan PACKAGE_LIFECYCLE.
 
         For composer packages (like Laravel), the namespace is significant:
         - pkg:composer/laravel/framework matches patterns against both "laravel" and "framework"
@@ -186,29 +186,4 @@ class LifecycleSource:
             # Also check combined namespace/name format
             names_to_check.append(f"{namespace_lower}/{name_lower}")
 
-        for entry_key, entry in PACKAGE_LIFECYCLE.items():
-            # Check name patterns against all possible name variations
-            patterns = entry.get("name_patterns", [])
-            name_matches = False
-
-            for pattern in patterns:
-                pattern_lower = pattern.lower()
-                for name in names_to_check:
-                    if fnmatch.fnmatch(name, pattern_lower):
-                        name_matches = True
-                        break
-                if name_matches:
-                    break
-
-            if not name_matches:
-                continue
-
-            # Check PURL type filter
-            allowed_types = entry.get("purl_types")
-            if allowed_types is not None:
-                if purl_type not in [t.lower() for t in allowed_types]:
-                    continue
-
-            return entry
-
-        return None
+        return get_lifecycle_index().find(names_to_check, purl_type)
@@ -0,0 +1,318 @@
+"""Local cache of generated SBOMs, keyed by their inputs.
+
+Running Trivy, Syft, cdxgen or cyclonedx-py on a lock file that didn't
+change since the last run produces the same SBOM again. The cache keys each
+validated SBOM by everything that determines it, and restores it instead of
+running the generator:
+
+- the content of the lock file and of the dependency manifests next to it
+- the generator and the identity of its installed executable (path, size and
+  modification time, so upgrading the tool invalidates the entry)
+- the output format and spec version
+- the lock file path passed to the tool and the sbomify-action version
+- environment variables the generators read for their settings
+  (GENERATOR_ENV_PREFIXES, e.g. TRIVY_* or FETCH_LICENSE)
+
+Other settings outside these inputs, such as a tool's own config files in the
+home directory, aren't part of the key; set GENERATION_CACHE=false when they
+change.
+
+A restored SBOM gets a new identity, like a freshly generated one: a new
+CycloneDX serialNumber and metadata.timestamp, or a new SPDX documentNamespace
+and creation time. Entries in other formats are generated again.
+
+Only pinned lock files are cached. Manifests like requirements.txt, pom.xml
+or package.json can resolve to different dependencies over time, and
+Java/Scala builds are scanned recursively, so their SBOMs are always generated.
+Docker images aren't cached either, as tags can move.
+
+Configuration via environment variables:
+    GENERATION_CACHE: Reuse SBOMs generated from identical inputs (default: true)
+    SBOMIFY_CACHE_DIR: Directory the cache is stored in (under ``generation/``);
+                       defaults to XDG_CACHE_HOME/sbomify or ~/.cache/sbomify
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from sbomify_action import __version__, jsonio
+from sbomify_action.cache_dir import get_cache_dir
+from sbomify_action.env import get_env_bool
+from sbomify_action.logging_config import logger
+
+from .protocol import GenerationInput, Generator
+from .result import GenerationResult
+
+# Directory under get_cache_dir() the entries are stored in
+CACHE_SUBDIR_NAME = "generation"
+
+# Bump to invalidate all entries when the key or entry layout changes
+CACHE_FORMAT_VERSION = 1
+
+# Entries kept; the least recently used ones are removed beyond this
+MAX_ENTRIES = 64
+
+# Lock files that pin exact dependency versions
+CACHEABLE_LOCK_FILES = frozenset(
+    {
+        "Pipfile.lock",
+        "poetry.lock",
+        "uv.lock",
+        "Cargo.lock",
+        "package-lock.json",
+        "yarn.lock",
+        "pnpm-lock.yaml",
+        "bun.lock",
+        "Gemfile.lock",
+        "go.sum",
+        "pubspec.lock",
+        "conan.lock",
+        "composer.lock",
+        "packages.lock.json",
+        "Package.resolved",
+        "mix.lock",
+        ".terraform.lock.hcl",
+    }
+)
+
+# Files next to a lock file that generators read as well
+MANIFEST_FILES = (
+    "pyproject.toml",
+    "Pipfile",
+    "Cargo.toml",
+    "package.json",
+    "Gemfile",
+    "go.mod",
+    "pubspec.yaml",
+    "conanfile.txt",
+    "conanfile.py",
+    "composer.json",
+    "Package.swift",
+    "mix.exs",
+)
+
+# Environment variables that change the generators' output: Trivy, Syft and
+# cdxgen settings, and cdxgen's license lookup
+GENERATOR_ENV_PREFIXES = ("TRIVY_", "SYFT_", "CDXGEN_", "CDX_", "FETCH_LICENSE")
+
+# The UUID that makes a generated SPDX documentNamespace unique
+_UUID_PATTERN = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+
+# GenerationResult fields stored next to each SBOM
+_META_FIELDS = ("sbom_format", "spec_version", "generator_name")
+
+
+def cache_enabled() -> bool:
+    """Check whether generated SBOMs are cached (GENERATION_CACHE)."""
+    return get_env_bool("GENERATION_CACHE", default=True)
+
+
+def _file_fingerprint(path: Path) -> str:
+    """Fingerprint a file by its name and the SHA-256 of its content."""
+    with open(path, "rb") as f:
+        return f"{path.name}:{hashlib.file_digest(f, 'sha256').hexdigest()}"
+
+
+def _generator_environment() -> list[str]:
+    """Get the environment variables that change the generators' output, in a stable order."""
+    return sorted(f"{name}={value}" for name, value in os.environ.items() if name.startswith(GENERATOR_ENV_PREFIXES))
+
+
+def _renew_identity(data: object) -> bool:
+    """
+    Give a restored SBOM a new document identity and creation time.
+
+    Returns:
+        False if the document isn't a CycloneDX or SPDX 2 JSON document
+    """
+    if not isinstance(data, dict):
+        return False
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    if data.get("bomFormat") == "CycloneDX":
+        if "serialNumber" in data:
+            data["serialNumber"] = f"urn:uuid:{uuid.uuid4()}"
+        metadata = data.get("metadata")
+        if isinstance(metadata, dict) and "timestamp" in metadata:
+            metadata["timestamp"] = now
+        return True
+    if isinstance(data.get("spdxVersion"), str):
+        namespace = data.get("documentNamespace")
+        if isinstance(namespace, str):
+            new_id = str(uuid.uuid4())
+            matches = list(_UUID_PATTERN.finditer(namespace))
+            if matches:
+                last = matches[-1]
+                data["documentNamespace"] = namespace[: last.start()] + new_id + namespace[last.end() :]
+            else:
+                data["documentNamespace"] = f"{namespace.rstrip('/')}-{new_id}"
+        creation_info = data.get("creationInfo")
+        if isinstance(creation_info, dict) and "created" in creation_info:
+            creation_info["created"] = now
+        return True
+    return False
+
+
+class GenerationCache:
+    """
+    Validated SBOMs stored by generation key.
+
+    Each entry is a ``<key>.json`` SBOM plus a ``<key>.meta.json`` file with
+    the format, spec version and generator name of the result. The directory
+    is looked up on every use, so changes to SBOMIFY_CACHE_DIR apply to an
+    existing cache.
+
+    Example:
+        cache = GenerationCache()
+        key = cache.key_for(generator, input, spec_version)
+        result = cache.restore(key, input.output_file) if key else None
+        if result is None:
+            result = generator.generate(input)
+            if key and result.is_valid:
+                cache.store(key, result)
+    """
+
+    def __init__(self, directory: Optional[Path] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Cache directory (default: CACHE_SUBDIR_NAME in get_cache_dir())
+        """
+        self._directory = directory
+
+    @property
+    def directory(self) -> Path:
+        """Directory the entries are stored in."""
+        return self._directory or get_cache_dir() / CACHE_SUBDIR_NAME
+
+    def key_for(self, generator: Generator, input: GenerationInput, spec_version: str) -> Optional[str]:
+        """
+        Compute the cache key of generating an SBOM.
+
+        Args:
+            generator: Generator that would produce the SBOM
+            input: Generation input
+            spec_version: Spec version the generator would produce
+
+        Returns:
+            The key, or None if the SBOM can't be cached (caching disabled,
+            not a pinned lock file, or the generator's executable not found).
+            In-process generators have no executable and aren't cached.
+        """
+        if not cache_enabled() or not input.lock_file or input.lock_file_name not in CACHEABLE_LOCK_FILES:
+            return None
+        if not generator.command:
+            return None
+
+        executable = shutil.which(generator.command)
+        if not executable:
+            return None
+
+        try:
+            stat = os.stat(executable)
+            lock_file = Path(input.lock_file)
+            parts = [
+                str(CACHE_FORMAT_VERSION),
+                __version__,
+                generator.name,
+                executable,
+                str(stat.st_size),
+                str(stat.st_mtime_ns),
+                input.output_format,
+                spec_version,
+                input.lock_file,
+                _file_fingerprint(lock_file),
+                *_generator_environment(),
+            ]
+            for name in MANIFEST_FILES:
+                manifest = lock_file.parent / name
+                if manifest.is_file():
+                    parts.append(_file_fingerprint(manifest))
+        except OSError as e:
+            logger.debug(f"Not caching generation for {input.lock_file}: {e}")
+            return None
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    def restore(self, key: str, output_file: str) -> Optional[GenerationResult]:
+        """
+        Write a cached SBOM to output_file, with a new document identity.
+
+        Returns:
+            A validated GenerationResult for the restored SBOM, or None on a miss
+        """
+        sbom_path = self.directory / f"{key}.json"
+        meta_path = self.directory / f"{key}.meta.json"
+        try:
+            meta = jsonio.loads(meta_path.read_bytes())
+            if not isinstance(meta, dict) or not all(isinstance(meta.get(field), str) for field in _META_FIELDS):
+                return None
+            data = jsonio.loads(sbom_path.read_bytes())
+            if not _renew_identity(data):
+                return None
+            Path(output_file).write_text(jsonio.dumps(data, indent=2), encoding="utf-8")
+            # Mark the entry as recently used
+            os.utime(meta_path)
+        except FileNotFoundError:
+            return None
+        except (OSError, jsonio.JSONDecodeError) as e:
+            logger.debug(f"Ignoring unreadable generation cache entry {key}: {e}")
+            return None
+
+        return GenerationResult.success_result(
+            output_file=output_file,
+            sbom_format=meta["sbom_format"],
+            spec_version=meta["spec_version"],
+            generator_name=meta["generator_name"],
+            validated=True,
+        )
+
+    def store(self, key: str, result: GenerationResult) -> None:
+        """
+        Store a validated SBOM under a key.
+
+        Failing to write is logged and otherwise ignored; it only means the
+        next run generates the SBOM again.
+        """
+        if not result.is_valid or not result.output_file:
+            return
+        meta = {field: getattr(result, field) for field in _META_FIELDS}
+        directory = self.directory
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            # The SBOM is written before its metadata, which marks the entry complete
+            self._write_atomic(directory / f"{key}.json", Path(result.output_file).read_bytes())
+            self._write_atomic(directory / f"{key}.meta.json", jsonio.dumps(meta).encode())
+        except OSError as e:
+            logger.debug(f"Could not store generation cache entry {key}: {e}")
+            return
+        self._prune(directory)
+
+    @staticmethod
+    def _write_atomic(path: Path, content: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".generation-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @staticmethod
+    def _prune(directory: Path) -> None:
+        """Remove the least recently used entries beyond MAX_ENTRIES."""
+        try:
+            entries = sorted(directory.glob("*.meta.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+            for meta_path in entries[MAX_ENTRIES:]:
+                key = meta_path.name.removesuffix(".meta.json")
+                meta_path.unlink(missing_ok=True)
+                (directory / f"{key}.json").unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"Could not prune generation cache {directory}: {e}")
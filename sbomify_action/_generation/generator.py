@@ -4,11 +4,13 @@ from typing import Dict, List, Optional
 
 from sbomify_action.logging_config import logger
 
+from .cache import GenerationCache
 from .generators import (
     CdxgenFsGenerator,
     CdxgenImageGenerator,
     CycloneDXCargoGenerator,
     CycloneDXPyGenerator,
+    NativeLockfileGenerator,
     SyftFsGenerator,
     SyftImageGenerator,
     TrivyFsGenerator,
@@ -25,6 +27,12 @@ def create_default_registry() -> GeneratorRegistry:
 
     Returns a registry configured with generators in priority order:
 
+    Priority 5 - In-Process:
+    - NativeLockfileGenerator: SBOM built from the lockfile, no external tool
+      - Input: uv.lock, poetry.lock, Pipfile.lock, Cargo.lock, package-lock.json,
+               yarn.lock, pnpm-lock.yaml, pubspec.lock
+      - Output: CycloneDX 1.4-1.7, SPDX 2.2-2.3
+
     Priority 10 - Native Sources:
     - CycloneDXPyGenerator: Native Python CycloneDX generator
       - Input: Python lock files only (requirements.txt, poetry.lock, Pipfile.lock, pyproject.toml)
@@ -62,11 +70,16 @@ def create_default_registry() -> GeneratorRegistry:
 
     Generators are queried sequentially in priority order. The first
     generator that supports the input and requested format/version is used.
+    Validated SBOMs are cached, so identical pinned lock files aren't
+    generated again (see GenerationCache).
 
     Returns:
         Configured GeneratorRegistry
     """
-    registry = GeneratorRegistry()
+    registry = GeneratorRegistry(cache=GenerationCache())
+
+    # Priority 5: In-process generator (no external tool)
+    registry.register(NativeLockfileGenerator())
 
     # Priority 10: Native generators
     registry.register(CycloneDXPyGenerator())
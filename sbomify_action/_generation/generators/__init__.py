@@ -1,6 +1,7 @@
 """Generator plugin implementations.
 
 This module contains all generator plugins:
+- NativeLockfileGenerator: In-process lockfile generator (priority 5)
 - CycloneDXPyGenerator: Native Python CycloneDX generator (priority 10)
 - CycloneDXCargoGenerator: Native Rust/Cargo CycloneDX generator (priority 10)
 - CdxgenFsGenerator: cdxgen filesystem scanner (priority 20)
@@ -14,10 +15,12 @@ This module contains all generator plugins:
 from .cdxgen import CdxgenFsGenerator, CdxgenImageGenerator
 from .cyclonedx_cargo import CycloneDXCargoGenerator
 from .cyclonedx_py import CycloneDXPyGenerator
+from .native_lockfile import NativeLockfileGenerator
 from .syft import SyftFsGenerator, SyftImageGenerator
 from .trivy import TrivyFsGenerator, TrivyImageGenerator
 
 __all__ = [
+    "NativeLockfileGenerator",
     "CycloneDXPyGenerator",
     "CycloneDXCargoGenerator",
     "CdxgenFsGenerator",
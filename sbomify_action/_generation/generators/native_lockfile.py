@@ -0,0 +1,381 @@
+"""Native lockfile generator plugin.
+
+Builds SBOMs in-process from the lockfile alone, reusing the lockfile
+parsers of hash enrichment. No external tool is started, so it is tried
+before all of them for the lockfiles it understands.
+Priority: 5 (in-process)
+
+Supported inputs:
+- Python: uv.lock, poetry.lock, Pipfile.lock
+- Rust: Cargo.lock
+- JavaScript: package-lock.json, yarn.lock, pnpm-lock.yaml
+- Dart: pubspec.lock
+
+Supported outputs:
+- CycloneDX 1.4-1.7
+- SPDX 2.2-2.3
+"""
+
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from packageurl import PackageURL
+
+from sbomify_action import __version__, jsonio
+from sbomify_action._hash_enrichment import LockedPackage, PackageHash, ParserRegistry, normalize_package_name
+from sbomify_action._hash_enrichment import create_default_registry as create_parser_registry
+from sbomify_action.logging_config import logger
+
+from ..protocol import (
+    NATIVE_CYCLONEDX_DEFAULT,
+    NATIVE_CYCLONEDX_VERSIONS,
+    NATIVE_SPDX_DEFAULT,
+    NATIVE_SPDX_VERSIONS,
+    FormatVersion,
+    GenerationInput,
+)
+from ..result import GenerationResult
+
+# Same tool identity as augmentation uses, so it isn't listed twice
+TOOL_NAME = "sbomify action"
+TOOL_VENDOR = "sbomify"
+
+# Lockfile parser ecosystem -> PURL type
+PURL_TYPES = {
+    "pypi": "pypi",
+    "npm": "npm",
+    "cargo": "cargo",
+    "pub": "pub",
+}
+
+# Checksum algorithms of the SPDX 2.2 schema (2.3 adds SHA3, BLAKE2b and BLAKE3)
+SPDX_22_CHECKSUM_ALGORITHMS = frozenset({"SHA1", "SHA224", "SHA256", "SHA384", "SHA512", "MD2", "MD4", "MD5", "MD6"})
+
+
+class _Component:
+    """A locked package as it is written to the SBOM."""
+
+    def __init__(self, package: LockedPackage, ecosystem: str):
+        self.name = package.name
+        self.version = package.version
+        self.direct = package.direct
+        self.dependencies = list(package.dependencies)
+        self.hashes: list[PackageHash] = []
+
+        namespace = None
+        purl_name = package.name
+        if ecosystem == "npm" and package.name.startswith("@") and "/" in package.name:
+            namespace, purl_name = package.name.split("/", 1)
+        elif ecosystem == "pypi":
+            purl_name = package.name.lower().replace("_", "-")
+        self.namespace = namespace
+        self.short_name = purl_name if namespace else package.name
+        self.purl = PackageURL(
+            type=PURL_TYPES[ecosystem], namespace=namespace, name=purl_name, version=package.version
+        ).to_string()
+        self.depends_on: list["_Component"] = []
+
+
+class NativeLockfileGenerator:
+    """
+    In-process SBOM generator for pinned lockfiles.
+
+    Reads packages, dependencies and hashes with the hash enrichment
+    parsers and writes the SBOM directly, without starting an external
+    tool. Covers what the lockfile records: PURLs, hashes and the
+    dependency graph. Licenses and other metadata are left to enrichment.
+
+    Development-only packages are left out where the lockfile or the
+    manifest next to it tells them apart, like cdxgen's --required-only.
+    When the lockfile doesn't record the project's own requirements, the
+    packages no other package depends on are taken as its direct ones.
+    """
+
+    def __init__(self, parsers: ParserRegistry | None = None):
+        """
+        Initialize the generator.
+
+        Args:
+            parsers: Lockfile parsers (default: the hash enrichment parsers)
+        """
+        self._parsers = parsers or create_parser_registry()
+
+    @property
+    def name(self) -> str:
+        return "native-lockfile"
+
+    @property
+    def command(self) -> str:
+        # Runs in-process
+        return ""
+
+    @property
+    def priority(self) -> int:
+        # Tried before the external tools, as it needs none
+        return 5
+
+    @property
+    def supported_formats(self) -> list[FormatVersion]:
+        return [
+            FormatVersion(
+                format="cyclonedx",
+                versions=NATIVE_CYCLONEDX_VERSIONS,
+                default_version=NATIVE_CYCLONEDX_DEFAULT,
+            ),
+            FormatVersion(
+                format="spdx",
+                versions=NATIVE_SPDX_VERSIONS,
+                default_version=NATIVE_SPDX_DEFAULT,
+            ),
+        ]
+
+    def supports(self, input: GenerationInput) -> bool:
+        """
+        Check if this generator supports the given input.
+
+        Supports lockfiles that have a hash enrichment parser, in CycloneDX
+        1.4-1.7 or SPDX 2.2-2.3.
+        """
+        if not input.is_lock_file or not input.lock_file_name:
+            return False
+
+        if self._parsers.get_parser_for(input.lock_file_name) is None:
+            return False
+
+        if input.output_format == "cyclonedx":
+            versions = NATIVE_CYCLONEDX_VERSIONS
+        elif input.output_format == "spdx":
+            versions = NATIVE_SPDX_VERSIONS
+        else:
+            return False
+
+        return not input.spec_version or input.spec_version in versions
+
+    def generate(self, input: GenerationInput) -> GenerationResult:
+        """Generate an SBOM from the lockfile."""
+        if input.output_format == "spdx":
+            spec_version = input.spec_version or NATIVE_SPDX_DEFAULT
+        else:
+            spec_version = input.spec_version or NATIVE_CYCLONEDX_DEFAULT
+
+        parser = self._parsers.get_parser_for(input.lock_file_name or "")
+        if parser is None:
+            return GenerationResult.failure_result(
+                error_message=f"No lockfile parser for {input.lock_file_name}",
+                sbom_format=input.output_format,
+                spec_version=spec_version,
+                generator_name=self.name,
+            )
+
+        lock_file = Path(input.lock_file or "")
+        logger.info(f"Generating SBOM from {input.lock_file_name} in-process ({input.output_format} {spec_version})")
+
+        # Any parse error (malformed TOML/JSON/YAML, unexpected layout) leaves
+        # the lockfile to the external generators
+        try:
+            packages = parser.parse_packages(lock_file)
+            hashes = parser.parse(lock_file)
+        except Exception as e:
+            return GenerationResult.failure_result(
+                error_message=f"Could not read {input.lock_file_name}: {e}",
+                sbom_format=input.output_format,
+                spec_version=spec_version,
+                generator_name=self.name,
+            )
+
+        if not packages:
+            return GenerationResult.failure_result(
+                error_message=f"No packages found in {input.lock_file_name}",
+                sbom_format=input.output_format,
+                spec_version=spec_version,
+                generator_name=self.name,
+            )
+
+        components = self._build_components(packages, hashes, parser.ecosystem)
+        project_name = lock_file.resolve().parent.name or "project"
+
+        if input.output_format == "spdx":
+            document = self._spdx_document(project_name, components, spec_version)
+        else:
+            document = self._cyclonedx_document(project_name, components, spec_version)
+
+        with open(input.output_file, "w", encoding="utf-8") as f:
+            jsonio.dump(document, f, indent=2)
+
+        logger.info(f"Generated SBOM with {len(components)} packages from {input.lock_file_name}")
+        return GenerationResult.success_result(
+            output_file=input.output_file,
+            sbom_format=input.output_format,
+            spec_version=spec_version,
+            generator_name=self.name,
+        )
+
+    @staticmethod
+    def _build_components(packages: list[LockedPackage], hashes: list[PackageHash], ecosystem: str) -> list[_Component]:
+        """Merge duplicate packages, attach hashes and resolve dependencies."""
+        merged: dict[tuple[str, str], _Component] = {}
+        for package in packages:
+            key = (normalize_package_name(package.name, ecosystem), package.version)
+            component = merged.get(key)
+            if component is None:
+                merged[key] = _Component(package, ecosystem)
+            else:
+                component.direct = component.direct or package.direct
+                component.dependencies.extend(dep for dep in package.dependencies if dep not in component.dependencies)
+
+        for pkg_hash in hashes:
+            component = merged.get((normalize_package_name(pkg_hash.name, ecosystem), pkg_hash.version))
+            if component is not None and pkg_hash not in component.hashes:
+                component.hashes.append(pkg_hash)
+
+        by_name: dict[str, list[_Component]] = {}
+        for component in merged.values():
+            by_name.setdefault(normalize_package_name(component.name, ecosystem), []).append(component)
+
+        # Dependencies without a version match every locked version of the name
+        for component in merged.values():
+            for name, version in component.dependencies:
+                for dependency in by_name.get(normalize_package_name(name, ecosystem), []):
+                    if (version is None or dependency.version == version) and dependency is not component:
+                        if dependency not in component.depends_on:
+                            component.depends_on.append(dependency)
+
+        components = sorted(merged.values(), key=lambda c: (c.name.lower(), c.version))
+
+        # Without the project's own requirements, take the packages nothing depends on
+        if not any(component.direct for component in components):
+            required = {id(dependency) for component in components for dependency in component.depends_on}
+            for component in components:
+                component.direct = id(component) not in required
+
+        return components
+
+    @staticmethod
+    def _cyclonedx_document(project_name: str, components: list[_Component], spec_version: str) -> dict[str, Any]:
+        """Build a CycloneDX JSON document."""
+        root_ref = f"{project_name}-project"
+        tool: dict[str, Any] = {"name": TOOL_NAME, "version": __version__}
+        if spec_version == "1.4":
+            tools: Any = [{"vendor": TOOL_VENDOR, **tool}]
+        else:
+            tools = {"components": [{"type": "application", "group": TOOL_VENDOR, **tool}]}
+
+        cdx_components = []
+        for component in components:
+            entry: dict[str, Any] = {"type": "library", "bom-ref": component.purl}
+            if component.namespace:
+                entry["group"] = component.namespace
+            entry.update({"name": component.short_name, "version": component.version, "purl": component.purl})
+            if component.hashes:
+                entry["hashes"] = [{"alg": h.algorithm.cyclonedx_alg, "content": h.value} for h in component.hashes]
+            cdx_components.append(entry)
+
+        dependencies = [{"ref": root_ref, "dependsOn": [c.purl for c in components if c.direct]}]
+        dependencies.extend(
+            {"ref": component.purl, "dependsOn": [dependency.purl for dependency in component.depends_on]}
+            for component in components
+        )
+
+        return {
+            "bomFormat": "CycloneDX",
+            "specVersion": spec_version,
+            "serialNumber": f"urn:uuid:{uuid.uuid4()}",
+            "version": 1,
+            "metadata": {
+                "timestamp": _utc_timestamp(),
+                "tools": tools,
+                "component": {"type": "application", "bom-ref": root_ref, "name": project_name},
+            },
+            "components": cdx_components,
+            "dependencies": dependencies,
+        }
+
+    @staticmethod
+    def _spdx_document(project_name: str, components: list[_Component], spec_version: str) -> dict[str, Any]:
+        """Build an SPDX JSON document."""
+        root_id = "SPDXRef-Project"
+        # SPDX 2.3 renamed the category, keeping the 2.2 spelling deprecated
+        purl_category = "PACKAGE-MANAGER" if spec_version == "2.3" else "PACKAGE_MANAGER"
+
+        root: dict[str, Any] = {
+            "SPDXID": root_id,
+            "name": project_name,
+            "downloadLocation": "NOASSERTION",
+            "filesAnalyzed": False,
+            "licenseConcluded": "NOASSERTION",
+            "licenseDeclared": "NOASSERTION",
+            "copyrightText": "NOASSERTION",
+        }
+        if spec_version == "2.3":
+            root["primaryPackagePurpose"] = "APPLICATION"
+
+        spdx_ids = {id(component): f"SPDXRef-Package-{index}" for index, component in enumerate(components, 1)}
+        packages = [root]
+        for component in components:
+            package: dict[str, Any] = {
+                "SPDXID": spdx_ids[id(component)],
+                "name": component.name,
+                "versionInfo": component.version,
+                "downloadLocation": "NOASSERTION",
+                "filesAnalyzed": False,
+                "licenseConcluded": "NOASSERTION",
+                "licenseDeclared": "NOASSERTION",
+                "copyrightText": "NOASSERTION",
+                "externalRefs": [
+                    {
+                        "referenceCategory": purl_category,
+                        "referenceType": "purl",
+                        "referenceLocator": component.purl,
+                    }
+                ],
+            }
+            checksums = [
+                {"algorithm": h.algorithm.spdx_alg, "checksumValue": h.value}
+                for h in component.hashes
+                if spec_version != "2.2" or h.algorithm.spdx_alg in SPDX_22_CHECKSUM_ALGORITHMS
+            ]
+            if checksums:
+                package["checksums"] = checksums
+            packages.append(package)
+
+        relationships = [
+            {"spdxElementId": "SPDXRef-DOCUMENT", "relationshipType": "DESCRIBES", "relatedSpdxElement": root_id}
+        ]
+        for component in components:
+            if component.direct:
+                relationships.append(
+                    {
+                        "spdxElementId": root_id,
+                        "relationshipType": "DEPENDS_ON",
+                        "relatedSpdxElement": spdx_ids[id(component)],
+                    }
+                )
+            relationships.extend(
+                {
+                    "spdxElementId": spdx_ids[id(component)],
+                    "relationshipType": "DEPENDS_ON",
+                    "relatedSpdxElement": spdx_ids[id(dependency)],
+                }
+                for dependency in component.depends_on
+            )
+
+        return {
+            "spdxVersion": f"SPDX-{spec_version}",
+            "dataLicense": "CC0-1.0",
+            "SPDXID": "SPDXRef-DOCUMENT",
+            "name": project_name,
+            "documentNamespace": f"https://sbomify.com/spdxdocs/{uuid.uuid4()}",
+            "creationInfo": {
+                "created": _utc_timestamp(),
+                "creators": [f"Tool: {TOOL_NAME}-{__version__}"],
+            },
+            "packages": packages,
+            "relationships": relationships,
+        }
+
+
+def _utc_timestamp() -> str:
+    """Get the current UTC time as an ISO-8601 timestamp."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
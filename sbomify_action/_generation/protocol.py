@@ -51,6 +51,12 @@ CDXGEN_CYCLONEDX_DEFAULT = "1.6"
 CARGO_CYCLONEDX_VERSIONS = ("1.4", "1.5", "1.6")
 CARGO_CYCLONEDX_DEFAULT = "1.6"
 
+# In-process lockfile generator (no external tool)
+NATIVE_CYCLONEDX_VERSIONS = ("1.4", "1.5", "1.6", "1.7")
+NATIVE_CYCLONEDX_DEFAULT = "1.6"
+NATIVE_SPDX_VERSIONS = ("2.2", "2.3")
+NATIVE_SPDX_DEFAULT = "2.3"
+
 
 @dataclass
 class FormatVersion:
@@ -160,7 +166,8 @@ class Generator(Protocol):
         """
         The command-line tool this generator uses.
 
-        Used for tool availability checks.
+        Used for tool availability checks. Empty for generators that run
+        in-process and need no tool.
         Examples: "cyclonedx-py", "trivy", "syft", "cdxgen", "cargo-cyclonedx"
         """
         ...
@@ -1,9 +1,8 @@
 """Generator registry for managing SBOM generator plugins."""
 
-import json
 from typing import Any
 
-from sbomify_action import format_display_name
+from sbomify_action import format_display_name, jsonio
 from sbomify_action.exceptions import SBOMGenerationError, ToolNotAvailableError
 from sbomify_action.logging_config import logger
 from sbomify_action.serialization import (
@@ -15,6 +14,7 @@ from sbomify_action.serialization import (
 from sbomify_action.tool_checks import check_tool_for_input, format_no_tools_error
 from sbomify_action.validation import validate_sbom_file
 
+from .cache import GenerationCache
 from .protocol import FormatVersion, GenerationInput, Generator
 from .result import GenerationResult
 
@@ -40,9 +40,16 @@ class GeneratorRegistry:
         result = registry.generate(input)
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty registry."""
+    def __init__(self, cache: GenerationCache | None = None) -> None:
+        """
+        Initialize an empty registry.
+
+        Args:
+            cache: Cache of validated SBOMs restored instead of running a
+                   generator on identical inputs (default: no caching)
+        """
         self._generators: list[Generator] = []
+        self._cache = cache
 
     def register(self, generator: Generator) -> None:
         """
@@ -153,6 +160,13 @@ class GeneratorRegistry:
         errors: list[str] = []
         attempted_generators: list[str] = []
         for generator in generators:
+            cache_key = self._cache_key(generator, input)
+            if cache_key and self._cache:
+                cached = self._cache.restore(cache_key, input.output_file)
+                if cached:
+                    logger.info(f"Restored SBOM generated by {generator.name} from identical inputs (generation cache)")
+                    return cached
+
             logger.info(f"Trying generator: {generator.name}")
             attempted_generators.append(generator.name)
             try:
@@ -164,6 +178,10 @@ class GeneratorRegistry:
                     if validate and result.output_file:
                         result = self._validate_result(result)
 
+                    # Only SBOMs that passed validation are cached
+                    if cache_key and self._cache:
+                        self._cache.store(cache_key, result)
+
                     return result
                 else:
                     errors.append(f"{generator.name}: {result.error_message}")
@@ -202,6 +220,18 @@ class GeneratorRegistry:
             generator_name="none",
         )
 
+    def _cache_key(self, generator: Generator, input: GenerationInput) -> str | None:
+        """Get the generation cache key for running a generator, or None if not cached."""
+        if self._cache is None:
+            return None
+        spec_version = input.spec_version
+        if not spec_version:
+            format_version = self._get_format_version(generator, input.output_format)
+            if format_version is None:
+                return None
+            spec_version = format_version.default_version
+        return self._cache.key_for(generator, input, spec_version)
+
     def _validate_result(self, result: GenerationResult) -> GenerationResult:
         """Validate a generation result and update with validation info."""
         if not result.output_file:
@@ -256,13 +286,13 @@ class GeneratorRegistry:
         """
         try:
             with open(output_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+                data = jsonio.load(f)
 
             sanitized_count = sanitize_cyclonedx_licenses(data)
 
             if sanitized_count > 0:
                 with open(output_file, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2)
+                    jsonio.dump(data, f, indent=2)
                 logger.debug(f"Pre-validation: sanitized {sanitized_count} license ID(s)")
         except Exception as e:
             logger.debug(f"Could not sanitize licenses before validation: {e}")
@@ -280,14 +310,14 @@ class GeneratorRegistry:
         """
         try:
             with open(output_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+                data = jsonio.load(f)
 
             # Sanitize licenses first
             license_count = sanitize_spdx_licenses(data)
 
             if license_count > 0:
                 with open(output_file, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2)
+                    jsonio.dump(data, f, indent=2)
                 logger.debug(f"Pre-validation: sanitized {license_count} SPDX license(s)")
 
             # Then fix enum values (this reads/writes the file itself)
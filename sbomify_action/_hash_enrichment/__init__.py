@@ -20,20 +20,22 @@ Example usage:
     print(f"Added {stats['hashes_added']} hashes")
 """
 
-from .enricher import HashEnricher, create_default_registry, enrich_sbom_with_hashes
-from .models import HashAlgorithm, PackageHash, normalize_package_name
+from .enricher import HashEnricher, create_default_registry, enrich_document_with_hashes, enrich_sbom_with_hashes
+from .models import HashAlgorithm, LockedPackage, PackageHash, normalize_package_name
 from .protocol import LockfileHashParser
 from .registry import ParserRegistry
 
 __all__ = [
     # Main API
     "enrich_sbom_with_hashes",
+    "enrich_document_with_hashes",
     # Classes for advanced usage
     "HashEnricher",
     "ParserRegistry",
     "LockfileHashParser",
     # Models
     "PackageHash",
+    "LockedPackage",
     "HashAlgorithm",
     "normalize_package_name",
     # Factory
@@ -1,6 +1,5 @@
 """Hash enrichment orchestration for SBOMs."""
 
-import json
 from pathlib import Path
 from typing import Any
 
@@ -9,8 +8,8 @@ from cyclonedx.model import HashType
 from cyclonedx.model.bom import Bom
 
 from ..console import get_audit_trail
+from ..document import SBOMDocument
 from ..logging_config import logger
-from ..serialization import serialize_cyclonedx_bom
 from ..spdx3 import is_spdx3
 from .models import HashAlgorithm, PackageHash, normalize_package_name
 from .parsers import (
@@ -299,34 +298,45 @@ def enrich_sbom_with_hashes(
         - hashes_added: Number of hashes added
         - hashes_skipped: Number of hashes skipped (already present)
     """
-    sbom_path = Path(sbom_file)
-    lock_path = Path(lock_file)
+    document = SBOMDocument.from_file(sbom_file)
+    stats = enrich_document_with_hashes(document, lock_file, overwrite_existing)
+    if document.modified:
+        document.write(sbom_file)
+    return stats
+
+
+def enrich_document_with_hashes(
+    document: SBOMDocument,
+    lock_file: str,
+    overwrite_existing: bool = False,
+) -> dict[str, int]:
+    """Enrich an in-memory SBOM document with hashes extracted from lockfile.
+
+    Args:
+        document: SBOM document (modified in place)
+        lock_file: Path to lockfile to extract hashes from
+        overwrite_existing: If True, replace existing hashes
 
-    # Load SBOM
-    with sbom_path.open("r") as f:
-        sbom_data = json.load(f)
+    Returns:
+        Statistics dict (see enrich_sbom_with_hashes)
+    """
+    lock_path = Path(lock_file)
+    sbom_data = document.data
 
     enricher = HashEnricher()
 
     # Detect format and enrich
     if sbom_data.get("bomFormat") == "CycloneDX":
         # CycloneDX format
-        bom = Bom.from_json(sbom_data)
-        stats = enricher.enrich_cyclonedx(bom, lock_path, overwrite_existing)
-
-        # Serialize back
-        spec_version = sbom_data.get("specVersion", "1.6")
-        serialized = serialize_cyclonedx_bom(bom, spec_version)
-        with sbom_path.open("w") as f:
-            f.write(serialized)
+        stats = enricher.enrich_cyclonedx(document.bom, lock_path, overwrite_existing)
+        if stats["hashes_added"] > 0:
+            document.update_bom()
 
     elif sbom_data.get("spdxVersion"):
         # SPDX 2.x format
         stats = enricher.enrich_spdx(sbom_data, lock_path, overwrite_existing)
-
-        # Write back
-        with sbom_path.open("w") as f:
-            json.dump(sbom_data, f, indent=2)
+        if stats["hashes_added"] > 0:
+            document.update_data()
 
     elif is_spdx3(sbom_data):
         # SPDX 3 format - pass through without hash enrichment for now
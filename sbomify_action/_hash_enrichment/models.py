@@ -1,6 +1,6 @@
 """Data models for lockfile hash extraction."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -176,6 +176,21 @@ class PackageHash:
         )
 
 
+@dataclass
+class LockedPackage:
+    """Package pinned by a lockfile, with its dependencies.
+
+    Dependencies reference other locked packages by (name, version). The
+    version is None when the lockfile only names the dependency, which
+    leaves the match to the single locked package of that name.
+    """
+
+    name: str
+    version: str
+    dependencies: list[tuple[str, str | None]] = field(default_factory=list)
+    direct: bool = False  # Required by the locked project itself
+
+
 def normalize_package_name(name: str, ecosystem: str) -> str:
     """Normalize package name for matching across lockfile and SBOM.
 
@@ -208,3 +223,37 @@ def normalize_package_name(name: str, ecosystem: str) -> str:
     else:
         # Default: lowercase
         return name.lower()
+
+
+def prune_unreachable(packages: list[LockedPackage], ecosystem: str) -> list[LockedPackage]:
+    """Keep the packages reachable from the direct ones through their dependencies.
+
+    Used for lockfiles that record what the project requires but don't mark
+    development-only packages, which are unreachable from the project's own
+    requirements. Returns the packages unchanged if none of them is direct.
+
+    Args:
+        packages: Locked packages with their dependencies
+        ecosystem: Ecosystem identifier for matching dependency names
+
+    Returns:
+        The reachable packages, in their original order.
+    """
+    by_name: dict[str, list[LockedPackage]] = {}
+    for package in packages:
+        by_name.setdefault(normalize_package_name(package.name, ecosystem), []).append(package)
+
+    pending = [package for package in packages if package.direct]
+    if not pending:
+        return packages
+
+    reached = {id(package) for package in pending}
+    while pending:
+        package = pending.pop()
+        for name, version in package.dependencies:
+            for dependency in by_name.get(normalize_package_name(name, ecosystem), []):
+                if (version is None or dependency.version == version) and id(dependency) not in reached:
+                    reached.add(id(dependency))
+                    pending.append(dependency)
+
+    return [package for package in packages if id(package) in reached]
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import tomllib
 
-from ..models import HashAlgorithm, PackageHash
+from ..models import HashAlgorithm, LockedPackage, PackageHash
 
 
 class CargoLockParser:
@@ -15,6 +15,7 @@ class CargoLockParser:
     name = "serde"
     version = "1.0.193"
     checksum = "abc123..."  # Always SHA256, no prefix
+    dependencies = ["libc", "serde_derive 1.0.193 (registry+...)"]
     """
 
     name = "cargo-lock"
@@ -59,3 +60,44 @@ class CargoLockParser:
             )
 
         return hashes
+
+    def parse_packages(self, lock_file_path: Path) -> list[LockedPackage]:
+        """Parse Cargo.lock and extract crates with their dependencies.
+
+        Crates without a source are workspace members or local path crates
+        of the project; the crates they depend on are the direct ones.
+        Cargo.lock doesn't tell dev-dependencies apart, so they are kept.
+
+        Args:
+            lock_file_path: Path to Cargo.lock file
+
+        Returns:
+            List of LockedPackage objects, excluding local crates.
+        """
+        with lock_file_path.open("rb") as f:
+            data = tomllib.load(f)
+
+        packages: list[LockedPackage] = []
+        direct: set[tuple[str, str | None]] = set()
+
+        for pkg in data.get("package", []):
+            name = pkg.get("name")
+            version = pkg.get("version")
+            if not name or not version:
+                continue
+
+            # Entries are "name", "name version" or "name version (source)"
+            dependencies: list[tuple[str, str | None]] = []
+            for entry in pkg.get("dependencies", []):
+                parts = entry.split()
+                if parts:
+                    dependencies.append((parts[0], parts[1] if len(parts) > 1 else None))
+
+            if not pkg.get("source"):
+                direct.update(dependencies)
+                continue
+            packages.append(LockedPackage(name=name, version=version, dependencies=dependencies))
+
+        for package in packages:
+            package.direct = (package.name, package.version) in direct or (package.name, None) in direct
+        return packages
@@ -1,9 +1,9 @@
 """Parser for package-lock.json files (npm)."""
 
-import json
 from pathlib import Path
 
-from ..models import PackageHash
+from ... import jsonio
+from ..models import LockedPackage, PackageHash, prune_unreachable
 
 
 class PackageLockParser:
@@ -20,6 +20,10 @@ class PackageLockParser:
     }
 
     v1 uses "dependencies" instead of "packages".
+
+    Dependencies of each entry are resolved like Node.js does, from the
+    closest node_modules directory up to the root one. Dev packages are
+    marked with "dev": true.
     """
 
     name = "npm-package-lock"
@@ -41,7 +45,7 @@ class PackageLockParser:
             List of PackageHash objects (one per package@version).
         """
         with lock_file_path.open("r") as f:
-            data = json.load(f)
+            data = jsonio.load(f)
 
         hashes: list[PackageHash] = []
         seen: set[tuple[str, str]] = set()  # (name, version)
@@ -90,6 +94,108 @@ class PackageLockParser:
 
         return hashes
 
+    def parse_packages(self, lock_file_path: Path) -> list[LockedPackage]:
+        """Parse package-lock.json and extract packages with their dependencies.
+
+        The root package and workspace members (v2/v3 entries outside
+        node_modules) are the project; their dependencies and optional
+        dependencies are the direct ones. Dev packages are left out. For v1
+        lockfiles, the direct dependencies are read from package.json.
+
+        Args:
+            lock_file_path: Path to package-lock.json file
+
+        Returns:
+            List of LockedPackage objects (one per node_modules entry).
+        """
+        with lock_file_path.open("r") as f:
+            data = jsonio.load(f)
+
+        packages = data.get("packages", {})
+        if not packages:
+            found: list[LockedPackage] = []
+            self._collect_dependencies(data.get("dependencies", {}), [], found)
+            required = read_package_json_dependencies(lock_file_path.parent / "package.json")
+            for package in found:
+                package.direct = package.name in required
+            return prune_unreachable(found, self.ecosystem)
+
+        result: list[LockedPackage] = []
+        direct: set[tuple[str, str]] = set()
+        for pkg_path, pkg_data in packages.items():
+            if not isinstance(pkg_data, dict) or pkg_data.get("link") or pkg_data.get("dev"):
+                continue
+
+            dependencies: list[tuple[str, str | None]] = []
+            for dep_name in _runtime_dependency_names(pkg_data):
+                resolved = self._resolve(packages, pkg_path, dep_name)
+                if resolved is not None:
+                    dependencies.append(resolved)
+
+            name = self._extract_package_name(pkg_path) if pkg_path else None
+            if name is None:
+                # Root package or workspace member
+                direct.update((dep_name, dep_version) for dep_name, dep_version in dependencies if dep_version)
+                continue
+
+            version = pkg_data.get("version")
+            if version:
+                result.append(
+                    LockedPackage(name=pkg_data.get("name", name), version=version, dependencies=dependencies)
+                )
+
+        for package in result:
+            package.direct = (package.name, package.version) in direct
+        return result
+
+    def _resolve(self, packages: dict, pkg_path: str, dep_name: str) -> tuple[str, str | None] | None:
+        """Resolve a dependency of the entry at pkg_path to (name, version).
+
+        Looks in pkg_path/node_modules, then in the node_modules directories
+        above it. Returns None for unresolved dependencies and for links to
+        workspace members.
+        """
+        base = pkg_path
+        while True:
+            candidate = f"{base}/node_modules/{dep_name}" if base else f"node_modules/{dep_name}"
+            entry = packages.get(candidate)
+            if isinstance(entry, dict):
+                if entry.get("link") or not entry.get("version"):
+                    return None
+                return entry.get("name", dep_name), entry["version"]
+            if not base:
+                return None
+            # Step up to the node_modules directory containing this entry
+            parent = base.rfind("/node_modules/")
+            base = base[:parent] if parent != -1 else ""
+
+    def _collect_dependencies(self, dependencies: dict, scopes: list[dict], found: list[LockedPackage]) -> None:
+        """Collect v1 format dependencies recursively.
+
+        "requires" are resolved in the entry's own nested dependencies, then
+        in the enclosing scopes up to the top level.
+        """
+        scopes = [dependencies, *scopes]
+        for name, pkg_data in dependencies.items():
+            if not isinstance(pkg_data, dict) or pkg_data.get("dev"):
+                continue
+            version = pkg_data.get("version")
+            if not version:
+                continue
+
+            nested = pkg_data.get("dependencies", {})
+            resolved: list[tuple[str, str | None]] = []
+            for dep_name in pkg_data.get("requires", {}):
+                for scope in [nested, *scopes]:
+                    dep_data = scope.get(dep_name)
+                    if isinstance(dep_data, dict):
+                        resolved.append((dep_name, dep_data.get("version")))
+                        break
+            found.append(LockedPackage(name=name, version=version, dependencies=resolved))
+
+            if nested:
+                self._collect_dependencies(nested, scopes, found)
+
     def _extract_package_name(self, pkg_path: str) -> str | None:
         """Extract package name from node_modules path."""
         # Handle paths like "node_modules/@scope/name" or "node_modules/name"
@@ -142,3 +248,39 @@ class PackageLockParser:
                 hashes.extend(self._parse_dependencies(nested, seen))
 
         return hashes
+
+
+def _runtime_dependency_names(pkg_data: dict) -> list[str]:
+    """Get the names of the dependencies and optional dependencies of a package entry."""
+    names: list[str] = []
+    for field in ("dependencies", "optionalDependencies"):
+        dependencies = pkg_data.get(field)
+        if isinstance(dependencies, dict):
+            names.extend(name for name in dependencies if name not in names)
+    return names
+
+
+def read_package_json_dependencies(package_json_path: Path) -> dict[str, str]:
+    """Read the dependencies and optional dependencies from package.json.
+
+    Args:
+        package_json_path: Path to package.json
+
+    Returns:
+        Mapping of package name to version range; empty if the file is
+        missing or unreadable.
+    """
+    try:
+        with package_json_path.open("r") as f:
+            manifest = jsonio.load(f)
+    except (OSError, jsonio.JSONDecodeError):
+        return {}
+    if not isinstance(manifest, dict):
+        return {}
+
+    required: dict[str, str] = {}
+    for field in ("dependencies", "optionalDependencies"):
+        dependencies = manifest.get(field)
+        if isinstance(dependencies, dict):
+            required.update({name: str(spec) for name, spec in dependencies.items()})
+    return required
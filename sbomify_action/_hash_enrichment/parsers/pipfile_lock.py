@@ -1,9 +1,9 @@
 """Parser for Pipfile.lock files (Python Pipenv)."""
 
-import json
 from pathlib import Path
 
-from ..models import PackageHash
+from ... import jsonio
+from ..models import LockedPackage, PackageHash
 
 
 class PipfileLockParser:
@@ -41,7 +41,7 @@ class PipfileLockParser:
             List of PackageHash objects (one per package).
         """
         with lock_file_path.open("r") as f:
-            data = json.load(f)
+            data = jsonio.load(f)
 
         hashes: list[PackageHash] = []
         seen_packages: set[tuple[str, str]] = set()  # (name, version)
@@ -85,6 +85,31 @@ class PipfileLockParser:
 
         return hashes
 
+    def parse_packages(self, lock_file_path: Path) -> list[LockedPackage]:
+        """Parse Pipfile.lock and extract the packages of the default section.
+
+        Pipfile.lock is flat: it records neither dependencies between packages
+        nor which ones the Pipfile requires, so every default package is
+        treated as a direct dependency. The develop section is left out.
+
+        Args:
+            lock_file_path: Path to Pipfile.lock file
+
+        Returns:
+            List of LockedPackage objects without dependencies.
+        """
+        with lock_file_path.open("r") as f:
+            data = jsonio.load(f)
+
+        packages: list[LockedPackage] = []
+        for name, pkg_data in data.get("default", {}).items():
+            if not isinstance(pkg_data, dict):
+                continue
+            version = pkg_data.get("version", "").lstrip("=")
+            if version:
+                packages.append(LockedPackage(name=name, version=version, direct=True))
+        return packages
+
     @staticmethod
     def _select_best_hash(hash_strings: list[str]) -> str | None:
         """Select the best hash from available hashes.
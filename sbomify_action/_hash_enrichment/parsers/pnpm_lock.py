@@ -4,7 +4,7 @@ from pathlib import Path
 
 import yaml
 
-from ..models import PackageHash
+from ..models import LockedPackage, PackageHash, prune_unreachable
 
 
 class PnpmLockParser:
@@ -26,6 +26,10 @@ class PnpmLockParser:
     snapshots:
       package@version:
         ...
+
+    Dependencies map names to versions in the packages (v6-v8) or snapshots
+    (v9+) entries, and the project's own in importers (or at the top level
+    for single-project lockfiles before v9).
     """
 
     name = "pnpm-lock"
@@ -66,6 +70,80 @@ class PnpmLockParser:
 
         return hashes
 
+    def parse_packages(self, lock_file_path: Path) -> list[LockedPackage]:
+        """Parse pnpm-lock.yaml and extract packages with their dependencies.
+
+        The dependencies and optional dependencies of the importers are the
+        direct ones. Dev packages are left out: v6-v8 mark them with
+        dev: true, and for v9+ packages not reachable from the direct
+        dependencies are dropped.
+
+        Args:
+            lock_file_path: Path to pnpm-lock.yaml file
+
+        Returns:
+            List of LockedPackage objects (one per package or snapshot entry).
+        """
+        with lock_file_path.open("r") as f:
+            data = yaml.safe_load(f)
+
+        if not isinstance(data, dict):
+            return []
+
+        snapshots = data.get("snapshots")
+        entries = snapshots if isinstance(snapshots, dict) and snapshots else data.get("packages") or {}
+
+        packages: list[LockedPackage] = []
+        for pkg_key, pkg_data in entries.items():
+            name, version = self._parse_package_key(pkg_key)
+            if not name or not version:
+                continue
+            if not isinstance(pkg_data, dict):
+                pkg_data = {}
+            if pkg_data.get("dev") is True:
+                continue
+            packages.append(LockedPackage(name=name, version=version, dependencies=self._dependency_refs(pkg_data)))
+
+        importers = data.get("importers")
+        projects = list(importers.values()) if isinstance(importers, dict) else [data]
+        direct: set[tuple[str, str | None]] = set()
+        for project in projects:
+            if isinstance(project, dict):
+                direct.update(self._dependency_refs(project))
+
+        for package in packages:
+            package.direct = (package.name, package.version) in direct
+        return prune_unreachable(packages, self.ecosystem)
+
+    def _dependency_refs(self, entry: dict) -> list[tuple[str, str | None]]:
+        """Get the (name, version) of the dependencies and optional dependencies of an entry.
+
+        Importers give {specifier, version} mappings (v6+) or plain versions,
+        and packages plain versions, possibly with a peer dependency suffix
+        or as an alias ("name@version"). Links to local packages are skipped.
+        """
+        refs: list[tuple[str, str | None]] = []
+        for field in ("dependencies", "optionalDependencies"):
+            dependencies = entry.get(field)
+            if not isinstance(dependencies, dict):
+                continue
+            for dep_name, reference in dependencies.items():
+                if isinstance(reference, dict):
+                    reference = reference.get("version")
+                if reference is None:
+                    continue
+                reference = str(reference)
+                if reference.startswith(("link:", "file:")):
+                    continue
+                version = reference.split("(")[0]
+                if "@" in version.lstrip("/@"):
+                    alias_name, alias_version = self._parse_package_key(version)
+                    if alias_name and alias_version:
+                        refs.append((alias_name, alias_version))
+                    continue
+                refs.append((str(dep_name), version))
+        return refs
+
     def _parse_packages(self, packages: dict, seen: set[tuple[str, str]] | None = None) -> list[PackageHash]:
         """Parse packages section.
 
@@ -1,10 +1,14 @@
 """Parser for poetry.lock files (Python Poetry)."""
 
+import re
 from pathlib import Path
 
 import tomllib
 
-from ..models import PackageHash
+from ..models import LockedPackage, PackageHash, normalize_package_name, prune_unreachable
+
+# Distribution name at the start of a PEP 508 requirement
+_REQUIREMENT_NAME = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
 
 
 class PoetryLockParser:
@@ -22,6 +26,10 @@ class PoetryLockParser:
     Or in newer versions:
     [package.files]
     "django-5.1.1-py3-none-any.whl" = "sha256:abc123..."
+
+    Dependencies are in [package.dependencies] (name -> constraint), and
+    dev packages are marked by category = "dev" (Poetry < 1.5) or by
+    groups without "main" (Poetry 2).
     """
 
     name = "poetry-lock"
@@ -94,6 +102,66 @@ class PoetryLockParser:
 
         return hashes
 
+    def parse_packages(self, lock_file_path: Path) -> list[LockedPackage]:
+        """Parse poetry.lock and extract packages with their dependencies.
+
+        The lockfile doesn't record the project's own requirements, so they
+        are read from pyproject.toml next to it when present. Packages only
+        reachable from other dependency groups are then left out.
+
+        Args:
+            lock_file_path: Path to poetry.lock file
+
+        Returns:
+            List of LockedPackage objects, excluding dev packages.
+        """
+        with lock_file_path.open("rb") as f:
+            data = tomllib.load(f)
+
+        packages: list[LockedPackage] = []
+        for pkg in data.get("package", []):
+            name = pkg.get("name")
+            version = pkg.get("version")
+            if not name or not version:
+                continue
+
+            groups = pkg.get("groups")
+            if pkg.get("category") == "dev" or (isinstance(groups, list) and "main" not in groups):
+                continue
+
+            dependencies = pkg.get("dependencies", {})
+            packages.append(
+                LockedPackage(
+                    name=name,
+                    version=version,
+                    dependencies=[(dep, None) for dep in dependencies] if isinstance(dependencies, dict) else [],
+                )
+            )
+
+        direct = self._project_requirements(lock_file_path.parent / "pyproject.toml")
+        if direct:
+            for package in packages:
+                package.direct = normalize_package_name(package.name, self.ecosystem) in direct
+        return prune_unreachable(packages, self.ecosystem)
+
+    def _project_requirements(self, pyproject_path: Path) -> set[str]:
+        """Read the normalized names of the main requirements from pyproject.toml."""
+        try:
+            with pyproject_path.open("rb") as f:
+                pyproject = tomllib.load(f)
+        except (OSError, tomllib.TOMLDecodeError):
+            return set()
+
+        names: set[str] = set()
+        poetry_dependencies = pyproject.get("tool", {}).get("poetry", {}).get("dependencies", {})
+        if isinstance(poetry_dependencies, dict):
+            names.update(name for name in poetry_dependencies if name.lower() != "python")
+        for requirement in pyproject.get("project", {}).get("dependencies", []):
+            match = _REQUIREMENT_NAME.match(requirement) if isinstance(requirement, str) else None
+            if match:
+                names.add(match.group(1))
+        return {normalize_package_name(name, self.ecosystem) for name in names}
+
     def _select_best_file_hash(self, file_entries: list[tuple[str, str]]) -> tuple[str, str] | None:
         """Select the best file hash from available entries.
 
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import yaml
 
-from ..models import HashAlgorithm, PackageHash
+from ..models import HashAlgorithm, LockedPackage, PackageHash
 
 
 class PubspecLockParser:
@@ -71,3 +71,33 @@ class PubspecLockParser:
                     )
 
         return hashes
+
+    def parse_packages(self, lock_file_path: Path) -> list[LockedPackage]:
+        """Parse pubspec.lock and extract the locked packages.
+
+        pubspec.lock records whether a package is a direct ("direct main",
+        "direct overridden") or transitive dependency, but not which package
+        requires a transitive one. "direct dev" packages are left out, as
+        are SDK and path packages, which aren't versioned on their own.
+
+        Args:
+            lock_file_path: Path to pubspec.lock file
+
+        Returns:
+            List of LockedPackage objects without dependencies.
+        """
+        with lock_file_path.open("r") as f:
+            data = yaml.safe_load(f)
+
+        packages: list[LockedPackage] = []
+        for name, pkg_data in (data or {}).get("packages", {}).items():
+            if not isinstance(pkg_data, dict) or pkg_data.get("source") in ("sdk", "path"):
+                continue
+            dependency = str(pkg_data.get("dependency", ""))
+            version = pkg_data.get("version")
+            if dependency == "direct dev" or not version:
+                continue
+            packages.append(
+                LockedPackage(name=name, version=str(version).strip('"'), direct=dependency.startswith("direct"))
+            )
+        return packages
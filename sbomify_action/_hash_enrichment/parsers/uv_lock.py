@@ -4,7 +4,7 @@ from pathlib import Path
 
 import tomllib
 
-from ..models import PackageHash
+from ..models import LockedPackage, PackageHash, prune_unreachable
 
 
 class UvLockParser:
@@ -14,6 +14,8 @@ class UvLockParser:
     - name, version
     - sdist = { hash = "sha256:...", ... }
     - wheels = [{ hash = "sha256:...", ... }, ...]
+    - dependencies = [{ name = "...", extra = [...] }, ...]
+    - optional-dependencies / dev-dependencies tables keyed by extra/group
     """
 
     name = "uv-lock"
@@ -81,6 +83,72 @@ class UvLockParser:
 
         return hashes
 
+    def parse_packages(self, lock_file_path: Path) -> list[LockedPackage]:
+        """Parse uv.lock and extract packages with their dependencies.
+
+        The project and workspace members are the packages with an editable
+        or virtual source. Their dependencies and optional dependencies are
+        the direct ones; dev-dependencies are left out, along with the
+        packages only they require. Optional dependencies of other packages
+        are followed for the extras something requests.
+
+        Args:
+            lock_file_path: Path to uv.lock file
+
+        Returns:
+            List of LockedPackage objects, excluding the project itself.
+        """
+        with lock_file_path.open("rb") as f:
+            data = tomllib.load(f)
+
+        entries = [pkg for pkg in data.get("package", []) if isinstance(pkg, dict) and pkg.get("name")]
+
+        # Extras requested anywhere: name -> extra names
+        requested_extras: dict[str, set[str]] = {}
+        for pkg in entries:
+            for dep in self._dependency_entries(pkg, include_optional=self._is_project(pkg)):
+                requested_extras.setdefault(dep["name"], set()).update(dep.get("extra", []))
+
+        packages: list[LockedPackage] = []
+        direct: set[str] = set()
+        for pkg in entries:
+            if self._is_project(pkg):
+                direct.update(dep["name"] for dep in self._dependency_entries(pkg, include_optional=True))
+                continue
+
+            version = pkg.get("version")
+            if not version:
+                continue
+
+            dependencies = [(dep["name"], dep.get("version")) for dep in self._dependency_entries(pkg)]
+            optional = pkg.get("optional-dependencies", {})
+            for extra in sorted(requested_extras.get(pkg["name"], ())):
+                dependencies.extend(
+                    (dep["name"], dep.get("version"))
+                    for dep in optional.get(extra, [])
+                    if isinstance(dep, dict) and dep.get("name")
+                )
+            packages.append(LockedPackage(name=pkg["name"], version=version, dependencies=dependencies))
+
+        for package in packages:
+            package.direct = package.name in direct
+        return prune_unreachable(packages, self.ecosystem)
+
+    @staticmethod
+    def _is_project(pkg: dict) -> bool:
+        """Check if a package entry is the project or a workspace member."""
+        source = pkg.get("source", {})
+        return isinstance(source, dict) and ("editable" in source or "virtual" in source)
+
+    @staticmethod
+    def _dependency_entries(pkg: dict, include_optional: bool = False) -> list[dict]:
+        """Get the dependency entries of a package, optionally with all of its optional ones."""
+        entries = list(pkg.get("dependencies", []))
+        if include_optional:
+            for extra_entries in pkg.get("optional-dependencies", {}).values():
+                entries.extend(extra_entries)
+        return [dep for dep in entries if isinstance(dep, dict) and dep.get("name")]
+
     def _select_best_wheel_hash(self, wheels: list) -> str | None:
         """Select the best wheel hash from available wheels.
 
@@ -2,8 +2,20 @@
 
 import re
 from pathlib import Path
+from typing import NamedTuple
 
-from ..models import PackageHash
+from ..models import LockedPackage, PackageHash, prune_unreachable
+from .package_lock import read_package_json_dependencies
+
+
+class _YarnEntry(NamedTuple):
+    """Entry of a yarn.lock file, before resolving its dependencies."""
+
+    specifiers: list[str]  # Header specifiers, e.g. ["lodash@^4.17.0", "lodash@^4.17.21"]
+    name: str
+    version: str | None
+    dependencies: dict[str, str]  # name -> range
+    workspace: bool = False
 
 
 class YarnLockParser:
@@ -20,6 +32,9 @@ class YarnLockParser:
       version: 1.2.3
       resolution: "package-name@npm:1.2.3"
       checksum: sha512-base64...
+
+    Both formats list each package's dependencies by name and range, which
+    resolve to the entry whose header contains "name@range".
     """
 
     name = "yarn-lock"
@@ -48,6 +63,128 @@ class YarnLockParser:
             # Yarn v1 custom format
             return self._parse_v1_format(content)
 
+    def parse_packages(self, lock_file_path: Path) -> list[LockedPackage]:
+        """Parse yarn.lock and extract packages with their dependencies.
+
+        yarn.lock doesn't tell dev packages apart, so the direct dependencies
+        are read from package.json next to it (dependencies and
+        optionalDependencies) and packages not reachable from them are left
+        out. Without package.json, the dependencies of Berry workspace
+        entries are the direct ones.
+
+        Args:
+            lock_file_path: Path to yarn.lock file
+
+        Returns:
+            List of LockedPackage objects, excluding workspaces.
+        """
+        content = lock_file_path.read_text()
+        if content.startswith("# This file is generated by running"):
+            entries = self._berry_entries(content)
+        else:
+            entries = self._v1_entries(content)
+
+        # Header specifier (name@range) -> (name, version)
+        resolved: dict[str, tuple[str, str]] = {}
+        for entry in entries:
+            if entry.version:
+                for specifier in entry.specifiers:
+                    resolved[specifier] = (entry.name, entry.version)
+
+        def resolve(dep_name: str, dep_range: str) -> tuple[str, str] | None:
+            return resolved.get(f"{dep_name}@{dep_range}") or resolved.get(f"{dep_name}@npm:{dep_range}")
+
+        packages: list[LockedPackage] = []
+        workspace_direct: set[tuple[str, str]] = set()
+        for entry in entries:
+            refs = [ref for ref in (resolve(dep, dep_range) for dep, dep_range in entry.dependencies.items()) if ref]
+            if entry.workspace:
+                workspace_direct.update(refs)
+            elif entry.version:
+                packages.append(LockedPackage(name=entry.name, version=entry.version, dependencies=list(refs)))
+
+        required = read_package_json_dependencies(lock_file_path.parent / "package.json")
+        if required:
+            direct = {ref for ref in (resolve(dep, dep_range) for dep, dep_range in required.items()) if ref}
+        else:
+            direct = workspace_direct
+
+        for package in packages:
+            package.direct = (package.name, package.version) in direct
+        return prune_unreachable(packages, self.ecosystem)
+
+    def _v1_entries(self, content: str) -> list[_YarnEntry]:
+        """Parse Yarn v1 entries with their dependencies."""
+        entries: list[_YarnEntry] = []
+        specifiers: list[str] = []
+        name: str | None = None
+        version: str | None = None
+        dependencies: dict[str, str] = {}
+        in_dependencies = False
+
+        def _add_entry() -> None:
+            if name:
+                entries.append(_YarnEntry(specifiers, name, version, dependencies))
+
+        for line in content.split("\n"):
+            if not line.strip() or line.startswith("#"):
+                continue
+
+            # Entry header (e.g., '"@scope/name@^1.0.0", "@scope/name@^1.1.0":')
+            if not line.startswith(" "):
+                _add_entry()
+                header = line.strip().rstrip(":")
+                specifiers = [spec.strip().strip('"') for spec in header.split(",") if spec.strip()]
+                name = self._extract_name_from_header(specifiers[0]) if specifiers else None
+                version = None
+                dependencies = {}
+                in_dependencies = False
+                continue
+
+            stripped = line.strip()
+            if line.startswith("    ") and in_dependencies:
+                # Dependency line (e.g., '"@scope/dep" "^1.0.0"' or 'dep "^1.0.0"')
+                dep_name, _, dep_range = stripped.partition(" ")
+                dependencies[dep_name.strip('"')] = dep_range.strip().strip('"')
+            else:
+                in_dependencies = stripped in ("dependencies:", "optionalDependencies:")
+                if stripped.startswith('version "'):
+                    version = stripped[len("version ") :].strip('"')
+
+        _add_entry()
+        return entries
+
+    def _berry_entries(self, content: str) -> list[_YarnEntry]:
+        """Parse Yarn v2+ (Berry) entries with their dependencies."""
+        import yaml
+
+        try:
+            data = yaml.safe_load(content)
+        except yaml.YAMLError:
+            return []
+        if not isinstance(data, dict):
+            return []
+
+        entries: list[_YarnEntry] = []
+        for key, pkg_data in data.items():
+            if not isinstance(pkg_data, dict) or key.startswith("__"):
+                continue
+            name = self._extract_name_from_berry_key(key)
+            if not name:
+                continue
+
+            specifiers = [spec.strip() for spec in key.split(",") if spec.strip()]
+            version = pkg_data.get("version")
+            dependencies = {}
+            for field in ("dependencies", "optionalDependencies"):
+                if isinstance(pkg_data.get(field), dict):
+                    dependencies.update({str(dep): str(dep_range) for dep, dep_range in pkg_data[field].items()})
+            workspace = "@workspace:" in str(pkg_data.get("resolution", ""))
+            entries.append(
+                _YarnEntry(specifiers, name, str(version) if version is not None else None, dependencies, workspace)
+            )
+        return entries
+
     def _parse_v1_format(self, content: str) -> list[PackageHash]:
         """Parse Yarn v1 lockfile format.
 
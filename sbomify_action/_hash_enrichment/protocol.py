@@ -3,7 +3,7 @@
 from pathlib import Path
 from typing import Protocol
 
-from .models import PackageHash
+from .models import LockedPackage, PackageHash
 
 
 class LockfileHashParser(Protocol):
@@ -24,6 +24,10 @@ class LockfileHashParser(Protocol):
             def parse(self, lock_file_path: Path) -> list[PackageHash]:
                 # Parse uv.lock and return hashes
                 ...
+
+            def parse_packages(self, lock_file_path: Path) -> list[LockedPackage]:
+                # Parse uv.lock and return packages with their dependencies
+                ...
     """
 
     @property
@@ -82,3 +86,25 @@ class LockfileHashParser(Protocol):
             FileProcessingError: If lockfile cannot be read or parsed.
         """
         ...
+
+    def parse_packages(self, lock_file_path: Path) -> list[LockedPackage]:
+        """Parse lockfile and extract the locked packages and their dependencies.
+
+        Used to generate SBOMs from the lockfile alone. Implementations should:
+        1. Skip the locked project itself and workspace members, marking the
+           packages they require as direct
+        2. Skip development-only packages where the lockfile tells them apart
+
+        A package locked at several places (e.g. nested node_modules) may be
+        returned more than once; callers merge entries with equal name and version.
+
+        Args:
+            lock_file_path: Full path to the lockfile
+
+        Returns:
+            List of LockedPackage objects. Empty list if no packages found.
+
+        Raises:
+            FileProcessingError: If lockfile cannot be read or parsed.
+        """
+        ...
@@ -4,13 +4,15 @@ This processor handles the creation or retrieval of product releases
 in the sbomify platform and associates (tags) uploaded SBOMs with those releases.
 """
 
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 from sbomify_action.exceptions import APIError
 from sbomify_action.logging_config import logger
 
 from ..protocol import ProcessorInput
 from ..releases_api import (
+    TAG_WORKERS,
     check_release_exists,
     create_release,
     get_release_details,
@@ -83,35 +85,23 @@ class SbomifyReleasesProcessor:
                 error_message="API base URL and token are required for release processing",
             )
 
-        processed = 0
-        failed = 0
-        release_ids: List[str] = []
-        errors: List[str] = []
+        # Releases are independent, so several are tagged concurrently
+        releases = input.product_releases
 
-        for release_spec in input.product_releases:
-            try:
-                product_id, version = release_spec.split(":", 1)
-                logger.info(f"Processing release {version} for product {product_id}")
-
-                release_id = self._process_single_release(
-                    api_base_url=api_base_url,
-                    token=token,
-                    sbom_id=input.sbom_id,
-                    product_id=product_id,
-                    version=version,
-                )
-
-                if release_id:
-                    release_ids.append(release_id)
-                    processed += 1
-                else:
-                    failed += 1
-                    errors.append(f"Could not get release ID for {product_id}:{version}")
-
-            except Exception as e:
-                failed += 1
-                errors.append(f"Error processing {release_spec}: {str(e)}")
-                logger.error(f"Error processing release {release_spec}: {e}")
+        def process_spec(release_spec: str) -> Tuple[Optional[str], Optional[str]]:
+            return self._process_release_spec(api_base_url, token, input.sbom_id, release_spec)
+
+        if len(releases) > 1:
+            max_workers = min(TAG_WORKERS, len(releases))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="release") as executor:
+                outcomes = list(executor.map(process_spec, releases))
+        else:
+            outcomes = [process_spec(release_spec) for release_spec in releases]
+
+        release_ids: List[str] = [release_id for release_id, _ in outcomes if release_id]
+        errors: List[str] = [error for _, error in outcomes if error]
+        processed = len(release_ids)
+        failed = len(errors)
 
         if failed > 0 and processed == 0:
             return ProcessorResult.failure_result(
@@ -137,6 +127,34 @@ class SbomifyReleasesProcessor:
             },
         )
 
+    def _process_release_spec(
+        self, api_base_url: str, token: str, sbom_id: str, release_spec: str
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Process one "product_id:version" release spec.
+
+        Returns:
+            Tuple of (release ID, None) on success, or (None, error message) on failure
+        """
+        try:
+            product_id, version = release_spec.split(":", 1)
+            logger.info(f"Processing release {version} for product {product_id}")
+
+            release_id = self._process_single_release(
+                api_base_url=api_base_url,
+                token=token,
+                sbom_id=sbom_id,
+                product_id=product_id,
+                version=version,
+            )
+        except Exception as e:
+            logger.error(f"Error processing release {release_spec}: {e}")
+            return None, f"Error processing {release_spec}: {str(e)}"
+
+        if not release_id:
+            return None, f"Could not get release ID for {product_id}:{version}"
+        return release_id, None
+
     def _process_single_release(
         self,
         api_base_url: str,
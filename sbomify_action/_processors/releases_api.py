@@ -2,9 +2,14 @@
 
 This module provides reusable functions for interacting with the sbomify
 releases API. Used by both cli/main.py and the ReleasesProcessor.
+
+Release lookups are served from a per-run index: each product's release
+list is fetched once, and releases created during the run are added to it.
 """
 
-from typing import Any, Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import requests
 
@@ -12,6 +17,34 @@ from sbomify_action.exceptions import APIError
 from sbomify_action.http_client import get_default_headers
 from sbomify_action.logging_config import logger
 
+from .._upload.retry import RetryPolicy, send_with_retries
+
+# SBOM IDs sent per bulk tagging request
+TAG_BATCH_SIZE = 100
+
+# Concurrent tagging requests when the bulk endpoint isn't available
+TAG_WORKERS = 8
+
+# Statuses meaning the API has no bulk tagging endpoint. A 404 isn't one of
+# them: it's also returned for an unknown release.
+_BULK_UNSUPPORTED_STATUS_CODES = frozenset({405, 501})
+
+# API base URLs known not to support bulk tagging, so they aren't probed again
+_bulk_tagging_unsupported: Set[str] = set()
+
+# Safety limit against infinite pagination of release lists
+MAX_RELEASE_PAGES = 100
+
+# Release lists per (API base URL, token, product ID), fetched once per run.
+# Releases created by create_release are added in place.
+_release_index: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+
+# Guards _release_index and _release_index_locks
+_release_index_lock = threading.Lock()
+
+# One lock per product, so concurrent lookups of a product fetch its list once
+_release_index_locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+
 
 def _safe_json_dict(response: requests.Response) -> Optional[Dict[str, Any]]:
     """
@@ -35,28 +68,18 @@ def _safe_json_dict(response: requests.Response) -> Optional[Dict[str, Any]]:
     return None
 
 
-def _fetch_releases(api_base_url: str, token: str, params: Dict[str, str], error_context: str) -> List[Dict[str, Any]]:
+def _fetch_release_page(
+    url: str, headers: Dict[str, str], params: Dict[str, Any], error_context: str
+) -> Optional[Dict[str, Any]]:
     """
-    Fetch releases from the API with the given query parameters.
-
-    This is an internal helper that handles the common request/response
-    logic for all release-fetching operations.
-
-    Args:
-        api_base_url: Base URL for the sbomify API
-        token: API authentication token
-        params: Query parameters for the request
-        error_context: Context string for error messages (e.g., "check release existence")
+    Fetch one page of releases.
 
     Returns:
-        List of release dicts from the API
+        The response body, or None if nothing was found or the body isn't a dict
 
     Raises:
         APIError: If API call fails
     """
-    url = api_base_url + "/api/v1/releases"
-    headers = get_default_headers(token)
-
     try:
         response = requests.get(url, headers=headers, params=params, timeout=60)
     except requests.exceptions.ConnectionError:
@@ -65,15 +88,9 @@ def _fetch_releases(api_base_url: str, token: str, params: Dict[str, str], error
         raise APIError("API request timed out")
 
     if response.status_code == 404:
-        return []
+        return None
     elif response.ok:
-        data = _safe_json_dict(response)
-        if data is None:
-            return []
-        items = data.get("items")
-        if not isinstance(items, list):
-            return []
-        return items
+        return _safe_json_dict(response)
     else:
         err_msg = f"Failed to {error_context}. [{response.status_code}]"
         if response.headers.get("content-type") == "application/json":
@@ -83,6 +100,95 @@ def _fetch_releases(api_base_url: str, token: str, params: Dict[str, str], error
         raise APIError(err_msg)
 
 
+def _fetch_releases(api_base_url: str, token: str, params: Dict[str, str], error_context: str) -> List[Dict[str, Any]]:
+    """
+    Fetch releases from the API with the given query parameters.
+
+    This is an internal helper that handles the common request/response
+    logic for all release-fetching operations. When the list is paginated,
+    the 'next' links are followed (up to MAX_RELEASE_PAGES pages).
+
+    Args:
+        api_base_url: Base URL for the sbomify API
+        token: API authentication token
+        params: Query parameters for the request
+        error_context: Context string for error messages (e.g., "check release existence")
+
+    Returns:
+        List of release dicts from the API
+
+    Raises:
+        APIError: If API call fails
+    """
+    url = api_base_url + "/api/v1/releases"
+    headers = get_default_headers(token)
+
+    releases: List[Dict[str, Any]] = []
+    data = _fetch_release_page(url, headers, params, error_context)
+    page = 1
+    while data is not None:
+        items = data.get("items")
+        if not isinstance(items, list):
+            break
+        releases.extend(items)
+        if not data.get("next"):
+            break
+        if page >= MAX_RELEASE_PAGES:
+            logger.warning(
+                f"Pagination safety limit reached ({MAX_RELEASE_PAGES} pages). "
+                f"Release list may be incomplete ({len(releases)} releases fetched)."
+            )
+            break
+        page += 1
+        data = _fetch_release_page(url, headers, {**params, "page": page}, error_context)
+    return releases
+
+
+def _product_releases(api_base_url: str, token: str, product_id: str, error_context: str) -> List[Dict[str, Any]]:
+    """
+    Get the releases of a product from the release index.
+
+    The product's release list is fetched on first use, following its
+    pages, and served from memory afterwards.
+
+    Raises:
+        APIError: If API call fails
+    """
+    key = (api_base_url, token, product_id)
+    with _release_index_lock:
+        product_lock = _release_index_locks.setdefault(key, threading.Lock())
+    with product_lock:
+        with _release_index_lock:
+            releases = _release_index.get(key)
+        if releases is None:
+            releases = _fetch_releases(api_base_url, token, {"product_id": product_id}, error_context)
+            with _release_index_lock:
+                _release_index[key] = releases
+    with _release_index_lock:
+        return list(releases)
+
+
+def _add_to_release_index(api_base_url: str, token: str, product_id: str, release: Dict[str, Any]) -> None:
+    """Add a created release to the index of its product, if that was fetched already."""
+    with _release_index_lock:
+        releases = _release_index.get((api_base_url, token, product_id))
+        if releases is not None:
+            releases.append(release)
+
+
+def _forget_release_index(api_base_url: str, token: str, product_id: str) -> None:
+    """Drop the index of a product, so the next lookup fetches its release list again."""
+    with _release_index_lock:
+        _release_index.pop((api_base_url, token, product_id), None)
+
+
+def clear_release_index() -> None:
+    """Forget the release lists fetched during this run (mainly for tests)."""
+    with _release_index_lock:
+        _release_index.clear()
+        _release_index_locks.clear()
+
+
 def check_release_exists(api_base_url: str, token: str, product_id: str, version: str) -> bool:
     """
     Check if a release exists for a product.
@@ -99,8 +205,7 @@ def check_release_exists(api_base_url: str, token: str, product_id: str, version
     Raises:
         APIError: If API call fails
     """
-    params = {"product_id": product_id, "version": version}
-    releases = _fetch_releases(api_base_url, token, params, "check release existence")
+    releases = _product_releases(api_base_url, token, product_id, "check release existence")
     return any(release.get("version") == version for release in releases)
 
 
@@ -120,8 +225,7 @@ def get_release_id(api_base_url: str, token: str, product_id: str, version: str)
     Raises:
         APIError: If API call fails
     """
-    params = {"product_id": product_id, "version": version}
-    releases = _fetch_releases(api_base_url, token, params, "get release ID")
+    releases = _product_releases(api_base_url, token, product_id, "get release ID")
     for release in releases:
         if release.get("version") == version:
             return release.get("id")
@@ -148,9 +252,7 @@ def get_release_id_by_name(api_base_url: str, token: str, product_id: str, name:
     Raises:
         APIError: If API call fails
     """
-    # Query by product_id only, don't filter by version
-    params = {"product_id": product_id}
-    releases = _fetch_releases(api_base_url, token, params, "get release ID by name")
+    releases = _product_releases(api_base_url, token, product_id, "get release ID by name")
     for release in releases:
         if release.get("name") == name:
             return release.get("id")
@@ -173,8 +275,7 @@ def get_release_details(api_base_url: str, token: str, product_id: str, version:
     Raises:
         APIError: If API call fails
     """
-    params = {"product_id": product_id, "version": version}
-    releases = _fetch_releases(api_base_url, token, params, "get release details")
+    releases = _product_releases(api_base_url, token, product_id, "get release details")
     for release in releases:
         if release.get("version") == version:
             return release
@@ -225,6 +326,8 @@ def create_release(api_base_url: str, token: str, product_id: str, version: str)
                 logger.info(
                     f"Release '{version}' for product {product_id} already exists, retrieving existing release ID"
                 )
+                # Someone else created it since the index was fetched
+                _forget_release_index(api_base_url, token, product_id)
                 # Search by name since the API enforces uniqueness on the name field
                 existing_id = get_release_id_by_name(api_base_url, token, product_id, version)
                 if existing_id:
@@ -253,19 +356,46 @@ def create_release(api_base_url: str, token: str, product_id: str, version: str)
     if data is not None:
         release_id = data.get("id")
         if release_id is not None:
+            _add_to_release_index(api_base_url, token, product_id, {**payload, **data})
             return release_id
     raise APIError("Invalid response format when creating release")
 
 
-def tag_sbom_with_release(api_base_url: str, token: str, sbom_id: str, release_id: str) -> None:
+def _post_with_retries(
+    url: str, headers: Dict[str, str], payload: Dict[str, Any], policy: Optional[RetryPolicy]
+) -> requests.Response:
+    """
+    POST a JSON payload, retrying network errors and retryable statuses.
+
+    Raises:
+        APIError: If the last attempt could not connect or timed out
+    """
+
+    def send() -> requests.Response:
+        return requests.post(url, headers=headers, json=payload, timeout=60)
+
+    try:
+        return send_with_retries(send, "sbomify releases", policy)
+    except requests.exceptions.ConnectionError:
+        raise APIError("Failed to connect to sbomify API")
+    except requests.exceptions.Timeout:
+        raise APIError("API request timed out")
+
+
+def tag_sbom_with_release(
+    api_base_url: str, token: str, sbom_id: str, release_id: str, policy: Optional[RetryPolicy] = None
+) -> None:
     """
     Associate/tag an SBOM with a release.
 
+    Tagging is idempotent, so transient failures are retried.
+
     Args:
         api_base_url: Base URL for the sbomify API
         token: API authentication token
         sbom_id: The SBOM ID from upload response
         release_id: The release ID to associate with
+        policy: Retry policy (default: from environment)
 
     Raises:
         APIError: If API call fails
@@ -274,12 +404,7 @@ def tag_sbom_with_release(api_base_url: str, token: str, sbom_id: str, release_i
     headers = get_default_headers(token, content_type="application/json")
     payload = {"sbom_id": sbom_id}
 
-    try:
-        response = requests.post(url, headers=headers, json=payload, timeout=60)
-    except requests.exceptions.ConnectionError:
-        raise APIError("Failed to connect to sbomify API")
-    except requests.exceptions.Timeout:
-        raise APIError("API request timed out")
+    response = _post_with_retries(url, headers, payload, policy)
 
     if not response.ok:
         # Handle duplicate artifact - SBOM already tagged (idempotent success)
@@ -297,6 +422,119 @@ def tag_sbom_with_release(api_base_url: str, token: str, sbom_id: str, release_i
         raise APIError(err_msg)
 
 
+def _tag_batch(
+    api_base_url: str, token: str, sbom_ids: List[str], release_id: str, policy: RetryPolicy
+) -> Optional[int]:
+    """
+    Tag a batch of SBOMs with a release in one request to the bulk endpoint.
+
+    SBOMs already tagged with the release are skipped by the API.
+
+    Returns:
+        None if the batch was tagged, otherwise the status code of a response
+        meaning the bulk endpoint isn't available: one of
+        _BULK_UNSUPPORTED_STATUS_CODES, or 404 without an API error body
+        (the route doesn't exist)
+
+    Raises:
+        APIError: If API call fails, including a 404 from the API for an
+            unknown release
+    """
+    url = api_base_url + f"/api/v1/releases/{release_id}/artifacts/bulk"
+    headers = get_default_headers(token, content_type="application/json")
+
+    response = _post_with_retries(url, headers, {"sbom_ids": sbom_ids}, policy)
+
+    if response.status_code in _BULK_UNSUPPORTED_STATUS_CODES:
+        return response.status_code
+    if response.status_code == 404 and _safe_json_dict(response) is None:
+        return response.status_code
+    if not response.ok:
+        err_msg = f"Failed to tag SBOMs with release. [{response.status_code}]"
+        if response.headers.get("content-type") == "application/json":
+            error_data = _safe_json_dict(response)
+            if error_data is not None and "detail" in error_data:
+                err_msg += f" - {error_data['detail']}"
+        raise APIError(err_msg)
+    return None
+
+
+def tag_sboms_with_release(
+    api_base_url: str,
+    token: str,
+    sbom_ids: Iterable[str],
+    release_id: str,
+    max_workers: int = TAG_WORKERS,
+    policy: Optional[RetryPolicy] = None,
+) -> None:
+    """
+    Associate/tag many SBOMs with a release.
+
+    The SBOMs are sent in batches of TAG_BATCH_SIZE to the bulk endpoint.
+    When the API doesn't have one, or a batch fails, they are tagged one by
+    one with up to max_workers concurrent requests. Every request retries
+    transient failures.
+
+    Args:
+        api_base_url: Base URL for the sbomify API
+        token: API authentication token
+        sbom_ids: The SBOM IDs from upload responses (duplicates are tagged once)
+        release_id: The release ID to associate with
+        max_workers: Maximum number of concurrent single tagging requests
+        policy: Retry policy (default: from environment)
+
+    Raises:
+        APIError: If any SBOM could not be tagged (after the others were)
+    """
+    remaining = list(dict.fromkeys(sbom_ids))
+    if not remaining:
+        return
+    total = len(remaining)
+    policy = policy or RetryPolicy.from_env()
+
+    if api_base_url not in _bulk_tagging_unsupported:
+        batches = [remaining[i : i + TAG_BATCH_SIZE] for i in range(0, len(remaining), TAG_BATCH_SIZE)]
+        individually: List[str] = []
+        for index, batch in enumerate(batches):
+            try:
+                status_code = _tag_batch(api_base_url, token, batch, release_id, policy)
+            except APIError as e:
+                # E.g. one unknown SBOM fails the whole batch; tag its SBOMs one by one
+                logger.warning(f"Bulk tagging of {len(batch)} SBOMs failed ({e}), tagging them individually")
+                individually.extend(batch)
+                continue
+            if status_code is not None:
+                logger.debug(
+                    f"Bulk tagging not available from {api_base_url} [{status_code}], tagging SBOMs individually"
+                )
+                # Only remembered when the status can't depend on the release
+                if status_code in _BULK_UNSUPPORTED_STATUS_CODES:
+                    _bulk_tagging_unsupported.add(api_base_url)
+                individually.extend(sbom_id for rest in batches[index:] for sbom_id in rest)
+                break
+        remaining = individually
+        if not remaining:
+            return
+
+    def tag(sbom_id: str) -> Optional[APIError]:
+        try:
+            tag_sbom_with_release(api_base_url, token, sbom_id, release_id, policy)
+        except APIError as e:
+            return e
+        return None
+
+    if max_workers > 1 and len(remaining) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(remaining)), thread_name_prefix="tag") as executor:
+            errors = list(executor.map(tag, remaining))
+    else:
+        errors = [tag(sbom_id) for sbom_id in remaining]
+
+    failed = [(sbom_id, error) for sbom_id, error in zip(remaining, errors) if error is not None]
+    if failed:
+        sbom_id, error = failed[0]
+        raise APIError(f"Failed to tag {len(failed)} of {total} SBOMs with release (SBOM {sbom_id}: {error})")
+
+
 def get_release_friendly_name(release_details: Optional[Dict[str, Any]], version: str) -> str:
     """
     Get a user-friendly name for a release.
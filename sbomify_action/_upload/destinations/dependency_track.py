@@ -16,17 +16,19 @@ Note: Project name and version come from the global COMPONENT_NAME and COMPONENT
 environment variables, not from DTRACK_* prefixed variables.
 """
 
-import base64
+import os
 from dataclasses import dataclass
-from pathlib import Path
 from typing import Any, Dict, Optional
 
 import requests
 
+from sbomify_action.compression import detect_compression, open_sbom_binary
 from sbomify_action.logging_config import logger
 
 from ..protocol import DestinationConfig, UploadInput
 from ..result import UploadResult
+from ..retry import send_with_retries
+from ..streaming import MultipartFormBody
 
 # Upload timeout in seconds
 UPLOAD_TIMEOUT = 120
@@ -126,7 +128,8 @@ class DependencyTrackDestination:
         """
         Upload SBOM to Dependency Track.
 
-        Uses the /api/v1/bom endpoint to upload the SBOM.
+        Uses the multipart form of the /api/v1/bom endpoint, streaming the
+        SBOM file as the request body.
 
         Args:
             input: UploadInput with file and format
@@ -147,10 +150,32 @@ class DependencyTrackDestination:
                 error_message=f"Dependency Track only supports CycloneDX format, got: {input.sbom_format}",
             )
 
-        # Read SBOM file
+        # Form fields identifying the project
+        fields: Dict[str, str] = {"autoCreate": "true" if self._config.auto_create else "false"}
+        if self._config.project_id:
+            fields["project"] = self._config.project_id
+            logger.info(f"Uploading SBOM to Dependency Track project ID: {self._config.project_id}")
+        elif input.component_name and input.component_version:
+            fields["projectName"] = input.component_name
+            fields["projectVersion"] = input.component_version
+            logger.info(f"Uploading SBOM to Dependency Track project: {input.component_name}:{input.component_version}")
+        else:
+            return UploadResult.failure_result(
+                destination_name=self.name,
+                error_message=(
+                    "Dependency Track requires either DTRACK_PROJECT_ID or both COMPONENT_NAME and COMPONENT_VERSION"
+                ),
+            )
+
+        # Report a missing or unreadable file before anything is sent. No
+        # Idempotency-Key is sent: /v1/bom ignores it, and a retry after a lost
+        # response imports the BOM into the project version again.
         try:
-            with Path(input.sbom_file).open("r") as f:
-                sbom_data = f.read()
+            with open(input.sbom_file, "rb") as f:
+                file_size: Optional[int] = os.fstat(f.fileno()).st_size
+            # The decompressed size of a compressed file isn't known, so it is sent chunked
+            if detect_compression(input.sbom_file):
+                file_size = None
         except FileNotFoundError:
             return UploadResult.failure_result(
                 destination_name=self.name,
@@ -164,46 +189,28 @@ class DependencyTrackDestination:
 
         # Build the upload URL - append /v1/bom to the API base URL
         url = f"{self._config.api_url}/v1/bom"
-
-        # Prepare headers
-        headers = {
-            "X-Api-Key": self._config.api_key,
-            "Content-Type": "application/json",
-        }
-
-        # Prepare payload
-        # Dependency Track expects base64-encoded BOM
-        bom_base64 = base64.b64encode(sbom_data.encode()).decode()
-
-        payload: Dict[str, Any] = {
-            "bom": bom_base64,
-            "autoCreate": self._config.auto_create,
-        }
-
-        # Add project identifier
-        if self._config.project_id:
-            payload["project"] = self._config.project_id
-            logger.info(f"Uploading SBOM to Dependency Track project ID: {self._config.project_id}")
-        elif input.component_name and input.component_version:
-            payload["projectName"] = input.component_name
-            payload["projectVersion"] = input.component_version
-            logger.info(f"Uploading SBOM to Dependency Track project: {input.component_name}:{input.component_version}")
-        else:
-            return UploadResult.failure_result(
-                destination_name=self.name,
-                error_message=(
-                    "Dependency Track requires either DTRACK_PROJECT_ID or both COMPONENT_NAME and COMPONENT_VERSION"
-                ),
-            )
+        api_key = self._config.api_key
+
+        def send() -> requests.Response:
+            # The multipart form of the BOM endpoint takes the file as is, so the SBOM is
+            # streamed from disk (decompressing gzip/zstd files) rather than base64-encoded
+            # into a JSON payload. Called for every attempt, as the stream can only be sent once.
+            with open_sbom_binary(input.sbom_file) as source:
+                body = MultipartFormBody(fields, "bom", "bom.json", source, file_size=file_size)
+                headers = {
+                    "X-Api-Key": api_key,
+                    "Content-Type": body.content_type,
+                }
+                return requests.post(
+                    url,
+                    headers=headers,
+                    data=body,
+                    timeout=UPLOAD_TIMEOUT,
+                )
 
         # Execute the upload
         try:
-            response = requests.put(
-                url,
-                headers=headers,
-                json=payload,
-                timeout=UPLOAD_TIMEOUT,
-            )
+            response = send_with_retries(send, self.name)
         except requests.exceptions.ConnectionError:
             return UploadResult.failure_result(
                 destination_name=self.name,
@@ -1,18 +1,21 @@
 """sbomify API destination for SBOM uploads."""
 
-import gzip
-import json
 import os
-from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 import requests
 
+from sbomify_action import jsonio
+from sbomify_action.compression import detect_compression, open_sbom_binary, read_sbom_bytes
 from sbomify_action.http_client import get_default_headers
 from sbomify_action.logging_config import logger
+from sbomify_action.validation import has_passed_validation
 
 from ..protocol import UploadInput
 from ..result import UploadResult
+from ..retry import idempotency_key, send_with_retries
+from ..streaming import GzipStream
+from ..upload_record import UploadRecord, skip_unchanged_enabled
 
 # Default sbomify production API
 SBOMIFY_PRODUCTION_API = "https://app.sbomify.com"
@@ -56,6 +59,7 @@ class SbomifyDestination:
         self._token = token
         self._component_id = component_id
         self._api_base_url = api_base_url or SBOMIFY_PRODUCTION_API
+        self._record = UploadRecord()
 
     @property
     def name(self) -> str:
@@ -97,10 +101,13 @@ class SbomifyDestination:
         # Prepare headers
         headers = get_default_headers(self._token, content_type="application/json")
 
-        # Read SBOM file
+        # sbomify recognises a retried attempt by its Idempotency-Key and doesn't
+        # store it twice; the key is the content hash, which also keys the upload
+        # record. Hashing reports a missing or unreadable file before anything is sent.
+        compression = detect_compression(input.sbom_file)
         try:
-            with Path(input.sbom_file).open("rb") as f:
-                sbom_bytes = f.read()
+            headers["Idempotency-Key"] = idempotency_key(input.sbom_file)
+            file_size = os.path.getsize(input.sbom_file)
         except FileNotFoundError:
             return UploadResult.failure_result(
                 destination_name=self.name,
@@ -116,31 +123,56 @@ class SbomifyDestination:
                 validation_error=validation_error,
             )
 
+        # Skip SBOMs recorded as uploaded to this component, without sending the body
+        content_hash = headers["Idempotency-Key"]
+        existing = self._find_recorded(url, content_hash)
+        if existing is not None:
+            return UploadResult.success_result(
+                destination_name=self.name,
+                sbom_id=existing,
+                validated=validated,
+                validation_error=validation_error,
+                metadata={"content_hash": content_hash},
+                duplicate=True,
+            )
+
         format_display = "CycloneDX" if input.sbom_format == "cyclonedx" else "SPDX"
         logger.info(f"Uploading {format_display} SBOM to component: {self._component_id}")
 
-        # Gzip-compress large payloads to avoid upstream timeouts
-        upload_data: bytes = sbom_bytes
-        if len(sbom_bytes) > GZIP_THRESHOLD:
-            compressed = gzip.compress(sbom_bytes)
-            if len(compressed) < len(sbom_bytes):
-                upload_data = compressed
-                headers["Content-Encoding"] = "gzip"
-                logger.info(
-                    f"Compressed upload: {len(sbom_bytes):,} -> {len(upload_data):,} bytes "
-                    f"({len(sbom_bytes) / len(upload_data):.1f}x)"
+        # A gzip-compressed file is sent as it is. Large payloads are streamed
+        # gzip-compressed to avoid upstream timeouts; zstd files are always
+        # recompressed (the API only accepts gzip encoding, and their
+        # decompressed size isn't known up front).
+        compress = compression == "zstd" or (compression is None and file_size > GZIP_THRESHOLD)
+        if compression == "gzip" or compress:
+            headers["Content-Encoding"] = "gzip"
+        if compression == "gzip":
+            logger.info(f"Uploading gzip-compressed SBOM file: {file_size:,} bytes")
+
+        gzip_streams: list[GzipStream] = []
+
+        def send() -> requests.Response:
+            # Called for every attempt, as a streamed body can only be sent once
+            source = open(input.sbom_file, "rb") if compression == "gzip" else open_sbom_binary(input.sbom_file)
+            with source:
+                upload_data: bytes | IO[bytes] | GzipStream
+                if compression == "gzip":
+                    upload_data = source
+                elif compress:
+                    upload_data = GzipStream(source)
+                    gzip_streams.append(upload_data)
+                else:
+                    upload_data = source.read()
+                return requests.post(
+                    url,
+                    headers=headers,
+                    data=upload_data,
+                    timeout=UPLOAD_TIMEOUT,
                 )
-            else:
-                logger.debug("Gzip compression did not reduce size, sending uncompressed")
 
         # Execute the upload
         try:
-            response = requests.post(
-                url,
-                headers=headers,
-                data=upload_data,
-                timeout=UPLOAD_TIMEOUT,
-            )
+            response = send_with_retries(send, self.name)
         except requests.exceptions.ConnectionError:
             return UploadResult.failure_result(
                 destination_name=self.name,
@@ -156,6 +188,13 @@ class SbomifyDestination:
                 validation_error=validation_error,
             )
 
+        if gzip_streams and gzip_streams[-1].bytes_sent:
+            gzip_stream = gzip_streams[-1]
+            logger.info(
+                f"Compressed upload: {gzip_stream.bytes_read:,} -> {gzip_stream.bytes_sent:,} bytes "
+                f"({gzip_stream.bytes_read / gzip_stream.bytes_sent:.1f}x)"
+            )
+
         # Handle response
         if not response.ok:
             # Handle component not found error (check before JSON parsing)
@@ -176,16 +215,21 @@ class SbomifyDestination:
                 if "detail" in response_json:
                     err_msg += f" - {response_json['detail']}"
 
-                # Handle duplicate SBOM error with specific message
+                # The component version already has an SBOM (e.g. an earlier
+                # attempt or CI run stored it). Its content may differ from this
+                # one, so it isn't written to the upload record.
                 if response.status_code == 409 and error_code == "DUPLICATE_ARTIFACT":
-                    return UploadResult.failure_result(
+                    logger.warning("An SBOM already exists for this component version, keeping the existing SBOM")
+                    sbom_id = response_json.get("sbom_id") or response_json.get("id")
+                    return UploadResult.success_result(
                         destination_name=self.name,
-                        error_message="An SBOM already exists for this component version. Use a different version or delete the existing SBOM.",
-                        error_code=error_code,
+                        sbom_id=sbom_id,
                         validated=validated,
                         validation_error=validation_error,
+                        metadata=response_json,
+                        duplicate=True,
                     )
-            except (ValueError, json.JSONDecodeError):
+            except (ValueError, jsonio.JSONDecodeError):
                 pass
 
             return UploadResult.failure_result(
@@ -205,7 +249,8 @@ class SbomifyDestination:
             response_metadata = response_data
             if sbom_id:
                 logger.info(f"SBOM ID: {sbom_id}")
-        except (ValueError, json.JSONDecodeError):
+                self._record.remember(url, content_hash, sbom_id)
+        except (ValueError, jsonio.JSONDecodeError):
             logger.warning("Could not extract SBOM ID from upload response")
 
         logger.info("SBOM uploaded successfully to sbomify")
@@ -218,6 +263,28 @@ class SbomifyDestination:
             metadata=response_metadata,
         )
 
+    def _find_recorded(self, url: str, content_hash: str) -> str | None:
+        """
+        Get the SBOM ID this content was recorded as uploaded under, if skipping is enabled.
+
+        With UPLOAD_SKIP_UNCHANGED, the local upload record is consulted. It
+        isn't checked against the server.
+
+        Args:
+            url: Upload URL, which identifies the component and format
+            content_hash: Content hash of the SBOM (its idempotency key)
+
+        Returns:
+            The recorded SBOM ID, or None if the SBOM should be uploaded
+        """
+        if not skip_unchanged_enabled():
+            return None
+
+        sbom_id = self._record.lookup(url, content_hash)
+        if sbom_id is not None:
+            logger.info(f"SBOM is unchanged since it was uploaded as {sbom_id}, skipping upload")
+        return sbom_id
+
     def _validate_cyclonedx_sbom(self, sbom_file_path: str) -> bool:
         """
         Validate CycloneDX SBOM structure.
@@ -228,9 +295,12 @@ class SbomifyDestination:
         Returns:
             True if valid, False if invalid
         """
+        if has_passed_validation(sbom_file_path):
+            logger.debug("SBOM already passed schema validation, skipping basic validation")
+            return True
+
         try:
-            with Path(sbom_file_path).open("r") as f:
-                sbom_data = json.load(f)
+            sbom_data = jsonio.loads(read_sbom_bytes(sbom_file_path))
 
             # Check for basic CycloneDX structure
             if sbom_data.get("bomFormat") == "CycloneDX" and sbom_data.get("specVersion"):
@@ -240,7 +310,7 @@ class SbomifyDestination:
                 logger.warning("SBOM basic validation failed: missing bomFormat or specVersion")
                 return False
 
-        except json.JSONDecodeError as e:
+        except jsonio.JSONDecodeError as e:
             logger.warning(f"SBOM validation failed: Invalid JSON - {e}")
             return False
         except FileNotFoundError:
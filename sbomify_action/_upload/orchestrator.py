@@ -125,20 +125,29 @@ class UploadOrchestrator:
 
         return self._registry.upload(input, destination_name=destination)
 
-    def upload_all(self, input: UploadInput) -> List[UploadResult]:
+    def upload_all(
+        self,
+        input: UploadInput,
+        destinations: Optional[List[str]] = None,
+    ) -> List[UploadResult]:
         """
-        Upload an SBOM to all configured destinations.
+        Upload an SBOM to all configured destinations concurrently.
 
         Args:
             input: UploadInput with SBOM file and format
+            destinations: Names of the destinations to upload to instead of all configured ones
 
         Returns:
-            List of UploadResult from each configured destination
+            List of UploadResult from each destination, in registration order
+            or in the order of destinations when given
         """
-        configured = self._registry.get_configured_destinations()
-        logger.info(f"Uploading SBOM to {len(configured)} configured destination(s): {[d.name for d in configured]}")
+        if destinations is None:
+            names = self.get_configured_destinations()
+            logger.info(f"Uploading SBOM to {len(names)} configured destination(s): {names}")
+        else:
+            logger.info(f"Uploading SBOM to {len(destinations)} destination(s): {destinations}")
 
-        return self._registry.upload_all(input)
+        return self._registry.upload_all(input, destinations=destinations)
 
     def get_configured_destinations(self) -> List[str]:
         """
@@ -8,6 +8,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal, Optional, Protocol
 
+from sbomify_action.env import get_env_bool
+
 if TYPE_CHECKING:
     from .result import UploadResult
 
@@ -70,19 +72,20 @@ class DestinationConfig(ABC):
         """Check if this destination is configured for upload."""
         ...
 
+    @classmethod
+    def _env_key(cls, key: str) -> str:
+        """Get the name of an environment variable with prefix."""
+        return f"{cls.ENV_PREFIX}_{key}" if cls.ENV_PREFIX else key
+
     @classmethod
     def _get_env(cls, key: str, default: Optional[str] = None) -> Optional[str]:
         """Get environment variable with prefix."""
-        full_key = f"{cls.ENV_PREFIX}_{key}" if cls.ENV_PREFIX else key
-        return os.getenv(full_key, default)
+        return os.getenv(cls._env_key(key), default)
 
     @classmethod
     def _get_env_bool(cls, key: str, default: bool = False) -> bool:
         """Get boolean environment variable with prefix."""
-        value = cls._get_env(key)
-        if value is None:
-            return default
-        return value.lower() in ("true", "yes", "1", "on")
+        return get_env_bool(cls._env_key(key), default)
 
 
 class Destination(Protocol):
@@ -1,5 +1,6 @@
 """Destination registry for managing SBOM upload plugins."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, FrozenSet, List, Optional
 
 from sbomify_action.logging_config import logger
@@ -92,28 +93,69 @@ class DestinationRegistry:
 
         return self._execute_upload(destination, input)
 
-    def upload_all(self, input: UploadInput) -> List[UploadResult]:
+    def upload_all(
+        self,
+        input: UploadInput,
+        destinations: Optional[List[str]] = None,
+    ) -> List[UploadResult]:
         """
         Upload an SBOM to all configured destinations.
 
+        Destinations are uploaded to concurrently, so the total time is that
+        of the slowest destination rather than the sum of all of them. Each
+        destination is bounded by its own HTTP timeout and retry policy.
+
         Args:
             input: UploadInput with SBOM file and format
+            destinations: Names of the destinations to upload to instead of
+                all configured ones; unconfigured ones get a failure result,
+                as with upload()
 
         Returns:
-            List of UploadResult from each configured destination
+            List of UploadResult from each destination, in registration order,
+            or in the order of destinations when given
+
+        Raises:
+            ValueError: If a named destination is not registered
         """
+        if destinations is not None:
+            return self._upload_named(input, destinations)
+
         configured = self.get_configured_destinations()
 
         if not configured:
             logger.warning("No destinations configured for upload")
             return []
 
-        results = []
-        for destination in configured:
-            result = self._execute_upload(destination, input)
-            results.append(result)
+        return self._upload_concurrently(configured, input)
+
+    def _upload_named(self, input: UploadInput, names: List[str]) -> List[UploadResult]:
+        """Upload to the named destinations concurrently, returning results in the order of names."""
+        results: Dict[str, UploadResult] = {}
+        selected: List[Destination] = []
+        for name in dict.fromkeys(names):
+            destination = self._destinations.get(name)
+            if not destination:
+                available = list(self._destinations.keys())
+                raise ValueError(f"Destination '{name}' not found. Available destinations: {available}")
+            if destination.is_configured():
+                selected.append(destination)
+            else:
+                results[name] = UploadResult.failure_result(
+                    destination_name=name,
+                    error_message=f"Destination '{name}' is not configured",
+                )
+
+        if selected:
+            uploaded = self._upload_concurrently(selected, input)
+            results.update((destination.name, result) for destination, result in zip(selected, uploaded))
+
+        return [results[name] for name in dict.fromkeys(names)]
 
-        return results
+    def _upload_concurrently(self, destinations: List[Destination], input: UploadInput) -> List[UploadResult]:
+        """Upload to each destination on its own thread, returning results in the same order."""
+        with ThreadPoolExecutor(max_workers=len(destinations), thread_name_prefix="upload") as executor:
+            return list(executor.map(lambda destination: self._execute_upload(destination, input), destinations))
 
     def _execute_upload(self, destination: Destination, input: UploadInput) -> UploadResult:
         """Execute upload with a specific destination."""
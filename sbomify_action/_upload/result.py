@@ -18,6 +18,7 @@ class UploadResult:
         validated: Whether the SBOM was validated before upload
         validation_error: Validation error message if validation failed
         metadata: Additional destination-specific metadata from the response
+        duplicate: The destination already had this SBOM, so nothing new was stored
     """
 
     success: bool
@@ -28,6 +29,7 @@ class UploadResult:
     validated: bool = False
     validation_error: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    duplicate: bool = False
 
     def __post_init__(self) -> None:
         """Validate result state."""
@@ -49,6 +51,7 @@ class UploadResult:
         validated: bool = False,
         validation_error: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        duplicate: bool = False,
     ) -> "UploadResult":
         """Create a successful upload result."""
         return cls(
@@ -59,6 +62,7 @@ class UploadResult:
             validated=validated,
             validation_error=validation_error,
             metadata=metadata or {},
+            duplicate=duplicate,
         )
 
     @classmethod
@@ -0,0 +1,144 @@
+"""Retries with exponential backoff for SBOM upload requests.
+
+Configuration via environment variables:
+    UPLOAD_RETRIES: Number of retries after a failed attempt (default: 3, 0 disables retries)
+    UPLOAD_RETRY_BACKOFF: Delay before the first retry in seconds, doubled for
+                          each further retry (default: 1)
+
+Every attempt of an upload to sbomify carries the same ``Idempotency-Key``
+header, derived from the SBOM content, so the server can recognise a retry of
+an attempt whose response was lost instead of storing a duplicate. Destinations
+that don't support the header, like Dependency-Track, don't send it.
+"""
+
+import hashlib
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, FrozenSet, Optional
+
+import requests
+
+from sbomify_action.compression import open_sbom_binary
+from sbomify_action.logging_config import logger
+
+from .streaming import iter_chunks
+
+# Statuses worth another attempt: timeouts, rate limiting and gateway/server hiccups
+RETRYABLE_STATUS_CODES: FrozenSet[int] = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 1.0
+
+# Upper bound for a single delay, including server-requested Retry-After values
+MAX_BACKOFF = 60.0
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How often and how patiently to retry an upload request.
+
+    Attributes:
+        retries: Number of retries after the first attempt
+        backoff: Delay before the first retry in seconds; doubles for each retry
+    """
+
+    retries: int = DEFAULT_RETRIES
+    backoff: float = DEFAULT_BACKOFF
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        """Load the policy from UPLOAD_RETRIES and UPLOAD_RETRY_BACKOFF, ignoring invalid values."""
+        try:
+            retries = max(0, int(os.environ.get("UPLOAD_RETRIES", DEFAULT_RETRIES)))
+        except ValueError:
+            retries = DEFAULT_RETRIES
+        try:
+            backoff = max(0.0, float(os.environ.get("UPLOAD_RETRY_BACKOFF", DEFAULT_BACKOFF)))
+        except ValueError:
+            backoff = DEFAULT_BACKOFF
+        return cls(retries=retries, backoff=backoff)
+
+    def delay(self, retry: int, response: Optional[requests.Response] = None) -> float:
+        """
+        Get the delay before a retry.
+
+        Args:
+            retry: 1 for the first retry, 2 for the second, ...
+            response: Response of the failed attempt, whose Retry-After header is honoured
+
+        Returns:
+            Seconds to wait
+        """
+        delay = self.backoff * 2 ** (retry - 1)
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+        return min(delay, MAX_BACKOFF)
+
+
+def idempotency_key(file_path: str | Path) -> str:
+    """
+    Derive an upload's idempotency key from the SBOM content.
+
+    The (decompressed) content is hashed in chunks, so the key is the same for
+    identical SBOMs whether or not they were stored compressed.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    digest = hashlib.sha256()
+    with open_sbom_binary(file_path) as f:
+        for chunk in iter_chunks(f):
+            digest.update(chunk)
+    return f"sha256:{digest.hexdigest()}"
+
+
+def send_with_retries(
+    send: Callable[[], requests.Response],
+    destination_name: str,
+    policy: Optional[RetryPolicy] = None,
+) -> requests.Response:
+    """
+    Make an upload request, retrying network errors and retryable statuses.
+
+    ``send`` makes one attempt and is called again for each retry, so it must
+    build a fresh request body every time (streamed bodies can't be replayed).
+
+    Args:
+        send: Function making a single request attempt
+        destination_name: Destination name for log messages
+        policy: Retry policy (default: from environment)
+
+    Returns:
+        The response of the last attempt, which may still be an error response
+
+    Raises:
+        requests.exceptions.ConnectionError: If the last attempt could not connect
+        requests.exceptions.Timeout: If the last attempt timed out
+    """
+    policy = policy or RetryPolicy.from_env()
+    retry = 0
+    while True:
+        try:
+            response = send()
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            if retry >= policy.retries:
+                raise
+            retry += 1
+            delay = policy.delay(retry)
+            reason = type(e).__name__
+        else:
+            if response.status_code not in RETRYABLE_STATUS_CODES or retry >= policy.retries:
+                return response
+            retry += 1
+            delay = policy.delay(retry, response)
+            reason = f"[{response.status_code}]"
+
+        logger.warning(
+            f"Upload to {destination_name} failed {reason}, retrying in {delay:.1f}s ({retry}/{policy.retries})"
+        )
+        time.sleep(delay)
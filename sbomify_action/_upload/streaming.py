@@ -0,0 +1,109 @@
+"""Streaming request bodies for SBOM uploads.
+
+Destinations hand these objects to ``requests`` as ``data=``, so the SBOM is
+read from disk and sent chunk by chunk instead of being held in memory.
+Bodies with a known size are sent with a Content-Length header; the others
+use chunked transfer encoding.
+"""
+
+import uuid
+import zlib
+from typing import IO, Dict, Iterator, Optional
+
+# Read size for streamed uploads (64 KiB)
+CHUNK_SIZE = 64 * 1024
+
+# Same trade-off as compression._GZIP_LEVEL: level 9 costs a lot for little gain on JSON
+_GZIP_LEVEL = 6
+
+# zlib window bits value that produces a gzip header and trailer
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def iter_chunks(source: IO[bytes], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield a binary file's contents in chunks of at most chunk_size bytes."""
+    while chunk := source.read(chunk_size):
+        yield chunk
+
+
+class GzipStream:
+    """
+    Request body that gzip-compresses a binary stream as it is sent.
+
+    Only one chunk of input and output is held in memory at a time. The byte
+    counters are filled in while the body is consumed, so they can be logged
+    once the request has been sent.
+    """
+
+    def __init__(self, source: IO[bytes], chunk_size: int = CHUNK_SIZE):
+        self._source = source
+        self._chunk_size = chunk_size
+        self.bytes_read = 0
+        self.bytes_sent = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        compressor = zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, _GZIP_WBITS)
+        for chunk in iter_chunks(self._source, self._chunk_size):
+            self.bytes_read += len(chunk)
+            compressed = compressor.compress(chunk)
+            if compressed:
+                self.bytes_sent += len(compressed)
+                yield compressed
+        tail = compressor.flush()
+        self.bytes_sent += len(tail)
+        yield tail
+
+
+class MultipartFormBody:
+    """
+    ``multipart/form-data`` request body with a single file part streamed from disk.
+
+    ``requests`` buffers the whole form in memory when given ``files=``; this
+    body only holds the small form fields and one chunk of the file. When the
+    file size is given (plain files) ``len`` is set and ``requests`` sends a
+    Content-Length header, otherwise the body is sent chunked.
+
+    Example:
+        with open("sbom.json", "rb") as f:
+            body = MultipartFormBody({"project": project_id}, "bom", "sbom.json", f, file_size=size)
+            requests.post(url, data=body, headers={"Content-Type": body.content_type})
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, str],
+        file_field: str,
+        file_name: str,
+        source: IO[bytes],
+        file_size: Optional[int] = None,
+        file_content_type: str = "application/json",
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        self.boundary = uuid.uuid4().hex
+        self._source = source
+        self._chunk_size = chunk_size
+
+        head = b"".join(self._field_part(name, value) for name, value in fields.items())
+        head += (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{file_field}"; filename="{file_name}"\r\n'
+            f"Content-Type: {file_content_type}\r\n\r\n"
+        ).encode()
+        self._head = head
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+
+        # Read by requests' super_len(); None makes it fall back to chunked encoding
+        self.len: Optional[int] = None if file_size is None else len(head) + file_size + len(self._tail)
+
+    @property
+    def content_type(self) -> str:
+        """Content-Type header value, including the boundary."""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def _field_part(self, name: str, value: str) -> bytes:
+        return f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._head
+        yield from iter_chunks(self._source, self._chunk_size)
+        yield self._tail
@@ -0,0 +1,160 @@
+"""Local record of SBOMs already uploaded, keyed by content hash.
+
+Re-triggered CI jobs and Yocto builds often produce byte-identical SBOMs.
+The record remembers which content was uploaded to which component, so an
+identical SBOM can be skipped without transferring it again.
+
+Skipping is opt-in: the record is local and isn't checked against the
+server, so an SBOM deleted on the server since it was recorded is still
+skipped, and its recorded ID reported. Only the most recent uploads are kept.
+
+Configuration via environment variables:
+    UPLOAD_SKIP_UNCHANGED: Skip SBOMs recorded as uploaded before (default: false)
+    SBOMIFY_CACHE_DIR: Directory the record is stored in (as ``uploads.json``);
+                       defaults to XDG_CACHE_HOME/sbomify or ~/.cache/sbomify
+"""
+
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from sbomify_action import jsonio
+from sbomify_action.cache_dir import get_cache_dir
+from sbomify_action.env import get_env_bool
+from sbomify_action.logging_config import logger
+
+RECORD_FILE_NAME = "uploads.json"
+
+# Recorded uploads kept per target, and in total; the least recently
+# recorded ones are dropped first
+MAX_ENTRIES_PER_TARGET = 20
+MAX_ENTRIES = 10_000
+
+# Serialises updates from concurrent uploads within this process
+_record_lock = threading.Lock()
+
+# Parsed record files, keyed by path, with the (mtime, size) they were read at
+_loaded: Dict[Path, Tuple[Tuple[int, int], Dict[str, Dict[str, str]]]] = {}
+
+
+def skip_unchanged_enabled() -> bool:
+    """Check whether SBOMs recorded as uploaded should be skipped (UPLOAD_SKIP_UNCHANGED)."""
+    return get_env_bool("UPLOAD_SKIP_UNCHANGED", default=False)
+
+
+def get_record_path() -> Path:
+    """Get the path of the upload record file."""
+    return get_cache_dir() / RECORD_FILE_NAME
+
+
+class UploadRecord:
+    """
+    Mapping of content hash -> SBOM ID per upload target, persisted as JSON.
+
+    A target identifies where an SBOM was uploaded to, e.g. an API base URL
+    plus component ID. Every change is written back immediately (merged with
+    the file's current contents, then atomically replaced), so concurrent
+    uploads and separate runs sharing a cache directory don't lose entries.
+    The file is only parsed again when it has changed, and is pruned to
+    MAX_ENTRIES_PER_TARGET per target and MAX_ENTRIES in total.
+
+    Example:
+        record = UploadRecord()
+        sbom_id = record.lookup(target, content_hash)
+        if sbom_id is None:
+            sbom_id = upload(...)
+            record.remember(target, content_hash, sbom_id)
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize the record.
+
+        Args:
+            path: Record file (default: from get_record_path())
+        """
+        self._path = path or get_record_path()
+
+    @property
+    def path(self) -> Path:
+        """Path of the record file."""
+        return self._path
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        try:
+            stat = self._path.stat()
+        except FileNotFoundError:
+            return {}
+        except OSError as e:
+            logger.debug(f"Ignoring unreadable upload record {self._path}: {e}")
+            return {}
+
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = _loaded.get(self._path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        try:
+            data = jsonio.loads(self._path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, jsonio.JSONDecodeError) as e:
+            logger.debug(f"Ignoring unreadable upload record {self._path}: {e}")
+            return {}
+        if not isinstance(data, dict):
+            data = {}
+        _loaded[self._path] = (version, data)
+        return data
+
+    def lookup(self, target: str, content_hash: str) -> Optional[str]:
+        """
+        Get the SBOM ID recorded for content uploaded to a target.
+
+        Returns:
+            The SBOM ID, or None if this content wasn't recorded for the target
+        """
+        entries = self._load().get(target)
+        if not isinstance(entries, dict):
+            return None
+        sbom_id = entries.get(content_hash)
+        return sbom_id if isinstance(sbom_id, str) else None
+
+    def remember(self, target: str, content_hash: str, sbom_id: str) -> None:
+        """
+        Record that content was uploaded to a target as sbom_id.
+
+        Failing to write the record is logged and otherwise ignored; it only
+        means the next identical upload isn't skipped.
+        """
+        with _record_lock:
+            # Copy, as the loaded data is shared with lookups
+            data = {key: dict(value) for key, value in self._load().items() if isinstance(value, dict)}
+            # Most recently recorded targets and entries go last
+            entries = data.pop(target, {})
+            entries.pop(content_hash, None)
+            entries[content_hash] = sbom_id
+            data[target] = dict(list(entries.items())[-MAX_ENTRIES_PER_TARGET:])
+            _prune(data)
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self._path.parent, prefix=".uploads-", suffix=".json")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        f.write(jsonio.dumps(data))
+                    os.replace(tmp_path, self._path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+            except OSError as e:
+                logger.debug(f"Could not update upload record {self._path}: {e}")
+
+
+def _prune(data: Dict[str, Dict[str, str]]) -> None:
+    """Drop the least recently recorded targets until at most MAX_ENTRIES entries are left."""
+    total = sum(len(entries) for entries in data.values())
+    for target in list(data):
+        if total <= MAX_ENTRIES:
+            break
+        total -= len(data.pop(target))
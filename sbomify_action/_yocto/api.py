@@ -1,16 +1,73 @@
 """Component CRUD API calls for Yocto pipeline."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 
 from sbomify_action.exceptions import APIError, PlanLimitError
 from sbomify_action.http_client import get_default_headers
 from sbomify_action.logging_config import logger
 
+# Components per page when listing
+PAGE_SIZE = 100
+
+# Safety limit against infinite pagination
+MAX_PAGES = 500
+
+# Pages fetched concurrently once the total count is known
+LIST_WORKERS = 8
+
+
+def _fetch_component_page(api_base_url: str, token: str, page: int, page_size: int = PAGE_SIZE) -> dict:
+    """Fetch one page of the component list.
+
+    Raises:
+        APIError: If API call fails
+    """
+    url = api_base_url + "/api/v1/components"
+    headers = get_default_headers(token)
+    try:
+        response = requests.get(url, headers=headers, params={"page": page, "page_size": page_size}, timeout=60)
+    except requests.exceptions.ConnectionError:
+        raise APIError("Failed to connect to sbomify API")
+    except requests.exceptions.Timeout:
+        raise APIError("API request timed out")
+
+    if not response.ok:
+        raise APIError(f"Failed to list components. [{response.status_code}]")
+
+    try:
+        data = response.json()
+    except (ValueError, requests.exceptions.JSONDecodeError):
+        raise APIError("Failed to list components: invalid JSON response from API")
+
+    if not isinstance(data, dict):
+        raise APIError(f"Failed to list components: unexpected response type ({type(data).__name__})")
+    return data
+
+
+def _total_count(data: dict) -> int | None:
+    """Get the total number of components from a page, if the response reports it."""
+    count = data.get("count")
+    if count is None and isinstance(data.get("pagination"), dict):
+        count = data["pagination"].get("total")
+    return count if isinstance(count, int) and not isinstance(count, bool) else None
+
+
+def _add_page_items(components: dict[str, str], data: dict) -> None:
+    for item in data.get("items", []):
+        name = item.get("name")
+        comp_id = item.get("id")
+        if name and comp_id:
+            components[name] = str(comp_id)
+
 
 def list_components(api_base_url: str, token: str) -> dict[str, str]:
     """Fetch all components and return a name-to-id mapping.
 
-    Paginates through all results to build a complete cache.
+    Paginates through all results to build a complete cache. When the
+    first page reports the total count, the remaining pages are fetched
+    concurrently; otherwise the 'next' links are followed one by one.
 
     Args:
         api_base_url: Base URL for the sbomify API
@@ -22,45 +79,30 @@ def list_components(api_base_url: str, token: str) -> dict[str, str]:
     Raises:
         APIError: If API call fails
     """
-    url = api_base_url + "/api/v1/components"
-    headers = get_default_headers(token)
     components: dict[str, str] = {}
+    data = _fetch_component_page(api_base_url, token, 1)
+    _add_page_items(components, data)
     page = 1
-    max_pages = 500  # Safety limit against infinite pagination
-
-    while page <= max_pages:
-        try:
-            response = requests.get(url, headers=headers, params={"page": page, "page_size": 100}, timeout=60)
-        except requests.exceptions.ConnectionError:
-            raise APIError("Failed to connect to sbomify API")
-        except requests.exceptions.Timeout:
-            raise APIError("API request timed out")
-
-        if not response.ok:
-            raise APIError(f"Failed to list components. [{response.status_code}]")
 
-        try:
-            data = response.json()
-        except (ValueError, requests.exceptions.JSONDecodeError):
-            raise APIError("Failed to list components: invalid JSON response from API")
-
-        if not isinstance(data, dict):
-            raise APIError(f"Failed to list components: unexpected response type ({type(data).__name__})")
-
-        for item in data.get("items", []):
-            name = item.get("name")
-            comp_id = item.get("id")
-            if name and comp_id:
-                components[name] = str(comp_id)
-
-        # Paginate based on 'next' link, not empty items
-        if not data.get("next"):
-            break
+    total = _total_count(data)
+    if total is not None and data.get("next"):
+        last_page = min(MAX_PAGES, -(-total // PAGE_SIZE))
+        with ThreadPoolExecutor(max_workers=LIST_WORKERS, thread_name_prefix="components") as executor:
+            pages = executor.map(lambda p: _fetch_component_page(api_base_url, token, p), range(2, last_page + 1))
+            for data in pages:
+                _add_page_items(components, data)
+        page = last_page
+
+    # Follow 'next' links for servers that don't report a count, or for
+    # components added while the pages were being fetched
+    while data.get("next") and page < MAX_PAGES:
         page += 1
+        data = _fetch_component_page(api_base_url, token, page)
+        _add_page_items(components, data)
 
-    if page > max_pages and data.get("next"):
+    if page >= MAX_PAGES and data.get("next"):
         logger.warning(
-            f"Pagination safety limit reached ({max_pages} pages). "
+            f"Pagination safety limit reached ({MAX_PAGES} pages). "
             f"Component cache may be incomplete ({len(components)} components fetched)."
         )
 
@@ -68,6 +110,25 @@ def list_components(api_base_url: str, token: str) -> dict[str, str]:
     return components
 
 
+def sample_components(api_base_url: str, token: str) -> tuple[int | None, dict[str, str]]:
+    """Get the number of components in the workspace and the first page of them.
+
+    A single request, cheap enough to revalidate a cached mapping before
+    trusting it instead of listing every component again.
+
+    Returns:
+        The component count (None if the API doesn't report it) and the
+        first page's name-to-id mapping
+
+    Raises:
+        APIError: If API call fails
+    """
+    data = _fetch_component_page(api_base_url, token, 1)
+    components: dict[str, str] = {}
+    _add_page_items(components, data)
+    return _total_count(data), components
+
+
 def create_component(api_base_url: str, token: str, name: str) -> str:
     """Create a new component.
 
@@ -2,6 +2,7 @@
 
 import tarfile
 import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 
 import zstandard
@@ -87,3 +88,54 @@ def _extract_tar_gz(archive: Path, dest: Path) -> None:
     """Extract a tar.gz archive."""
     with tarfile.open(archive, "r:gz") as tar:
         tar.extractall(path=dest, filter="data")
+
+
+def iter_archive_documents(archive_path: str) -> Iterator[tuple[str, bytes]]:
+    """Stream the SPDX documents out of a Yocto SPDX archive without extracting it.
+
+    Tar members are read one at a time straight from the decompression
+    stream; nothing is written to disk.
+
+    Args:
+        archive_path: Path to .tar.zst or .tar.gz archive
+
+    Yields:
+        (member name, file content) for every ``*.spdx.json`` member
+
+    Raises:
+        FileProcessingError: If the archive is missing, invalid or has no SPDX files
+    """
+    path = Path(archive_path)
+    if not path.exists():
+        raise FileProcessingError(f"Archive not found: {archive_path}")
+
+    archive_type = _detect_archive_type(archive_path)
+    logger.info(f"Streaming {path.name}")
+
+    count = 0
+    try:
+        with open(path, "rb") as fh:
+            if archive_type == "zst":
+                stream = zstandard.ZstdDecompressor().stream_reader(fh)
+                mode = "r|"
+            else:
+                stream = fh
+                mode = "r|gz"
+            with stream, tarfile.open(fileobj=stream, mode=mode) as tar:
+                for member in tar:
+                    if not member.isfile() or not member.name.endswith(".spdx.json"):
+                        continue
+                    member_file = tar.extractfile(member)
+                    if member_file is None:
+                        continue
+                    count += 1
+                    yield member.name, member_file.read()
+    except FileProcessingError:
+        raise
+    except Exception as e:
+        raise FileProcessingError(f"Failed to read archive {path.name}: {e}") from e
+
+    if not count:
+        raise FileProcessingError(f"No .spdx.json files found in archive {path.name}")
+
+    logger.info(f"Read {count} SPDX files from {path.name}")
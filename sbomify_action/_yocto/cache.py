@@ -0,0 +1,184 @@
+"""Local state kept between Yocto pipeline runs.
+
+Stored as JSON files in SBOMIFY_CACHE_DIR, or XDG_CACHE_HOME/sbomify
+(~/.cache/sbomify) when unset. Files are merged with their current contents
+and atomically replaced when saved, so separate runs sharing a cache
+directory don't lose each other's entries.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from sbomify_action import jsonio
+from sbomify_action.cache_dir import get_cache_dir
+from sbomify_action.logging_config import logger
+
+from .models import YoctoPackage
+
+MANIFEST_FILE_NAME = "yocto-manifest.json"
+COMPONENTS_FILE_NAME = "yocto-components.json"
+
+# Serialises saves within this process
+_save_lock = threading.Lock()
+
+
+def workspace_scope(api_base_url: str, token: str) -> str:
+    """Identify a workspace by its API URL and a hash of the token, without storing the token itself."""
+    token_hash = hashlib.sha256(token.encode()).hexdigest()[:16]
+    return f"{api_base_url}|{token_hash}"
+
+
+def _load_json(path: Path) -> dict:
+    """Load a state file, treating a missing or unreadable file as empty."""
+    try:
+        data = jsonio.loads(path.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except (OSError, jsonio.JSONDecodeError) as e:
+        logger.debug(f"Ignoring unreadable state file {path}: {e}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _update_json(path: Path, scope: str, entries: dict) -> None:
+    """Merge entries into one scope of a state file and atomically replace it.
+
+    Failing to write is logged and otherwise ignored; it only means the next
+    run can't reuse this run's results.
+    """
+    with _save_lock:
+        data = _load_json(path)
+        scoped = data.get(scope)
+        if not isinstance(scoped, dict):
+            scoped = data[scope] = {}
+        scoped.update(entries)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".yocto-", suffix=".json")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(jsonio.dumps(data))
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug(f"Could not update state file {path}: {e}")
+
+
+class PackageManifest:
+    """
+    Packages uploaded by earlier runs: name -> (version, fingerprint, settings, SBOM ID).
+
+    Entries are scoped to an API and product, and only the latest upload of
+    each package name is kept. A package whose version and document
+    fingerprint match its entry, and that was processed with the same
+    settings (e.g. augmentation and enrichment), is unchanged: its earlier
+    SBOM can be tagged into a new release without processing it again.
+
+    Example:
+        manifest = PackageManifest(scope, settings={"augment": False, "enrich": True})
+        sbom_id = manifest.lookup(pkg)
+        if sbom_id is None:
+            sbom_id = process_and_upload(pkg)
+            manifest.record(pkg, sbom_id)
+        manifest.save()
+    """
+
+    def __init__(self, scope: str, path: Path | None = None, settings: dict | None = None):
+        """
+        Load the manifest entries of a scope.
+
+        Args:
+            scope: Identifies where the SBOMs were uploaded, e.g. workspace_scope() and product ID
+            path: Manifest file (default: MANIFEST_FILE_NAME in get_cache_dir())
+            settings: JSON-serializable processing settings that shape the
+                uploaded SBOMs; entries recorded with other settings are changed
+        """
+        self._scope = scope
+        self._settings = settings or {}
+        self._path = path or get_cache_dir() / MANIFEST_FILE_NAME
+        entries = _load_json(self._path).get(scope)
+        self._entries: dict[str, dict] = entries if isinstance(entries, dict) else {}
+        self._recorded: dict[str, dict] = {}
+
+    @property
+    def path(self) -> Path:
+        """Path of the manifest file."""
+        return self._path
+
+    def lookup(self, pkg: YoctoPackage) -> str | None:
+        """
+        Get the SBOM ID uploaded for an unchanged package.
+
+        Returns:
+            The SBOM ID, or None if the package is new or changed
+        """
+        entry = self._entries.get(pkg.name)
+        if not isinstance(entry, dict):
+            return None
+        if entry.get("version") != pkg.version or entry.get("sha256") != pkg.sha256:
+            return None
+        if entry.get("settings", {}) != self._settings:
+            return None
+        sbom_id = entry.get("sbom_id")
+        return sbom_id if isinstance(sbom_id, str) else None
+
+    def record(self, pkg: YoctoPackage, sbom_id: str) -> None:
+        """Record that a package was uploaded as sbom_id (written by save())."""
+        entry = {"version": pkg.version, "sha256": pkg.sha256, "settings": self._settings, "sbom_id": sbom_id}
+        self._entries[pkg.name] = entry
+        self._recorded[pkg.name] = entry
+
+    def save(self) -> None:
+        """Write the entries recorded since loading to the manifest file."""
+        if self._recorded:
+            _update_json(self._path, self._scope, self._recorded)
+            self._recorded = {}
+
+
+class ComponentCache:
+    """
+    Name -> component ID mapping of a workspace, kept between runs.
+
+    The workspace is identified by the API URL and a hash of the token, so
+    the token itself is never written to disk. Callers revalidate the
+    mapping before trusting it, e.g. against the first page of components.
+    """
+
+    def __init__(self, api_base_url: str, token: str, path: Path | None = None):
+        """
+        Load the cached mapping of a workspace.
+
+        Args:
+            api_base_url: Base URL for the sbomify API
+            token: API authentication token
+            path: Cache file (default: COMPONENTS_FILE_NAME in get_cache_dir())
+        """
+        self._scope = workspace_scope(api_base_url, token)
+        self._path = path or get_cache_dir() / COMPONENTS_FILE_NAME
+        entry = _load_json(self._path).get(self._scope)
+        components = entry.get("components") if isinstance(entry, dict) else None
+        self._components: dict[str, str] | None = (
+            {name: comp_id for name, comp_id in components.items() if isinstance(comp_id, str)}
+            if isinstance(components, dict)
+            else None
+        )
+
+    @property
+    def path(self) -> Path:
+        """Path of the cache file."""
+        return self._path
+
+    @property
+    def components(self) -> dict[str, str] | None:
+        """The cached mapping, or None if nothing was cached for this workspace."""
+        return self._components
+
+    def store(self, components: dict[str, str]) -> None:
+        """Replace the cached mapping and write it to the cache file."""
+        self._components = dict(components)
+        _update_json(self._path, self._scope, {"components": self._components})
@@ -3,6 +3,9 @@
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
 
+# Packages processed concurrently; the work is almost entirely network wait
+DEFAULT_WORKERS = 8
+
 
 @dataclass
 class YoctoPackage:
@@ -13,6 +16,9 @@ class YoctoPackage:
     spdx_file: str
     document_namespace: str
     sha256: str
+    # zstd-compressed document, for packages streamed from an archive rather
+    # than extracted (spdx_file is then the archive member name)
+    content: bytes | None = dataclass_field(default=None, repr=False)
 
 
 @dataclass
@@ -30,6 +36,9 @@ class YoctoConfig:
     component_id: str | None = None
     visibility: str | None = None
     max_packages: int | None = None
+    workers: int = DEFAULT_WORKERS
+    stream: bool = False
+    incremental: bool = False
 
 
 @dataclass
@@ -39,6 +48,8 @@ class YoctoPipelineResult:
     packages_found: int = 0
     components_created: int = 0
     sboms_uploaded: int = 0
+    # Unchanged since an earlier run, so their earlier SBOMs were tagged instead
+    sboms_unchanged: int = 0
     sboms_skipped: int = 0
     errors: int = 0
     release_id: str | None = None
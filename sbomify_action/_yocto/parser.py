@@ -1,19 +1,33 @@
 """SPDX 2.2 parsing and package discovery for Yocto builds."""
 
 import hashlib
-import json
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
+import zstandard
+
+from sbomify_action import jsonio
 from sbomify_action.exceptions import FileProcessingError
 from sbomify_action.logging_config import logger
 
+from .archive import iter_archive_documents
 from .models import YoctoPackage
 
+# Below this many files, starting worker processes costs more than it saves
+PARALLEL_DISCOVERY_MIN_FILES = 64
+
 
-def _compute_sha256(data: dict) -> str:
-    """Compute SHA256 of parsed JSON data with normalized content (sorted keys)."""
-    normalized = json.dumps(data, sort_keys=True, separators=(",", ":"))
-    return hashlib.sha256(normalized.encode()).hexdigest()
+def _compute_sha256(content: bytes) -> str:
+    """Compute SHA256 of an SPDX document's raw bytes.
+
+    Yocto writes its SPDX output deterministically, so identical documents
+    have identical bytes; hashing them as read avoids re-serializing the
+    parsed document.
+    """
+    return hashlib.sha256(content).hexdigest()
 
 
 def _is_spdx_22(data: dict) -> bool:
@@ -55,8 +69,8 @@ def _categorize_document(file_path: Path, data: dict) -> str:
     return "package"
 
 
-def _extract_package_info(file_path: str, data: dict) -> YoctoPackage:
-    """Extract package info from an SPDX 2.2 document."""
+def _extract_package_info(file_path: str, data: dict, content: bytes) -> YoctoPackage:
+    """Extract package info from an SPDX 2.2 document parsed from *content*."""
     name = data.get("name", Path(file_path).stem)
     namespace = data.get("documentNamespace", "")
 
@@ -66,7 +80,7 @@ def _extract_package_info(file_path: str, data: dict) -> YoctoPackage:
     if packages:
         version = packages[0].get("versionInfo", "")
 
-    sha256 = _compute_sha256(data)
+    sha256 = _compute_sha256(content)
 
     return YoctoPackage(
         name=name,
@@ -77,58 +91,99 @@ def _extract_package_info(file_path: str, data: dict) -> YoctoPackage:
     )
 
 
-def discover_packages(extract_dir: str) -> list[YoctoPackage]:
-    """Discover package SBOMs from extracted Yocto SPDX output.
+@dataclass
+class _ScannedDocument:
+    """Outcome of parsing and classifying one SPDX file."""
 
-    Scans for *.spdx.json files, identifies the rootfs manifest,
-    skips recipe-* and runtime-* documents, and returns package SBOMs.
+    spdx_file: str
+    # "invalid", "non-spdx22", "rootfs", "recipe", "runtime" or "package"
+    category: str
+    package: YoctoPackage | None = None
+    error: str | None = None
+
+
+def _scan_document(spdx_file: str, content: bytes, keep_content: bool = False) -> _ScannedDocument:
+    """Parse and classify one SPDX file, extracting package info from package documents.
 
     Args:
-        extract_dir: Directory containing extracted SPDX files
+        spdx_file: File path or archive member name
+        content: The file's raw bytes
+        keep_content: Attach the compressed raw bytes to the package
+    """
+    try:
+        data = jsonio.loads(content)
+    except jsonio.JSONDecodeError as e:
+        return _ScannedDocument(spdx_file, "invalid", error=str(e))
 
-    Returns:
-        List of YoctoPackage objects for package SBOMs
+    if not _is_spdx_22(data):
+        return _ScannedDocument(spdx_file, "non-spdx22")
 
-    Raises:
-        FileProcessingError: If no valid SPDX 2.2 content is found
+    category = _categorize_document(Path(spdx_file), data)
+    if category != "package":
+        return _ScannedDocument(spdx_file, category)
+
+    package = _extract_package_info(spdx_file, data, content)
+    if keep_content:
+        package.content = zstandard.ZstdCompressor().compress(content)
+    return _ScannedDocument(spdx_file, category, package=package)
+
+
+def _scan_file(spdx_file: str) -> _ScannedDocument:
+    """Read, parse and classify one extracted SPDX file (runs in worker processes)."""
+    try:
+        content = Path(spdx_file).read_bytes()
+    except OSError as e:
+        return _ScannedDocument(spdx_file, "invalid", error=str(e))
+    return _scan_document(spdx_file, content)
+
+
+def _scan_files(spdx_files: list[str]) -> Iterator[_ScannedDocument]:
+    """Scan SPDX files across a process pool, yielding results in input order.
+
+    Parsing is CPU-bound, so large builds are spread over all cores; small
+    ones are scanned in this process.
     """
-    extract_path = Path(extract_dir)
-    spdx_files = sorted(extract_path.rglob("*.spdx.json"))
+    if len(spdx_files) < PARALLEL_DISCOVERY_MIN_FILES:
+        yield from map(_scan_file, spdx_files)
+        return
 
-    if not spdx_files:
-        raise FileProcessingError(f"No .spdx.json files found in {extract_dir}")
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(spdx_files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_scan_file, spdx_files, chunksize=chunksize)
+
+
+def _select_packages(scanned: Iterable[_ScannedDocument], source: str) -> list[YoctoPackage]:
+    """Pick the package documents out of a Yocto build's scanned SPDX documents.
+
+    Logs the rootfs manifest and the skipped invalid, non-SPDX-2.2, recipe-*
+    and runtime-* documents.
 
+    Raises:
+        FileProcessingError: If no package SBOMs are found
+    """
     packages: list[YoctoPackage] = []
     rootfs_found = False
     skipped_recipe = 0
     skipped_runtime = 0
     skipped_non_spdx22 = 0
 
-    for spdx_file in spdx_files:
-        try:
-            with open(spdx_file, "r") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, OSError) as e:
-            logger.warning(f"Skipping {spdx_file.name}: {e}")
-            continue
-
-        if not _is_spdx_22(data):
+    for doc in scanned:
+        name = Path(doc.spdx_file).name
+        if doc.category == "invalid":
+            logger.warning(f"Skipping {name}: {doc.error}")
+        elif doc.category == "non-spdx22":
             skipped_non_spdx22 += 1
-            logger.debug(f"Skipping non-SPDX-2.2 file: {spdx_file.name}")
-            continue
-
-        category = _categorize_document(spdx_file, data)
-
-        if category == "rootfs":
+            logger.debug(f"Skipping non-SPDX-2.2 file: {name}")
+        elif doc.category == "rootfs":
             rootfs_found = True
-            logger.info(f"Found rootfs manifest: {spdx_file.name}")
-        elif category == "recipe":
+            logger.info(f"Found rootfs manifest: {name}")
+        elif doc.category == "recipe":
             skipped_recipe += 1
-        elif category == "runtime":
+        elif doc.category == "runtime":
             skipped_runtime += 1
-        elif category == "package":
-            pkg = _extract_package_info(str(spdx_file), data)
-            packages.append(pkg)
+        elif doc.package is not None:
+            packages.append(doc.package)
 
     logger.info(
         f"Discovery: {len(packages)} packages, "
@@ -138,6 +193,73 @@ def discover_packages(extract_dir: str) -> list[YoctoPackage]:
     )
 
     if not packages:
-        raise FileProcessingError("No package SBOMs found in extracted archive")
+        raise FileProcessingError(f"No package SBOMs found in {source}")
 
     return packages
+
+
+def discover_packages(extract_dir: str) -> list[YoctoPackage]:
+    """Discover package SBOMs from extracted Yocto SPDX output.
+
+    Scans for *.spdx.json files, identifies the rootfs manifest,
+    skips recipe-* and runtime-* documents, and returns package SBOMs.
+    Large builds are parsed in parallel across worker processes.
+
+    Args:
+        extract_dir: Directory containing extracted SPDX files
+
+    Returns:
+        List of YoctoPackage objects for package SBOMs
+
+    Raises:
+        FileProcessingError: If no valid SPDX 2.2 content is found
+    """
+    extract_path = Path(extract_dir)
+    spdx_files = sorted(extract_path.rglob("*.spdx.json"))
+
+    if not spdx_files:
+        raise FileProcessingError(f"No .spdx.json files found in {extract_dir}")
+
+    return _select_packages(_scan_files([str(f) for f in spdx_files]), "extracted archive")
+
+
+def discover_packages_from_archive(archive_path: str) -> list[YoctoPackage]:
+    """Discover package SBOMs by streaming a Yocto SPDX archive.
+
+    Same as discover_packages(), but the archive members are parsed in
+    memory. The returned packages carry the member name in ``spdx_file``,
+    ordered by member name, and their document zstd-compressed in
+    ``content``; parsed documents aren't kept, so only about the compressed
+    size of the package documents stays in memory. Use
+    load_package_document() to parse a package's document when it's needed.
+
+    Args:
+        archive_path: Path to .tar.zst or .tar.gz archive
+
+    Returns:
+        List of YoctoPackage objects for package SBOMs
+
+    Raises:
+        FileProcessingError: If the archive is invalid or has no package SBOMs
+    """
+    scanned = (
+        _scan_document(name, content, keep_content=True) for name, content in iter_archive_documents(archive_path)
+    )
+    packages = _select_packages(scanned, "archive")
+    return sorted(packages, key=lambda pkg: Path(pkg.spdx_file))
+
+
+def load_package_document(pkg: YoctoPackage) -> dict:
+    """Parse the document of a package streamed from an archive.
+
+    Raises:
+        ValueError: If the package wasn't streamed from an archive
+    """
+    if pkg.content is None:
+        raise ValueError(f"No streamed document for {pkg.name}")
+    return jsonio.loads(zstandard.ZstdDecompressor().decompress(pkg.content))
+
+
+def store_package_document(pkg: YoctoPackage, data: dict) -> None:
+    """Replace the document of a package streamed from an archive, e.g. after modifying it."""
+    pkg.content = zstandard.ZstdCompressor().compress(jsonio.dumps(data).encode("utf-8"))
@@ -1,24 +1,43 @@
 """Batch orchestrator for Yocto SPDX pipeline."""
 
-import json
+import os
 import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 
 from rich.table import Table
 
-from sbomify_action._processors.releases_api import create_release, tag_sbom_with_release
-from sbomify_action.augmentation import augment_sbom_from_file
+from sbomify_action import jsonio
+from sbomify_action._enrichment.enricher import Enricher
+from sbomify_action._processors.releases_api import create_release, tag_sbom_with_release, tag_sboms_with_release
+from sbomify_action.augmentation import augment_sbom_document, augment_sbom_from_file
 from sbomify_action.console import console
-from sbomify_action.enrichment import enrich_sbom
-from sbomify_action.exceptions import APIError, ConfigurationError, PlanLimitError
+from sbomify_action.document import SBOMDocument
+from sbomify_action.enrichment import enrich_sbom, enrich_sbom_document
+from sbomify_action.exceptions import APIError, ComponentNotFoundError, ConfigurationError, PlanLimitError
 from sbomify_action.logging_config import logger
 from sbomify_action.spdx3 import is_spdx3
 from sbomify_action.upload import upload_sbom
 
-from .api import get_or_create_component, list_components, patch_component_visibility
+from .api import get_or_create_component, list_components, patch_component_visibility, sample_components
 from .archive import extract_archive
-from .models import YoctoConfig, YoctoPipelineResult
-from .parser import discover_packages
-from .purl import inject_yocto_purls_spdx3, inject_yocto_purls_spdx22
+from .cache import ComponentCache, PackageManifest, workspace_scope
+from .models import YoctoConfig, YoctoPackage, YoctoPipelineResult
+from .parser import (
+    discover_packages,
+    discover_packages_from_archive,
+    load_package_document,
+    store_package_document,
+)
+from .purl import (
+    collect_purls_spdx22,
+    collect_purls_spdx22_data,
+    inject_yocto_purls_spdx3,
+    inject_yocto_purls_spdx22,
+    inject_yocto_purls_spdx22_data,
+)
 
 
 def _process_single_package(
@@ -26,11 +45,17 @@ def _process_single_package(
     pkg_spdx_file: str,
     component_id: str,
     config: YoctoConfig,
-) -> str | None:
+    enricher: Enricher | None = None,
+) -> tuple[str | None, bool]:
     """Process a single package SBOM: augment, enrich, upload.
 
+    Args:
+        enricher: Shared, prefetched enricher for batch runs; enrich_sbom()
+            creates its own when None.
+
     Returns:
-        sbom_id if uploaded successfully, None otherwise.
+        sbom_id of the uploaded or already existing SBOM (None if it is
+        unknown), and whether the SBOM already existed.
 
     Raises:
         Exception: Propagated from augmentation/enrichment/upload.
@@ -55,11 +80,71 @@ def _process_single_package(
             input_file=working_file,
             output_file=enriched_file,
             validate=False,
+            enricher=enricher,
         )
         working_file = enriched_file
 
+    return _upload_package_sbom(pkg_name, working_file, component_id, config)
+
+
+def _process_streamed_package(
+    pkg_name: str,
+    data: dict,
+    component_id: str,
+    config: YoctoConfig,
+    enricher: Enricher | None = None,
+) -> tuple[str | None, bool]:
+    """Process a package SBOM held in memory: augment, enrich, upload.
+
+    The document only touches disk once, as a compressed temporary file
+    for the upload, which is removed afterwards.
+
+    Returns:
+        sbom_id of the uploaded or already existing SBOM (None if it is
+        unknown), and whether the SBOM already existed.
+
+    Raises:
+        Exception: Propagated from augmentation/enrichment/upload.
+    """
+    document = SBOMDocument(data)
+
+    if config.augment:
+        augment_sbom_document(
+            document,
+            api_base_url=config.api_base_url,
+            token=config.token,
+            component_id=component_id,
+            validate=False,
+        )
+
+    if config.enrich:
+        enrich_sbom_document(document, validate=False, enricher=enricher)
+
+    fd, upload_file = tempfile.mkstemp(prefix="yocto-", suffix=".spdx.json.gz")
+    os.close(fd)
+    try:
+        document.write(upload_file)
+        return _upload_package_sbom(pkg_name, upload_file, component_id, config)
+    finally:
+        os.unlink(upload_file)
+
+
+def _upload_package_sbom(
+    pkg_name: str, sbom_file: str, component_id: str, config: YoctoConfig
+) -> tuple[str | None, bool]:
+    """Upload a package SBOM to its component.
+
+    Returns:
+        sbom_id if uploaded successfully, or of the SBOM the component
+        already has (None if its ID is unknown); and whether the SBOM
+        already existed. An existing SBOM's content may differ from this one.
+
+    Raises:
+        ComponentNotFoundError: If the component no longer exists.
+        APIError: If the upload failed or returned no SBOM ID.
+    """
     result = upload_sbom(
-        sbom_file=working_file,
+        sbom_file=sbom_file,
         sbom_format="spdx",
         token=config.token,
         component_id=component_id,
@@ -67,15 +152,21 @@ def _process_single_package(
         validate_before_upload=False,
     )
 
-    if result.success and result.sbom_id:
-        return result.sbom_id
+    # An SBOM that already exists (409 DUPLICATE_ARTIFACT, or recorded as
+    # uploaded) is reused, so it's still tagged into the release
+    if result.duplicate:
+        if result.sbom_id:
+            logger.info(f"SBOM for '{pkg_name}' already exists as {result.sbom_id}, reusing it")
+        else:
+            logger.info(f"SBOM for '{pkg_name}' already exists, skipping")
+        return result.sbom_id, True
 
-    # 409 DUPLICATE_ARTIFACT is a benign skip
-    if result.error_code == "DUPLICATE_ARTIFACT":
-        logger.info(f"SBOM for '{pkg_name}' already exists, skipping")
-        return None
+    if result.success and result.sbom_id:
+        return result.sbom_id, False
 
     if not result.success:
+        if result.error_code == "COMPONENT_NOT_FOUND":
+            raise ComponentNotFoundError(f"Upload failed for '{pkg_name}': {result.error_message}")
         raise APIError(f"Upload failed for '{pkg_name}': {result.error_message}")
 
     # Upload reported success but no SBOM ID was returned
@@ -85,6 +176,178 @@ def _process_single_package(
     )
 
 
+@dataclass
+class _PackageOutcome:
+    """What happened to one package in the worker pool."""
+
+    started: bool = True
+    component_id: str | None = None
+    component_created: bool = False
+    sbom_id: str | None = None
+    # The SBOM already existed, possibly with other content than this package's
+    existing: bool = False
+    error: Exception | None = None
+    # Unchanged since an earlier run: not processed, sbom_id is the earlier upload
+    unchanged: bool = False
+
+
+class _ComponentResolver:
+    """Thread-safe get-or-create of components by name.
+
+    Lookups for the same name are serialised so concurrent workers never
+    create a component twice, while different names proceed in parallel.
+    """
+
+    def __init__(self, config: YoctoConfig, cache: dict[str, str]):
+        self._config = config
+        self._cache = cache
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def get_or_create(self, name: str) -> tuple[str, bool]:
+        with self._locks_guard:
+            lock = self._locks.setdefault(name, threading.Lock())
+        with lock:
+            return get_or_create_component(self._config.api_base_url, self._config.token, name, self._cache)
+
+    def refresh(self, name: str, stale_id: str) -> None:
+        """Update the mapping from a fresh listing after stale_id turned out not to exist.
+
+        Entries are replaced one at a time so concurrent lookups never see
+        an emptied mapping, and workers that hit the same stale entry list
+        the components only once.
+        """
+        with self._refresh_lock:
+            if self._cache.get(name) != stale_id:
+                return
+            before = dict(self._cache)
+            components = list_components(self._config.api_base_url, self._config.token)
+            for stale_name, comp_id in before.items():
+                if stale_name not in components and self._cache.get(stale_name) == comp_id:
+                    self._cache.pop(stale_name, None)
+            self._cache.update(components)
+            if self._cache.get(name) == stale_id:
+                # Listed although uploads to it fail; create a new one instead
+                self._cache.pop(name, None)
+
+
+def _inject_purls(pkg: YoctoPackage) -> int:
+    """Inject yocto PURLs into a package's document, returning how many were injected."""
+    if pkg.content is None:
+        return inject_yocto_purls_spdx22(pkg.spdx_file)
+    data = load_package_document(pkg)
+    injected = inject_yocto_purls_spdx22_data(data)
+    if injected:
+        store_package_document(pkg, data)
+    return injected
+
+
+def _prefetch_enrichment(packages: list[YoctoPackage], enricher: Enricher, config: YoctoConfig) -> None:
+    """Look up metadata for every distinct PURL across the package SBOMs in one batch.
+
+    The same packages (glibc, busybox, ...) are referenced from many documents;
+    fetching them once up front means enriching each document afterwards only
+    reads the enricher's results.
+    """
+    if all(pkg.content is not None for pkg in packages):
+        # Parsed one at a time, so only one document is held at once
+        purls = collect_purls_spdx22_data(load_package_document(pkg) for pkg in packages)
+    else:
+        purls = collect_purls_spdx22([pkg.spdx_file for pkg in packages])
+    console.print(f"[bold]Fetching enrichment metadata...[/bold] {len(purls)} unique PURLs")
+    metadata_map = enricher.fetch_all_metadata(purls, max_workers=max(1, config.workers))
+    stats = enricher.get_enrichment_stats(metadata_map)
+    console.print(f"  Found metadata for {stats['enriched']}/{stats['total']} PURLs")
+
+
+def _process_packages(
+    packages: list[YoctoPackage],
+    component_cache: dict[str, str],
+    config: YoctoConfig,
+    enricher: Enricher | None = None,
+) -> list[_PackageOutcome]:
+    """Create components for and process packages on a bounded worker pool.
+
+    A PlanLimitError stops the pool: packages that haven't started are
+    cancelled and reported as not started.
+
+    Returns:
+        One outcome per package, in package order.
+    """
+    resolver = _ComponentResolver(config, component_cache)
+    stop = threading.Event()
+    total = len(packages)
+
+    def upload(pkg: YoctoPackage, outcome: _PackageOutcome) -> tuple[str | None, bool]:
+        outcome.component_id, outcome.component_created = resolver.get_or_create(pkg.name)
+        if outcome.component_created and config.visibility:
+            patch_component_visibility(config.api_base_url, config.token, outcome.component_id, config.visibility)
+        if pkg.content is not None:
+            data = load_package_document(pkg)
+            return _process_streamed_package(pkg.name, data, outcome.component_id, config, enricher)
+        return _process_single_package(pkg.name, pkg.spdx_file, outcome.component_id, config, enricher)
+
+    def process(index: int, pkg: YoctoPackage) -> _PackageOutcome:
+        if stop.is_set():
+            return _PackageOutcome(started=False)
+        console.print(f"  [{index}/{total}] Processing {pkg.name} {pkg.version}...")
+        outcome = _PackageOutcome()
+        try:
+            try:
+                outcome.sbom_id, outcome.existing = upload(pkg, outcome)
+            except ComponentNotFoundError as e:
+                if outcome.component_created:
+                    raise
+                # The mapping (e.g. cached by an earlier run) names a deleted component
+                logger.warning(f"{e}; listing components again")
+                resolver.refresh(pkg.name, outcome.component_id)
+                outcome.sbom_id, outcome.existing = upload(pkg, outcome)
+        except PlanLimitError as e:
+            stop.set()
+            outcome.error = e
+        except Exception as e:
+            outcome.error = e
+        finally:
+            # A streamed document isn't needed once processed; release it
+            pkg.content = None
+        return outcome
+
+    with ThreadPoolExecutor(max_workers=max(1, config.workers), thread_name_prefix="yocto") as executor:
+        futures = [executor.submit(process, i, pkg) for i, pkg in enumerate(packages, 1)]
+        for future in as_completed(futures):
+            if stop.is_set():
+                # Drop queued packages; running ones finish before the pool exits
+                executor.shutdown(wait=False, cancel_futures=True)
+                break
+
+    return [_PackageOutcome(started=False) if future.cancelled() else future.result() for future in futures]
+
+
+def _load_components(config: YoctoConfig, cache: ComponentCache | None) -> dict[str, str]:
+    """Get the name-to-id mapping of all components, from the local cache if it's still valid.
+
+    The cached mapping is revalidated with a single request for the first
+    page of components: if the workspace's component count differs (or
+    isn't reported), or any component on that page is missing from the
+    cache or has another ID, all components are listed again and the cache
+    is refreshed. Entries that still go stale are handled when an upload
+    reports COMPONENT_NOT_FOUND.
+    """
+    if cache is not None:
+        cached = cache.components
+        if cached is not None:
+            count, first_page = sample_components(config.api_base_url, config.token)
+            if count == len(cached) and all(cached.get(name) == comp_id for name, comp_id in first_page.items()):
+                console.print(f"  Using {len(cached)} cached components")
+                return dict(cached)
+
+    components = list_components(config.api_base_url, config.token)
+    if cache is not None:
+        cache.store(components)
+    return components
+
+
 def _print_summary(result: YoctoPipelineResult) -> None:
     """Print a Rich summary table of the pipeline run."""
     table = Table(title="Yocto Pipeline Summary", show_header=False)
@@ -94,6 +357,8 @@ def _print_summary(result: YoctoPipelineResult) -> None:
     table.add_row("Packages found", str(result.packages_found))
     table.add_row("Components created", str(result.components_created))
     table.add_row("SBOMs uploaded", str(result.sboms_uploaded), style="green" if result.sboms_uploaded else "")
+    if result.sboms_unchanged:
+        table.add_row("SBOMs unchanged", str(result.sboms_unchanged))
     table.add_row("SBOMs skipped", str(result.sboms_skipped), style="yellow" if result.sboms_skipped else "")
     table.add_row("Errors", str(result.errors), style="red" if result.errors else "")
     if result.release_id:
@@ -108,8 +373,8 @@ def _detect_spdx3(input_path: str) -> dict | None:
         return None
     try:
         with open(input_path, encoding="utf-8") as f:
-            data = json.load(f)
-    except json.JSONDecodeError:
+            data = jsonio.load(f)
+    except jsonio.JSONDecodeError:
         # File is JSON-like but malformed — let the archive path try
         return None
     except OSError as e:
@@ -154,7 +419,7 @@ def _run_spdx3_pipeline(config: YoctoConfig, data: dict) -> YoctoPipelineResult:
         console.print(f"  Injected {purls_injected} yocto PURL(s)")
 
     try:
-        sbom_id = _process_single_package(
+        sbom_id, _ = _process_single_package(
             pkg_name="spdx3-image",
             pkg_spdx_file=config.input_path,
             component_id=config.component_id,
@@ -189,7 +454,9 @@ def run_yocto_pipeline(config: YoctoConfig) -> YoctoPipelineResult:
     to the component specified by --component-id.
 
     For SPDX 2.2 archives (.spdx.tar.zst/.tar.gz), extracts and processes
-    each package SBOM individually.
+    each package SBOM individually. With ``config.stream``, the archive is
+    read in memory instead of being extracted. With ``config.incremental``,
+    packages unchanged since an earlier run reuse that run's SBOM.
 
     Args:
         config: Pipeline configuration
@@ -204,15 +471,22 @@ def run_yocto_pipeline(config: YoctoConfig) -> YoctoPipelineResult:
 
     result = YoctoPipelineResult()
     extract_dir = None
+    enricher = None
 
     try:
-        # Step 1: Extract
-        console.print(f"\n[bold]Extracting archive:[/bold] {config.input_path}")
-        extract_dir = extract_archive(config.input_path)
+        if config.stream:
+            # Steps 1+2: Discover packages straight from the archive stream
+            console.print(f"\n[bold]Streaming archive:[/bold] {config.input_path}")
+            console.print("[bold]Discovering packages...[/bold]")
+            packages = discover_packages_from_archive(config.input_path)
+        else:
+            # Step 1: Extract
+            console.print(f"\n[bold]Extracting archive:[/bold] {config.input_path}")
+            extract_dir = extract_archive(config.input_path)
 
-        # Step 2: Discover packages
-        console.print("[bold]Discovering packages...[/bold]")
-        packages = discover_packages(extract_dir)
+            # Step 2: Discover packages
+            console.print("[bold]Discovering packages...[/bold]")
+            packages = discover_packages(extract_dir)
         if config.max_packages and len(packages) > config.max_packages:
             console.print(f"  Found {len(packages)} package SBOMs, limiting to {config.max_packages}")
             packages = packages[: config.max_packages]
@@ -227,54 +501,94 @@ def run_yocto_pipeline(config: YoctoConfig) -> YoctoPipelineResult:
             _print_summary(result)
             return result
 
+        # Packages unchanged since an earlier run are only tagged into the release
+        manifest = None
+        unchanged: dict[int, str] = {}
+        if config.incremental:
+            manifest = PackageManifest(
+                f"{workspace_scope(config.api_base_url, config.token)}|{config.product_id}",
+                settings={"augment": config.augment, "enrich": config.enrich},
+            )
+            for index, pkg in enumerate(packages):
+                sbom_id = manifest.lookup(pkg)
+                if sbom_id:
+                    unchanged[index] = sbom_id
+            if unchanged:
+                console.print(f"  {len(unchanged)} packages unchanged since the last upload")
+        pending = [pkg for index, pkg in enumerate(packages) if index not in unchanged]
+
         # Inject yocto PURLs for packages that lack them (after dry-run check
         # to avoid unnecessary file I/O during dry-run)
-        total_purls = sum(inject_yocto_purls_spdx22(pkg.spdx_file) for pkg in packages)
+        total_purls = sum(_inject_purls(pkg) for pkg in pending)
         if total_purls:
             console.print(f"  Injected {total_purls} yocto PURL(s)")
 
-        # Step 3: Cache existing components
-        console.print("[bold]Fetching existing components...[/bold]")
-        component_cache = list_components(config.api_base_url, config.token)
-
-        # Step 4: Process each package
+        processed: list[_PackageOutcome] = []
+        persistent_components = None
+        if pending:
+            # Step 3: Cache existing components
+            console.print("[bold]Fetching existing components...[/bold]")
+            persistent_components = ComponentCache(config.api_base_url, config.token) if config.incremental else None
+            component_cache = _load_components(config, persistent_components)
+
+            # Enrich archive-wide: each distinct PURL is fetched once, up front
+            if config.enrich:
+                enricher = Enricher()
+                _prefetch_enrichment(pending, enricher, config)
+
+            # Step 4: Process packages concurrently
+            processed = _process_packages(pending, component_cache, config, enricher)
+
+        processed_outcomes = iter(processed)
+        outcomes = [
+            _PackageOutcome(sbom_id=unchanged[index], unchanged=True)
+            if index in unchanged
+            else next(processed_outcomes)
+            for index in range(len(packages))
+        ]
+
+        # Tally in package order so the summary doesn't depend on scheduling
         collected_sbom_ids: list[str] = []
-
-        for i, pkg in enumerate(packages, 1):
-            console.print(f"  [{i}/{len(packages)}] Processing {pkg.name} {pkg.version}...")
-
-            try:
-                comp_id, was_created = get_or_create_component(
-                    config.api_base_url, config.token, pkg.name, component_cache
-                )
-                if was_created:
-                    result.components_created += 1
-                    if config.visibility:
-                        patch_component_visibility(config.api_base_url, config.token, comp_id, config.visibility)
-
-                sbom_id = _process_single_package(pkg.name, pkg.spdx_file, comp_id, config)
-
-                if sbom_id:
-                    collected_sbom_ids.append(sbom_id)
-                    result.sboms_uploaded += 1
-                else:
-                    result.sboms_skipped += 1
-
-            except PlanLimitError as e:
-                remaining = len(packages) - i
+        plan_limit_reached = False
+        not_started = 0
+        for pkg, outcome in zip(packages, outcomes):
+            if outcome.unchanged and outcome.sbom_id:
+                collected_sbom_ids.append(outcome.sbom_id)
+                result.sboms_unchanged += 1
+                continue
+            if not outcome.started:
+                not_started += 1
+                continue
+            if outcome.component_created:
+                result.components_created += 1
+            if isinstance(outcome.error, PlanLimitError):
+                plan_limit_reached = True
                 result.errors += 1
-                result.error_messages.append(str(e))
-                logger.error(str(e))
-                console.print(
-                    f"\n[bold red]Plan limit reached.[/bold red] Stopping pipeline ({remaining} packages remaining).\n"
-                    "Upgrade your plan or reduce the number of components to continue."
-                )
-                break
-
-            except Exception as e:
+                result.error_messages.append(str(outcome.error))
+                logger.error(str(outcome.error))
+            elif outcome.error is not None:
                 result.errors += 1
-                result.error_messages.append(f"{pkg.name}: {e}")
-                logger.error(f"Error processing {pkg.name}: {e}")
+                result.error_messages.append(f"{pkg.name}: {outcome.error}")
+                logger.error(f"Error processing {pkg.name}: {outcome.error}")
+            elif outcome.sbom_id:
+                collected_sbom_ids.append(outcome.sbom_id)
+                result.sboms_uploaded += 1
+                # An existing SBOM isn't known to match this package's fingerprint
+                if manifest and not outcome.existing:
+                    manifest.record(pkg, outcome.sbom_id)
+            else:
+                result.sboms_skipped += 1
+
+        if manifest:
+            manifest.save()
+        if persistent_components is not None and component_cache != persistent_components.components:
+            persistent_components.store(component_cache)
+
+        if plan_limit_reached:
+            console.print(
+                f"\n[bold red]Plan limit reached.[/bold red] Stopping pipeline ({not_started} packages remaining).\n"
+                "Upgrade your plan or reduce the number of components to continue."
+            )
 
         # Step 5: Release tagging
         if collected_sbom_ids:
@@ -285,8 +599,13 @@ def run_yocto_pipeline(config: YoctoConfig) -> YoctoPipelineResult:
                 )
                 if release_id:
                     result.release_id = release_id
-                    for sbom_id in collected_sbom_ids:
-                        tag_sbom_with_release(config.api_base_url, config.token, sbom_id, release_id)
+                    tag_sboms_with_release(
+                        config.api_base_url,
+                        config.token,
+                        collected_sbom_ids,
+                        release_id,
+                        max_workers=max(1, config.workers),
+                    )
                     console.print(f"  Tagged {len(collected_sbom_ids)} SBOMs with release {release_id}")
             except APIError as e:
                 result.errors += 1
@@ -296,6 +615,8 @@ def run_yocto_pipeline(config: YoctoConfig) -> YoctoPipelineResult:
         _print_summary(result)
 
     finally:
+        if enricher:
+            enricher.close()
         # Clean up temp directory
         if extract_dir:
             try:
@@ -1,9 +1,10 @@
 """Yocto PURL generation and injection for SPDX 2.2 and SPDX 3 SBOMs."""
 
-import json
+from collections.abc import Iterable, Iterator
 
 from packageurl import PackageURL
 
+from sbomify_action import jsonio
 from sbomify_action.logging_config import logger
 
 
@@ -38,19 +39,15 @@ def _has_yocto_purl_spdx22(package_data: dict) -> bool:
     return False
 
 
-def inject_yocto_purls_spdx22(spdx_file: str) -> int:
-    """Inject yocto PURLs into SPDX 2.2 packages missing one.
+def inject_yocto_purls_spdx22_data(data: dict) -> int:
+    """Inject yocto PURLs into the packages of a parsed SPDX 2.2 document.
 
-    Reads *spdx_file* as JSON, iterates ``packages[]``, and appends a
-    ``pkg:yocto/<name>@<version>`` external ref for any package that does
-    not already have a yocto PURL.  Writes the file back in-place.
+    Appends a ``pkg:yocto/<name>@<version>`` external ref to every package
+    in ``packages[]`` that does not already have a yocto PURL.
 
     Returns:
         Number of PURLs injected.
     """
-    with open(spdx_file, encoding="utf-8") as f:
-        data = json.load(f)
-
     injected = 0
     for pkg in data.get("packages", []):
         if _has_yocto_purl_spdx22(pkg):
@@ -73,9 +70,27 @@ def inject_yocto_purls_spdx22(spdx_file: str) -> int:
         )
         injected += 1
 
+    return injected
+
+
+def inject_yocto_purls_spdx22(spdx_file: str) -> int:
+    """Inject yocto PURLs into SPDX 2.2 packages missing one.
+
+    Reads *spdx_file* as JSON, injects PURLs with
+    :func:`inject_yocto_purls_spdx22_data`, and writes the file back
+    in-place if anything changed.
+
+    Returns:
+        Number of PURLs injected.
+    """
+    with open(spdx_file, encoding="utf-8") as f:
+        data = jsonio.load(f)
+
+    injected = inject_yocto_purls_spdx22_data(data)
+
     if injected:
         with open(spdx_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
+            jsonio.dump(data, f, indent=4)
         logger.debug(f"Injected {injected} yocto PURL(s) into {spdx_file}")
 
     return injected
@@ -92,7 +107,7 @@ def inject_yocto_purls_spdx3(spdx3_file: str) -> int:
         Number of PURLs injected.
     """
     with open(spdx3_file, encoding="utf-8") as f:
-        data = json.load(f)
+        data = jsonio.load(f)
 
     injected = 0
     for element in data.get("@graph", []):
@@ -117,7 +132,43 @@ def inject_yocto_purls_spdx3(spdx3_file: str) -> int:
 
     if injected:
         with open(spdx3_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
+            jsonio.dump(data, f, indent=4)
         logger.debug(f"Injected {injected} yocto PURL(s) into {spdx3_file}")
 
     return injected
+
+
+def collect_purls_spdx22(spdx_files: list[str]) -> list[str]:
+    """Collect the distinct PURLs referenced by SPDX 2.2 packages across documents.
+
+    Unreadable documents are skipped; they fail later, when processed.
+
+    Returns:
+        PURL strings in order of first appearance.
+    """
+
+    def load_documents() -> Iterator[dict]:
+        for spdx_file in spdx_files:
+            try:
+                with open(spdx_file, encoding="utf-8") as f:
+                    yield jsonio.load(f)
+            except (jsonio.JSONDecodeError, OSError) as e:
+                logger.debug(f"Not collecting PURLs from {spdx_file}: {e}")
+
+    return collect_purls_spdx22_data(load_documents())
+
+
+def collect_purls_spdx22_data(documents: Iterable[dict]) -> list[str]:
+    """Collect the distinct PURLs referenced by packages of parsed SPDX 2.2 documents.
+
+    Returns:
+        PURL strings in order of first appearance.
+    """
+    purls: dict[str, None] = {}
+    for data in documents:
+        for pkg in data.get("packages", []):
+            for ref in pkg.get("externalRefs", []):
+                locator = ref.get("referenceLocator")
+                if ref.get("referenceType") == "purl" and isinstance(locator, str):
+                    purls.setdefault(locator, None)
+    return list(purls)
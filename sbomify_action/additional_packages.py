@@ -32,10 +32,16 @@ from spdx_tools.spdx.model import (
     SpdxNoAssertion,
 )
 from spdx_tools.spdx.parser.parse_anything import parse_file as spdx_parse_file
-from spdx_tools.spdx.writer.write_anything import write_file as spdx_write_file
 
+from .document import SBOMDocument
+from .exceptions import SBOMValidationError
 from .logging_config import logger
-from .serialization import restore_spdx_document_describes, sanitize_spdx_json_file, serialize_cyclonedx_bom
+from .serialization import (
+    restore_spdx_document_describes,
+    sanitize_spdx_json_file,
+    write_cyclonedx_bom,
+    write_spdx_document,
+)
 from .spdx3 import is_spdx3
 
 # Default file name for additional packages
@@ -395,13 +401,12 @@ def create_empty_sbom(output_file: str, sbom_format: str, spec_version: str | No
     import uuid
     from datetime import datetime, timezone
 
-    from .serialization import DEFAULT_CYCLONEDX_VERSION, serialize_cyclonedx_bom
+    from .serialization import DEFAULT_CYCLONEDX_VERSION
 
     if sbom_format == "cyclonedx":
         bom = Bom()
-        serialized = serialize_cyclonedx_bom(bom, DEFAULT_CYCLONEDX_VERSION)
         with open(output_file, "w", encoding="utf-8") as f:
-            f.write(serialized)
+            write_cyclonedx_bom(bom, f, DEFAULT_CYCLONEDX_VERSION)
         logger.info(f"Created empty CycloneDX SBOM: {output_file}")
         return "cyclonedx"
 
@@ -419,7 +424,7 @@ def create_empty_sbom(output_file: str, sbom_format: str, spec_version: str | No
             created=datetime.now(timezone.utc),
         )
         document = Document(creation_info=creation_info)
-        spdx_write_file(document, output_file, validate=False)
+        write_spdx_document(document, output_file)
         sanitize_spdx_json_file(output_file)
         logger.info(f"Created empty SPDX SBOM: {output_file}")
         return "spdx"
@@ -542,7 +547,49 @@ def inject_additional_packages(sbom_file: str) -> int:
         return 0
 
     logger.info(f"Injecting {len(purls)} additional package(s) into SBOM")
+    return _inject_packages_into_file(sbom_file, purls)
+
+
+def inject_additional_packages_into_document(document: SBOMDocument) -> int:
+    """
+    Inject additional packages into an in-memory SBOM document.
+
+    Same as inject_additional_packages(), but CycloneDX SBOMs are modified in
+    memory. SPDX SBOMs go through the file-based implementation.
+
+    Args:
+        document: The SBOM document to modify
+
+    Returns:
+        Number of packages injected (0 if no packages to inject)
+    """
+    purls = get_additional_packages()
+
+    if not purls:
+        logger.debug("No additional packages to inject")
+        return 0
+
+    logger.info(f"Injecting {len(purls)} additional package(s) into SBOM")
+
+    if document.sbom_format != "cyclonedx":
+        return document.apply_file_step(lambda path: _inject_packages_into_file(path, purls), in_place=True)
+
+    try:
+        bom = document.bom
+    except SBOMValidationError as e:
+        logger.error(str(e))
+        return 0
+
+    injected = inject_packages_into_cyclonedx(bom, purls)
+    if injected > 0:
+        document.update_bom()
+        logger.info(f"Injected {injected} additional package(s) into CycloneDX SBOM")
+
+    return injected
+
 
+def _inject_packages_into_file(sbom_file: str, purls: List[str]) -> int:
+    """Inject PURLs into an SBOM file, writing it back if anything was added."""
     # Load and detect format
     sbom_path = Path(sbom_file)
     try:
@@ -572,9 +619,8 @@ def inject_additional_packages(sbom_file: str) -> int:
 
         if injected > 0:
             # Write back
-            serialized = serialize_cyclonedx_bom(bom, spec_version)
             with open(sbom_path, "w", encoding="utf-8") as f:
-                f.write(serialized)
+                write_cyclonedx_bom(bom, f, spec_version)
             logger.info(f"Injected {injected} additional package(s) into CycloneDX SBOM")
 
         return injected
@@ -605,7 +651,7 @@ def inject_additional_packages(sbom_file: str) -> int:
 
         if injected > 0:
             # Write back
-            spdx_write_file(document, str(sbom_path), validate=False)
+            write_spdx_document(document, str(sbom_path))
             sanitize_spdx_json_file(str(sbom_path))
             restore_spdx_document_describes(str(sbom_path))
             logger.info(f"Injected {injected} additional package(s) into SPDX SBOM")
@@ -52,7 +52,8 @@ from spdx_tools.spdx.model import (
 )
 from spdx_tools.spdx.parser.jsonlikedict.license_expression_parser import LicenseExpressionParser
 from spdx_tools.spdx.parser.parse_anything import parse_file as spdx_parse_file
-from spdx_tools.spdx.writer.write_anything import write_file as spdx_write_file
+
+from . import jsonio
 
 # Import augmentation plugin architecture
 from ._augmentation import create_default_registry
@@ -60,18 +61,19 @@ from ._augmentation.utils import build_vcs_url_with_commit, truncate_sha
 
 # Import lockfile constants from generation utils (single source of truth)
 from ._generation.utils import ALL_LOCK_FILES
+from .compression import read_sbom_bytes, uncompressed_path
 from .console import get_audit_trail
+from .document import SBOMDocument
 from .exceptions import SBOMValidationError
 from .logging_config import logger
 from .serialization import (
-    link_root_dependencies,
     restore_spdx_document_describes,
-    sanitize_dependency_graph,
+    sanitize_cyclonedx_bom,
     sanitize_spdx_json_file,
-    serialize_cyclonedx_bom,
+    write_spdx_document,
 )
 from .spdx3 import is_spdx3
-from .validation import validate_sbom_file_auto
+from .validation import ValidationResult, validate_sbom_data_auto, validate_sbom_file_auto
 
 # Constants for SPDX license parsing
 SPDX_LOGICAL_OPERATORS = [" OR ", " AND ", " WITH "]
@@ -1853,7 +1855,7 @@ def augment_sbom_from_file(
     to ensure it works regardless of augmentation settings.
 
     Args:
-        input_file: Path to input SBOM file
+        input_file: Path to input SBOM file (may be gzip or zstd compressed)
         output_file: Path to save augmented SBOM
         api_base_url: Backend API base URL (optional, for sbomify API provider)
         token: Authentication token (optional, for sbomify API provider)
@@ -1886,14 +1888,11 @@ def augment_sbom_from_file(
 
     # Try CycloneDX first
     try:
-        import json
-
         try:
-            with open(input_path, "r") as f:
-                data = json.load(f)
+            data = jsonio.loads(read_sbom_bytes(input_path))
         except FileNotFoundError:
             raise FileNotFoundError(f"Input SBOM file not found: {input_file}")
-        except json.JSONDecodeError as e:
+        except jsonio.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in SBOM file: {e}")
         except PermissionError:
             raise PermissionError(f"Permission denied reading SBOM file: {input_file}")
@@ -1901,36 +1900,13 @@ def augment_sbom_from_file(
             raise OSError(f"Error reading SBOM file {input_file}: {e}")
 
         if data.get("bomFormat") == "CycloneDX":
-            # Validate required fields before processing
-            spec_version = data.get("specVersion")
-            if spec_version is None:
-                raise SBOMValidationError("CycloneDX SBOM is missing required 'specVersion' field")
-
-            # Parse as CycloneDX
-            try:
-                bom = Bom.from_json(data)
-            except Exception as e:
-                raise SBOMValidationError(f"Failed to parse CycloneDX SBOM: {e}")
-            logger.info("Processing CycloneDX SBOM")
-
-            # Augment
-            bom = augment_cyclonedx_sbom(
-                bom,
-                augmentation_data,
-                override_sbom_metadata,
-                component_name,
-                component_version,
-                spec_version,
+            document = SBOMDocument(data)
+            _augment_cyclonedx_document(
+                document, augmentation_data, override_sbom_metadata, component_name, component_version
             )
 
-            # Sanitize dependency graph (add stubs for orphaned references)
-            sanitize_dependency_graph(bom)
-
-            # Link top-level components to root if root has no dependencies
-            link_root_dependencies(bom)
-
             # Write output using version-aware serialization
-            serialized = serialize_cyclonedx_bom(bom, spec_version)
+            serialized = document.to_json()
 
             output_path = Path(output_file)
             try:
@@ -1945,98 +1921,202 @@ def augment_sbom_from_file(
 
             # Validate the augmented SBOM
             if validate:
-                validation_result = validate_sbom_file_auto(output_file)
-                if validation_result.valid is None:
-                    logger.warning(
-                        f"Augmented SBOM could not be validated ({validation_result.sbom_format} "
-                        f"{validation_result.spec_version}): {validation_result.error_message}"
-                    )
-                elif not validation_result.valid:
-                    raise SBOMValidationError(f"Augmented SBOM failed validation: {validation_result.error_message}")
-                else:
-                    logger.info(
-                        f"Augmented SBOM validated: {validation_result.sbom_format} {validation_result.spec_version}"
-                    )
+                _report_augmented_validation(validate_sbom_file_auto(output_file))
 
             return "cyclonedx"
 
-        elif is_spdx3(data):
-            # Parse as SPDX 3
-            logger.info("Processing SPDX 3 SBOM")
-            augment_spdx3_sbom(
-                str(input_path),
-                output_file,
-                augmentation_data,
-                override_sbom_metadata,
-                component_name,
-                component_version,
-            )
-
-            logger.info(f"Augmented SPDX 3 SBOM written to: {output_file}")
+        elif is_spdx3(data) or data.get("spdxVersion"):
+            with uncompressed_path(input_path) as plain_input:
+                _augment_spdx_file(
+                    plain_input,
+                    output_file,
+                    is_spdx3(data),
+                    augmentation_data,
+                    override_sbom_metadata,
+                    component_name,
+                    component_version,
+                )
 
             # Validate the augmented SBOM
             if validate:
-                validation_result = validate_sbom_file_auto(output_file)
-                if validation_result.valid is None:
-                    logger.warning(
-                        f"Augmented SBOM could not be validated ({validation_result.sbom_format} "
-                        f"{validation_result.spec_version}): {validation_result.error_message}"
-                    )
-                elif not validation_result.valid:
-                    raise SBOMValidationError(f"Augmented SBOM failed validation: {validation_result.error_message}")
-                else:
-                    logger.info(
-                        f"Augmented SBOM validated: {validation_result.sbom_format} {validation_result.spec_version}"
-                    )
+                _report_augmented_validation(validate_sbom_file_auto(output_file))
 
             return "spdx"
 
-        elif data.get("spdxVersion"):
-            # Parse as SPDX 2.x
-            try:
-                document = spdx_parse_file(str(input_path))
-            except Exception as e:
-                raise SBOMValidationError(f"Failed to parse SPDX SBOM: {e}")
-            logger.info("Processing SPDX SBOM")
+        else:
+            raise ValueError("Neither CycloneDX nor SPDX format detected")
 
-            # Augment
-            document = augment_spdx_sbom(
-                document, augmentation_data, override_sbom_metadata, component_name, component_version
-            )
+    except Exception as e:
+        logger.error(f"Failed to augment SBOM: {e}")
+        raise
 
-            # Write output
-            output_path = Path(output_file)
-            try:
-                spdx_write_file(document, str(output_path), validate=False)
-                sanitize_spdx_json_file(str(output_path))
-                restore_spdx_document_describes(str(output_path))
-            except PermissionError:
-                raise PermissionError(f"Permission denied writing output file: {output_file}")
-            except OSError as e:
-                raise OSError(f"Error writing output file {output_file}: {e}")
 
-            logger.info(f"Augmented SPDX SBOM written to: {output_file}")
+def augment_sbom_document(
+    document: SBOMDocument,
+    api_base_url: Optional[str] = None,
+    token: Optional[str] = None,
+    component_id: Optional[str] = None,
+    override_sbom_metadata: bool = False,
+    component_name: Optional[str] = None,
+    component_version: Optional[str] = None,
+    validate: bool = True,
+    config_path: Optional[str] = None,
+) -> Literal["cyclonedx", "spdx"]:
+    """
+    Augment an in-memory SBOM document with metadata from multiple providers.
 
-            # Validate the augmented SBOM
-            if validate:
-                validation_result = validate_sbom_file_auto(output_file)
-                if validation_result.valid is None:
-                    logger.warning(
-                        f"Augmented SBOM could not be validated ({validation_result.sbom_format} "
-                        f"{validation_result.spec_version}): {validation_result.error_message}"
-                    )
-                elif not validation_result.valid:
-                    raise SBOMValidationError(f"Augmented SBOM failed validation: {validation_result.error_message}")
-                else:
-                    logger.info(
-                        f"Augmented SBOM validated: {validation_result.sbom_format} {validation_result.spec_version}"
-                    )
+    Same as augment_sbom_from_file(), but the document is modified in place.
+    CycloneDX SBOMs are augmented in memory; SPDX SBOMs go through the
+    file-based spdx_tools implementation.
 
-            return "spdx"
+    Args:
+        document: SBOM document to augment (modified in place)
+        api_base_url: Backend API base URL (optional, for sbomify API provider)
+        token: Authentication token (optional, for sbomify API provider)
+        component_id: Component ID (optional, for sbomify API provider)
+        override_sbom_metadata: Whether to override existing metadata
+        component_name: Optional component name override
+        component_version: Optional component version override
+        validate: Whether to validate the augmented SBOM (default: True)
+        config_path: Path to JSON config file (optional, defaults to sbomify.json)
+
+    Returns:
+        SBOM format ('cyclonedx' or 'spdx')
 
+    Raises:
+        ValueError: If SBOM format is not supported
+        SBOMValidationError: If validation fails
+        Exception: For other errors during augmentation
+    """
+    # Fetch metadata from all providers (merged by priority)
+    logger.info("Fetching augmentation metadata from providers")
+    augmentation_data = fetch_augmentation_metadata(
+        api_base_url=api_base_url,
+        token=token,
+        component_id=component_id,
+        config_path=config_path,
+    )
+
+    try:
+        if document.sbom_format == "cyclonedx":
+            _augment_cyclonedx_document(
+                document, augmentation_data, override_sbom_metadata, component_name, component_version
+            )
+        elif document.sbom_format == "spdx":
+            spdx3 = document.is_spdx3
+            document.apply_file_step(
+                lambda input_file, output_file: _augment_spdx_file(
+                    input_file,
+                    output_file,
+                    spdx3,
+                    augmentation_data,
+                    override_sbom_metadata,
+                    component_name,
+                    component_version,
+                )
+            )
         else:
             raise ValueError("Neither CycloneDX nor SPDX format detected")
 
+        if validate:
+            _report_augmented_validation(validate_sbom_data_auto(document.data))
+
+        return document.sbom_format
+
     except Exception as e:
         logger.error(f"Failed to augment SBOM: {e}")
         raise
+
+
+def _augment_cyclonedx_document(
+    document: SBOMDocument,
+    augmentation_data: Dict[str, Any],
+    override_sbom_metadata: bool,
+    component_name: Optional[str],
+    component_version: Optional[str],
+) -> None:
+    """Augment a CycloneDX document's Bom and sanitize it for output."""
+    # Validate required fields before processing
+    spec_version = document.spec_version
+    if spec_version is None:
+        raise SBOMValidationError("CycloneDX SBOM is missing required 'specVersion' field")
+
+    # Parse as CycloneDX
+    bom = document.bom
+    logger.info("Processing CycloneDX SBOM")
+
+    # Augment
+    bom = augment_cyclonedx_sbom(
+        bom,
+        augmentation_data,
+        override_sbom_metadata,
+        component_name,
+        component_version,
+        spec_version,
+    )
+
+    # Single pass: add stubs for orphaned references, link top-level
+    # components to root if it has no dependencies, fix PURL encoding
+    sanitize_cyclonedx_bom(bom, sanitize_purls=False, sanitize_licenses=False)
+    document.update_bom(bom)
+
+
+def _augment_spdx_file(
+    input_file: str,
+    output_file: str,
+    spdx3: bool,
+    augmentation_data: Dict[str, Any],
+    override_sbom_metadata: bool,
+    component_name: Optional[str],
+    component_version: Optional[str],
+) -> None:
+    """Augment an SPDX 2.x or SPDX 3 SBOM file and write the result."""
+    if spdx3:
+        # Parse as SPDX 3
+        logger.info("Processing SPDX 3 SBOM")
+        augment_spdx3_sbom(
+            input_file,
+            output_file,
+            augmentation_data,
+            override_sbom_metadata,
+            component_name,
+            component_version,
+        )
+
+        logger.info(f"Augmented SPDX 3 SBOM written to: {output_file}")
+        return
+
+    # Parse as SPDX 2.x
+    try:
+        document = spdx_parse_file(input_file)
+    except Exception as e:
+        raise SBOMValidationError(f"Failed to parse SPDX SBOM: {e}")
+    logger.info("Processing SPDX SBOM")
+
+    # Augment
+    document = augment_spdx_sbom(document, augmentation_data, override_sbom_metadata, component_name, component_version)
+
+    # Write output
+    try:
+        write_spdx_document(document, output_file)
+        sanitize_spdx_json_file(output_file)
+        restore_spdx_document_describes(output_file)
+    except PermissionError:
+        raise PermissionError(f"Permission denied writing output file: {output_file}")
+    except OSError as e:
+        raise OSError(f"Error writing output file {output_file}: {e}")
+
+    logger.info(f"Augmented SPDX SBOM written to: {output_file}")
+
+
+def _report_augmented_validation(validation_result: ValidationResult) -> None:
+    """Log the validation result of an augmented SBOM, raising if it is invalid."""
+    if validation_result.valid is None:
+        logger.warning(
+            f"Augmented SBOM could not be validated ({validation_result.sbom_format} "
+            f"{validation_result.spec_version}): {validation_result.error_message}"
+        )
+    elif not validation_result.valid:
+        raise SBOMValidationError(f"Augmented SBOM failed validation: {validation_result.error_message}")
+    else:
+        logger.info(f"Augmented SBOM validated: {validation_result.sbom_format} {validation_result.spec_version}")
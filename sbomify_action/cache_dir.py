@@ -0,0 +1,23 @@
+"""Location of the state sbomify-action keeps between runs.
+
+The generation cache, the upload record and the Yocto pipeline's state are
+all stored under one directory:
+
+    SBOMIFY_CACHE_DIR: The directory, if set
+    XDG_CACHE_HOME/sbomify: Otherwise (~/.cache/sbomify when XDG_CACHE_HOME is unset)
+"""
+
+import os
+from pathlib import Path
+
+
+def get_cache_dir() -> Path:
+    """Get the directory sbomify-action keeps its state in.
+
+    Looked up on every call, so changes to the environment apply immediately.
+    The directory isn't created.
+    """
+    explicit_cache = os.environ.get("SBOMIFY_CACHE_DIR")
+    if explicit_cache:
+        return Path(explicit_cache)
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "sbomify"
@@ -1,7 +1,5 @@
-import json
 import logging
 import os
-import shutil
 import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -14,16 +12,17 @@ import sentry_sdk
 # Add cyclonedx imports for proper SBOM handling
 from cyclonedx.model.bom import Bom
 
-from .. import format_display_name
+from .. import format_display_name, jsonio
 from .._upload import VALID_DESTINATIONS
-from ..additional_packages import inject_additional_packages
-from ..augmentation import augment_sbom_from_file
+from .._yocto.models import DEFAULT_WORKERS as DEFAULT_YOCTO_WORKERS
+from ..additional_packages import inject_additional_packages_into_document
+from ..augmentation import augment_sbom_document
+from ..compression import OUTPUT_COMPRESSIONS, read_sbom_bytes, with_compression_suffix
 from ..console import (
     get_audit_trail,
     gha_group,
     gha_notice,
     print_component_not_found_error,
-    print_duplicate_sbom_error,
     print_final_success,
     print_step_end,
     print_step_header,
@@ -32,6 +31,7 @@ from ..console import (
 from ..console import (
     print_banner as console_print_banner,
 )
+from ..document import SBOMDocument
 from ..exceptions import (
     APIError,
     ConfigurationError,
@@ -49,12 +49,11 @@ from ..generation import (
 )
 from ..logging_config import logger
 from ..serialization import (
-    _fix_purl_encoding_bugs_in_json,
     sanitize_spdx_licenses,
-    serialize_cyclonedx_bom,
 )
 from ..spdx3 import is_spdx3
-from ..upload import upload_sbom
+from ..upload import upload_to_all
+from ..validation import validate_sbom_file_auto
 
 
 # Import version for tool metadata with multiple fallback mechanisms
@@ -134,9 +133,12 @@ SBOMIFY_TOOL_NAME = "sbomify-action"
 SBOMIFY_VENDOR_NAME = "sbomify"
 LOCALHOST_PATTERNS = ["127.0.0.1", "localhost", "0.0.0.0"]
 VALID_SBOM_FORMATS: tuple[str, ...] = ("cyclonedx", "spdx")
+# "each-step" validates after augmentation and enrichment; "final" validates the finished SBOM once
+VALIDATION_POLICIES: tuple[str, ...] = ("each-step", "final")
 NONE_SENTINEL = "none"
 
-# Intermediate SBOM files for pipeline steps
+# Intermediate SBOMs, only written with KEEP_INTERMEDIATES (step_1.json also
+# receives the output of external generators before it is loaded)
 STEP_1_FILE = "step_1.json"  # Output of generation/validation
 STEP_2_FILE = "step_2.json"  # Output of augmentation
 STEP_3_FILE = "step_3.json"  # Output of enrichment
@@ -216,6 +218,9 @@ class Config:
     api_base_url: str = SBOMIFY_PRODUCTION_API
     sbom_format: SBOMFormat = "cyclonedx"
     spec_version: Optional[str] = None
+    validation_policy: str = "each-step"
+    keep_intermediates: bool = False
+    output_compression: str = "none"
 
     def __post_init__(self) -> None:
         """Set default values that depend on other fields."""
@@ -284,6 +289,20 @@ class Config:
                 f"Invalid SBOM_FORMAT: '{self.sbom_format}'. Must be one of: {', '.join(VALID_SBOM_FORMATS)}"
             )
 
+        # Validate validation policy
+        if self.validation_policy not in VALIDATION_POLICIES:
+            raise ConfigurationError(
+                f"Invalid VALIDATION_POLICY: '{self.validation_policy}'. "
+                f"Must be one of: {', '.join(VALIDATION_POLICIES)}"
+            )
+
+        # Validate output compression
+        if self.output_compression not in OUTPUT_COMPRESSIONS:
+            raise ConfigurationError(
+                f"Invalid OUTPUT_COMPRESSION: '{self.output_compression}'. "
+                f"Must be one of: {', '.join(OUTPUT_COMPRESSIONS)}"
+            )
+
         # Validate spec_version against sbom_format
         if self.spec_version:
             from ..generation import CYCLONEDX_VERSIONS, SPDX_VERSIONS
@@ -302,7 +321,7 @@ class Config:
         if self.product_releases:
             try:
                 # Parse JSON list format like ["product_id:v1.2.3"]
-                product_releases_list = json.loads(self.product_releases)
+                product_releases_list = jsonio.loads(self.product_releases)
                 if not isinstance(product_releases_list, list):
                     raise ConfigurationError('PRODUCT_RELEASE must be a JSON list like ["product_id:v1.2.3"]')
 
@@ -327,7 +346,7 @@ class Config:
                 self.product_releases = product_releases_list
                 logger.info(f"Validated product releases: {self.product_releases}")
 
-            except json.JSONDecodeError as e:
+            except jsonio.JSONDecodeError as e:
                 raise ConfigurationError(f"Invalid JSON format for PRODUCT_RELEASE: {e}")
             except Exception as e:
                 if "ConfigurationError" in str(type(e)):
@@ -465,6 +484,9 @@ def build_config(
     api_base_url: str = SBOMIFY_PRODUCTION_API,
     sbom_format: str = "cyclonedx",
     spec_version: Optional[str] = None,
+    validation_policy: str = "each-step",
+    keep_intermediates: bool = False,
+    output_compression: str = "none",
 ) -> Config:
     """
     Build and validate configuration from provided arguments.
@@ -529,7 +551,8 @@ def build_config(
         sbom_file=expanded_sbom_file,
         docker_image=docker_image,
         lock_file=expanded_lock_file,
-        output_file=output_file,
+        # A compressed output file gets the compression's extension (sbom.json -> sbom.json.gz)
+        output_file=with_compression_suffix(output_file, output_compression.lower()),
         upload=upload,
         upload_destinations=upload_destinations,
         augment=augment,
@@ -543,6 +566,9 @@ def build_config(
         api_base_url=api_base_url,
         sbom_format=sbom_format_lower,
         spec_version=spec_version,
+        validation_policy=validation_policy.lower(),
+        keep_intermediates=keep_intermediates,
+        output_compression=output_compression.lower(),
     )
 
     try:
@@ -588,6 +614,9 @@ def load_config() -> Config:
         product_releases=os.getenv("PRODUCT_RELEASE"),
         api_base_url=os.getenv("API_BASE_URL", SBOMIFY_PRODUCTION_API),
         sbom_format=os.getenv("SBOM_FORMAT", "cyclonedx"),
+        validation_policy=os.getenv("VALIDATION_POLICY", "each-step"),
+        keep_intermediates=evaluate_boolean(os.getenv("KEEP_INTERMEDIATES", "False")),
+        output_compression=os.getenv("OUTPUT_COMPRESSION", "none"),
     )
 
 
@@ -799,18 +828,30 @@ def path_expansion(path: str) -> str:
         )
 
 
-def get_last_sbom_from_last_step() -> Optional[str]:
+def _load_sbom_document(file_path: str) -> SBOMDocument:
     """
-    Helper function to get the SBOM from the previous step.
+    Load an SBOM file into the document carried through the pipeline.
+
+    Args:
+        file_path: Path to the SBOM JSON file
 
     Returns:
-        Path to the most recent SBOM file, or None if not found
+        The loaded SBOM document
+
+    Raises:
+        SBOMValidationError: If the file is not a CycloneDX or SPDX JSON document
     """
-    steps = [STEP_3_FILE, STEP_2_FILE, STEP_1_FILE]
-    for file in steps:
-        if Path(file).is_file():
-            return file
-    return None
+    document = SBOMDocument.from_file(file_path)
+    if document.sbom_format is None:
+        raise SBOMValidationError("Neither CycloneDX nor SPDX format found in JSON file")
+    return document
+
+
+def _dump_intermediate_sbom(document: SBOMDocument, step_file: str, config: Config) -> None:
+    """Write the SBOM as it is after a step, if intermediates were requested (KEEP_INTERMEDIATES)."""
+    if config.keep_intermediates:
+        document.write(step_file)
+        logger.info(f"Intermediate SBOM written to: {step_file}")
 
 
 def evaluate_boolean(value: str) -> bool:
@@ -840,9 +881,8 @@ def validate_sbom(file_path: str) -> str:
         SBOMValidationError: If SBOM is invalid or unsupported format
     """
     try:
-        with Path(file_path).open("r") as f:
-            data = json.load(f)
-    except json.JSONDecodeError:
+        data = jsonio.loads(read_sbom_bytes(file_path))
+    except jsonio.JSONDecodeError:
         raise SBOMValidationError("Invalid JSON format")
     except FileNotFoundError:
         raise SBOMValidationError(f"SBOM file not found: {file_path}")
@@ -858,37 +898,6 @@ def validate_sbom(file_path: str) -> str:
         raise SBOMValidationError("Neither CycloneDX nor SPDX format found in JSON file")
 
 
-def _detect_sbom_format_silent(file_path: str) -> str:
-    """
-    Silently detect the format of an SBOM file without logging.
-    Used for internal format checks after initial detection.
-
-    Args:
-        file_path: Path to the SBOM JSON file
-
-    Returns:
-        Format string: 'cyclonedx' or 'spdx'
-
-    Raises:
-        SBOMValidationError: If SBOM is invalid or unsupported format
-    """
-    try:
-        with Path(file_path).open("r") as f:
-            data = json.load(f)
-    except json.JSONDecodeError:
-        raise SBOMValidationError("Invalid JSON format")
-    except FileNotFoundError:
-        raise SBOMValidationError(f"SBOM file not found: {file_path}")
-
-    # Detect artifact type without logging
-    if data.get("bomFormat") == "CycloneDX":
-        return "cyclonedx"
-    elif data.get("spdxVersion") is not None or is_spdx3(data):
-        return "spdx"
-    else:
-        raise SBOMValidationError("Neither CycloneDX nor SPDX format found in JSON file")
-
-
 def load_sbom_from_file(file_path: str) -> tuple[str, dict, object]:
     """
     Load SBOM from JSON file using appropriate library based on format.
@@ -906,8 +915,7 @@ def load_sbom_from_file(file_path: str) -> tuple[str, dict, object]:
         SBOMValidationError: If SBOM cannot be parsed
     """
     try:
-        with Path(file_path).open("r") as f:
-            sbom_json = json.load(f)
+        sbom_json = jsonio.loads(read_sbom_bytes(file_path))
 
         # Detect format silently (format should already be known at this point)
         if sbom_json.get("bomFormat") == "CycloneDX":
@@ -929,7 +937,7 @@ def load_sbom_from_file(file_path: str) -> tuple[str, dict, object]:
         raise SBOMValidationError(f"Failed to load SBOM from {file_path}: {e}")
 
 
-def enrich_sbom(input_file: str, output_file: str) -> None:
+def enrich_sbom(input_file: str, output_file: str, validate: bool = True) -> None:
     """
     Takes a path to an SBOM as input and returns an enriched SBOM as the output
     using the plugin-based enrichment system.
@@ -937,6 +945,7 @@ def enrich_sbom(input_file: str, output_file: str) -> None:
     Args:
         input_file: Path to input SBOM file
         output_file: Path to save enriched SBOM
+        validate: Whether to validate the enriched SBOM
 
     Raises:
         SBOMGenerationError: If enrichment fails
@@ -944,11 +953,37 @@ def enrich_sbom(input_file: str, output_file: str) -> None:
     from ..enrichment import enrich_sbom as _enrich_impl
 
     try:
-        _enrich_impl(input_file, output_file)
+        _enrich_impl(input_file, output_file, validate=validate)
     except FileNotFoundError as e:
         raise SBOMGenerationError(f"Input file not found: {e}")
     except ValueError as e:
         raise SBOMValidationError(f"Invalid SBOM format: {e}")
+    except SBOMValidationError:
+        raise
+    except Exception as e:
+        raise SBOMGenerationError(f"Enrichment failed: {e}")
+
+
+def enrich_document(document: SBOMDocument, validate: bool = True) -> None:
+    """
+    Enrich an in-memory SBOM document using the plugin-based enrichment system.
+
+    Args:
+        document: The SBOM document to enrich (modified in place)
+        validate: Whether to validate the enriched SBOM
+
+    Raises:
+        SBOMValidationError: If the SBOM format is invalid or validation fails
+        SBOMGenerationError: If enrichment fails
+    """
+    from ..enrichment import enrich_sbom_document
+
+    try:
+        enrich_sbom_document(document, validate=validate)
+    except ValueError as e:
+        raise SBOMValidationError(f"Invalid SBOM format: {e}")
+    except SBOMValidationError:
+        raise
     except Exception as e:
         raise SBOMGenerationError(f"Enrichment failed: {e}")
 
@@ -1026,7 +1061,9 @@ def run_pipeline(config: Config) -> None:
         logger.error("Neither SBOM file, Docker image nor lockfile found.")
         sys.exit(1)
 
-    # Process input based on type
+    # Process input based on type. From here on the SBOM is carried through
+    # the remaining steps as an in-memory document and written once in step 4.
+    document: Optional[SBOMDocument] = None
     if FILE_TYPE == "ADDITIONAL_ONLY":
         from ..additional_packages import create_empty_sbom
 
@@ -1041,21 +1078,14 @@ def run_pipeline(config: Config) -> None:
         try:
             if FILE_TYPE == "SBOM":
                 logger.info(f"Processing existing SBOM file: {FILE}")
-                FORMAT = validate_sbom(FILE)
-                shutil.copy(FILE, STEP_1_FILE)
+                document = _load_sbom_document(FILE)
+                FORMAT = document.sbom_format
+                logger.info(f"Detected {format_display_name(FORMAT)} SBOM.")
 
                 # Sanitize SPDX licenses in input SBOMs (e.g. RPM-style "GPLv2+", "ASL 2.0")
                 # so that downstream steps can parse the file with spdx_tools
-                if FORMAT == "spdx":
-                    try:
-                        with open(STEP_1_FILE, encoding="utf-8") as f:
-                            spdx_data = json.load(f)
-                        sanitized = sanitize_spdx_licenses(spdx_data)
-                        if sanitized > 0:
-                            with open(STEP_1_FILE, "w", encoding="utf-8") as f:
-                                json.dump(spdx_data, f, ensure_ascii=False)
-                    except (OSError, json.JSONDecodeError) as e:
-                        logger.warning(f"Could not sanitize SPDX licenses in input SBOM: {e}")
+                if FORMAT == "spdx" and sanitize_spdx_licenses(document.data) > 0:
+                    document.update_data()
             elif config.docker_image:
                 logger.info(f"Generating SBOM from Docker image: {config.docker_image}")
                 result = generate_sbom(
@@ -1098,10 +1128,14 @@ def run_pipeline(config: Config) -> None:
             _log_step_end(1, success=False)
             sys.exit(1)
 
-    # Set the SBOM format based on the output (silent detection for generated SBOMs)
+    # Load the generated SBOM and set the SBOM format based on it
     try:
+        if document is None:
+            document = _load_sbom_document(STEP_1_FILE)
+            if not config.keep_intermediates:
+                Path(STEP_1_FILE).unlink()
         if FILE_TYPE not in ("SBOM", "ADDITIONAL_ONLY"):  # Only detect format if we generated the SBOM
-            FORMAT = _detect_sbom_format_silent(STEP_1_FILE)
+            FORMAT = document.sbom_format
             logger.info(f"Generated SBOM format: {format_display_name(FORMAT)}")
     except SBOMValidationError as e:
         logger.error(f"Generated SBOM validation failed: {e}")
@@ -1125,21 +1159,21 @@ def run_pipeline(config: Config) -> None:
     # Apply component version override if specified (regardless of augmentation settings)
     if config.component_version:
         logger.info(f"Applying component version override: {config.component_version}")
-        _apply_sbom_version_override(STEP_1_FILE, config)
+        _apply_sbom_version_override(document, config)
 
     # Apply component name override if specified (regardless of augmentation settings)
     if config.component_name:
         logger.info(f"Applying component name override: {config.component_name}")
-        _apply_sbom_name_override(STEP_1_FILE, config)
+        _apply_sbom_name_override(document, config)
 
     # Apply component PURL override if specified (regardless of augmentation settings)
     if config.component_purl:
         logger.info(f"Applying component PURL override: {config.component_purl}")
-        _apply_sbom_purl_override(STEP_1_FILE, config)
+        _apply_sbom_purl_override(document, config)
 
     # Inject additional packages if specified (file or environment variables)
     try:
-        injected_count = inject_additional_packages(STEP_1_FILE)
+        injected_count = inject_additional_packages_into_document(document)
         if injected_count > 0:
             logger.info(f"Successfully injected {injected_count} additional package(s) into SBOM")
         elif config.is_additional_packages_only:
@@ -1151,7 +1185,7 @@ def run_pipeline(config: Config) -> None:
             sys.exit(1)
         logger.warning(
             f"Failed to inject additional packages into SBOM: {e}. "
-            f"Verify that the SBOM file '{STEP_1_FILE}' exists and is readable, and that any "
+            "Verify that the SBOM is valid, and that any "
             "additional package configuration (ADDITIONAL_PACKAGES env var or "
             "additional_packages.txt file) is present and correctly formatted."
         )
@@ -1166,14 +1200,11 @@ def run_pipeline(config: Config) -> None:
         if supports_dependency_expansion(config.lock_file):
             _log_step_header(1.4, "Transitive Dependency Discovery")
             try:
-                from sbomify_action._dependency_expansion import expand_sbom_dependencies
+                from sbomify_action._dependency_expansion import expand_document_dependencies
 
                 logger.info("Discovering transitive dependencies...")
 
-                result = expand_sbom_dependencies(
-                    sbom_file=STEP_1_FILE,
-                    lock_file=config.lock_file,
-                )
+                result = expand_document_dependencies(document, lock_file=config.lock_file)
 
                 if result.added_count > 0:
                     logger.info(
@@ -1207,15 +1238,11 @@ def run_pipeline(config: Config) -> None:
     if config.lock_file and not config.is_additional_packages_only:
         _log_step_header(1.5, "Hash Enrichment from Lockfile")
         try:
-            from sbomify_action._hash_enrichment import enrich_sbom_with_hashes
+            from sbomify_action._hash_enrichment import enrich_document_with_hashes
 
             logger.info(f"Extracting hashes from lockfile: {config.lock_file}")
 
-            stats = enrich_sbom_with_hashes(
-                sbom_file=STEP_1_FILE,
-                lock_file=config.lock_file,
-                overwrite_existing=False,
-            )
+            stats = enrich_document_with_hashes(document, lock_file=config.lock_file, overwrite_existing=False)
 
             if stats["hashes_added"] > 0:
                 logger.info(
@@ -1232,6 +1259,8 @@ def run_pipeline(config: Config) -> None:
             _log_step_end(1.5, success=False)
             # Don't fail the entire process for hash enrichment issues
 
+    _dump_intermediate_sbom(document, STEP_1_FILE, config)
+
     # Step 2: Augmentation
     if config.augment:
         _log_step_header(2, "SBOM Augmentation with Backend Metadata")
@@ -1246,26 +1275,22 @@ def run_pipeline(config: Config) -> None:
             )
 
         try:
-            sbom_input_file = get_last_sbom_from_last_step()
-            if not sbom_input_file:
-                raise FileProcessingError("No SBOM file found from previous step")
-
             logger.info("Augmenting SBOM with backend metadata")
 
-            # Use augmentation module's file-based function
             # Note: PURL override is applied separately via _apply_sbom_purl_override()
-            sbom_format = augment_sbom_from_file(
-                input_file=sbom_input_file,
-                output_file=STEP_2_FILE,
+            sbom_format = augment_sbom_document(
+                document,
                 api_base_url=config.api_base_url,
                 token=config.token,
                 component_id=config.component_id,
                 override_sbom_metadata=config.override_sbom_metadata,
                 component_name=config.component_name,
                 component_version=config.component_version,
+                validate=config.validation_policy == "each-step",
             )
 
             logger.info(f"{format_display_name(sbom_format)} SBOM augmentation completed")
+            _dump_intermediate_sbom(document, STEP_2_FILE, config)
             _log_step_end(2)
 
         except (FileProcessingError, APIError, SBOMValidationError) as e:
@@ -1281,13 +1306,9 @@ def run_pipeline(config: Config) -> None:
     if config.enrich:
         _log_step_header(3, "SBOM Enrichment with Ecosystem Data")
         try:
-            sbom_input_file = get_last_sbom_from_last_step()
-            if not sbom_input_file:
-                raise FileProcessingError("No SBOM file found from previous step")
-
             logger.info("Enriching SBOM components with metadata from multiple data sources")
-            enrich_sbom(sbom_input_file, STEP_3_FILE)
-            _detect_sbom_format_silent(STEP_3_FILE)  # Silent validation
+            enrich_document(document, validate=config.validation_policy == "each-step")
+            _dump_intermediate_sbom(document, STEP_3_FILE, config)
             _log_step_end(3)
         except (FileProcessingError, SBOMGenerationError, SBOMValidationError) as e:
             logger.error(f"Step 3 (enrichment) failed: {e}")
@@ -1301,10 +1322,6 @@ def run_pipeline(config: Config) -> None:
     # Step 4: Finalize output
     _log_step_header(4, "Finalizing SBOM Output")
     try:
-        final_sbom_file = get_last_sbom_from_last_step()
-        if not final_sbom_file:
-            raise FileProcessingError("No SBOM file found to finalize")
-
         # Get the parent directory of the file path
         parent_dir = Path(config.output_file).parent
 
@@ -1312,28 +1329,18 @@ def run_pipeline(config: Config) -> None:
         if parent_dir != Path(".") and not parent_dir.exists():
             parent_dir.mkdir(parents=True, exist_ok=True)
 
-        # Read, fix any PURL encoding bugs, and write final SBOM
+        # Write final SBOM, fixing any PURL encoding bugs in CycloneDX
         # This fixes double-encoded %40%40 or double @@ issues
         # Note: We preserve canonical %40 encoding per PURL spec
-        with open(final_sbom_file, "r") as f:
-            content = f.read()
-
-        # Detect format and fix any PURL encoding bugs in CycloneDX
-        if '"bomFormat"' in content and '"CycloneDX"' in content:
-            content = _fix_purl_encoding_bugs_in_json(content)
-
-        with open(config.output_file, "w") as f:
-            f.write(content)
+        document.write(config.output_file, fix_purl_encoding=document.sbom_format == "cyclonedx")
 
-        # Clean up temporary files
-        while get_last_sbom_from_last_step():
-            temp_file = get_last_sbom_from_last_step()
-            Path(temp_file).unlink()
+        if config.validation_policy == "final":
+            _validate_final_sbom(config.output_file)
 
         logger.info(f"Final SBOM saved to: {config.output_file}")
         _log_step_end(4)
 
-    except (FileProcessingError, OSError) as e:
+    except (FileProcessingError, SBOMValidationError, OSError) as e:
         logger.error(f"Failed to finalize output: {e}")
         _log_step_end(4, success=False)
         sys.exit(1)
@@ -1343,34 +1350,27 @@ def run_pipeline(config: Config) -> None:
     if config.upload:
         _log_step_header(5, "Uploading SBOM")
         try:
-            # Upload to each configured destination
+            # Upload to the configured destinations concurrently
             logger.info(f"Upload destinations: {config.upload_destinations}")
 
+            results = upload_to_all(
+                sbom_file=config.output_file,
+                sbom_format=FORMAT,
+                token=config.token,
+                component_id=config.component_id,
+                api_base_url=config.api_base_url,
+                component_name=config.component_name,
+                component_version=config.component_version,
+                validate_before_upload=(FORMAT == "cyclonedx"),
+                destinations=config.upload_destinations,
+            )
+
             failed_destinations: list[str] = []
-            for destination in config.upload_destinations:
-                logger.info(f"Uploading to: {destination}")
-
-                result = upload_sbom(
-                    sbom_file=config.output_file,
-                    sbom_format=FORMAT,
-                    token=config.token,
-                    component_id=config.component_id,
-                    api_base_url=config.api_base_url,
-                    component_name=config.component_name,
-                    component_version=config.component_version,
-                    destination=destination,
-                    validate_before_upload=(FORMAT == "cyclonedx"),
-                )
+            for result in results:
+                destination = result.destination_name
 
                 if not result.success:
-                    if result.error_code == "DUPLICATE_ARTIFACT":
-                        logger.error(
-                            f"Upload to {destination} failed with duplicate SBOM: "
-                            f"component_id={config.component_id}, format={FORMAT}, "
-                            f"version={config.component_version}"
-                        )
-                        print_duplicate_sbom_error(config.component_id, FORMAT, config.component_version)
-                    elif result.error_code == "COMPONENT_NOT_FOUND":
+                    if result.error_code == "COMPONENT_NOT_FOUND":
                         logger.error(
                             f"Upload to {destination} failed: component not found (component_id={config.component_id})"
                         )
@@ -1378,6 +1378,10 @@ def run_pipeline(config: Config) -> None:
                     else:
                         logger.error(f"Upload to {destination} failed: {result.error_message}")
                     failed_destinations.append(destination)
+                elif result.duplicate:
+                    logger.info(f"{destination} already has this SBOM, nothing new uploaded")
+                    if destination == "sbomify" and result.sbom_id:
+                        sbom_id = result.sbom_id
                 else:
                     logger.info(f"Upload to {destination} succeeded")
                     # Store sbom_id from sbomify for release tagging
@@ -1468,6 +1472,29 @@ def run_pipeline(config: Config) -> None:
     print_final_success()
 
 
+def _validate_final_sbom(sbom_file_path: str) -> None:
+    """
+    Schema-validate the finished SBOM (VALIDATION_POLICY=final).
+
+    Args:
+        sbom_file_path: Path to the final SBOM JSON file
+
+    Raises:
+        SBOMValidationError: If the SBOM fails validation
+    """
+    validation_result = validate_sbom_file_auto(sbom_file_path)
+    fmt = format_display_name(validation_result.sbom_format)
+    if validation_result.valid is None:
+        logger.warning(
+            f"Final SBOM could not be validated ({fmt} {validation_result.spec_version}): "
+            f"{validation_result.error_message}"
+        )
+    elif not validation_result.valid:
+        raise SBOMValidationError(f"Final SBOM failed validation: {validation_result.error_message}")
+    else:
+        logger.info(f"Final SBOM validated: {fmt} {validation_result.spec_version}")
+
+
 def _validate_cyclonedx_sbom(sbom_file_path: str) -> bool | None:
     """
     Validate CycloneDX SBOM using cyclonedx-py tool.
@@ -1478,12 +1505,9 @@ def _validate_cyclonedx_sbom(sbom_file_path: str) -> bool | None:
     Returns:
         True if valid, False if invalid, None if validation tool not available
     """
-    import json
-
     try:
         # Basic JSON validation - ensure it's valid JSON and has required CycloneDX fields
-        with Path(sbom_file_path).open("r") as f:
-            sbom_data = json.load(f)
+        sbom_data = jsonio.loads(read_sbom_bytes(sbom_file_path))
 
         # Check for basic CycloneDX structure
         if sbom_data.get("bomFormat") == "CycloneDX" and sbom_data.get("specVersion"):
@@ -1493,7 +1517,7 @@ def _validate_cyclonedx_sbom(sbom_file_path: str) -> bool | None:
             logger.warning("SBOM basic validation failed: missing bomFormat or specVersion")
             return False
 
-    except json.JSONDecodeError as e:
+    except jsonio.JSONDecodeError as e:
         logger.warning(f"SBOM validation failed: Invalid JSON - {e}")
         return False
     except FileNotFoundError:
@@ -1542,18 +1566,16 @@ def _update_spdx_json_purl_version(package_json: dict, new_version: str) -> bool
     return False
 
 
-def _apply_sbom_version_override(sbom_file: str, config: "Config") -> None:
+def _apply_sbom_version_override(document: SBOMDocument, config: "Config") -> None:
     """
     Apply component version override based on configuration.
     This function ensures that COMPONENT_VERSION (or deprecated SBOM_VERSION) is applied regardless of augmentation settings.
 
+    Failures are logged as warnings and don't stop the pipeline.
+
     Args:
-        sbom_file: Path to the SBOM file to modify
+        document: The SBOM document to modify
         config: Configuration with version override settings
-
-    Raises:
-        SBOMValidationError: If SBOM cannot be processed
-        FileProcessingError: If file operations fail
     """
     if not config.component_version:
         return  # No version override specified
@@ -1561,89 +1583,75 @@ def _apply_sbom_version_override(sbom_file: str, config: "Config") -> None:
     audit_trail = get_audit_trail()
 
     try:
-        # Load SBOM from file
-        sbom_format, original_json, parsed_object = load_sbom_from_file(sbom_file)
         old_version = None
 
-        if sbom_format == "cyclonedx":
-            from cyclonedx.model.bom import Bom
+        if document.sbom_format == "cyclonedx":
             from cyclonedx.model.component import Component, ComponentType
 
             from ..augmentation import _update_component_purl_version
 
-            if isinstance(parsed_object, Bom):
-                # Apply version override to CycloneDX BOM object
-                if hasattr(parsed_object.metadata, "component") and parsed_object.metadata.component:
-                    old_version = parsed_object.metadata.component.version
-                    parsed_object.metadata.component.version = config.component_version
-                    # Also update the PURL version to maintain consistency
-                    _update_component_purl_version(parsed_object.metadata.component, config.component_version)
-                else:
-                    # Create component if it doesn't exist
-                    component_name = original_json.get("metadata", {}).get("component", {}).get("name", "unknown")
-                    parsed_object.metadata.component = Component(
-                        name=component_name, type=ComponentType.APPLICATION, version=config.component_version
-                    )
+            bom = document.bom
+            # Apply version override to CycloneDX BOM object
+            if bom.metadata.component:
+                old_version = bom.metadata.component.version
+                bom.metadata.component.version = config.component_version
+                # Also update the PURL version to maintain consistency
+                _update_component_purl_version(bom.metadata.component, config.component_version)
+            else:
+                # Create component if it doesn't exist
+                bom.metadata.component = Component(
+                    name="unknown", type=ComponentType.APPLICATION, version=config.component_version
+                )
 
-                # Record to audit trail
-                audit_trail.record_component_version_override(config.component_version, old_version)
+            # Record to audit trail
+            audit_trail.record_component_version_override(config.component_version, old_version)
+            document.update_bom()
 
-                # Serialize the BOM back to JSON using version-aware serializer
-                spec_version = original_json.get("specVersion")
-                if spec_version is None:
-                    raise SBOMValidationError("CycloneDX SBOM is missing required 'specVersion' field")
-                serialized = serialize_cyclonedx_bom(parsed_object, spec_version)
-                with Path(sbom_file).open("w") as f:
-                    f.write(serialized)
-
-        elif sbom_format == "spdx":
-            if is_spdx3(original_json):
-                # SPDX 3 - use parser/writer
-                from ..spdx3 import get_spdx3_root_package, parse_spdx3_file, write_spdx3_file
-
-                payload = parse_spdx3_file(sbom_file)
-                root_pkg = get_spdx3_root_package(payload)
-                if root_pkg:
-                    old_version = root_pkg.package_version
-                    root_pkg.package_version = config.component_version
-                    audit_trail.record_component_version_override(config.component_version, old_version)
-                    write_spdx3_file(payload, sbom_file)
-                else:
-                    logger.warning("SPDX 3 SBOM has no root package - cannot set version override")
+        elif document.is_spdx3:
+            # SPDX 3 - use parser/writer
+            from ..spdx3 import get_spdx3_root_package, parse_spdx3_data, spdx3_payload_to_dict
+
+            payload = parse_spdx3_data(document.data)
+            root_pkg = get_spdx3_root_package(payload)
+            if root_pkg:
+                old_version = root_pkg.package_version
+                root_pkg.package_version = config.component_version
+                audit_trail.record_component_version_override(config.component_version, old_version)
+                document.update_data(spdx3_payload_to_dict(payload))
             else:
-                # SPDX 2.x - apply version override to packages[0].versionInfo in JSON
-                if "packages" in original_json and original_json["packages"]:
-                    main_package = original_json["packages"][0]
-                    old_version = main_package.get("versionInfo")
-                    main_package["versionInfo"] = config.component_version
-                    # Also update PURL in externalRefs if present
-                    _update_spdx_json_purl_version(main_package, config.component_version)
-
-                    # Record to audit trail
-                    audit_trail.record_component_version_override(config.component_version, old_version)
-                else:
-                    logger.warning("SPDX SBOM has no packages - cannot set version override")
+                logger.warning("SPDX 3 SBOM has no root package - cannot set version override")
+
+        elif document.sbom_format == "spdx":
+            # SPDX 2.x - apply version override to packages[0].versionInfo in JSON
+            sbom_json = document.data
+            if "packages" in sbom_json and sbom_json["packages"]:
+                main_package = sbom_json["packages"][0]
+                old_version = main_package.get("versionInfo")
+                main_package["versionInfo"] = config.component_version
+                # Also update PURL in externalRefs if present
+                _update_spdx_json_purl_version(main_package, config.component_version)
 
-                with Path(sbom_file).open("w") as f:
-                    json.dump(original_json, f, indent=2)
+                # Record to audit trail
+                audit_trail.record_component_version_override(config.component_version, old_version)
+                document.update_data()
+            else:
+                logger.warning("SPDX SBOM has no packages - cannot set version override")
 
     except Exception as e:
         logger.warning(f"Failed to apply component version override: {e}")
         # Don't fail the entire process for version override issues
 
 
-def _apply_sbom_name_override(sbom_file: str, config: "Config") -> None:
+def _apply_sbom_name_override(document: SBOMDocument, config: "Config") -> None:
     """
     Apply component name override based on configuration.
     This function ensures that COMPONENT_NAME is applied regardless of augmentation settings.
 
+    Failures are logged as warnings and don't stop the pipeline.
+
     Args:
-        sbom_file: Path to the SBOM file to modify
+        document: The SBOM document to modify
         config: Configuration with name override settings
-
-    Raises:
-        SBOMValidationError: If SBOM cannot be processed
-        FileProcessingError: If file operations fail
     """
     if not config.component_name:
         return  # No name override specified
@@ -1651,90 +1659,75 @@ def _apply_sbom_name_override(sbom_file: str, config: "Config") -> None:
     audit_trail = get_audit_trail()
 
     try:
-        # Load SBOM from file
-        sbom_format, original_json, parsed_object = load_sbom_from_file(sbom_file)
-
-        if sbom_format == "cyclonedx":
-            from cyclonedx.model.bom import Bom
+        if document.sbom_format == "cyclonedx":
             from cyclonedx.model.component import Component, ComponentType
 
-            if isinstance(parsed_object, Bom):
-                # Apply name override to CycloneDX BOM object
-                needs_update = False
-                old_name = None
-                if hasattr(parsed_object.metadata, "component") and parsed_object.metadata.component:
-                    old_name = parsed_object.metadata.component.name or "unknown"
-                    if old_name != config.component_name:
-                        parsed_object.metadata.component.name = config.component_name
-                        needs_update = True
-                else:
-                    # Create component if it doesn't exist
-                    component_version = original_json.get("metadata", {}).get("component", {}).get("version", "unknown")
-                    parsed_object.metadata.component = Component(
-                        name=config.component_name, type=ComponentType.APPLICATION, version=component_version
-                    )
+            bom = document.bom
+            # Apply name override to CycloneDX BOM object
+            needs_update = False
+            old_name = None
+            if bom.metadata.component:
+                old_name = bom.metadata.component.name or "unknown"
+                if old_name != config.component_name:
+                    bom.metadata.component.name = config.component_name
                     needs_update = True
+            else:
+                # Create component if it doesn't exist
+                bom.metadata.component = Component(
+                    name=config.component_name, type=ComponentType.APPLICATION, version="unknown"
+                )
+                needs_update = True
 
-                if needs_update:
-                    # Record to audit trail
-                    audit_trail.record_component_name_override(config.component_name, old_name)
-
-                    # Serialize the BOM back to JSON using version-aware serializer
-                    spec_version = original_json.get("specVersion")
-                    if spec_version is None:
-                        raise SBOMValidationError("CycloneDX SBOM is missing required 'specVersion' field")
-                    serialized = serialize_cyclonedx_bom(parsed_object, spec_version)
-                    with Path(sbom_file).open("w") as f:
-                        f.write(serialized)
-
-        elif sbom_format == "spdx":
-            if is_spdx3(original_json):
-                # SPDX 3 - use parser/writer
-                from ..spdx3 import get_spdx3_document, get_spdx3_root_package, parse_spdx3_file, write_spdx3_file
-
-                payload = parse_spdx3_file(sbom_file)
-                doc = get_spdx3_document(payload)
-                root_pkg = get_spdx3_root_package(payload)
-                if not doc and not root_pkg:
-                    logger.warning("SPDX 3 SBOM has no document or root package - cannot set name override")
-                else:
-                    old_name = (doc.name if doc else None) or "unknown"
-                    if old_name != config.component_name:
-                        if doc:
-                            doc.name = config.component_name
-                        if root_pkg:
-                            root_pkg.name = config.component_name
-                        audit_trail.record_component_name_override(config.component_name, old_name)
-                        write_spdx3_file(payload, sbom_file)
+            if needs_update:
+                # Record to audit trail
+                audit_trail.record_component_name_override(config.component_name, old_name)
+                document.update_bom()
+
+        elif document.is_spdx3:
+            # SPDX 3 - use parser/writer
+            from ..spdx3 import get_spdx3_document, get_spdx3_root_package, parse_spdx3_data, spdx3_payload_to_dict
+
+            payload = parse_spdx3_data(document.data)
+            doc = get_spdx3_document(payload)
+            root_pkg = get_spdx3_root_package(payload)
+            if not doc and not root_pkg:
+                logger.warning("SPDX 3 SBOM has no document or root package - cannot set name override")
             else:
-                # SPDX 2.x - apply name override to the top-level "name" field
-                old_name = original_json.get("name", "unknown")
+                old_name = (doc.name if doc else None) or "unknown"
                 if old_name != config.component_name:
-                    original_json["name"] = config.component_name
-
-                    # Record to audit trail
+                    if doc:
+                        doc.name = config.component_name
+                    if root_pkg:
+                        root_pkg.name = config.component_name
                     audit_trail.record_component_name_override(config.component_name, old_name)
+                    document.update_data(spdx3_payload_to_dict(payload))
 
-                    with Path(sbom_file).open("w") as f:
-                        json.dump(original_json, f, indent=2)
+        elif document.sbom_format == "spdx":
+            # SPDX 2.x - apply name override to the top-level "name" field
+            sbom_json = document.data
+            old_name = sbom_json.get("name", "unknown")
+            if old_name != config.component_name:
+                sbom_json["name"] = config.component_name
+
+                # Record to audit trail
+                audit_trail.record_component_name_override(config.component_name, old_name)
+                document.update_data()
 
     except Exception as e:
         logger.warning(f"Failed to apply component name override: {e}")
         # Don't fail the entire process for name override issues
 
 
-def _apply_sbom_purl_override(sbom_file: str, config: "Config") -> None:
+def _apply_sbom_purl_override(document: SBOMDocument, config: "Config") -> None:
     """
     Apply component PURL override based on configuration.
     This function ensures that COMPONENT_PURL is applied regardless of augmentation settings.
 
+    Failures are logged as warnings and don't stop the pipeline.
+
     Args:
-        sbom_file: Path to the SBOM file to modify
+        document: The SBOM document to modify
         config: Configuration with PURL override settings
-
-    Raises:
-        SBOMValidationError: If SBOM cannot be processed
-        FileProcessingError: If file operations fail
     """
     if not config.component_purl:
         return  # No PURL override specified
@@ -1753,104 +1746,85 @@ def _apply_sbom_purl_override(sbom_file: str, config: "Config") -> None:
     audit_trail = get_audit_trail()
 
     try:
-        # Load SBOM from file
-        sbom_format, original_json, parsed_object = load_sbom_from_file(sbom_file)
-
-        if sbom_format == "cyclonedx":
-            from cyclonedx.model.bom import Bom
+        if document.sbom_format == "cyclonedx":
             from cyclonedx.model.component import Component, ComponentType
 
-            if isinstance(parsed_object, Bom):
-                # Apply PURL override to CycloneDX BOM object
-                needs_update = False
-                old_purl = None
-                if hasattr(parsed_object.metadata, "component") and parsed_object.metadata.component:
-                    old_purl = (
-                        str(parsed_object.metadata.component.purl) if parsed_object.metadata.component.purl else None
-                    )
-                    if old_purl != config.component_purl:
-                        parsed_object.metadata.component.purl = purl_obj
-                        needs_update = True
-                else:
-                    # Create component if it doesn't exist
-                    component = original_json.get("metadata", {}).get("component", {})
-                    component_name = component.get("name", "unknown")
-                    component_version = component.get("version", "unknown")
-                    parsed_object.metadata.component = Component(
-                        name=component_name, type=ComponentType.APPLICATION, version=component_version, purl=purl_obj
-                    )
+            bom = document.bom
+            # Apply PURL override to CycloneDX BOM object
+            needs_update = False
+            old_purl = None
+            if bom.metadata.component:
+                old_purl = str(bom.metadata.component.purl) if bom.metadata.component.purl else None
+                if old_purl != config.component_purl:
+                    bom.metadata.component.purl = purl_obj
                     needs_update = True
+            else:
+                # Create component if it doesn't exist
+                bom.metadata.component = Component(
+                    name="unknown", type=ComponentType.APPLICATION, version="unknown", purl=purl_obj
+                )
+                needs_update = True
 
-                if needs_update:
-                    # Record to audit trail
+            if needs_update:
+                # Record to audit trail
+                audit_trail.record_component_purl_override(config.component_purl, old_purl)
+                document.update_bom()
+
+        elif document.is_spdx3:
+            # SPDX 3 - use parser/writer
+            from ..spdx3 import get_spdx3_root_package, parse_spdx3_data, spdx3_payload_to_dict
+
+            payload = parse_spdx3_data(document.data)
+            root_pkg = get_spdx3_root_package(payload)
+            if root_pkg:
+                old_purl = root_pkg.package_url
+                if old_purl != config.component_purl:
+                    root_pkg.package_url = config.component_purl
                     audit_trail.record_component_purl_override(config.component_purl, old_purl)
+                    document.update_data(spdx3_payload_to_dict(payload))
+            else:
+                logger.warning("SPDX 3 SBOM has no root package - cannot set PURL override")
+
+        elif document.sbom_format == "spdx":
+            # SPDX 2.x - apply PURL override to external references
+            sbom_json = document.data
+            packages = sbom_json.get("packages", [])
+            if packages:
+                main_package = packages[0]
+                external_refs = main_package.get("externalRefs", [])
+
+                # Find existing PURL reference
+                existing_purl_ref = None
+                existing_purl_idx = None
+                for idx, ref in enumerate(external_refs):
+                    if ref.get("referenceType") == "purl":
+                        existing_purl_ref = ref
+                        existing_purl_idx = idx
+                        break
 
-                    # Serialize the BOM back to JSON using version-aware serializer
-                    spec_version = original_json.get("specVersion")
-                    if spec_version is None:
-                        raise SBOMValidationError("CycloneDX SBOM is missing required 'specVersion' field")
-                    serialized = serialize_cyclonedx_bom(parsed_object, spec_version)
-                    with Path(sbom_file).open("w") as f:
-                        f.write(serialized)
-
-        elif sbom_format == "spdx":
-            if is_spdx3(original_json):
-                # SPDX 3 - use parser/writer
-                from ..spdx3 import get_spdx3_root_package, parse_spdx3_file, write_spdx3_file
-
-                payload = parse_spdx3_file(sbom_file)
-                root_pkg = get_spdx3_root_package(payload)
-                if root_pkg:
-                    old_purl = root_pkg.package_url
+                old_purl = None
+                if existing_purl_ref:
+                    old_purl = existing_purl_ref.get("referenceLocator", "unknown")
                     if old_purl != config.component_purl:
-                        root_pkg.package_url = config.component_purl
-                        audit_trail.record_component_purl_override(config.component_purl, old_purl)
-                        write_spdx3_file(payload, sbom_file)
+                        external_refs[existing_purl_idx]["referenceLocator"] = config.component_purl
                 else:
-                    logger.warning("SPDX 3 SBOM has no root package - cannot set PURL override")
-            else:
-                # SPDX 2.x - apply PURL override to external references
-                packages = original_json.get("packages", [])
-                if packages:
-                    main_package = packages[0]
-                    external_refs = main_package.get("externalRefs", [])
-
-                    # Find existing PURL reference
-                    existing_purl_ref = None
-                    existing_purl_idx = None
-                    for idx, ref in enumerate(external_refs):
-                        if ref.get("referenceType") == "purl":
-                            existing_purl_ref = ref
-                            existing_purl_idx = idx
-                            break
-
-                    old_purl = None
-                    if existing_purl_ref:
-                        old_purl = existing_purl_ref.get("referenceLocator", "unknown")
-                        if old_purl != config.component_purl:
-                            external_refs[existing_purl_idx]["referenceLocator"] = config.component_purl
-                    else:
-                        # Add new PURL reference
-                        purl_category = "PACKAGE-MANAGER"
-                        if config.component_purl.startswith("pkg:docker/") or config.component_purl.startswith(
-                            "pkg:oci/"
-                        ):
-                            purl_category = "OTHER"
-                        new_purl_ref = {
-                            "referenceCategory": purl_category,
-                            "referenceType": "purl",
-                            "referenceLocator": config.component_purl,
-                        }
-                        external_refs.append(new_purl_ref)
-                        main_package["externalRefs"] = external_refs
-
-                    # Record to audit trail
-                    audit_trail.record_component_purl_override(config.component_purl, old_purl)
+                    # Add new PURL reference
+                    purl_category = "PACKAGE-MANAGER"
+                    if config.component_purl.startswith("pkg:docker/") or config.component_purl.startswith("pkg:oci/"):
+                        purl_category = "OTHER"
+                    new_purl_ref = {
+                        "referenceCategory": purl_category,
+                        "referenceType": "purl",
+                        "referenceLocator": config.component_purl,
+                    }
+                    external_refs.append(new_purl_ref)
+                    main_package["externalRefs"] = external_refs
 
-                    with Path(sbom_file).open("w") as f:
-                        json.dump(original_json, f, indent=2)
-                else:
-                    logger.warning("SPDX SBOM has no packages - cannot set PURL override")
+                # Record to audit trail
+                audit_trail.record_component_purl_override(config.component_purl, old_purl)
+                document.update_data()
+            else:
+                logger.warning("SPDX SBOM has no packages - cannot set PURL override")
 
     except Exception as e:
         logger.warning(f"Failed to apply component PURL override: {e}")
@@ -1956,7 +1930,15 @@ def _parse_upload_destinations_callback(
     envvar="OUTPUT_FILE",
     default="sbom_output.json",
     show_default=True,
-    help="Output path for the generated SBOM.",
+    help="Output path for the generated SBOM. A .gz or .zst extension writes a compressed file.",
+)
+@click.option(
+    "--output-compression",
+    envvar="OUTPUT_COMPRESSION",
+    type=click.Choice(OUTPUT_COMPRESSIONS, case_sensitive=False),
+    default="none",
+    show_default=True,
+    help="Compress the final SBOM; the matching extension (.gz or .zst) is added to the output file name.",
 )
 @click.option(
     "--upload/--no-upload",
@@ -2042,6 +2024,23 @@ def _parse_upload_destinations_callback(
     default=None,
     help="Override the spec version for SBOM generation (e.g., '1.6', '2.3', '3.0.1').",
 )
+@click.option(
+    "--validation-policy",
+    envvar="VALIDATION_POLICY",
+    type=click.Choice(VALIDATION_POLICIES, case_sensitive=False),
+    default="each-step",
+    show_default=True,
+    help="When to schema-validate: after each processing step, or once on the final SBOM.",
+)
+@click.option(
+    "--keep-intermediates/--no-keep-intermediates",
+    default=False,
+    show_default=True,
+    callback=_make_bool_envvar_callback("KEEP_INTERMEDIATES", False),
+    is_eager=True,
+    help="Write the SBOM after each step to step_1.json, step_2.json and step_3.json (for debugging). "
+    "[env: KEEP_INTERMEDIATES]",
+)
 @click.option(
     "--telemetry/--no-telemetry",
     envvar="TELEMETRY",
@@ -2085,6 +2084,9 @@ def cli(
     api_base_url: str,
     sbom_format: str,
     spec_version: Optional[str],
+    validation_policy: str,
+    keep_intermediates: bool,
+    output_compression: str,
     telemetry: bool,
     verbose: bool,
     quiet: bool,
@@ -2179,6 +2181,9 @@ def cli(
         api_base_url=api_base_url,
         sbom_format=sbom_format,
         spec_version=spec_version,
+        validation_policy=validation_policy,
+        keep_intermediates=keep_intermediates,
+        output_compression=output_compression,
     )
 
     # Run the pipeline
@@ -2209,6 +2214,26 @@ def cli(
     hidden=False,
     help="[Advanced] Limit number of packages to process (SPDX 2.2 only). Useful for testing.",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=DEFAULT_YOCTO_WORKERS,
+    show_default=True,
+    help="Number of packages processed concurrently (SPDX 2.2 only).",
+)
+@click.option(
+    "--stream/--no-stream",
+    default=False,
+    help="Read the archive in memory instead of extracting it to disk (SPDX 2.2 only).",
+)
+@click.option(
+    "--incremental/--no-incremental",
+    default=False,
+    help=(
+        "Reuse the SBOMs of packages unchanged since an earlier run instead of uploading them again (SPDX 2.2 only). "
+        "Relies on local state that isn't checked against the server."
+    ),
+)
 @click.option("--verbose", is_flag=True, default=False, help="Enable verbose logging.")
 @click.pass_context
 def yocto_cmd(
@@ -2221,6 +2246,9 @@ def yocto_cmd(
     dry_run: bool,
     visibility: str | None,
     max_packages: int | None,
+    workers: int,
+    stream: bool,
+    incremental: bool,
     verbose: bool,
 ) -> None:
     """Process Yocto/OpenEmbedded SPDX SBOMs.
@@ -2291,6 +2319,9 @@ def yocto_cmd(
         component_id=component_id,
         visibility=visibility,
         max_packages=max_packages,
+        workers=workers,
+        stream=stream,
+        incremental=incremental,
     )
 
     result = run_yocto_pipeline(config)
@@ -0,0 +1,157 @@
+"""Transparent compression for SBOM files.
+
+SBOMs can be read from gzip (``.json.gz``) and zstd (``.json.zst``) files
+anywhere a plain ``.json`` file is accepted. Compressed input is recognised by
+its magic bytes, so a compressed file is read correctly whatever it is called.
+Written files are compressed according to their extension.
+
+Usage:
+    from sbomify_action.compression import open_sbom_for_writing, read_sbom_bytes
+
+    data = jsonio.loads(read_sbom_bytes("sbom.json.zst"))
+    with open_sbom_for_writing("sbom.json.gz") as f:
+        jsonio.dump(data, f)
+"""
+
+import gzip
+import io
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, Literal, Optional
+
+import zstandard
+
+Compression = Literal["gzip", "zstd"]
+
+# Values accepted for the output compression setting
+OUTPUT_COMPRESSIONS = ["none", "gzip", "zstd"]
+
+COMPRESSION_SUFFIXES: dict[Compression, str] = {"gzip": ".gz", "zstd": ".zst"}
+
+_MAGIC_BYTES: dict[Compression, bytes] = {"gzip": b"\x1f\x8b", "zstd": b"\x28\xb5\x2f\xfd"}
+
+# gzip's default level 9 is several times slower than 6 for a negligible gain on JSON
+_GZIP_LEVEL = 6
+
+
+def detect_compression(file_path: str | Path) -> Optional[Compression]:
+    """
+    Detect whether a file is gzip or zstd compressed from its magic bytes.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        "gzip", "zstd", or None for uncompressed or unreadable files
+    """
+    try:
+        with open(file_path, "rb") as f:
+            head = f.read(4)
+    except OSError:
+        return None
+    for compression, magic in _MAGIC_BYTES.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def compression_for_path(file_path: str | Path) -> Optional[Compression]:
+    """Get the compression implied by a file name's extension, if any."""
+    suffix = Path(file_path).suffix.lower()
+    for compression, compression_suffix in COMPRESSION_SUFFIXES.items():
+        if suffix == compression_suffix:
+            return compression
+    return None
+
+
+def with_compression_suffix(file_path: str, compression: Optional[str]) -> str:
+    """
+    Add the extension for a compression to a file name unless it already has it.
+
+    Args:
+        file_path: File name, e.g. "sbom.json"
+        compression: "gzip", "zstd", or None/"none" for no compression
+
+    Returns:
+        The file name with the compression's extension, e.g. "sbom.json.gz"
+    """
+    suffix = COMPRESSION_SUFFIXES.get(compression)
+    if suffix is None or file_path.lower().endswith(suffix):
+        return file_path
+    return file_path + suffix
+
+
+def open_sbom_binary(file_path: str | Path) -> IO[bytes]:
+    """
+    Open an SBOM file for reading, decompressing it if it is compressed.
+
+    Raises:
+        OSError: If the file cannot be opened
+    """
+    compression = detect_compression(file_path)
+    if compression == "gzip":
+        return gzip.open(file_path, "rb")
+    if compression == "zstd":
+        return zstandard.ZstdDecompressor().stream_reader(open(file_path, "rb"), closefd=True)
+    return open(file_path, "rb")
+
+
+def read_sbom_bytes(file_path: str | Path) -> bytes:
+    """
+    Read the (decompressed) contents of an SBOM file.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    with open_sbom_binary(file_path) as f:
+        return f.read()
+
+
+def open_sbom_for_writing(file_path: str | Path) -> IO[str]:
+    """
+    Open an SBOM file for writing text, compressing it as its extension implies.
+
+    Raises:
+        OSError: If the file cannot be created
+    """
+    compression = compression_for_path(file_path)
+    if compression == "gzip":
+        return gzip.open(file_path, "wt", encoding="utf-8", compresslevel=_GZIP_LEVEL)
+    if compression == "zstd":
+        writer = zstandard.ZstdCompressor().stream_writer(open(file_path, "wb"), closefd=True)
+        return io.TextIOWrapper(writer, encoding="utf-8")
+    return open(file_path, "w", encoding="utf-8")
+
+
+@contextmanager
+def uncompressed_path(file_path: str | Path) -> Iterator[str]:
+    """
+    Provide an uncompressed copy of an SBOM file for code that needs a plain file.
+
+    Yields the path itself when the file is not compressed (or doesn't exist,
+    so callers report missing files as usual). Otherwise the file is
+    decompressed into a temporary ``.json`` file that is removed afterwards.
+
+    Args:
+        file_path: Path to a possibly compressed SBOM file
+
+    Yields:
+        Path to an uncompressed SBOM file
+    """
+    if detect_compression(file_path) is None:
+        yield str(file_path)
+        return
+
+    name = Path(file_path).name
+    stem = Path(name).stem if compression_for_path(name) else name
+    # Keep a .json name: spdx_tools picks its parser from the file extension
+    if not stem.lower().endswith(".json"):
+        stem = "sbom.json"
+
+    with tempfile.TemporaryDirectory(prefix="sbomify-") as tmp_dir:
+        plain_path = Path(tmp_dir) / stem
+        with open_sbom_binary(file_path) as src, open(plain_path, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        yield str(plain_path)
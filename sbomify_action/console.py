@@ -16,8 +16,6 @@ from rich.table import Table
 from rich.text import Text
 from rich.theme import Theme
 
-from sbomify_action import format_display_name
-
 # Detect CI environments
 IS_GITHUB_ACTIONS = os.getenv("GITHUB_ACTIONS") == "true"
 IS_GITLAB_CI = os.getenv("GITLAB_CI") == "true"
@@ -357,37 +355,6 @@ def print_upload_summary(
             console.print(f"  Error: {error_message}")
 
 
-def print_duplicate_sbom_error(component_id: str, sbom_format: str, component_version: Optional[str] = None) -> None:
-    """
-    Print a styled error panel for duplicate SBOM upload.
-
-    This provides a clear, user-friendly error message when an SBOM
-    already exists for the component, with suggested solutions.
-
-    Args:
-        component_id: The component ID that has the duplicate
-        sbom_format: SBOM format (cyclonedx/spdx)
-        component_version: The component version that has the duplicate
-    """
-    content = Text()
-    content.append("An SBOM already exists for this component.\n\n", style="bold")
-    content.append("Details:\n", style="cyan")
-    content.append(f"  Component ID: {component_id}\n")
-    if component_version:
-        content.append(f"  Version: {component_version}\n")
-    content.append(f"  Format: {format_display_name(sbom_format)}\n\n")
-    content.append("Possible solutions:\n", style="cyan")
-    content.append("  1. Set a unique version via COMPONENT_VERSION or --component-version\n")
-    content.append("  2. Delete the existing SBOM in the sbomify dashboard\n")
-    content.append("  3. Use a different component ID\n")
-
-    panel = Panel(content, title="[bold red]Duplicate SBOM[/bold red]", border_style="red")
-    console.print(panel)
-
-    # Also emit GHA error annotation
-    gha_error("SBOM already exists for this component version", title="Duplicate SBOM")
-
-
 def print_component_not_found_error(component_id: str) -> None:
     """
     Print a styled error panel for component not found error.
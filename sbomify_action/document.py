@@ -0,0 +1,244 @@
+"""
+In-memory SBOM document handed between pipeline steps.
+
+Each pipeline step used to read the SBOM from disk, parse it, modify it and
+write it back, so a single run parsed and serialized the SBOM once per step.
+SBOMDocument keeps the SBOM in memory instead. It holds the parsed JSON data
+and, for CycloneDX, the cyclonedx-python-lib Bom model. Whichever form a step
+modified last is the current one; the other form is rebuilt from it only when
+a later step asks for it. The document is serialized once, when it is written.
+
+Steps that are still implemented on top of files (the SPDX 2.x steps built on
+spdx_tools' file parser and writer) run through apply_file_step(), which hands
+them a temporary copy of the document and loads their output back.
+"""
+
+import tempfile
+from pathlib import Path
+from typing import Callable, Literal, Optional, TypeVar
+
+from cyclonedx.model.bom import Bom
+
+from . import jsonio
+from .compression import open_sbom_for_writing, read_sbom_bytes
+from .exceptions import SBOMValidationError
+from .serialization import _fix_purl_encoding_bugs_in_json, serialize_cyclonedx_bom, write_cyclonedx_bom
+from .spdx3 import is_spdx3
+
+T = TypeVar("T")
+
+
+def _detect_format(data: dict) -> Optional[Literal["cyclonedx", "spdx"]]:
+    if data.get("bomFormat") == "CycloneDX":
+        return "cyclonedx"
+    if data.get("spdxVersion") is not None or is_spdx3(data):
+        return "spdx"
+    return None
+
+
+class SBOMDocument:
+    """
+    An SBOM held in memory while it moves through the pipeline.
+
+    Steps read the representation they need (``data`` or, for CycloneDX,
+    ``bom``) and must report in-place changes with update_data() or
+    update_bom() so the other representation is rebuilt when next needed.
+
+    ``sbom_format`` is ``"cyclonedx"``, ``"spdx"`` or None for JSON that is
+    neither; steps are expected to skip documents they don't recognize.
+    """
+
+    def __init__(self, data: dict, text: Optional[str] = None) -> None:
+        """
+        Create a document from parsed SBOM JSON data.
+
+        Args:
+            data: Parsed SBOM JSON data
+            text: The JSON text the data was parsed from, if any. It is
+                written out verbatim as long as the document is unmodified.
+
+        Raises:
+            SBOMValidationError: If the data is not a JSON object
+        """
+        if not isinstance(data, dict):
+            raise SBOMValidationError("Neither CycloneDX nor SPDX format found in JSON file")
+        self.sbom_format = _detect_format(data)
+        self.spec_version: Optional[str] = data.get("specVersion") if self.sbom_format == "cyclonedx" else None
+        self.modified = False
+        self._data: Optional[dict] = data
+        self._bom: Optional[Bom] = None
+        self._text = text
+
+    @classmethod
+    def from_json(cls, text: str) -> "SBOMDocument":
+        """
+        Parse a document from JSON text.
+
+        Raises:
+            SBOMValidationError: If the text is not a JSON object
+        """
+        try:
+            data = jsonio.loads(text)
+        except jsonio.JSONDecodeError:
+            raise SBOMValidationError("Invalid JSON format")
+        return cls(data, text)
+
+    @classmethod
+    def from_file(cls, file_path: str | Path) -> "SBOMDocument":
+        """
+        Load a document from an SBOM JSON file, which may be gzip or zstd compressed.
+
+        Raises:
+            SBOMValidationError: If the file is missing or not a JSON object
+        """
+        try:
+            text = read_sbom_bytes(file_path).decode("utf-8")
+        except FileNotFoundError:
+            raise SBOMValidationError(f"SBOM file not found: {file_path}")
+        return cls.from_json(text)
+
+    @property
+    def is_spdx3(self) -> bool:
+        """Whether this is an SPDX 3 JSON-LD document."""
+        return self.sbom_format == "spdx" and is_spdx3(self.data)
+
+    @property
+    def data(self) -> dict:
+        """The SBOM as parsed JSON data, rebuilt from the Bom model if that changed last."""
+        if self._data is None:
+            self._data = jsonio.loads(self.to_json())
+        return self._data
+
+    @property
+    def bom(self) -> Bom:
+        """
+        The CycloneDX Bom model, parsed from the JSON data on first access.
+
+        Raises:
+            SBOMValidationError: If the document is not CycloneDX or cannot be parsed
+        """
+        if self._bom is None:
+            if self.sbom_format != "cyclonedx":
+                raise SBOMValidationError("Only CycloneDX SBOMs have a Bom model")
+            if self.spec_version is None:
+                raise SBOMValidationError("CycloneDX SBOM is missing required 'specVersion' field")
+            try:
+                self._bom = Bom.from_json(self.data)
+            except Exception as e:
+                raise SBOMValidationError(f"Failed to parse CycloneDX SBOM: {e}")
+        return self._bom
+
+    def update_data(self, data: Optional[dict] = None) -> None:
+        """
+        Record a change to the JSON data.
+
+        Args:
+            data: Replacement data. If omitted, ``data`` was modified in place.
+        """
+        if data is not None:
+            self._data = data
+        elif self._data is None:
+            raise ValueError("update_data() called without data before the data was read")
+        self._bom = None
+        self._text = None
+        self.modified = True
+
+    def update_bom(self, bom: Optional[Bom] = None) -> None:
+        """
+        Record a change to the CycloneDX Bom model.
+
+        Args:
+            bom: Replacement Bom. If omitted, ``bom`` was modified in place.
+        """
+        if bom is not None:
+            self._bom = bom
+        elif self._bom is None:
+            raise ValueError("update_bom() called without a Bom before the Bom was read")
+        self._data = None
+        self._text = None
+        self.modified = True
+
+    def to_json(self) -> str:
+        """
+        Serialize the document.
+
+        An unmodified document is returned exactly as it was read. CycloneDX
+        documents whose Bom changed last are serialized with the version-aware
+        CycloneDX serializer; anything else is written as 2-space indented JSON.
+        """
+        if self._text is None:
+            if self._data is None:
+                self._text = serialize_cyclonedx_bom(self._bom, self.spec_version)
+            else:
+                self._text = jsonio.dumps(self._data, indent=2)
+        return self._text
+
+    def write(self, file_path: str | Path, fix_purl_encoding: bool = False) -> None:
+        """
+        Write the document to a file.
+
+        The output is the same as to_json(), but modified JSON data is
+        streamed to the file element by element instead of being serialized
+        to a string first. A CycloneDX Bom model is serialized in full.
+
+        Args:
+            file_path: Output file path. A ``.gz`` or ``.zst`` extension
+                writes a gzip or zstd compressed file.
+            fix_purl_encoding: Fix PURL encoding bugs (%40%40, @@) in the output.
+                CycloneDX Bom models are fixed when serialized anyway; this
+                covers JSON that never went through the model.
+        """
+        fix = _fix_purl_encoding_bugs_in_json if fix_purl_encoding else None
+        with open_sbom_for_writing(file_path) as f:
+            if self._text is not None:
+                f.write(fix(self._text) if fix else self._text)
+            elif self._data is None:
+                write_cyclonedx_bom(self._bom, f, self.spec_version)
+            else:
+                # Strings never span chunks, so fixing chunk by chunk is safe
+                for chunk in jsonio.iterencode(self._data, indent=2):
+                    f.write(fix(chunk) if fix else chunk)
+
+    def apply_file_step(self, step: Callable[..., T], in_place: bool = False) -> T:
+        """
+        Run a file-based step against this document.
+
+        The document is written to a temporary file and the step's output is
+        loaded back into the document. If the step produces no output, the
+        document is left unchanged.
+
+        Args:
+            step: Called as ``step(input_path, output_path)``, or as
+                ``step(path)`` for steps that modify the file in place
+            in_place: Whether the step modifies its input file in place
+
+        Returns:
+            Whatever the step returns
+        """
+        with tempfile.TemporaryDirectory(prefix="sbomify-") as tmp_dir:
+            input_path = Path(tmp_dir) / "input.json"
+            output_path = Path(tmp_dir) / "output.json"
+            text = self.to_json()
+            input_path.write_text(text, encoding="utf-8")
+
+            if in_place:
+                result = step(str(input_path))
+                output_text = input_path.read_text(encoding="utf-8")
+                if output_text != text:
+                    self._load(output_text)
+            else:
+                result = step(str(input_path), str(output_path))
+                if output_path.exists():
+                    self._load(output_path.read_text(encoding="utf-8"))
+
+        return result
+
+    def _load(self, text: str) -> None:
+        """Replace the document contents with a step's JSON output."""
+        replacement = SBOMDocument.from_json(text)
+        self.sbom_format = replacement.sbom_format
+        self.spec_version = replacement.spec_version
+        self._data = replacement._data
+        self._bom = None
+        self._text = text
+        self.modified = True
@@ -50,10 +50,10 @@ Plugin architecture is in sbomify_action/_enrichment/:
 - sources/: Individual data source implementations
 """
 
-import json
 import os
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from cyclonedx.model import ExternalReference, ExternalReferenceType, Property, XsUri
 from cyclonedx.model.bom import Bom
@@ -72,9 +72,8 @@ from spdx_tools.spdx.model import (
 )
 from spdx_tools.spdx.parser.jsonlikedict.license_expression_parser import LicenseExpressionParser
 from spdx_tools.spdx.parser.parse_anything import parse_file as spdx_parse_file
-from spdx_tools.spdx.writer.write_anything import write_file as spdx_write_file
 
-from . import format_display_name
+from . import format_display_name, jsonio
 
 # Import from plugin architecture
 from ._enrichment.enricher import Enricher, clear_all_caches
@@ -88,7 +87,9 @@ from ._enrichment.sanitization import (
     sanitize_url,
 )
 from ._enrichment.sources.purl import NAMESPACE_TO_SUPPLIER
+from .compression import read_sbom_bytes, uncompressed_path
 from .console import get_audit_trail
+from .document import SBOMDocument
 from .exceptions import SBOMValidationError
 from .generation import (
     CPP_LOCK_FILES,
@@ -101,43 +102,36 @@ from .generation import (
 )
 from .logging_config import logger
 from .serialization import (
-    link_root_dependencies,
     restore_spdx_document_describes,
+    sanitize_cyclonedx_bom,
     sanitize_cyclonedx_licenses,
-    sanitize_dependency_graph,
-    sanitize_purls,
     sanitize_spdx_json_file,
     sanitize_spdx_purls,
-    serialize_cyclonedx_bom,
+    write_spdx_document,
 )
-from .validation import validate_sbom_file_auto
+from .validation import ValidationResult, validate_sbom_data_auto, validate_sbom_file_auto
 
 
-def _sanitize_and_serialize_cyclonedx(bom: Bom, spec_version: str) -> str:
+def _sanitize_cyclonedx(bom: Bom) -> None:
     """
-    Sanitize PURLs, dependency graph and serialize CycloneDX BOM.
+    Sanitize PURLs, licenses and the dependency graph of a CycloneDX BOM.
 
-    This is the final modification step before serialization. It:
+    This is the final modification step before serialization. In a single pass it:
     1. Normalizes PURLs (fixes encoding issues like double @@)
     2. Clears invalid PURLs that cannot be fixed (local workspace packages, path-based versions)
-    3. Adds stub components for any orphaned dependency references
+    3. Sanitizes invalid license IDs and expressions
+    4. Adds stub components for any orphaned dependency references
+    5. Links top-level components to the root if it has no dependencies
 
     Args:
-        bom: The CycloneDX BOM to sanitize and serialize
-        spec_version: The CycloneDX spec version
-
-    Returns:
-        Serialized JSON string
+        bom: The CycloneDX BOM to sanitize (modified in place)
     """
-    normalized_count, cleared_count = sanitize_purls(bom)
+    stats = sanitize_cyclonedx_bom(bom)
     logger.debug(
         "PURL sanitization completed: %d normalized, %d cleared",
-        normalized_count,
-        cleared_count,
+        stats.purls_normalized,
+        stats.purls_cleared,
     )
-    sanitize_dependency_graph(bom)
-    link_root_dependencies(bom)
-    return serialize_cyclonedx_bom(bom, spec_version)
 
 
 # Combine all lockfile names into a single set for efficient lookup
@@ -1219,7 +1213,12 @@ def _enrich_spdx3_sbom(input_path: Path, output_path: Path, enricher: Enricher)
         raise SBOMValidationError(f"Failed to write enriched SPDX 3 SBOM: {e}") from e
 
 
-def enrich_sbom(input_file: str, output_file: str, validate: bool = True) -> None:
+def enrich_sbom(
+    input_file: str,
+    output_file: str,
+    validate: bool = True,
+    enricher: Optional[Enricher] = None,
+) -> None:
     """
     Enrich SBOM with metadata from multiple data sources using plugin architecture.
 
@@ -1240,9 +1239,12 @@ def enrich_sbom(input_file: str, output_file: str, validate: bool = True) -> Non
     (when validate=True).
 
     Args:
-        input_file: Path to input SBOM file
+        input_file: Path to input SBOM file (may be gzip or zstd compressed)
         output_file: Path to save enriched SBOM
         validate: Whether to validate the output SBOM (default: True)
+        enricher: Enricher to use instead of a new one, e.g. one shared across
+                  a batch of SBOMs and prefetched with fetch_all_metadata().
+                  It is not closed afterwards.
 
     Raises:
         FileNotFoundError: If input file doesn't exist
@@ -1255,17 +1257,16 @@ def enrich_sbom(input_file: str, output_file: str, validate: bool = True) -> Non
     input_path = Path(input_file)
     output_path = Path(output_file)
 
-    # Parse input file
+    # Parse input file (possibly gzip/zstd compressed)
     try:
-        with open(input_path, "r") as f:
-            data = json.load(f)
+        data = jsonio.loads(read_sbom_bytes(input_path))
     except FileNotFoundError:
         raise FileNotFoundError(f"Input SBOM file not found: {input_file}")
-    except json.JSONDecodeError as e:
+    except jsonio.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in SBOM file: {e}")
 
-    # Create enricher with default sources
-    with Enricher() as enricher:
+    # Create enricher with default sources, unless the caller shares one
+    with nullcontext(enricher) if enricher is not None else Enricher() as enricher:
         # Log registered sources
         sources = enricher.registry.list_sources()
         logger.debug(f"Registered data sources: {[s['name'] for s in sources]}")
@@ -1275,31 +1276,92 @@ def enrich_sbom(input_file: str, output_file: str, validate: bool = True) -> Non
         if data.get("bomFormat") == "CycloneDX":
             _enrich_cyclonedx_sbom(data, input_path, output_path, enricher)
         elif is_spdx3(data):
-            _enrich_spdx3_sbom(input_path, output_path, enricher)
+            with uncompressed_path(input_path) as plain_input:
+                _enrich_spdx3_sbom(Path(plain_input), output_path, enricher)
         elif data.get("spdxVersion"):
-            _enrich_spdx_sbom(input_path, output_path, enricher)
+            with uncompressed_path(input_path) as plain_input:
+                _enrich_spdx_sbom(Path(plain_input), output_path, enricher)
         else:
             raise ValueError("Neither CycloneDX nor SPDX format found in JSON file")
 
     # Validate the enriched SBOM
     if validate:
-        validation_result = validate_sbom_file_auto(str(output_path))
-        if validation_result.valid is None:
-            fmt = format_display_name(validation_result.sbom_format)
-            ver = validation_result.spec_version
-            logger.warning(f"Enriched SBOM could not be validated ({fmt} {ver}): {validation_result.error_message}")
-        elif not validation_result.valid:
-            raise SBOMValidationError(f"Enriched SBOM failed validation: {validation_result.error_message}")
+        _report_enriched_validation(validate_sbom_file_auto(str(output_path)))
+
+
+def enrich_sbom_document(
+    document: SBOMDocument,
+    validate: bool = True,
+    enricher: Optional[Enricher] = None,
+) -> None:
+    """
+    Enrich an in-memory SBOM document using the plugin architecture.
+
+    Same as enrich_sbom(), but the document is modified in place. CycloneDX
+    SBOMs are enriched in memory; SPDX SBOMs go through the file-based
+    spdx_tools implementation.
+
+    Args:
+        document: SBOM document to enrich (modified in place)
+        validate: Whether to validate the enriched SBOM (default: True)
+        enricher: Enricher to use instead of a new one (see enrich_sbom())
+
+    Raises:
+        ValueError: If SBOM format is invalid
+        SBOMValidationError: If validation fails
+        Exception: For other errors during enrichment
+    """
+    logger.info("Starting SBOM enrichment")
+
+    with nullcontext(enricher) if enricher is not None else Enricher() as enricher:
+        sources = enricher.registry.list_sources()
+        logger.debug(f"Registered data sources: {[s['name'] for s in sources]}")
+
+        if document.sbom_format == "cyclonedx":
+            _enrich_cyclonedx_document(document, enricher)
+        elif document.is_spdx3:
+            document.apply_file_step(lambda i, o: _enrich_spdx3_sbom(Path(i), Path(o), enricher))
+        elif document.sbom_format == "spdx":
+            document.apply_file_step(lambda i, o: _enrich_spdx_sbom(Path(i), Path(o), enricher))
         else:
-            fmt = format_display_name(validation_result.sbom_format)
-            logger.info(f"Enriched SBOM validated: {fmt} {validation_result.spec_version}")
+            raise ValueError("Neither CycloneDX nor SPDX format found in JSON file")
+
+    if validate:
+        _report_enriched_validation(validate_sbom_data_auto(document.data))
+
+
+def _report_enriched_validation(validation_result: ValidationResult) -> None:
+    """Log the validation result of an enriched SBOM, raising if it is invalid."""
+    fmt = format_display_name(validation_result.sbom_format)
+    if validation_result.valid is None:
+        ver = validation_result.spec_version
+        logger.warning(f"Enriched SBOM could not be validated ({fmt} {ver}): {validation_result.error_message}")
+    elif not validation_result.valid:
+        raise SBOMValidationError(f"Enriched SBOM failed validation: {validation_result.error_message}")
+    else:
+        logger.info(f"Enriched SBOM validated: {fmt} {validation_result.spec_version}")
 
 
 def _enrich_cyclonedx_sbom(data: Dict[str, Any], input_path: Path, output_path: Path, enricher: Enricher) -> None:
     """Enrich a CycloneDX SBOM."""
+    document = SBOMDocument(data)
+    _enrich_cyclonedx_document(document, enricher)
+
+    # Write output
+    try:
+        with open(output_path, "w") as f:
+            f.write(document.to_json())
+        logger.info(f"Enriched SBOM written to: {output_path}")
+    except Exception as e:
+        raise Exception(f"Failed to write enriched SBOM: {e}")
+
+
+def _enrich_cyclonedx_document(document: SBOMDocument, enricher: Enricher) -> None:
+    """Enrich a CycloneDX SBOM document and sanitize it for output."""
     logger.info("Processing CycloneDX SBOM")
 
-    spec_version = data.get("specVersion")
+    data = document.data
+    spec_version = document.spec_version
     if spec_version is None:
         raise SBOMValidationError("CycloneDX SBOM is missing required 'specVersion' field")
 
@@ -1342,9 +1404,8 @@ def _enrich_cyclonedx_sbom(data: Dict[str, Any], input_path: Path, output_path:
     components = _extract_components_from_cyclonedx(bom)
     if not components:
         logger.warning("No components with PURLs found in SBOM, skipping enrichment")
-        serialized = _sanitize_and_serialize_cyclonedx(bom, spec_version)
-        with open(output_path, "w") as f:
-            f.write(serialized)
+        _sanitize_cyclonedx(bom)
+        document.update_bom(bom)
         return
 
     logger.info(f"Found {len(components)} components to enrich")
@@ -1361,14 +1422,8 @@ def _enrich_cyclonedx_sbom(data: Dict[str, Any], input_path: Path, output_path:
     # Print summary
     _log_cyclonedx_enrichment_summary(stats, len(components))
 
-    # Write output
-    try:
-        serialized = _sanitize_and_serialize_cyclonedx(bom, spec_version)
-        with open(output_path, "w") as f:
-            f.write(serialized)
-        logger.info(f"Enriched SBOM written to: {output_path}")
-    except Exception as e:
-        raise Exception(f"Failed to write enriched SBOM: {e}")
+    _sanitize_cyclonedx(bom)
+    document.update_bom(bom)
 
 
 def _enrich_spdx_sbom(input_path: Path, output_path: Path, enricher: Enricher) -> None:
@@ -1389,7 +1444,7 @@ def _enrich_spdx_sbom(input_path: Path, output_path: Path, enricher: Enricher) -
     packages = _extract_packages_from_spdx(document)
     if not packages:
         logger.warning("No packages with PURLs found in SBOM, skipping enrichment")
-        spdx_write_file(document, str(output_path), validate=False)
+        write_spdx_document(document, str(output_path))
         sanitize_spdx_json_file(str(output_path))
         restore_spdx_document_describes(str(output_path))
         return
@@ -1418,7 +1473,7 @@ def _enrich_spdx_sbom(input_path: Path, output_path: Path, enricher: Enricher) -
 
     # Write output
     try:
-        spdx_write_file(document, str(output_path), validate=False)
+        write_spdx_document(document, str(output_path))
         sanitize_spdx_json_file(str(output_path))
         restore_spdx_document_describes(str(output_path))
         logger.info(f"Enriched SBOM written to: {output_path}")
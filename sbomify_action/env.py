@@ -0,0 +1,24 @@
+"""Helpers for reading configuration from environment variables."""
+
+import os
+
+# Values that turn a boolean setting on; anything else turns it off
+TRUE_VALUES = frozenset({"true", "yes", "1", "on"})
+
+
+def get_env_bool(key: str, default: bool = False) -> bool:
+    """
+    Get a boolean environment variable.
+
+    Args:
+        key: Name of the environment variable
+        default: Value when the variable is unset
+
+    Returns:
+        True for "true", "yes", "1" or "on" (case-insensitive), False for
+        any other value, and default when unset
+    """
+    value = os.getenv(key)
+    if value is None:
+        return default
+    return value.lower() in TRUE_VALUES
@@ -87,6 +87,10 @@ class PlanLimitError(APIError):
     """Raised when an API operation fails due to plan limits (e.g., max components)."""
 
 
+class ComponentNotFoundError(APIError):
+    """Raised when an API operation targets a component that does not exist."""
+
+
 class FileProcessingError(SbomifyError):
     """Raised when file operations fail."""
 
@@ -0,0 +1,277 @@
+"""JSON codec layer for SBOM load/dump sites.
+
+All SBOM JSON parsing and writing goes through this module so that a faster
+codec can be used when available. The functions mirror the stdlib ``json``
+API (``load``, ``loads``, ``dump``, ``dumps``) and produce the same output:
+
+- When ``orjson`` is installed it is used for every parse, and for every dump
+  whose formatting it can reproduce exactly (compact or 2-space indent).
+- Anything else (other indents, stdlib default spacing, ensure_ascii output
+  containing non-ASCII text, non-string keys, huge integers) is handled by
+  the stdlib, so output bytes never change with the codec in use.
+
+Known differences, neither of which occurs in practice in SBOMs: float
+exponent notation (``1e16`` vs ``1e+16``) when dumping, and integers wider
+than 64 bits being parsed as floats.
+
+The codec can be forced with the SBOMIFY_JSON_CODEC environment variable
+(``orjson`` or ``stdlib``) or with set_codec().
+
+dump() streams: iterencode() writes the top-level object one member at a time
+and its arrays one element at a time, so the full output string is never held
+in memory. Top-level values may also be iterators, which are written as arrays
+as they are consumed; writers use this to convert large models element by
+element instead of building the complete document first.
+"""
+
+import json
+import os
+from collections.abc import Iterator
+from typing import IO, Any, Callable, Dict, Iterable, Optional, Tuple
+
+from .logging_config import logger
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+# Separators stdlib json uses when none are given
+_DEFAULT_SEPARATORS = (", ", ": ")
+_DEFAULT_INDENT_SEPARATORS = (",", ": ")
+_COMPACT_SEPARATORS = (",", ":")
+
+
+class JsonCodec:
+    """Stdlib JSON codec; the reference behaviour for all other codecs."""
+
+    name = "stdlib"
+
+    def loads(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(
+        self,
+        obj: Any,
+        *,
+        indent: Optional[int] = None,
+        ensure_ascii: bool = True,
+        sort_keys: bool = False,
+        separators: Optional[Tuple[str, str]] = None,
+        default: Optional[Callable[[Any], Any]] = None,
+    ) -> str:
+        return json.dumps(
+            obj,
+            indent=indent,
+            ensure_ascii=ensure_ascii,
+            sort_keys=sort_keys,
+            separators=separators,
+            default=default,
+        )
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson-backed codec that falls back to stdlib for output it can't reproduce."""
+
+    name = "orjson"
+
+    def loads(self, data: str | bytes) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects some input stdlib accepts (NaN, Infinity);
+            # let stdlib decide and raise its own error for truly invalid JSON
+            return json.loads(data)
+
+    def dumps(
+        self,
+        obj: Any,
+        *,
+        indent: Optional[int] = None,
+        ensure_ascii: bool = True,
+        sort_keys: bool = False,
+        separators: Optional[Tuple[str, str]] = None,
+        default: Optional[Callable[[Any], Any]] = None,
+    ) -> str:
+        option = self._option_for(indent, separators)
+        if option is not None:
+            if sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            try:
+                data = orjson.dumps(obj, default=default, option=option)
+            except orjson.JSONEncodeError:
+                data = None
+            # ensure_ascii output is only identical while there's nothing to escape
+            if data is not None and (not ensure_ascii or (data.isascii() and b"\x7f" not in data)):
+                return data.decode("utf-8")
+        return super().dumps(
+            obj,
+            indent=indent,
+            ensure_ascii=ensure_ascii,
+            sort_keys=sort_keys,
+            separators=separators,
+            default=default,
+        )
+
+    @staticmethod
+    def _option_for(indent: Optional[int], separators: Optional[Tuple[str, str]]) -> Optional[int]:
+        """Get orjson options matching the requested stdlib layout, or None if there are none."""
+        if indent is None:
+            return 0 if tuple(separators or _DEFAULT_SEPARATORS) == _COMPACT_SEPARATORS else None
+        if indent == 2 and tuple(separators or _DEFAULT_INDENT_SEPARATORS) == _DEFAULT_INDENT_SEPARATORS:
+            return orjson.OPT_INDENT_2
+        return None
+
+
+_CODECS: Dict[str, Callable[[], JsonCodec]] = {"stdlib": JsonCodec}
+if orjson is not None:
+    _CODECS["orjson"] = OrjsonCodec
+
+
+def _default_codec() -> JsonCodec:
+    requested = os.environ.get("SBOMIFY_JSON_CODEC", "").strip().lower()
+    if requested:
+        if requested in _CODECS:
+            return _CODECS[requested]()
+        logger.warning(f"JSON codec '{requested}' is not available, using the default")
+    return OrjsonCodec() if orjson is not None else JsonCodec()
+
+
+_codec = _default_codec()
+
+
+def get_codec() -> JsonCodec:
+    """Get the codec currently in use."""
+    return _codec
+
+
+def set_codec(name: str) -> JsonCodec:
+    """
+    Select the codec used by this module.
+
+    Args:
+        name: Codec name ("orjson" or "stdlib")
+
+    Returns:
+        The previously active codec
+
+    Raises:
+        ValueError: If the codec is unknown or its library is not installed
+    """
+    global _codec
+    if name not in _CODECS:
+        raise ValueError(f"Unknown or unavailable JSON codec: {name}")
+    previous, _codec = _codec, _CODECS[name]()
+    return previous
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document from a string or bytes."""
+    return _codec.loads(data)
+
+
+def load(fp: IO) -> Any:
+    """Parse a JSON document from a text or binary file object."""
+    return _codec.loads(fp.read())
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: Optional[int] = None,
+    ensure_ascii: bool = True,
+    sort_keys: bool = False,
+    separators: Optional[Tuple[str, str]] = None,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """Serialize an object to a JSON string, formatted exactly like json.dumps()."""
+    return _codec.dumps(
+        obj,
+        indent=indent,
+        ensure_ascii=ensure_ascii,
+        sort_keys=sort_keys,
+        separators=separators,
+        default=default,
+    )
+
+
+def iterencode(
+    obj: Any,
+    *,
+    indent: Optional[int] = None,
+    ensure_ascii: bool = True,
+    sort_keys: bool = False,
+    separators: Optional[Tuple[str, str]] = None,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> Iterator[str]:
+    """
+    Serialize an object to JSON as a sequence of string chunks.
+
+    The concatenated chunks are exactly what dumps() would return. A top-level
+    object is split into its members, and arrays among its values into their
+    elements; each piece is encoded with the active codec. Values of the
+    top-level object may also be iterators, which are written as arrays.
+
+    Every string in the output is contained in a single chunk, so per-chunk
+    post-processing of string contents sees the same text as post-processing
+    the whole document.
+    """
+    options: Dict[str, Any] = {"ensure_ascii": ensure_ascii, "sort_keys": sort_keys, "default": default}
+    if not isinstance(obj, dict) or not obj or not all(isinstance(key, str) for key in obj):
+        yield dumps(obj, indent=indent, separators=separators, **options)
+        return
+
+    if separators is not None:
+        item_separator, key_separator = separators
+    else:
+        item_separator, key_separator = _DEFAULT_SEPARATORS if indent is None else _DEFAULT_INDENT_SEPARATORS
+    indent_str = None if indent is None else " " * indent
+
+    def newline(depth: int) -> str:
+        return "" if indent_str is None else "\n" + indent_str * depth
+
+    def encode(value: Any, depth: int) -> str:
+        text = dumps(value, indent=indent, separators=separators, **options)
+        # JSON strings can't contain raw newlines, so every newline is layout
+        return text if indent_str is None else text.replace("\n", newline(depth))
+
+    def encode_array(items: Iterable[Any]) -> Iterator[str]:
+        first = True
+        for item in items:
+            yield ("[" if first else item_separator) + newline(2) + encode(item, 2)
+            first = False
+        yield "[]" if first else newline(1) + "]"
+
+    for i, key in enumerate(sorted(obj) if sort_keys else obj):
+        value = obj[key]
+        prefix = ("{" if i == 0 else item_separator) + newline(1)
+        yield prefix + dumps(key, ensure_ascii=ensure_ascii) + key_separator
+        if isinstance(value, (list, tuple, Iterator)):
+            yield from encode_array(value)
+        else:
+            yield encode(value, 1)
+    yield newline(0) + "}"
+
+
+def dump(
+    obj: Any,
+    fp: IO[str],
+    *,
+    indent: Optional[int] = None,
+    ensure_ascii: bool = True,
+    sort_keys: bool = False,
+    separators: Optional[Tuple[str, str]] = None,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> None:
+    """Serialize an object to a text file object in chunks, formatted exactly like json.dump()."""
+    for chunk in iterencode(
+        obj,
+        indent=indent,
+        ensure_ascii=ensure_ascii,
+        sort_keys=sort_keys,
+        separators=separators,
+        default=default,
+    ):
+        fp.write(chunk)
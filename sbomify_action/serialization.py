@@ -6,18 +6,28 @@ formats, supporting multiple versions and making it easy to add new versions in
 """
 
 import hashlib
-import json
 import re
 import warnings
-from typing import TYPE_CHECKING, Dict, Optional, Type
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import IO, TYPE_CHECKING, Any, Dict, Optional, Type
 
 from cyclonedx.model.bom import Bom
 
 if TYPE_CHECKING:
+    from cyclonedx.model import BomRef
     from cyclonedx.model.component import Component
+    from cyclonedx.model.dependency import Dependency
+    from cyclonedx.model.service import Service
 from packageurl import PackageURL
+from spdx_tools.spdx.document_utils import create_document_without_duplicates
+from spdx_tools.spdx.formats import FileFormat, file_name_to_format
+from spdx_tools.spdx.jsonschema.document_converter import DocumentConverter
+from spdx_tools.spdx.jsonschema.document_properties import DocumentProperty
 from spdx_tools.spdx.model import Document
+from spdx_tools.spdx.writer.write_anything import write_file as spdx_write_file
 
+from . import jsonio
 from .console import get_transformation_tracker
 from .logging_config import logger
 
@@ -403,8 +413,8 @@ def sanitize_spdx_json_file(file_path: str) -> int:
     """
     try:
         with open(file_path, encoding="utf-8") as f:
-            data = json.load(f)
-    except (OSError, json.JSONDecodeError) as e:
+            data = jsonio.load(f)
+    except (OSError, jsonio.JSONDecodeError) as e:
         logger.warning(f"Failed to read SPDX file for sanitization: {e}")
         return 0
 
@@ -424,7 +434,7 @@ def sanitize_spdx_json_file(file_path: str) -> int:
     if fixed_count > 0:
         try:
             with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False)
+                jsonio.dump(data, f, ensure_ascii=False)
             logger.info(f"SPDX JSON sanitization: fixed {fixed_count} invalid enum value(s)")
         except OSError as e:
             logger.warning(f"Failed to write sanitized SPDX file: {e}")
@@ -449,8 +459,8 @@ def restore_spdx_document_describes(file_path: str) -> int:
     """
     try:
         with open(file_path, encoding="utf-8") as f:
-            data = json.load(f)
-    except (OSError, json.JSONDecodeError) as e:
+            data = jsonio.load(f)
+    except (OSError, jsonio.JSONDecodeError) as e:
         logger.warning(f"Failed to read SPDX file for documentDescribes restoration: {e}")
         return 0
 
@@ -482,7 +492,7 @@ def restore_spdx_document_describes(file_path: str) -> int:
 
     try:
         with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False)
+            jsonio.dump(data, f, ensure_ascii=False)
         logger.debug(f"Restored documentDescribes with {added_count} element(s)")
     except OSError as e:
         logger.warning(f"Failed to write SPDX file with documentDescribes: {e}")
@@ -491,6 +501,56 @@ def restore_spdx_document_describes(file_path: str) -> int:
     return added_count
 
 
+def _create_stub_component(ref_value: str) -> "Component":
+    """
+    Create a minimal stub component for an orphaned dependency reference.
+
+    The reference is parsed as a PURL where possible to fill in name, version
+    and group; otherwise the raw reference becomes the component name.
+
+    Args:
+        ref_value: The bom-ref value referenced by the dependency graph
+
+    Returns:
+        Stub Component carrying ref_value as its bom-ref
+    """
+    from cyclonedx.model import BomRef
+    from cyclonedx.model.component import Component, ComponentType
+
+    tracker = get_transformation_tracker()
+
+    # Try to parse as PURL to get component info
+    name, version, namespace, purl_obj = _extract_component_info_from_purl(ref_value)
+
+    if name:
+        # Create stub component from PURL info
+        stub = Component(
+            type=ComponentType.LIBRARY,
+            name=name,
+            version=version or _UNKNOWN_VERSION,
+            bom_ref=BomRef(ref_value),
+        )
+        if namespace:
+            stub.group = namespace
+        if purl_obj:
+            stub.purl = purl_obj
+
+        # Record for attestation
+        tracker.record_stub_added(ref_value, name, version or _UNKNOWN_VERSION)
+    else:
+        # Can't parse as PURL - create minimal stub with ref as name
+        stub = Component(
+            type=ComponentType.LIBRARY,
+            name=ref_value,
+            version=_UNKNOWN_VERSION,
+            bom_ref=BomRef(ref_value),
+        )
+        # Record for attestation
+        tracker.record_stub_added(ref_value, ref_value, _UNKNOWN_VERSION)
+
+    return stub
+
+
 def sanitize_dependency_graph(bom: Bom) -> int:
     """
     Fix orphaned dependency references by adding stub components for missing refs.
@@ -507,9 +567,6 @@ def sanitize_dependency_graph(bom: Bom) -> int:
     Returns:
         Number of stub components added
     """
-    from cyclonedx.model import BomRef
-    from cyclonedx.model.component import Component, ComponentType
-
     # Collect all known BomRef values
     known_refs: set[str] = set()
 
@@ -543,39 +600,10 @@ def sanitize_dependency_graph(bom: Bom) -> int:
     if not orphaned_refs:
         return 0
 
-    tracker = get_transformation_tracker()
     stubs_added = 0
 
     for ref_value in orphaned_refs:
-        # Try to parse as PURL to get component info
-        name, version, namespace, purl_obj = _extract_component_info_from_purl(ref_value)
-
-        if name:
-            # Create stub component from PURL info
-            stub = Component(
-                type=ComponentType.LIBRARY,
-                name=name,
-                version=version or _UNKNOWN_VERSION,
-                bom_ref=BomRef(ref_value),
-            )
-            if namespace:
-                stub.group = namespace
-            if purl_obj:
-                stub.purl = purl_obj
-
-            # Record for attestation
-            tracker.record_stub_added(ref_value, name, version or _UNKNOWN_VERSION)
-        else:
-            # Can't parse as PURL - create minimal stub with ref as name
-            stub = Component(
-                type=ComponentType.LIBRARY,
-                name=ref_value,
-                version=_UNKNOWN_VERSION,
-                bom_ref=BomRef(ref_value),
-            )
-            # Record for attestation
-            tracker.record_stub_added(ref_value, ref_value, _UNKNOWN_VERSION)
-
+        stub = _create_stub_component(ref_value)
         bom.components.add(stub)
         stubs_added += 1
 
@@ -658,44 +686,329 @@ def link_root_dependencies(bom: Bom) -> int:
         logger.debug("No top-level components to link to root")
         return 0
 
+    return _link_refs_to_root(root_dep, root_component.name, top_level_refs)
+
+
+def _link_refs_to_root(root_dep: "Dependency", root_name: str, top_level_refs: set[str]) -> int:
+    """Add top-level refs as direct dependencies of the root and record the change."""
+    from cyclonedx.model import BomRef
+    from cyclonedx.model.dependency import Dependency
+
     # Link top-level components as direct dependencies of root
-    for ref_value in top_level_refs:
+    for ref_value in sorted(top_level_refs):
         root_dep.dependencies.add(Dependency(ref=BomRef(ref_value)))
 
     # Record for attestation
     tracker = get_transformation_tracker()
-    tracker.record_root_dependencies_linked(root_component.name, len(top_level_refs))
+    tracker.record_root_dependencies_linked(root_name, len(top_level_refs))
 
-    logger.info(f"Linked {len(top_level_refs)} top-level component(s) as dependencies of root '{root_component.name}'")
+    logger.info(f"Linked {len(top_level_refs)} top-level component(s) as dependencies of root '{root_name}'")
 
     return len(top_level_refs)
 
 
-def serialize_cyclonedx_bom(bom: Bom, spec_version: Optional[str] = None) -> str:
+@dataclass
+class SanitizationStats:
+    """Counts of the fixes applied by sanitize_cyclonedx_bom()."""
+
+    purls_normalized: int = 0
+    purls_cleared: int = 0
+    licenses_sanitized: int = 0
+    refs_normalized: int = 0
+    stubs_added: int = 0
+    root_dependencies_linked: int = 0
+
+
+def _normalize_ref_value(value: str) -> str:
+    """Fix PURL encoding bugs in a bom-ref value (same rules as the JSON post-processing)."""
+    if value.startswith("pkg:"):
+        return normalize_purl(value)[0] or value
+    if "%40%40" in value:
+        return _DOUBLE_ENCODED_AT_PATTERN.sub("%40", value)
+    return value
+
+
+class _CycloneDXSanitizer:
     """
-    Serialize a CycloneDX BOM to JSON string using the appropriate version outputter.
+    Single-pass visitor applying all CycloneDX model fixes.
 
-    This function automatically selects the correct serializer based on the spec version,
-    supporting multiple CycloneDX versions (1.4, 1.5, 1.6, 1.7, and future versions like 2.0).
+    Components (including nested and tool components), services and the
+    dependency graph are each visited exactly once. The bom-ref index built
+    while visiting components and services is reused to find orphaned
+    dependency references and the top-level components to link to the root.
+    """
+
+    def __init__(
+        self,
+        bom: Bom,
+        *,
+        sanitize_purls: bool = True,
+        sanitize_licenses: bool = True,
+        fix_dependency_graph: bool = True,
+    ) -> None:
+        self._bom = bom
+        self._sanitize_purls = sanitize_purls
+        self._sanitize_licenses = sanitize_licenses
+        self._fix_dependency_graph = fix_dependency_graph
+        self._tracker = get_transformation_tracker()
+        self.stats = SanitizationStats()
+        # Every bom-ref defined in the BOM, and those of top-level components only
+        self._known_refs: set[str] = set()
+        self._top_level_refs: set[str] = set()
+        # Containers whose members were mutated and must be re-sorted/re-hashed
+        self._rebuild_components = False
+        self._rebuild_dependencies = False
+
+    def run(self) -> SanitizationStats:
+        bom = self._bom
+        metadata = bom.metadata
+
+        if metadata and metadata.component:
+            self._visit_component(metadata.component, "metadata")
+        if metadata and metadata.tools and metadata.tools.components:
+            for comp in metadata.tools.components:
+                self._visit_component(comp, "tools")
+        for comp in bom.components:
+            if self._visit_component(comp, "top-level"):
+                self._rebuild_components = True
+        for service in bom.services:
+            self._visit_service(service)
+
+        dependency_refs, nested_refs, root_dep = self._visit_dependencies()
+
+        if self._rebuild_components:
+            bom.components = list(bom.components)
+        if self._rebuild_dependencies:
+            bom.dependencies = list(bom.dependencies)
+
+        if self._fix_dependency_graph:
+            self._add_stubs(dependency_refs - self._known_refs)
+            self._link_root(root_dep, nested_refs)
+
+        return self.stats
+
+    def _visit_component(self, comp: "Component", scope: str) -> bool:
+        """Visit a component and its children; return True if its bom-ref or PURL changed."""
+        mutated = self._normalize_bom_ref(comp.bom_ref)
+        if comp.bom_ref and comp.bom_ref.value:
+            if scope != "tools":
+                self._known_refs.add(comp.bom_ref.value)
+            if scope == "top-level":
+                self._top_level_refs.add(comp.bom_ref.value)
+
+        if comp.purl:
+            if self._sanitize_purls and scope != "nested":
+                normalized, cleared = _sanitize_component_purl(comp, scope)
+                self.stats.purls_normalized += normalized
+                self.stats.purls_cleared += cleared
+                mutated = mutated or bool(normalized or cleared)
+            else:
+                mutated = self._normalize_purl_encoding(comp) or mutated
+
+        if self._sanitize_licenses and comp.licenses:
+            self._visit_licenses(comp, comp.name)
+
+        # Nested components: fix encoding and licenses, but never clear their PURLs
+        children_mutated = False
+        for child in comp.components:
+            children_mutated = self._visit_component(child, "nested") or children_mutated
+        if children_mutated:
+            comp.components = list(comp.components)
+
+        return mutated
+
+    def _visit_service(self, service: "Service") -> None:
+        self._normalize_bom_ref(service.bom_ref)
+        if service.bom_ref and service.bom_ref.value:
+            self._known_refs.add(service.bom_ref.value)
+        if self._sanitize_licenses and service.licenses:
+            self._visit_licenses(service, service.name)
+        for child in service.services:
+            self._visit_service(child)
+
+    def _visit_licenses(self, owner: "Component | Service", owner_name: Optional[str]) -> None:
+        from cyclonedx.model.license import DisjunctiveLicense, LicenseExpression
+
+        modified = False
+        for lic in owner.licenses:
+            if isinstance(lic, DisjunctiveLicense):
+                if lic.id and not _is_valid_spdx_license_id(lic.id):
+                    license_id = lic.id
+                    logger.debug(f"Sanitizing invalid license ID: {license_id} -> name")
+                    lic.name = license_id
+                    self._tracker.record_license_sanitized(license_id, f"name:{license_id}", component=owner_name)
+                    self.stats.licenses_sanitized += 1
+                    modified = True
+            elif isinstance(lic, LicenseExpression):
+                sanitized, was_modified = _sanitize_spdx_license_expression(lic.value)
+                if was_modified:
+                    logger.debug(f"Sanitizing invalid license expression: {lic.value} -> {sanitized}")
+                    self._tracker.record_license_sanitized(lic.value, sanitized, component=owner_name)
+                    lic.value = sanitized
+                    self.stats.licenses_sanitized += 1
+                    modified = True
+
+        if modified:
+            # Members were mutated in place; rebuild the sorted repository
+            owner.licenses = list(owner.licenses)
+
+    def _visit_dependencies(self) -> tuple[set[str], set[str], "Dependency | None"]:
+        dependency_refs: set[str] = set()
+        nested_refs: set[str] = set()
+        root_dep = None
+        root = self._bom.metadata.component if self._bom.metadata else None
+        root_ref_value = root.bom_ref.value if root and root.bom_ref else None
+
+        for dep in self._bom.dependencies:
+            if self._normalize_bom_ref(dep.ref):
+                self._rebuild_dependencies = True
+            if dep.ref and dep.ref.value:
+                dependency_refs.add(dep.ref.value)
+                if root_dep is None and root_ref_value and dep.ref.value == root_ref_value:
+                    root_dep = dep
+
+            nested_modified = False
+            for nested_dep in dep.dependencies:
+                if self._normalize_bom_ref(nested_dep.ref):
+                    nested_modified = True
+                if nested_dep.ref and nested_dep.ref.value:
+                    dependency_refs.add(nested_dep.ref.value)
+                    nested_refs.add(nested_dep.ref.value)
+            if nested_modified:
+                dep.dependencies = list(dep.dependencies)
+                self._rebuild_dependencies = True
+
+        return dependency_refs, nested_refs, root_dep
+
+    def _normalize_bom_ref(self, bom_ref: "BomRef | None") -> bool:
+        if not bom_ref or not bom_ref.value:
+            return False
+        normalized = _normalize_ref_value(bom_ref.value)
+        if normalized == bom_ref.value:
+            return False
+        logger.debug(f"Normalized bom-ref: {bom_ref.value} → {normalized}")
+        bom_ref.value = normalized
+        self.stats.refs_normalized += 1
+        return True
+
+    def _normalize_purl_encoding(self, comp: "Component") -> bool:
+        normalized, was_normalized = normalize_purl(str(comp.purl))
+        if not was_normalized or not normalized:
+            return False
+        try:
+            comp.purl = PackageURL.from_string(normalized)
+        except ValueError:
+            return False
+        self.stats.purls_normalized += 1
+        return True
+
+    def _add_stubs(self, orphaned_refs: set[str]) -> None:
+        if not orphaned_refs:
+            return
+        for ref_value in sorted(orphaned_refs):
+            self._bom.components.add(_create_stub_component(ref_value))
+            self._top_level_refs.add(ref_value)
+        self.stats.stubs_added = len(orphaned_refs)
+        logger.info(
+            f"Dependency graph sanitization: added {len(orphaned_refs)} stub component(s) for orphaned references. "
+            "These stubs may be enriched in the enrichment step."
+        )
+
+    def _link_root(self, root_dep: "Dependency | None", nested_refs: set[str]) -> None:
+        from cyclonedx.model import BomRef
+        from cyclonedx.model.dependency import Dependency
+
+        metadata = self._bom.metadata
+        if not metadata or not metadata.component:
+            logger.debug("No root component found, skipping dependency linking")
+            return
+        root_component = metadata.component
+        if not root_component.bom_ref or not root_component.bom_ref.value:
+            logger.debug("Root component has no bom-ref, skipping dependency linking")
+            return
+        root_ref_value = root_component.bom_ref.value
+
+        if root_dep is None:
+            root_dep = Dependency(ref=BomRef(root_ref_value))
+            self._bom.dependencies.add(root_dep)
+
+        if root_dep.dependencies and len(root_dep.dependencies) > 0:
+            logger.debug(
+                f"Root component '{root_component.name}' already has {len(root_dep.dependencies)} dependencies, skipping"
+            )
+            return
+
+        top_level_refs = self._top_level_refs - nested_refs - {root_ref_value}
+        if not top_level_refs:
+            logger.debug("No top-level components to link to root")
+            return
+
+        self.stats.root_dependencies_linked = _link_refs_to_root(root_dep, root_component.name, top_level_refs)
+
+
+def sanitize_cyclonedx_bom(
+    bom: Bom,
+    *,
+    sanitize_purls: bool = True,
+    sanitize_licenses: bool = True,
+    fix_dependency_graph: bool = True,
+) -> SanitizationStats:
+    """
+    Apply all CycloneDX model fixes in a single pass over the BOM.
+
+    This combines sanitize_purls(), license sanitization, PURL/bom-ref encoding
+    fixes, sanitize_dependency_graph() and link_root_dependencies(). Components,
+    services and dependencies are each visited once, driven by one shared
+    bom-ref index, so cost is linear in the size of the BOM.
 
     Args:
-        bom: The CycloneDX BOM object to serialize
-        spec_version: The CycloneDX spec version (e.g., "1.5", "1.6", "1.7", "2.0").
-                     If None, will try to detect from BOM object. Raises ValueError if not found.
+        bom: The CycloneDX BOM object to sanitize (modified in place)
+        sanitize_purls: Normalize and clear invalid PURLs on top-level, metadata
+            and tool components (encoding bugs are always fixed)
+        sanitize_licenses: Move invalid license IDs to names and convert invalid
+            expression keys to LicenseRef-*
+        fix_dependency_graph: Add stubs for orphaned dependency refs and link
+            top-level components to the root
 
     Returns:
-        JSON string representation of the BOM
+        SanitizationStats with the number of fixes applied
+    """
+    stats = _CycloneDXSanitizer(
+        bom,
+        sanitize_purls=sanitize_purls,
+        sanitize_licenses=sanitize_licenses,
+        fix_dependency_graph=fix_dependency_graph,
+    ).run()
 
-    Raises:
-        ValueError: If spec_version is unsupported or cannot be determined
+    if stats.purls_normalized:
+        logger.info(f"PURL sanitization: normalized {stats.purls_normalized} PURL(s)")
+    if stats.purls_cleared:
+        logger.info(f"PURL sanitization: cleared {stats.purls_cleared} invalid PURL(s)")
+    if stats.licenses_sanitized:
+        logger.info(f"Sanitized {stats.licenses_sanitized} invalid license(s)")
 
-    Examples:
-        >>> bom = Bom.from_json(data)
-        >>> # Serialize as CycloneDX 1.6
-        >>> json_str = serialize_cyclonedx_bom(bom, "1.6")
-        >>>
-        >>> # Auto-detect version from BOM
-        >>> json_str = serialize_cyclonedx_bom(bom)
+    return stats
+
+
+def fix_purl_encoding(bom: Bom) -> int:
+    """
+    Fix PURL encoding bugs (%40%40, @@) in PURLs and bom-refs on the model.
+
+    Args:
+        bom: The CycloneDX BOM object to fix (modified in place)
+
+    Returns:
+        Number of PURLs and bom-refs changed
+    """
+    stats = _CycloneDXSanitizer(bom, sanitize_purls=False, sanitize_licenses=False, fix_dependency_graph=False).run()
+    return stats.purls_normalized + stats.refs_normalized
+
+
+def _cyclonedx_bom_to_json(bom: Bom, spec_version: Optional[str], fix_encoding: bool) -> str:
+    """
+    Convert a CycloneDX BOM to a JSON string using the appropriate version outputter.
+
+    See serialize_cyclonedx_bom() for the arguments.
     """
     # Detect version if not provided
     if spec_version is None:
@@ -734,13 +1047,67 @@ def serialize_cyclonedx_bom(bom: Bom, spec_version: Optional[str] = None) -> str
             # Re-emit other warnings as-is using our logger
             logger.warning(f"CycloneDX serialization warning: {warning_msg}")
 
-    # Post-process JSON to fix PURL encoding bugs (double %40%40 or double @@)
+    # Fix PURL encoding bugs (double %40%40 or double @@) in the output rather
+    # than on the model, so the caller's Bom is left untouched and refs outside
+    # components (vulnerabilities, compositions, ...) are fixed too.
     # Note: We preserve the canonical %40 encoding per PURL spec
-    result = _fix_purl_encoding_bugs_in_json(result)
+    if fix_encoding:
+        result = _fix_purl_encoding_bugs_in_json(result)
 
     return result
 
 
+def serialize_cyclonedx_bom(bom: Bom, spec_version: Optional[str] = None, fix_encoding: bool = True) -> str:
+    """
+    Serialize a CycloneDX BOM to JSON string using the appropriate version outputter.
+
+    This function automatically selects the correct serializer based on the spec version,
+    supporting multiple CycloneDX versions (1.4, 1.5, 1.6, 1.7, and future versions like 2.0).
+    Use write_cyclonedx_bom() to write a BOM to a file.
+
+    Args:
+        bom: The CycloneDX BOM object to serialize
+        spec_version: The CycloneDX spec version (e.g., "1.5", "1.6", "1.7", "2.0").
+                     If None, will try to detect from BOM object. Raises ValueError if not found.
+        fix_encoding: Fix PURL encoding bugs (%40%40, @@) in the output. The BOM
+                     object itself is never modified.
+
+    Returns:
+        JSON string representation of the BOM
+
+    Raises:
+        ValueError: If spec_version is unsupported or cannot be determined
+
+    Examples:
+        >>> bom = Bom.from_json(data)
+        >>> # Serialize as CycloneDX 1.6
+        >>> json_str = serialize_cyclonedx_bom(bom, "1.6")
+        >>>
+        >>> # Auto-detect version from BOM
+        >>> json_str = serialize_cyclonedx_bom(bom)
+    """
+    return _cyclonedx_bom_to_json(bom, spec_version, fix_encoding)
+
+
+def write_cyclonedx_bom(bom: Bom, fp: IO[str], spec_version: Optional[str] = None, fix_encoding: bool = True) -> None:
+    """
+    Write a CycloneDX BOM as JSON to a text file object.
+
+    Produces the same output as serialize_cyclonedx_bom(). The library only
+    offers the output as one string, so it is built in full before writing.
+
+    Args:
+        bom: The CycloneDX BOM object to write
+        fp: Text file object to write to
+        spec_version: The CycloneDX spec version; see serialize_cyclonedx_bom()
+        fix_encoding: Fix PURL encoding bugs (%40%40, @@) in the output
+
+    Raises:
+        ValueError: If spec_version is unsupported or cannot be determined
+    """
+    fp.write(_cyclonedx_bom_to_json(bom, spec_version, fix_encoding))
+
+
 def _fix_purl_encoding_bugs_in_json(json_str: str) -> str:
     """
     Fix PURL encoding bugs in a serialized JSON string.
@@ -752,12 +1119,19 @@ def _fix_purl_encoding_bugs_in_json(json_str: str) -> str:
     Note: This preserves the canonical %40 encoding for @ in namespaces,
     which is correct per the PURL spec.
 
+    serialize_cyclonedx_bom() applies this to its output; it is also used for
+    JSON that never went through the model (e.g. raw generator output).
+
     Args:
         json_str: Serialized JSON string
 
     Returns:
         JSON string with fixed PURLs
     """
+    # Fast path: nothing to fix (substring checks are far cheaper than the regexes)
+    if "%40%40" not in json_str and "@@" not in json_str:
+        return json_str
+
     # Fix double-encoded %40 sequences in PURLs
     result = _DOUBLE_ENCODED_AT_PATTERN.sub("%40", json_str)
 
@@ -828,6 +1202,50 @@ def validate_spdx_version(version: str) -> bool:
     return version in SUPPORTED_SPDX_VERSIONS
 
 
+class _StreamingDocumentConverter(DocumentConverter):
+    """
+    DocumentConverter that converts the element lists lazily, one element at a time.
+
+    Overrides the private _get_property_value() hook, which is why
+    spdx-tools is pinned; test_converter_streams_element_lists checks it.
+    """
+
+    def _get_property_value(
+        self, document: Document, document_property: DocumentProperty, _document: Document | None = None
+    ) -> Any:
+        if document_property == DocumentProperty.PACKAGES and document.packages:
+            return (self.package_converter.convert(package, document) for package in document.packages)
+        if document_property == DocumentProperty.FILES and document.files:
+            return (self.file_converter.convert(file, document) for file in document.files)
+        if document_property == DocumentProperty.SNIPPETS and document.snippets:
+            return (self.snippet_converter.convert(snippet, document) for snippet in document.snippets)
+        if document_property == DocumentProperty.RELATIONSHIPS and document.relationships:
+            return (self.relationship_converter.convert(rel) for rel in document.relationships)
+        return super()._get_property_value(document, document_property, _document)
+
+
+def write_spdx_document(document: Document, file_path: str) -> None:
+    """
+    Write an SPDX 2.x document to a file without validating it.
+
+    JSON output is identical to spdx_tools' writer, but packages, files,
+    snippets and relationships are converted and written one at a time
+    rather than building the complete JSON data and string first. Other
+    formats are written by spdx_tools.
+
+    Args:
+        document: The SPDX document to write
+        file_path: Output file path; the format is taken from its extension
+    """
+    if file_name_to_format(file_path) != FileFormat.JSON:
+        spdx_write_file(document, file_path, validate=False)
+        return
+
+    document = create_document_without_duplicates(document)
+    with open(file_path, "w", encoding="utf-8") as f:
+        jsonio.dump(_StreamingDocumentConverter().convert(document), f, indent=4)
+
+
 def get_supported_cyclonedx_versions() -> list[str]:
     """
     Get list of supported CycloneDX versions.
@@ -961,6 +1379,7 @@ def _to_license_ref(key: str) -> str:
     return "LicenseRef-unknown"
 
 
+@lru_cache(maxsize=4096)
 def _sanitize_spdx_license_expression(expression: str) -> tuple[str, bool]:
     """
     Sanitize an SPDX license expression by converting invalid IDs to LicenseRef format.
@@ -969,68 +1388,25 @@ def _sanitize_spdx_license_expression(expression: str) -> tuple[str, bool]:
     unknown license symbols, and substitute them with LicenseRef-* equivalents
     using the library's own subs() method (no regex needed).
 
+    Results are memoized, since SBOMs repeat the same expressions many times.
+
     Args:
         expression: The license expression to sanitize
 
     Returns:
         Tuple of (sanitized expression, was_modified)
     """
-    from license_expression import ExpressionError, LicenseWithExceptionSymbol, get_spdx_licensing
+    from license_expression import LicenseWithExceptionSymbol
 
-    if not expression or expression in ("NOASSERTION", "NONE"):
-        return expression, False
+    from ._enrichment.license_expressions import SPDX_LICENSE_KEYS, parse_license_expression, spdx_licensing
 
-    spdx_licensing = get_spdx_licensing()
-
-    try:
-        parsed = spdx_licensing.parse(expression, validate=False)
-        unknown_keys = spdx_licensing.unknown_license_keys(parsed)
-
-        if not unknown_keys:
-            return expression, False
-
-        # Build symbol substitution map: old_symbol -> new_expression
-        unknown_set = {str(k) for k in unknown_keys}
-        subs_map = {}
-        for sym in parsed.symbols:
-            # LicenseWithExceptionSymbol (e.g. "MIT WITH Exception") has no .key;
-            # check its license_symbol and exception_symbol sub-keys instead.
-            if isinstance(sym, LicenseWithExceptionSymbol):
-                lic_key = sym.license_symbol.key
-                exc_key = sym.exception_symbol.key
-                lic_ref = (
-                    _to_license_ref(lic_key)
-                    if lic_key in unknown_set and not lic_key.startswith("LicenseRef-")
-                    else lic_key
-                )
-                exc_ref = (
-                    _to_license_ref(exc_key)
-                    if exc_key in unknown_set and not exc_key.startswith("LicenseRef-")
-                    else exc_key
-                )
-                if lic_ref != lic_key or exc_ref != exc_key:
-                    logger.debug(
-                        f"Converting invalid SPDX license WITH expression: '{lic_key} WITH {exc_key}' to '{lic_ref} WITH {exc_ref}'"
-                    )
-                    subs_map[sym] = spdx_licensing.parse(f"{lic_ref} WITH {exc_ref}", validate=False)
-                continue
-
-            key_str = sym.key
-            if key_str not in unknown_set or key_str.startswith("LicenseRef-"):
-                continue
-            license_ref = _to_license_ref(key_str)
-            logger.debug(f"Converting invalid SPDX license '{key_str}' to '{license_ref}'")
-            subs_map[sym] = spdx_licensing.parse(license_ref, validate=False)
-
-        if not subs_map:
-            return expression, False
-
-        result = parsed.subs(subs_map)
-        return result.render(), True
+    if not expression or expression in ("NOASSERTION", "NONE") or expression in SPDX_LICENSE_KEYS:
+        return expression, False
 
-    except ExpressionError as e:
+    parsed_expression = parse_license_expression(expression)
+    if parsed_expression is None:
         # Expression couldn't be parsed at all - convert entire thing to LicenseRef
-        logger.debug(f"Could not parse license expression '{expression}': {e}")
+        logger.debug(f"Could not parse license expression '{expression}'")
         sanitized = _to_license_ref(expression)
         if len(sanitized) <= _MAX_LICENSE_REF_LENGTH:
             return sanitized, True
@@ -1038,6 +1414,49 @@ def _sanitize_spdx_license_expression(expression: str) -> tuple[str, bool]:
             hash_val = hashlib.md5(expression.encode(), usedforsecurity=False).hexdigest()[:16]
             return f"LicenseRef-{hash_val}", True
 
+    parsed, unknown_keys = parsed_expression
+    if not unknown_keys:
+        return expression, False
+
+    # Build symbol substitution map: old_symbol -> new_expression
+    unknown_set = {str(k) for k in unknown_keys}
+    subs_map = {}
+    for sym in parsed.symbols:
+        # LicenseWithExceptionSymbol (e.g. "MIT WITH Exception") has no .key;
+        # check its license_symbol and exception_symbol sub-keys instead.
+        if isinstance(sym, LicenseWithExceptionSymbol):
+            lic_key = sym.license_symbol.key
+            exc_key = sym.exception_symbol.key
+            lic_ref = (
+                _to_license_ref(lic_key)
+                if lic_key in unknown_set and not lic_key.startswith("LicenseRef-")
+                else lic_key
+            )
+            exc_ref = (
+                _to_license_ref(exc_key)
+                if exc_key in unknown_set and not exc_key.startswith("LicenseRef-")
+                else exc_key
+            )
+            if lic_ref != lic_key or exc_ref != exc_key:
+                logger.debug(
+                    f"Converting invalid SPDX license WITH expression: '{lic_key} WITH {exc_key}' to '{lic_ref} WITH {exc_ref}'"
+                )
+                subs_map[sym] = spdx_licensing.parse(f"{lic_ref} WITH {exc_ref}", validate=False)
+            continue
+
+        key_str = sym.key
+        if key_str not in unknown_set or key_str.startswith("LicenseRef-"):
+            continue
+        license_ref = _to_license_ref(key_str)
+        logger.debug(f"Converting invalid SPDX license '{key_str}' to '{license_ref}'")
+        subs_map[sym] = spdx_licensing.parse(license_ref, validate=False)
+
+    if not subs_map:
+        return expression, False
+
+    result = parsed.subs(subs_map)
+    return result.render(), True
+
 
 def sanitize_spdx_licenses(data: dict) -> int:
     """
@@ -13,9 +13,9 @@ instead).
 """
 
 import copy
-import json
 import re
 import uuid
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -53,6 +53,7 @@ from spdx_tools.spdx3.writer.json_ld.json_ld_converter import (
     convert_payload_to_json_ld_list_of_elements,
 )
 
+from . import jsonio
 from .logging_config import logger
 
 
@@ -516,12 +517,12 @@ def parse_spdx3_file(file_path: str) -> Spdx3Payload:
 
     Raises:
         FileNotFoundError: If the file doesn't exist.
-        json.JSONDecodeError: If the file isn't valid JSON.
+        jsonio.JSONDecodeError: If the file isn't valid JSON.
         ValueError: If the file isn't SPDX 3 JSON-LD.
     """
     path = Path(file_path)
     with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+        data = jsonio.load(f)
 
     if not is_spdx3(data):
         raise ValueError(f"File does not appear to be SPDX 3 JSON-LD: {file_path}")
@@ -683,46 +684,68 @@ def _normalize_passthrough_element(elem: dict) -> None:
                     _normalize_nested_dict(item)
 
 
-def write_spdx3_file(
+def _iter_json_ld_elements(payload: Payload) -> Iterator[dict]:
+    """Convert the elements of a :class:`Payload` to JSON-LD dicts one at a time."""
+    # Converting one element at a time gives the same result as converting
+    # the whole payload (elements are converted independently), but only one
+    # converted element is held at a time while streaming
+    for spdx_id, element in payload.get_full_map().items():
+        (elem,) = convert_payload_to_json_ld_list_of_elements(Payload({spdx_id: element}))
+        # Post-process serialized elements to fix spdx_tools converter output:
+        # 1. Normalize @type→type, @id→spdxId (context aliases)
+        # 2. Restore type prefixes (e.g. "Package" → "software_Package")
+        # 3. Add software_ prefix to property names (e.g. "packageVersion" → "software_packageVersion")
+        _normalize_serialized_element(elem)
+        yield elem
+
+    # Re-attach passthrough elements that were not parsed into model objects.
+    # Deep-copy to avoid mutating the originals (normalization modifies in place,
+    # so converting the same payload twice would corrupt data).
+    # Preserve blank-node @id values (e.g. "_:CreationInfo0") since spdxId must
+    # be an IRI per the spec.
+    passthrough = payload.passthrough_elements if isinstance(payload, Spdx3Payload) else []
+    for original in passthrough:
+        elem = copy.deepcopy(original)
+        _normalize_passthrough_element(elem)
+        yield elem
+
+
+def spdx3_payload_to_dict(
     payload: Payload,
-    file_path: str,
     context_url: str = SPDX3_CONTEXT_URL,
-) -> None:
-    """Write a :class:`Payload` to a JSON-LD ``.json`` file.
+) -> dict:
+    """Convert a :class:`Payload` to SPDX 3 JSON-LD data.
 
     Uses ``spdx_tools``' converter to serialise model objects, then wraps
     them with the official ``@context`` URL.
 
     Args:
-        payload: The SPDX 3 payload to write.
-        file_path: Output file path (will be overwritten).
+        payload: The SPDX 3 payload to convert.
         context_url: JSON-LD ``@context`` URL.
+
+    Returns:
+        The JSON-LD document as a dict (``@context`` and ``@graph``).
     """
-    element_list = convert_payload_to_json_ld_list_of_elements(payload)
+    return {"@context": context_url, "@graph": list(_iter_json_ld_elements(payload))}
 
-    # Post-process serialized elements to fix spdx_tools converter output:
-    # 1. Normalize @type→type, @id→spdxId (context aliases)
-    # 2. Restore type prefixes (e.g. "Package" → "software_Package")
-    # 3. Add software_ prefix to property names (e.g. "packageVersion" → "software_packageVersion")
-    for elem in element_list:
-        _normalize_serialized_element(elem)
 
-    # Re-attach passthrough elements that were not parsed into model objects.
-    # Deep-copy to avoid mutating the originals (normalization modifies in place,
-    # so calling write_spdx3_file twice on the same payload would corrupt data).
-    # Preserve blank-node @id values (e.g. "_:CreationInfo0") since spdxId must
-    # be an IRI per the spec.
-    passthrough = payload.passthrough_elements if isinstance(payload, Spdx3Payload) else []
-    if passthrough:
-        passthrough_copy = copy.deepcopy(passthrough)
-        for elem in passthrough_copy:
-            _normalize_passthrough_element(elem)
-        element_list.extend(passthrough_copy)
+def write_spdx3_file(
+    payload: Payload,
+    file_path: str,
+    context_url: str = SPDX3_CONTEXT_URL,
+) -> None:
+    """Write a :class:`Payload` to a JSON-LD ``.json`` file.
 
-    complete_dict = {"@context": context_url, "@graph": element_list}
+    Elements are converted and written one at a time, so the complete
+    JSON-LD data is never built in memory.
 
+    Args:
+        payload: The SPDX 3 payload to write.
+        file_path: Output file path (will be overwritten).
+        context_url: JSON-LD ``@context`` URL.
+    """
     with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(complete_dict, f, indent=2)
+        jsonio.dump({"@context": context_url, "@graph": _iter_json_ld_elements(payload)}, f, indent=2)
 
     logger.debug(f"Wrote SPDX 3 JSON-LD to {file_path}")
 
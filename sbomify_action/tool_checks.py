@@ -104,7 +104,8 @@ def _get_external_tools() -> dict[str, ToolInfo]:
     # and adding a public API method would be over-engineering for this use case
     for generator in registry._generators:
         command = generator.command
-        if command not in tools:
+        # In-process generators have no command to install
+        if command and command not in tools:
             # Look up metadata for this command
             metadata = _TOOL_METADATA.get(command, {})
             tools[command] = ToolInfo(
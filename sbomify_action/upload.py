@@ -120,9 +120,10 @@ def upload_to_all(
     component_name: Optional[str] = None,
     component_version: Optional[str] = None,
     validate_before_upload: bool = True,
+    destinations: Optional[List[str]] = None,
 ) -> List[UploadResult]:
     """
-    Upload an SBOM to all configured destinations.
+    Upload an SBOM to all configured destinations, concurrently.
 
     Destinations are configured via:
     - sbomify: token and component_id parameters
@@ -137,9 +138,14 @@ def upload_to_all(
         component_name: Component name (for Dependency Track)
         component_version: Component version (for Dependency Track)
         validate_before_upload: Whether to validate SBOM before uploading
+        destinations: Names of the destinations to upload to instead of all
+            configured ones; results are returned in this order
 
     Returns:
-        List of UploadResult from each configured destination
+        List of UploadResult from each destination
+
+    Raises:
+        ValueError: If a named destination does not exist
 
     Example:
         results = upload_to_all(
@@ -168,7 +174,7 @@ def upload_to_all(
         sbomify_api_base_url=api_base_url,
     )
 
-    return orchestrator.upload_all(input_params)
+    return orchestrator.upload_all(input_params, destinations=destinations)
 
 
 # Re-export key types for convenience
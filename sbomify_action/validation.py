@@ -15,18 +15,24 @@ Usage:
 
     # Auto-detect format and version
     result = validate_sbom_file_auto("sbom.json")
+
+Files may be gzip or zstd compressed; they are validated on their decompressed
+contents.
 """
 
-import json
-from dataclasses import dataclass
+import hashlib
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal
+from typing import Any, Iterator, Literal
 
 import jsonschema
+from jsonschema.exceptions import ValidationError as SchemaValidationError
+from jsonschema.protocols import Validator
 from referencing import Registry, Resource
 from referencing.jsonschema import DRAFT7
 
-from sbomify_action import format_display_name
+from sbomify_action import format_display_name, jsonio
+from sbomify_action.compression import read_sbom_bytes
 from sbomify_action.logging_config import logger
 
 # SBOM format type - matches _generation.protocol.SBOMFormat
@@ -58,6 +64,13 @@ _schema_cache: dict[str, dict] = {}
 # Cache for the schema registry (built lazily)
 _registry_cache: Registry | None = None
 
+# Cache for compiled validators, keyed by (format, spec version)
+_validator_cache: dict[tuple[str, str], Validator] = {}
+
+# SBOM contents that already passed validation, as (sha256, format, spec version)
+# Pipeline steps that leave a file unchanged don't pay for validating it again
+_passed_validation: set[tuple[str, str, str]] = set()
+
 
 def _get_schema_registry() -> Registry:
     """
@@ -79,7 +92,7 @@ def _get_schema_registry() -> Registry:
 
     # Load the SPDX license schema from cyclonedx-python-lib
     with open(SPDX_JSON) as f:
-        spdx_schema = json.load(f)
+        spdx_schema = jsonio.load(f)
 
     # Create registry with the SPDX schema pre-registered
     # The schema's $id is "http://cyclonedx.org/schema/spdx.schema.json"
@@ -107,6 +120,8 @@ class ValidationResult:
     spec_version: str
     error_message: str | None = None
     error_path: str | None = None
+    # (message, path) of each error found; just the first unless validated with fail_fast=False
+    errors: list[tuple[str, str | None]] = field(default_factory=list)
 
     @classmethod
     def success(cls, sbom_format: SBOMFormat, spec_version: str) -> "ValidationResult":
@@ -120,6 +135,7 @@ class ValidationResult:
         spec_version: str,
         error_message: str,
         error_path: str | None = None,
+        errors: list[tuple[str, str | None]] | None = None,
     ) -> "ValidationResult":
         """Create a failed validation result."""
         return cls(
@@ -128,6 +144,7 @@ class ValidationResult:
             spec_version=spec_version,
             error_message=error_message,
             error_path=error_path,
+            errors=errors or [],
         )
 
     @classmethod
@@ -152,7 +169,7 @@ def _load_schema(schema_path: Path) -> dict | None:
         return None
 
     with open(schema_path) as f:
-        schema = json.load(f)
+        schema = jsonio.load(f)
         _schema_cache[cache_key] = schema
         return schema
 
@@ -181,10 +198,114 @@ def get_schema_for_format(sbom_format: SBOMFormat, spec_version: str) -> dict |
     return _load_schema(schema_path)
 
 
+def _freeze(value: Any) -> Any:
+    """Convert a JSON value to a hashable form with JSON Schema equality semantics (booleans aren't numbers)."""
+    if isinstance(value, dict):
+        return ("object", frozenset((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return ("array", tuple(_freeze(item) for item in value))
+    if isinstance(value, bool):
+        return ("boolean", value)
+    return value
+
+
+def _unique_items(validator: Validator, unique: bool, instance: Any, schema: dict) -> Iterator[SchemaValidationError]:
+    """
+    Hash-based replacement for the uniqueItems keyword.
+
+    jsonschema compares unsortable items (such as the objects in a components
+    array) pairwise, which is quadratic and takes minutes on large SBOMs.
+    Hashing a frozen copy of each item gives the same answer in linear time.
+    """
+    if not unique or not validator.is_type(instance, "array"):
+        return
+    seen = set()
+    for item in instance:
+        frozen = _freeze(item)
+        if frozen in seen:
+            yield SchemaValidationError(f"{instance!r} has non-unique elements")
+            return
+        seen.add(frozen)
+
+
+_FastDraft7Validator = jsonschema.validators.extend(jsonschema.Draft7Validator, {"uniqueItems": _unique_items})
+_FastDraft202012Validator = jsonschema.validators.extend(
+    jsonschema.Draft202012Validator, {"uniqueItems": _unique_items}
+)
+
+
+def get_validator(sbom_format: SBOMFormat, spec_version: str) -> Validator | None:
+    """
+    Get the compiled schema validator for a format and version.
+
+    Validators are built once and cached, so references resolved while
+    validating one SBOM are reused for the next.
+
+    Args:
+        sbom_format: The SBOM format ("cyclonedx" or "spdx")
+        spec_version: The spec version (e.g., "1.6" or "2.3")
+
+    Returns:
+        The validator, or None if no schema is available
+
+    Raises:
+        jsonschema.SchemaError: If the bundled schema itself is invalid
+    """
+    cache_key = (sbom_format, spec_version)
+    if cache_key in _validator_cache:
+        return _validator_cache[cache_key]
+
+    schema = get_schema_for_format(sbom_format, spec_version)
+    if schema is None:
+        return None
+
+    # SPDX 3.x schemas use Draft 2020-12; others use Draft 7
+    if sbom_format == "spdx" and spec_version and spec_version.startswith("3"):
+        validator_class = _FastDraft202012Validator
+    else:
+        validator_class = _FastDraft7Validator
+    validator_class.check_schema(schema)
+
+    # Use a registry with bundled schemas to avoid fetching remote references
+    # This is especially important for CycloneDX schemas that reference spdx.schema.json
+    validator = validator_class(schema, registry=_get_schema_registry())
+    _validator_cache[cache_key] = validator
+    return validator
+
+
+def iter_validation_errors(
+    sbom_data: dict,
+    sbom_format: SBOMFormat,
+    spec_version: str,
+) -> Iterator[SchemaValidationError]:
+    """
+    Stream schema validation errors for SBOM data.
+
+    Errors are yielded as they are found, so callers that only need the
+    first one can stop without walking the rest of the document.
+
+    Args:
+        sbom_data: The parsed SBOM JSON data
+        sbom_format: The SBOM format ("cyclonedx" or "spdx")
+        spec_version: The spec version (e.g., "1.6" or "2.3")
+
+    Yields:
+        jsonschema ValidationError for each schema violation (nothing if no schema is available)
+    """
+    validator = get_validator(sbom_format, spec_version)
+    if validator is not None:
+        yield from validator.iter_errors(sbom_data)
+
+
+def _error_path(error: SchemaValidationError) -> str | None:
+    return ".".join(str(p) for p in error.absolute_path) if error.absolute_path else None
+
+
 def validate_sbom_data(
     sbom_data: dict,
     sbom_format: SBOMFormat,
     spec_version: str,
+    fail_fast: bool = True,
 ) -> ValidationResult:
     """
     Validate SBOM data against its JSON schema.
@@ -193,61 +314,60 @@ def validate_sbom_data(
         sbom_data: The parsed SBOM JSON data
         sbom_format: The SBOM format ("cyclonedx" or "spdx")
         spec_version: The spec version (e.g., "1.6" or "2.3")
+        fail_fast: Stop at the first error. If False, every error is logged
+            and collected in ValidationResult.errors.
 
     Returns:
         ValidationResult with validation status and any errors
     """
-    schema = get_schema_for_format(sbom_format, spec_version)
+    try:
+        validator = get_validator(sbom_format, spec_version)
+    except jsonschema.SchemaError as e:
+        logger.error(f"Invalid schema: {e.message}")
+        return ValidationResult.failure(
+            sbom_format=sbom_format,
+            spec_version=spec_version,
+            error_message=f"Invalid schema: {e.message}",
+        )
 
-    if schema is None:
+    if validator is None:
         # No schema available - skip validation but log warning
         reason = f"No schema available for {sbom_format} {spec_version}"
         logger.warning(f"{reason}, unable to validate SBOM")
         return ValidationResult.skipped(sbom_format, spec_version, reason)
 
-    try:
-        # Use a registry with bundled schemas to avoid fetching remote references
-        # This is especially important for CycloneDX schemas that reference spdx.schema.json
-        registry = _get_schema_registry()
-
-        # Create a validator with the registry for local schema resolution
-        # SPDX 3.x schemas use Draft 2020-12; others use Draft 7
-        if sbom_format == "spdx" and spec_version and spec_version.startswith("3"):
-            validator = jsonschema.Draft202012Validator(schema, registry=registry)
-        else:
-            validator = jsonschema.Draft7Validator(schema, registry=registry)
-
-        # Validate and collect errors
-        errors = list(validator.iter_errors(sbom_data))
-        if errors:
-            # Return the first error (most relevant)
-            e = errors[0]
-            error_path = ".".join(str(p) for p in e.absolute_path) if e.absolute_path else None
-            logger.error(f"SBOM validation failed: {e.message}")
-            if error_path:
-                logger.error(f"Error at path: {error_path}")
-            return ValidationResult.failure(
-                sbom_format=sbom_format,
-                spec_version=spec_version,
-                error_message=e.message,
-                error_path=error_path,
-            )
-
-        logger.info(f"SBOM validated successfully against {format_display_name(sbom_format)} {spec_version} schema")
-        return ValidationResult.success(sbom_format, spec_version)
-    except jsonschema.SchemaError as e:
-        logger.error(f"Invalid schema: {e.message}")
+    errors: list[tuple[str, str | None]] = []
+    for e in validator.iter_errors(sbom_data):
+        error_path = _error_path(e)
+        errors.append((e.message, error_path))
+        logger.error(f"SBOM validation failed: {e.message}")
+        if error_path:
+            logger.error(f"Error at path: {error_path}")
+        if fail_fast:
+            break
+
+    if errors:
+        # Report the first error (most relevant)
+        error_message, error_path = errors[0]
+        if len(errors) > 1:
+            logger.error(f"SBOM has {len(errors)} validation errors")
         return ValidationResult.failure(
             sbom_format=sbom_format,
             spec_version=spec_version,
-            error_message=f"Invalid schema: {e.message}",
+            error_message=error_message,
+            error_path=error_path,
+            errors=errors,
         )
 
+    logger.info(f"SBOM validated successfully against {format_display_name(sbom_format)} {spec_version} schema")
+    return ValidationResult.success(sbom_format, spec_version)
+
 
 def validate_sbom_file(
     file_path: str,
     sbom_format: SBOMFormat,
     spec_version: str,
+    fail_fast: bool = True,
 ) -> ValidationResult:
     """
     Validate an SBOM file against its JSON schema.
@@ -256,6 +376,7 @@ def validate_sbom_file(
         file_path: Path to the SBOM JSON file
         sbom_format: The SBOM format ("cyclonedx" or "spdx")
         spec_version: The spec version (e.g., "1.6" or "2.3")
+        fail_fast: Stop at the first error (see validate_sbom_data)
 
     Returns:
         ValidationResult with validation status and any errors
@@ -268,17 +389,22 @@ def validate_sbom_file(
             error_message=f"File not found: {file_path}",
         )
 
+    content = read_sbom_bytes(path)
+    content_hash = _content_hash(content)
+    if (content_hash, sbom_format, spec_version) in _passed_validation:
+        logger.debug(f"SBOM unchanged since it passed validation, skipping: {file_path}")
+        return ValidationResult.success(sbom_format, spec_version)
+
     try:
-        with open(path) as f:
-            sbom_data = json.load(f)
-    except json.JSONDecodeError as e:
+        sbom_data = jsonio.loads(content)
+    except jsonio.JSONDecodeError as e:
         return ValidationResult.failure(
             sbom_format=sbom_format,
             spec_version=spec_version,
             error_message=f"Invalid JSON: {e}",
         )
 
-    return validate_sbom_data(sbom_data, sbom_format, spec_version)
+    return _validate_and_remember(sbom_data, content_hash, sbom_format, spec_version, fail_fast)
 
 
 def detect_sbom_format_and_version(sbom_data: dict) -> tuple[SBOMFormat | None, str | None]:
@@ -317,12 +443,13 @@ def detect_sbom_format_and_version(sbom_data: dict) -> tuple[SBOMFormat | None,
     return None, None
 
 
-def validate_sbom_file_auto(file_path: str) -> ValidationResult:
+def validate_sbom_file_auto(file_path: str, fail_fast: bool = True) -> ValidationResult:
     """
     Validate an SBOM file, auto-detecting its format and version.
 
     Args:
         file_path: Path to the SBOM JSON file
+        fail_fast: Stop at the first error (see validate_sbom_data)
 
     Returns:
         ValidationResult with validation status and any errors
@@ -335,16 +462,40 @@ def validate_sbom_file_auto(file_path: str) -> ValidationResult:
             error_message=f"File not found: {file_path}",
         )
 
+    content = read_sbom_bytes(path)
     try:
-        with open(path) as f:
-            sbom_data = json.load(f)
-    except json.JSONDecodeError as e:
+        sbom_data = jsonio.loads(content)
+    except jsonio.JSONDecodeError as e:
         return ValidationResult.failure(
             sbom_format="cyclonedx",
             spec_version="unknown",
             error_message=f"Invalid JSON: {e}",
         )
 
+    return _validate_data_auto(sbom_data, _content_hash(content), fail_fast, source=file_path)
+
+
+def validate_sbom_data_auto(sbom_data: dict, fail_fast: bool = True) -> ValidationResult:
+    """
+    Validate SBOM data, auto-detecting its format and version.
+
+    Args:
+        sbom_data: The parsed SBOM JSON data
+        fail_fast: Stop at the first error (see validate_sbom_data)
+
+    Returns:
+        ValidationResult with validation status and any errors
+    """
+    return _validate_data_auto(sbom_data, None, fail_fast)
+
+
+def _validate_data_auto(
+    sbom_data: dict,
+    content_hash: str | None,
+    fail_fast: bool,
+    source: str | None = None,
+) -> ValidationResult:
+    """Detect format and version, then validate (remembering the content hash if given)."""
     sbom_format, spec_version = detect_sbom_format_and_version(sbom_data)
 
     if sbom_format is None:
@@ -361,4 +512,51 @@ def validate_sbom_file_auto(file_path: str) -> ValidationResult:
             error_message=f"Could not detect {sbom_format} spec version",
         )
 
-    return validate_sbom_data(sbom_data, sbom_format, spec_version)
+    if content_hash is None:
+        return validate_sbom_data(sbom_data, sbom_format, spec_version, fail_fast=fail_fast)
+
+    if (content_hash, sbom_format, spec_version) in _passed_validation:
+        logger.debug(f"SBOM unchanged since it passed validation, skipping: {source}")
+        return ValidationResult.success(sbom_format, spec_version)
+
+    return _validate_and_remember(sbom_data, content_hash, sbom_format, spec_version, fail_fast)
+
+
+def _content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _validate_and_remember(
+    sbom_data: dict,
+    content_hash: str,
+    sbom_format: SBOMFormat,
+    spec_version: str,
+    fail_fast: bool,
+) -> ValidationResult:
+    """Validate SBOM data and remember its content hash if it passes."""
+    result = validate_sbom_data(sbom_data, sbom_format, spec_version, fail_fast=fail_fast)
+    if result.valid:
+        _passed_validation.add((content_hash, sbom_format, spec_version))
+    return result
+
+
+def has_passed_validation(file_path: str) -> bool:
+    """
+    Check whether a file's exact contents already passed schema validation.
+
+    Args:
+        file_path: Path to the SBOM JSON file
+
+    Returns:
+        True if an SBOM with the same content hash passed validation in this process
+    """
+    try:
+        content_hash = _content_hash(read_sbom_bytes(file_path))
+    except OSError:
+        return False
+    return any(passed_hash == content_hash for passed_hash, _, _ in _passed_validation)
+
+
+def clear_validation_cache() -> None:
+    """Forget which SBOM contents passed validation (mainly for tests)."""
+    _passed_validation.clear()
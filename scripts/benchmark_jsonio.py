@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark the JSON codecs behind sbomify_action.jsonio.
+
+Parses and serializes the largest SBOMs in tests/test-data with every
+available codec and reports the best time of several runs.
+
+Usage:
+    python scripts/benchmark_jsonio.py [--files N] [--runs N] [FILE ...]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sbomify_action import jsonio
+
+TEST_DATA = Path(__file__).parent.parent / "tests" / "test-data"
+
+# Output layouts used by the load/dump sites in the codebase
+DUMP_VARIANTS = {
+    "indent=2": {"indent": 2},
+    "compact": {"separators": (",", ":")},
+    "default": {"ensure_ascii": False},
+}
+
+
+def best_of(runs: int, func) -> float:
+    """Return the fastest of several timed calls, in milliseconds."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="*", type=Path, help="SBOM files (default: largest files in test-data)")
+    parser.add_argument("--files", type=int, default=5, help="Number of test-data files to use")
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs per measurement")
+    args = parser.parse_args()
+
+    paths = args.paths or sorted(TEST_DATA.glob("*.json"), key=lambda p: p.stat().st_size, reverse=True)[: args.files]
+    codecs = ["stdlib", "orjson"] if "orjson" in jsonio._CODECS else ["stdlib"]
+    previous = jsonio.get_codec()
+
+    print(f"{'file':<45} {'MB':>5} {'codec':<7} {'load ms':>8} " + " ".join(f"{v:>10}" for v in DUMP_VARIANTS))
+    try:
+        for path in paths:
+            raw = path.read_bytes()
+            for name in codecs:
+                jsonio.set_codec(name)
+                load_ms = best_of(args.runs, lambda: jsonio.loads(raw))
+                data = jsonio.loads(raw)
+                dump_ms = [best_of(args.runs, lambda kw=kw: jsonio.dumps(data, **kw)) for kw in DUMP_VARIANTS.values()]
+                print(
+                    f"{path.name[:45]:<45} {len(raw) / 1e6:>5.1f} {name:<7} {load_ms:>8.1f} "
+                    + " ".join(f"{ms:>10.1f}" for ms in dump_ms)
+                )
+    finally:
+        jsonio.set_codec(previous.name)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
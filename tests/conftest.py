@@ -13,3 +13,52 @@ def disable_sentry_for_tests(monkeypatch):
     this by setting TELEMETRY=true in their own fixtures or patches.
     """
     monkeypatch.setenv("TELEMETRY", "false")
+
+
+@pytest.fixture(autouse=True)
+def clear_validation_cache():
+    """Start every test without remembered validation results.
+
+    Validation results are cached by content hash for the lifetime of the
+    process, which would otherwise leak between tests.
+    """
+    from sbomify_action.validation import clear_validation_cache as clear
+
+    clear()
+    yield
+    clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_release_index():
+    """Start every test without fetched release lists.
+
+    Each product's releases are fetched once per process and then served
+    from memory, which would otherwise leak between tests.
+    """
+    from sbomify_action._processors.releases_api import clear_release_index as clear
+
+    clear()
+    yield
+    clear()
+
+
+@pytest.fixture(autouse=True)
+def no_upload_retry_delay(monkeypatch):
+    """Retry failed uploads without sleeping between attempts.
+
+    Uploads are retried with exponential backoff, which would make every
+    test of a failing upload wait several seconds.
+    """
+    monkeypatch.setenv("UPLOAD_RETRY_BACKOFF", "0")
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(monkeypatch, tmp_path):
+    """Keep state from earlier runs in a per-test cache directory.
+
+    Generated SBOMs, the record of uploaded SBOMs and the Yocto pipeline's
+    manifest are reused when their inputs match, so a shared cache directory
+    would make tests depend on which ones ran before them.
+    """
+    monkeypatch.setenv("SBOMIFY_CACHE_DIR", str(tmp_path / ".sbomify-cache"))
@@ -19,6 +19,7 @@ from sbomify_action.augmentation import (
     augment_spdx_sbom,
     fetch_augmentation_metadata,
 )
+from sbomify_action.document import SBOMDocument
 
 
 class TestLicenseHandling:
@@ -448,6 +449,42 @@ class TestSPDXAugmentation:
             org_creators = [c for c in output_doc.creation_info.creators if c.actor_type == ActorType.ORGANIZATION]
             assert any("SPDX Supplier" in c.name for c in org_creators)
 
+    @patch("sbomify_action._augmentation.providers.json_config.JsonConfigProvider._find_config_file")
+    @patch("sbomify_action._augmentation.providers.sbomify_api.requests.get")
+    def test_augment_sbom_from_file_compressed_spdx(self, mock_get, mock_find_config, spdx_document):
+        """Test augmenting a gzip-compressed SPDX SBOM file."""
+        import gzip
+
+        from spdx_tools.spdx.parser.parse_anything import parse_file as spdx_parse_file
+        from spdx_tools.spdx.writer.write_anything import write_file as spdx_write_file
+
+        mock_find_config.return_value = None
+        mock_response = Mock()
+        mock_response.ok = True
+        mock_response.json.return_value = {"supplier": {"name": "SPDX Supplier"}}
+        mock_get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plain_file = Path(tmpdir) / "plain_spdx.json"
+            input_file = Path(tmpdir) / "input_spdx.json.gz"
+            output_file = Path(tmpdir) / "output_spdx.json"
+
+            spdx_write_file(spdx_document, str(plain_file), validate=False)
+            input_file.write_bytes(gzip.compress(plain_file.read_bytes()))
+
+            format_result = augment_sbom_from_file(
+                input_file=str(input_file),
+                output_file=str(output_file),
+                api_base_url="https://api.test.com",
+                token="test-token",
+                component_id="test-component-spdx",
+            )
+
+            assert format_result == "spdx"
+            output_doc = spdx_parse_file(str(output_file))
+            org_creators = [c for c in output_doc.creation_info.creators if c.actor_type == ActorType.ORGANIZATION]
+            assert any("SPDX Supplier" in c.name for c in org_creators)
+
     def test_spdx_homepage_preservation(self, spdx_document):
         """Test that existing homepage is preserved."""
         # Set existing homepage
@@ -2372,13 +2409,20 @@ class MockPurlConfig:
     component_purl: str
 
 
+def _apply_purl_override_to_file(sbom_file: Path, config: MockPurlConfig) -> None:
+    """Run _apply_sbom_purl_override() on an SBOM file, as the pipeline does on its document."""
+    from sbomify_action.cli.main import _apply_sbom_purl_override
+
+    document = SBOMDocument.from_file(sbom_file)
+    _apply_sbom_purl_override(document, config)
+    document.write(sbom_file)
+
+
 class TestComponentPurlOverride:
     """Tests for COMPONENT_PURL override functionality via _apply_sbom_purl_override."""
 
     def test_cyclonedx_set_purl_when_none_exists(self, tmp_path):
         """Test setting PURL on CycloneDX component that has no PURL."""
-        from sbomify_action.cli.main import _apply_sbom_purl_override
-
         # Create a minimal CycloneDX SBOM without PURL
         sbom = {
             "bomFormat": "CycloneDX",
@@ -2390,7 +2434,7 @@ class TestComponentPurlOverride:
         sbom_file = tmp_path / "test.cdx.json"
         sbom_file.write_text(json.dumps(sbom))
 
-        _apply_sbom_purl_override(str(sbom_file), MockPurlConfig("pkg:pypi/test-app@1.0.0"))
+        _apply_purl_override_to_file(sbom_file, MockPurlConfig("pkg:pypi/test-app@1.0.0"))
 
         # Verify PURL was set
         result = json.loads(sbom_file.read_text())
@@ -2398,8 +2442,6 @@ class TestComponentPurlOverride:
 
     def test_cyclonedx_override_existing_purl(self, tmp_path):
         """Test overriding existing PURL on CycloneDX component."""
-        from sbomify_action.cli.main import _apply_sbom_purl_override
-
         # Create CycloneDX SBOM with existing PURL
         sbom = {
             "bomFormat": "CycloneDX",
@@ -2418,7 +2460,7 @@ class TestComponentPurlOverride:
         sbom_file = tmp_path / "test.cdx.json"
         sbom_file.write_text(json.dumps(sbom))
 
-        _apply_sbom_purl_override(str(sbom_file), MockPurlConfig("pkg:npm/@scope/new-package@2.0.0"))
+        _apply_purl_override_to_file(sbom_file, MockPurlConfig("pkg:npm/@scope/new-package@2.0.0"))
 
         # Verify PURL was overridden (may be in canonical %40 form or literal @ form)
         result = json.loads(sbom_file.read_text())
@@ -2428,8 +2470,6 @@ class TestComponentPurlOverride:
 
     def test_cyclonedx_invalid_purl_is_skipped(self, tmp_path):
         """Test that invalid PURL is skipped without crashing."""
-        from sbomify_action.cli.main import _apply_sbom_purl_override
-
         # Create CycloneDX SBOM without PURL
         sbom = {
             "bomFormat": "CycloneDX",
@@ -2442,7 +2482,7 @@ class TestComponentPurlOverride:
         sbom_file.write_text(json.dumps(sbom))
 
         # Should not raise
-        _apply_sbom_purl_override(str(sbom_file), MockPurlConfig("not-a-valid-purl"))
+        _apply_purl_override_to_file(sbom_file, MockPurlConfig("not-a-valid-purl"))
 
         # Verify PURL was not added (invalid PURL was skipped)
         result = json.loads(sbom_file.read_text())
@@ -2450,8 +2490,6 @@ class TestComponentPurlOverride:
 
     def test_spdx_set_purl_when_none_exists(self, tmp_path):
         """Test adding PURL to SPDX package that has no PURL."""
-        from sbomify_action.cli.main import _apply_sbom_purl_override
-
         # Create minimal SPDX SBOM without PURL
         sbom = {
             "spdxVersion": "SPDX-2.3",
@@ -2470,7 +2508,7 @@ class TestComponentPurlOverride:
         sbom_file = tmp_path / "test.spdx.json"
         sbom_file.write_text(json.dumps(sbom))
 
-        _apply_sbom_purl_override(str(sbom_file), MockPurlConfig("pkg:pypi/test-app@1.0.0"))
+        _apply_purl_override_to_file(sbom_file, MockPurlConfig("pkg:pypi/test-app@1.0.0"))
 
         # Verify PURL was added
         result = json.loads(sbom_file.read_text())
@@ -2480,8 +2518,6 @@ class TestComponentPurlOverride:
 
     def test_spdx_override_existing_purl(self, tmp_path):
         """Test overriding existing PURL on SPDX package."""
-        from sbomify_action.cli.main import _apply_sbom_purl_override
-
         # Create SPDX SBOM with existing PURL
         sbom = {
             "spdxVersion": "SPDX-2.3",
@@ -2507,7 +2543,7 @@ class TestComponentPurlOverride:
         sbom_file = tmp_path / "test.spdx.json"
         sbom_file.write_text(json.dumps(sbom))
 
-        _apply_sbom_purl_override(str(sbom_file), MockPurlConfig("pkg:npm/@scope/new-package@2.0.0"))
+        _apply_purl_override_to_file(sbom_file, MockPurlConfig("pkg:npm/@scope/new-package@2.0.0"))
 
         # Verify PURL was overridden
         result = json.loads(sbom_file.read_text())
@@ -2517,8 +2553,6 @@ class TestComponentPurlOverride:
 
     def test_spdx_invalid_purl_is_skipped(self, tmp_path):
         """Test that invalid PURL is skipped without crashing for SPDX."""
-        from sbomify_action.cli.main import _apply_sbom_purl_override
-
         # Create minimal SPDX SBOM
         sbom = {
             "spdxVersion": "SPDX-2.3",
@@ -2538,7 +2572,7 @@ class TestComponentPurlOverride:
         sbom_file.write_text(json.dumps(sbom))
 
         # Should not raise
-        _apply_sbom_purl_override(str(sbom_file), MockPurlConfig("not-a-valid-purl"))
+        _apply_purl_override_to_file(sbom_file, MockPurlConfig("not-a-valid-purl"))
 
         # Verify no PURL was added (invalid PURL was skipped)
         result = json.loads(sbom_file.read_text())
@@ -2547,8 +2581,6 @@ class TestComponentPurlOverride:
 
     def test_cyclonedx_creates_component_if_not_exists(self, tmp_path):
         """Test that component is created when setting PURL and no component exists."""
-        from sbomify_action.cli.main import _apply_sbom_purl_override
-
         # Create CycloneDX SBOM without metadata.component
         sbom = {
             "bomFormat": "CycloneDX",
@@ -2560,7 +2592,7 @@ class TestComponentPurlOverride:
         sbom_file = tmp_path / "test.cdx.json"
         sbom_file.write_text(json.dumps(sbom))
 
-        _apply_sbom_purl_override(str(sbom_file), MockPurlConfig("pkg:pypi/new-app@1.0.0"))
+        _apply_purl_override_to_file(sbom_file, MockPurlConfig("pkg:pypi/new-app@1.0.0"))
 
         # Verify component was created with PURL
         result = json.loads(sbom_file.read_text())
@@ -2573,7 +2605,6 @@ class TestComponentPurlOverride:
         from spdx_tools.spdx.parser.parse_anything import parse_file as spdx_parse_file
 
         from sbomify_action.augmentation import _ensure_spdx_main_package_purl
-        from sbomify_action.cli.main import _apply_sbom_purl_override
 
         custom_purl = "pkg:npm/@myorg/my-lib@3.0.0"
 
@@ -2595,7 +2626,7 @@ class TestComponentPurlOverride:
         }
         sbom_file = tmp_path / "test.spdx.json"
         sbom_file.write_text(json.dumps(sbom))
-        _apply_sbom_purl_override(str(sbom_file), MockPurlConfig(custom_purl))
+        _apply_purl_override_to_file(sbom_file, MockPurlConfig(custom_purl))
 
         # 2. Parse the file back (same path as production code)
         document = spdx_parse_file(str(sbom_file))
@@ -2625,7 +2656,6 @@ class TestComponentPurlOverride:
         from cyclonedx.model.bom import Bom
 
         from sbomify_action.augmentation import augment_cyclonedx_sbom
-        from sbomify_action.cli.main import _apply_sbom_purl_override
 
         custom_purl = "pkg:npm/@myorg/my-lib@3.0.0"
 
@@ -2639,7 +2669,7 @@ class TestComponentPurlOverride:
         }
         sbom_file = tmp_path / "test.cdx.json"
         sbom_file.write_text(json.dumps(sbom))
-        _apply_sbom_purl_override(str(sbom_file), MockPurlConfig(custom_purl))
+        _apply_purl_override_to_file(sbom_file, MockPurlConfig(custom_purl))
 
         # 2. Deserialize from the written file (same path as production code)
         sbom_data = json.loads(sbom_file.read_text())
@@ -0,0 +1,30 @@
+"""Tests for the directory state is kept in between runs."""
+
+from sbomify_action._generation.cache import GenerationCache
+from sbomify_action._upload.upload_record import get_record_path
+from sbomify_action._yocto.cache import ComponentCache, PackageManifest
+from sbomify_action.cache_dir import get_cache_dir
+
+
+class TestGetCacheDir:
+    def test_explicit_cache_dir(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("SBOMIFY_CACHE_DIR", str(tmp_path))
+        assert get_cache_dir() == tmp_path
+
+    def test_xdg_cache_home(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("SBOMIFY_CACHE_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert get_cache_dir() == tmp_path / "sbomify"
+
+    def test_empty_explicit_cache_dir_falls_back(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("SBOMIFY_CACHE_DIR", "")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert get_cache_dir() == tmp_path / "sbomify"
+
+    def test_state_is_kept_under_cache_dir(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("SBOMIFY_CACHE_DIR", str(tmp_path))
+
+        assert GenerationCache().directory == tmp_path / "generation"
+        assert get_record_path() == tmp_path / "uploads.json"
+        assert PackageManifest("scope").path == tmp_path / "yocto-manifest.json"
+        assert ComponentCache("https://app.sbomify.com", "token").path == tmp_path / "yocto-components.json"
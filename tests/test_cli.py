@@ -115,6 +115,61 @@ class TestCLIArgumentParsing(unittest.TestCase):
                 config = mock_run.call_args[0][0]
                 self.assertIn("requirements.txt", config.lock_file)
 
+    @patch.object(cli_main_module, "run_pipeline")
+    @patch.object(cli_main_module, "setup_dependencies")
+    @patch.object(cli_main_module, "initialize_sentry")
+    def test_validation_policy_argument(self, mock_sentry, mock_deps, mock_run):
+        """Test --validation-policy argument."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            lock_file = Path(tmp_dir) / "requirements.txt"
+            lock_file.write_text("requests==2.28.0")
+
+            result = self.runner.invoke(
+                cli,
+                ["--lock-file", str(lock_file), "--validation-policy", "final", "--no-upload"],
+            )
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            config = mock_run.call_args[0][0]
+            self.assertEqual(config.validation_policy, "final")
+
+    @patch.object(cli_main_module, "run_pipeline")
+    @patch.object(cli_main_module, "setup_dependencies")
+    @patch.object(cli_main_module, "initialize_sentry")
+    def test_output_compression_argument(self, mock_sentry, mock_deps, mock_run):
+        """Test --output-compression adds the extension to the output file."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            lock_file = Path(tmp_dir) / "requirements.txt"
+            lock_file.write_text("requests==2.28.0")
+
+            result = self.runner.invoke(
+                cli,
+                ["--lock-file", str(lock_file), "--output-compression", "zstd", "-o", "out.json", "--no-upload"],
+            )
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            config = mock_run.call_args[0][0]
+            self.assertEqual(config.output_compression, "zstd")
+            self.assertEqual(config.output_file, "out.json.zst")
+
+    @patch.object(cli_main_module, "run_pipeline")
+    @patch.object(cli_main_module, "setup_dependencies")
+    @patch.object(cli_main_module, "initialize_sentry")
+    def test_keep_intermediates_argument(self, mock_sentry, mock_deps, mock_run):
+        """Test --keep-intermediates argument."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            lock_file = Path(tmp_dir) / "requirements.txt"
+            lock_file.write_text("requests==2.28.0")
+
+            result = self.runner.invoke(
+                cli,
+                ["--lock-file", str(lock_file), "--keep-intermediates", "--no-upload"],
+            )
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            config = mock_run.call_args[0][0]
+            self.assertTrue(config.keep_intermediates)
+
     @patch.object(cli_main_module, "run_pipeline")
     @patch.object(cli_main_module, "setup_dependencies")
     @patch.object(cli_main_module, "initialize_sentry")
@@ -0,0 +1,119 @@
+"""Tests for transparent gzip/zstd SBOM file compression."""
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+import zstandard
+
+from sbomify_action.cli.main import load_sbom_from_file
+from sbomify_action.compression import (
+    compression_for_path,
+    detect_compression,
+    open_sbom_for_writing,
+    read_sbom_bytes,
+    uncompressed_path,
+    with_compression_suffix,
+)
+from sbomify_action.document import SBOMDocument
+from sbomify_action.validation import validate_sbom_file_auto
+
+SBOM = {"bomFormat": "CycloneDX", "specVersion": "1.6", "version": 1, "components": []}
+RAW = json.dumps(SBOM).encode()
+
+
+@pytest.fixture(params=["gzip", "zstd", None])
+def sbom_file(request, tmp_path) -> Path:
+    """The same SBOM written plain, gzip and zstd compressed."""
+    if request.param == "gzip":
+        path = tmp_path / "sbom.json.gz"
+        path.write_bytes(gzip.compress(RAW))
+    elif request.param == "zstd":
+        path = tmp_path / "sbom.json.zst"
+        path.write_bytes(zstandard.ZstdCompressor().compress(RAW))
+    else:
+        path = tmp_path / "sbom.json"
+        path.write_bytes(RAW)
+    return path
+
+
+class TestDetection:
+    def test_detects_by_magic_bytes(self, tmp_path):
+        misnamed = tmp_path / "sbom.json"
+        misnamed.write_bytes(gzip.compress(RAW))
+        assert detect_compression(misnamed) == "gzip"
+
+        misnamed.write_bytes(zstandard.ZstdCompressor().compress(RAW))
+        assert detect_compression(misnamed) == "zstd"
+
+        misnamed.write_bytes(RAW)
+        assert detect_compression(misnamed) is None
+
+    def test_missing_file_is_uncompressed(self, tmp_path):
+        assert detect_compression(tmp_path / "missing.json.gz") is None
+
+    def test_compression_for_path(self):
+        assert compression_for_path("sbom.json.gz") == "gzip"
+        assert compression_for_path("sbom.json.ZST") == "zstd"
+        assert compression_for_path("sbom.json") is None
+
+    def test_with_compression_suffix(self):
+        assert with_compression_suffix("sbom.json", "gzip") == "sbom.json.gz"
+        assert with_compression_suffix("sbom.json.gz", "gzip") == "sbom.json.gz"
+        assert with_compression_suffix("sbom.json", "zstd") == "sbom.json.zst"
+        assert with_compression_suffix("sbom.json", "none") == "sbom.json"
+        assert with_compression_suffix("sbom.json", None) == "sbom.json"
+
+
+class TestReadWrite:
+    def test_read_decompresses(self, sbom_file):
+        assert read_sbom_bytes(sbom_file) == RAW
+
+    @pytest.mark.parametrize("name", ["out.json", "out.json.gz", "out.json.zst"])
+    def test_write_compresses_by_extension(self, tmp_path, name):
+        path = tmp_path / name
+        with open_sbom_for_writing(path) as f:
+            f.write('{"name": "café"}')
+
+        assert detect_compression(path) == compression_for_path(path)
+        assert json.loads(read_sbom_bytes(path)) == {"name": "café"}
+
+    def test_uncompressed_path(self, sbom_file):
+        with uncompressed_path(sbom_file) as plain:
+            assert plain.endswith(".json")
+            assert Path(plain).read_bytes() == RAW
+            if detect_compression(sbom_file):
+                assert plain != str(sbom_file)
+        if plain != str(sbom_file):
+            assert not Path(plain).exists()
+
+    def test_uncompressed_path_for_missing_file(self, tmp_path):
+        missing = tmp_path / "missing.json.gz"
+        with uncompressed_path(missing) as plain:
+            assert plain == str(missing)
+
+
+class TestLoaders:
+    """SBOM loaders accept compressed files."""
+
+    def test_document_from_file(self, sbom_file):
+        document = SBOMDocument.from_file(sbom_file)
+        assert document.sbom_format == "cyclonedx"
+        assert document.to_json() == RAW.decode()
+
+    def test_document_write_compressed(self, sbom_file, tmp_path):
+        output = tmp_path / "out.json.zst"
+        SBOMDocument.from_file(sbom_file).write(output)
+        assert detect_compression(output) == "zstd"
+        assert read_sbom_bytes(output) == RAW
+
+    def test_load_sbom_from_file(self, sbom_file):
+        sbom_format, data, _ = load_sbom_from_file(str(sbom_file))
+        assert sbom_format == "cyclonedx"
+        assert data == SBOM
+
+    def test_validate_sbom_file_auto(self, sbom_file):
+        result = validate_sbom_file_auto(str(sbom_file))
+        assert result.valid
+        assert result.spec_version == "1.6"
@@ -115,6 +115,21 @@ class TestConfig(unittest.TestCase):
         self.assertIn("sbomify API token is not defined", str(cm.exception))
         self.assertIn("uploading to sbomify", str(cm.exception))
 
+    def test_config_validation_rejects_unknown_validation_policy(self):
+        """Test that VALIDATION_POLICY must be a known policy."""
+        config = Config(
+            token="",
+            component_id="",
+            sbom_file="/path/to/sbom.json",
+            upload=False,
+            validation_policy="never",
+        )
+
+        with self.assertRaises(ConfigurationError) as cm:
+            config.validate()
+
+        self.assertIn("Invalid VALIDATION_POLICY", str(cm.exception))
+
     def test_config_validation_upload_requires_token(self):
         """Test that TOKEN is required when uploading to sbomify."""
         config = Config(
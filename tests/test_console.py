@@ -22,7 +22,6 @@ from sbomify_action.console import (
     gha_notice,
     gha_warning,
     print_banner,
-    print_duplicate_sbom_error,
     print_enrichment_summary,
     print_final_failure,
     print_final_success,
@@ -337,45 +336,6 @@ class TestUploadSummary(unittest.TestCase):
         )
 
 
-class TestDuplicateSbomError(unittest.TestCase):
-    """Tests for duplicate SBOM error function."""
-
-    def test_print_duplicate_sbom_error_cyclonedx(self):
-        """Test duplicate SBOM error for CycloneDX format."""
-        # Should not raise an exception
-        print_duplicate_sbom_error(
-            component_id="my-component",
-            sbom_format="cyclonedx",
-        )
-
-    def test_print_duplicate_sbom_error_spdx(self):
-        """Test duplicate SBOM error for SPDX format."""
-        # Should not raise an exception
-        print_duplicate_sbom_error(
-            component_id="another-component",
-            sbom_format="spdx",
-        )
-
-    def test_print_duplicate_sbom_error_with_version(self):
-        """Test duplicate SBOM error includes version when provided."""
-        # Should not raise an exception
-        print_duplicate_sbom_error(
-            component_id="my-component",
-            sbom_format="cyclonedx",
-            component_version="1.2.3",
-        )
-
-    @patch.dict(os.environ, {"GITHUB_ACTIONS": "true"})
-    def test_print_duplicate_sbom_error_gha(self):
-        """Test duplicate SBOM error emits GHA annotation."""
-        # Should not raise an exception and emit GHA error
-        print_duplicate_sbom_error(
-            component_id="test-component",
-            sbom_format="cyclonedx",
-            component_version="2.0.0",
-        )
-
-
 class TestFinalMessages(unittest.TestCase):
     """Tests for final success/failure messages."""
 
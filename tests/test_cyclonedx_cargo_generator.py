@@ -177,9 +177,10 @@ class TestCycloneDXCargoGeneratorPriority(unittest.TestCase):
 
         generators = registry.get_generators_for(gen_input)
 
-        # First generator should be cyclonedx-cargo (priority 10)
-        self.assertGreater(len(generators), 0)
-        self.assertEqual(generators[0].name, "cyclonedx-cargo")
+        # The in-process generator (priority 5) comes first, then cyclonedx-cargo (priority 10)
+        self.assertGreater(len(generators), 1)
+        self.assertEqual(generators[0].name, "native-lockfile")
+        self.assertEqual(generators[1].name, "cyclonedx-cargo")
 
     @patch("sbomify_action._generation.generators.trivy._TRIVY_AVAILABLE", True)
     @patch("sbomify_action._generation.generators.cdxgen._CDXGEN_AVAILABLE", True)
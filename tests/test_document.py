@@ -0,0 +1,169 @@
+"""Tests for the in-memory SBOM document handed between pipeline steps."""
+
+import json
+from pathlib import Path
+
+import pytest
+from cyclonedx.model.component import Component
+
+from sbomify_action.document import SBOMDocument
+from sbomify_action.exceptions import SBOMValidationError
+
+CYCLONEDX_TEXT = """{
+    "bomFormat": "CycloneDX",
+    "specVersion": "1.6",
+    "version": 1,
+    "metadata": {"component": {"type": "application", "name": "app", "bom-ref": "app"}},
+    "components": []
+}"""
+
+SPDX_DATA = {
+    "spdxVersion": "SPDX-2.3",
+    "dataLicense": "CC0-1.0",
+    "SPDXID": "SPDXRef-DOCUMENT",
+    "name": "app",
+    "documentNamespace": "https://example.com/app",
+    "creationInfo": {"created": "2024-01-01T00:00:00Z", "creators": ["Tool: test"]},
+    "packages": [],
+}
+
+
+class TestSBOMDocument:
+    def test_detects_format(self):
+        assert SBOMDocument.from_json(CYCLONEDX_TEXT).sbom_format == "cyclonedx"
+        assert SBOMDocument(dict(SPDX_DATA)).sbom_format == "spdx"
+        assert SBOMDocument({"foo": "bar"}).sbom_format is None
+
+    def test_spec_version_only_for_cyclonedx(self):
+        assert SBOMDocument.from_json(CYCLONEDX_TEXT).spec_version == "1.6"
+        assert SBOMDocument(dict(SPDX_DATA)).spec_version is None
+
+    def test_rejects_non_object_json(self):
+        with pytest.raises(SBOMValidationError):
+            SBOMDocument.from_json("[1, 2, 3]")
+
+    def test_rejects_invalid_json(self):
+        with pytest.raises(SBOMValidationError, match="Invalid JSON format"):
+            SBOMDocument.from_json("{not json")
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(SBOMValidationError, match="SBOM file not found"):
+            SBOMDocument.from_file(tmp_path / "missing.json")
+
+    def test_unmodified_document_is_written_verbatim(self, tmp_path):
+        path = tmp_path / "sbom.json"
+        path.write_text(CYCLONEDX_TEXT, encoding="utf-8")
+
+        document = SBOMDocument.from_file(path)
+        # Reading either representation doesn't count as a change
+        assert document.bom.metadata.component.name == "app"
+        assert document.data["version"] == 1
+
+        assert not document.modified
+        assert document.to_json() == CYCLONEDX_TEXT
+
+    def test_write_streams_same_output_as_to_json(self, tmp_path):
+        path = tmp_path / "out.json"
+
+        document = SBOMDocument.from_json(CYCLONEDX_TEXT)
+        document.bom.components.add(Component(name="lib", version="1.0", bom_ref="lib"))
+        document.update_bom()
+        document.write(path)
+        assert path.read_text(encoding="utf-8") == document.to_json()
+
+        document = SBOMDocument(dict(SPDX_DATA))
+        document.data["name"] = "renamed"
+        document.update_data()
+        document.write(path)
+        assert path.read_text(encoding="utf-8") == json.dumps(document.data, indent=2)
+
+    def test_write_fixes_purl_encoding(self, tmp_path):
+        path = tmp_path / "out.json"
+        data = json.loads(CYCLONEDX_TEXT)
+        data["components"] = [{"type": "library", "name": "lib", "purl": "pkg:npm/%40%40scope/lib@@1.0"}]
+
+        # Unmodified documents are written verbatim, so the text is fixed directly
+        SBOMDocument.from_json(json.dumps(data)).write(path, fix_purl_encoding=True)
+        assert "pkg:npm/%40scope/lib@1.0" in path.read_text(encoding="utf-8")
+
+        # Modified JSON data is fixed chunk by chunk while streaming
+        document = SBOMDocument(data)
+        document.update_data()
+        document.write(path, fix_purl_encoding=True)
+        assert "pkg:npm/%40scope/lib@1.0" in path.read_text(encoding="utf-8")
+
+    def test_bom_changes_are_reflected_in_data(self):
+        document = SBOMDocument.from_json(CYCLONEDX_TEXT)
+        document.bom.components.add(Component(name="lib", version="1.0"))
+        document.update_bom()
+
+        assert document.modified
+        names = [c["name"] for c in document.data["components"]]
+        assert names == ["lib"]
+        assert json.loads(document.to_json())["specVersion"] == "1.6"
+
+    def test_data_changes_are_reflected_in_bom(self):
+        document = SBOMDocument.from_json(CYCLONEDX_TEXT)
+        assert document.bom.metadata.component.version is None
+
+        document.data["metadata"]["component"]["version"] = "2.0"
+        document.update_data()
+
+        assert document.modified
+        assert document.bom.metadata.component.version == "2.0"
+
+    def test_update_without_reading_raises(self):
+        document = SBOMDocument.from_json(CYCLONEDX_TEXT)
+        with pytest.raises(ValueError):
+            document.update_bom()
+
+    def test_bom_requires_cyclonedx(self):
+        with pytest.raises(SBOMValidationError, match="Only CycloneDX"):
+            SBOMDocument(dict(SPDX_DATA)).bom
+
+    def test_bom_requires_spec_version(self):
+        document = SBOMDocument({"bomFormat": "CycloneDX"})
+        with pytest.raises(SBOMValidationError, match="specVersion"):
+            document.bom
+
+    def test_apply_file_step_loads_output(self):
+        document = SBOMDocument(dict(SPDX_DATA))
+
+        def step(input_path, output_path):
+            data = json.loads(Path(input_path).read_text())
+            data["name"] = "renamed"
+            Path(output_path).write_text(json.dumps(data))
+            return "done"
+
+        assert document.apply_file_step(step) == "done"
+        assert document.modified
+        assert document.data["name"] == "renamed"
+
+    def test_apply_file_step_without_output_leaves_document_unchanged(self):
+        document = SBOMDocument(dict(SPDX_DATA))
+
+        document.apply_file_step(lambda input_path, output_path: None)
+
+        assert not document.modified
+        assert document.data == SPDX_DATA
+
+    def test_apply_file_step_in_place(self):
+        document = SBOMDocument(dict(SPDX_DATA))
+
+        def step(path):
+            data = json.loads(Path(path).read_text())
+            data["packages"].append({"SPDXID": "SPDXRef-lib", "name": "lib"})
+            Path(path).write_text(json.dumps(data))
+
+        document.apply_file_step(step, in_place=True)
+
+        assert document.modified
+        assert document.data["packages"][0]["name"] == "lib"
+
+    def test_apply_file_step_in_place_without_changes(self):
+        document = SBOMDocument.from_json(CYCLONEDX_TEXT)
+
+        document.apply_file_step(lambda path: None, in_place=True)
+
+        assert not document.modified
+        assert document.to_json() == CYCLONEDX_TEXT
@@ -753,6 +753,26 @@ class TestEnricher:
                 assert metadata is not None
                 assert metadata.description == "Test package"
 
+    def test_fetch_all_metadata_looks_up_each_purl_once(self):
+        """Duplicate PURLs are fetched once, and later lookups reuse the results."""
+        registry = SourceRegistry()
+        fetched = []
+
+        def fake_fetch(purl, session, merge_results=True):
+            fetched.append(str(purl))
+            return NormalizedMetadata(description=f"{purl.name} package", source="test")
+
+        with patch.object(registry, "fetch_metadata", side_effect=fake_fetch):
+            with Enricher(registry=registry) as enricher:
+                purls = ["pkg:pypi/a@1.0", "pkg:pypi/b@1.0", "pkg:pypi/a@1.0", "pkg:pypi/c@1.0"]
+                metadata_map = enricher.fetch_all_metadata(purls, max_workers=4)
+
+                assert list(metadata_map) == ["pkg:pypi/a@1.0", "pkg:pypi/b@1.0", "pkg:pypi/c@1.0"]
+                assert metadata_map["pkg:pypi/b@1.0"].description == "b package"
+                assert enricher.fetch_metadata("pkg:pypi/a@1.0").description == "a package"
+
+        assert sorted(fetched) == ["pkg:pypi/a@1.0", "pkg:pypi/b@1.0", "pkg:pypi/c@1.0"]
+
 
 # =============================================================================
 # Test Apply Metadata Functions
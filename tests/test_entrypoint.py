@@ -119,7 +119,7 @@ class TestSBOMGeneration(unittest.TestCase):
 
     @patch("subprocess.run")
     def test_generate_sbom_pipenv(self, mock_run):
-        """Test SBOM generation from Pipfile.lock."""
+        """Test SBOM generation from Pipfile.lock, in-process without an external tool."""
         output_file = "test_pipenv_generation.json"
         self._mock_subprocess_for_sbom(mock_run, output_file)
 
@@ -131,14 +131,15 @@ class TestSBOMGeneration(unittest.TestCase):
 
         self.assertTrue(result.success)
         self.assertEqual(result.sbom_format, "cyclonedx")
-        self.assertTrue(mock_run.called)
+        self.assertEqual(result.generator_name, "native-lockfile")
+        self.assertFalse(mock_run.called)
 
         if os.path.exists(output_file):
             os.remove(output_file)
 
     @patch("subprocess.run")
     def test_generate_sbom_rust_cargo(self, mock_run):
-        """Test SBOM generation from Cargo.lock."""
+        """Test SBOM generation from Cargo.lock, in-process without an external tool."""
         output_file = "test_cargo_generation.json"
 
         def side_effect(*args, **kwargs):
@@ -158,7 +159,8 @@ class TestSBOMGeneration(unittest.TestCase):
         )
 
         self.assertTrue(result.success)
-        self.assertTrue(mock_run.called)
+        self.assertEqual(result.generator_name, "native-lockfile")
+        self.assertFalse(mock_run.called)
 
         if os.path.exists(output_file):
             os.remove(output_file)
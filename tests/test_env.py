@@ -0,0 +1,33 @@
+"""Tests for reading settings from environment variables."""
+
+import pytest
+
+from sbomify_action._generation.cache import cache_enabled
+from sbomify_action._upload.destinations.dependency_track import DependencyTrackConfig
+from sbomify_action._upload.upload_record import skip_unchanged_enabled
+from sbomify_action.env import get_env_bool
+
+
+class TestGetEnvBool:
+    @pytest.mark.parametrize("value", ["true", "TRUE", "yes", "1", "on"])
+    def test_true_values(self, monkeypatch, value):
+        monkeypatch.setenv("SBOMIFY_TEST_FLAG", value)
+        assert get_env_bool("SBOMIFY_TEST_FLAG") is True
+
+    @pytest.mark.parametrize("value", ["false", "no", "0", "off", ""])
+    def test_other_values_are_false(self, monkeypatch, value):
+        monkeypatch.setenv("SBOMIFY_TEST_FLAG", value)
+        assert get_env_bool("SBOMIFY_TEST_FLAG", default=True) is False
+
+    def test_unset_uses_default(self, monkeypatch):
+        monkeypatch.delenv("SBOMIFY_TEST_FLAG", raising=False)
+        assert get_env_bool("SBOMIFY_TEST_FLAG") is False
+        assert get_env_bool("SBOMIFY_TEST_FLAG", default=True) is True
+
+    def test_settings_share_parsing(self, monkeypatch):
+        monkeypatch.setenv("GENERATION_CACHE", "off")
+        monkeypatch.setenv("UPLOAD_SKIP_UNCHANGED", "Yes")
+        monkeypatch.setenv("DTRACK_AUTO_CREATE", "1")
+        assert cache_enabled() is False
+        assert skip_unchanged_enabled() is True
+        assert DependencyTrackConfig._get_env_bool("AUTO_CREATE") is True
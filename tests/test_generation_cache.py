@@ -0,0 +1,251 @@
+"""Tests for the cache of generated SBOMs."""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from sbomify_action._generation import FormatVersion, GenerationInput, GenerationResult, GeneratorRegistry
+from sbomify_action._generation import cache as cache_module
+from sbomify_action._generation.cache import GenerationCache
+
+VALID_CYCLONEDX = {"bomFormat": "CycloneDX", "specVersion": "1.6", "version": 1, "components": []}
+
+
+class FakeGenerator:
+    """Generator writing a fixed CycloneDX SBOM and counting its runs."""
+
+    name = "fake-generator"
+    command = "fake-generator"
+    priority = 10
+
+    def __init__(self, sbom=None):
+        self.sbom = sbom or VALID_CYCLONEDX
+        self.runs = 0
+
+    @property
+    def supported_formats(self):
+        return [FormatVersion(format="cyclonedx", versions=("1.5", "1.6"), default_version="1.6")]
+
+    def supports(self, input):
+        return input.is_lock_file
+
+    def generate(self, input):
+        self.runs += 1
+        Path(input.output_file).write_text(json.dumps(self.sbom))
+        return GenerationResult.success_result(
+            output_file=input.output_file,
+            sbom_format="cyclonedx",
+            spec_version=input.spec_version or "1.6",
+            generator_name=self.name,
+        )
+
+
+class TestGenerationCache(unittest.TestCase):
+    """Tests for GenerationCache keys and entries."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.addCleanup(self._tmp.cleanup)
+        self.project = self.tmp / "project"
+        self.project.mkdir()
+        self.lock_file = self.project / "uv.lock"
+        self.lock_file.write_text('version = 1\n[[package]]\nname = "requests"\nversion = "2.32.3"\n')
+        self.tool = self.tmp / "fake-generator"
+        self.tool.write_text("#!/bin/sh\n")
+        which = patch("sbomify_action._generation.cache.shutil.which", return_value=str(self.tool))
+        which.start()
+        self.addCleanup(which.stop)
+        self.cache = GenerationCache(self.tmp / "cache")
+        self.generator = FakeGenerator()
+
+    def _input(self, lock_file=None, spec_version=None):
+        return GenerationInput(
+            lock_file=str(lock_file or self.lock_file),
+            output_file=str(self.tmp / "sbom.json"),
+            spec_version=spec_version,
+        )
+
+    def test_key_is_stable_for_identical_inputs(self):
+        key = self.cache.key_for(self.generator, self._input(), "1.6")
+        self.assertIsNotNone(key)
+        self.assertEqual(key, self.cache.key_for(self.generator, self._input(), "1.6"))
+
+    def test_key_changes_with_inputs(self):
+        key = self.cache.key_for(self.generator, self._input(), "1.6")
+
+        self.assertNotEqual(key, self.cache.key_for(self.generator, self._input(), "1.5"))
+
+        (self.project / "pyproject.toml").write_text('[project]\nname = "app"\n')
+        with_manifest = self.cache.key_for(self.generator, self._input(), "1.6")
+        self.assertNotEqual(key, with_manifest)
+
+        self.lock_file.write_text("version = 1\n")
+        self.assertNotEqual(with_manifest, self.cache.key_for(self.generator, self._input(), "1.6"))
+
+        # Upgrading the tool replaces its executable
+        os.utime(self.tool, ns=(0, 0))
+        self.assertNotEqual(key, self.cache.key_for(self.generator, self._input(), "1.6"))
+
+    def test_key_changes_with_generator_environment(self):
+        key = self.cache.key_for(self.generator, self._input(), "1.6")
+
+        with patch.dict(os.environ, {"TRIVY_SKIP_DIRS": "vendor"}):
+            self.assertNotEqual(key, self.cache.key_for(self.generator, self._input(), "1.6"))
+        with patch.dict(os.environ, {"FETCH_LICENSE": "true"}):
+            self.assertNotEqual(key, self.cache.key_for(self.generator, self._input(), "1.6"))
+        with patch.dict(os.environ, {"UNRELATED_SETTING": "1"}):
+            self.assertEqual(key, self.cache.key_for(self.generator, self._input(), "1.6"))
+
+    def test_no_key_for_uncacheable_inputs(self):
+        requirements = self.project / "requirements.txt"
+        requirements.write_text("requests\n")
+        self.assertIsNone(self.cache.key_for(self.generator, self._input(requirements), "1.6"))
+
+        docker_input = GenerationInput(docker_image="alpine:3.18")
+        self.assertIsNone(self.cache.key_for(self.generator, docker_input, "1.6"))
+
+        with patch.dict(os.environ, {"GENERATION_CACHE": "false"}):
+            self.assertIsNone(self.cache.key_for(self.generator, self._input(), "1.6"))
+
+        with patch("sbomify_action._generation.cache.shutil.which", return_value=None):
+            self.assertIsNone(self.cache.key_for(self.generator, self._input(), "1.6"))
+
+    def test_store_and_restore(self):
+        input = self._input()
+        self.generator.generate(input)
+        result = GenerationResult.success_result(
+            output_file=input.output_file,
+            sbom_format="cyclonedx",
+            spec_version="1.6",
+            generator_name="fake-generator",
+            validated=True,
+        )
+        self.cache.store("abc", result)
+
+        restored_file = self.tmp / "restored.json"
+        restored = self.cache.restore("abc", str(restored_file))
+
+        self.assertTrue(restored.is_valid)
+        self.assertEqual(restored.generator_name, "fake-generator")
+        self.assertEqual(restored.output_file, str(restored_file))
+        self.assertEqual(json.loads(restored_file.read_text()), VALID_CYCLONEDX)
+        self.assertIsNone(self.cache.restore("missing", str(restored_file)))
+
+    def _store(self, sbom, sbom_format="cyclonedx"):
+        sbom_file = self.tmp / "generated.json"
+        sbom_file.write_text(json.dumps(sbom))
+        result = GenerationResult.success_result(
+            output_file=str(sbom_file),
+            sbom_format=sbom_format,
+            spec_version="1.6" if sbom_format == "cyclonedx" else "2.3",
+            generator_name="fake-generator",
+            validated=True,
+        )
+        self.cache.store("abc", result)
+
+    def test_restore_renews_cyclonedx_identity(self):
+        serial = "urn:uuid:3e671687-395b-41f5-a30f-a58921a69b79"
+        self._store({**VALID_CYCLONEDX, "serialNumber": serial, "metadata": {"timestamp": "2020-01-01T00:00:00Z"}})
+
+        restored_file = self.tmp / "restored.json"
+        self.assertIsNotNone(self.cache.restore("abc", str(restored_file)))
+
+        restored = json.loads(restored_file.read_text())
+        self.assertRegex(restored["serialNumber"], r"^urn:uuid:[0-9a-f-]{36}$")
+        self.assertNotEqual(restored["serialNumber"], serial)
+        self.assertNotEqual(restored["metadata"]["timestamp"], "2020-01-01T00:00:00Z")
+
+    def test_restore_renews_spdx_identity(self):
+        namespace = "http://aquasecurity.github.io/trivy/filesystem/uv.lock-3e671687-395b-41f5-a30f-a58921a69b79"
+        self._store(
+            {
+                "spdxVersion": "SPDX-2.3",
+                "documentNamespace": namespace,
+                "creationInfo": {"created": "2020-01-01T00:00:00Z", "creators": ["Tool: trivy"]},
+            },
+            sbom_format="spdx",
+        )
+
+        restored_file = self.tmp / "restored.json"
+        self.assertIsNotNone(self.cache.restore("abc", str(restored_file)))
+
+        restored = json.loads(restored_file.read_text())
+        self.assertTrue(
+            restored["documentNamespace"].startswith("http://aquasecurity.github.io/trivy/filesystem/uv.lock-")
+        )
+        self.assertNotEqual(restored["documentNamespace"], namespace)
+        self.assertNotEqual(restored["creationInfo"]["created"], "2020-01-01T00:00:00Z")
+
+    def test_unknown_documents_are_not_restored(self):
+        self._store({"@context": "https://spdx.org/rdf/3.0.1/spdx-context.jsonld", "@graph": []}, sbom_format="spdx")
+
+        self.assertIsNone(self.cache.restore("abc", str(self.tmp / "restored.json")))
+
+    def test_unvalidated_results_are_not_stored(self):
+        input = self._input()
+        self.generator.generate(input)
+        result = GenerationResult.success_result(
+            output_file=input.output_file, sbom_format="cyclonedx", spec_version="1.6", generator_name="fake"
+        )
+
+        self.cache.store("abc", result)
+
+        self.assertIsNone(self.cache.restore("abc", str(self.tmp / "restored.json")))
+
+    def test_least_recently_used_entries_are_pruned(self):
+        input = self._input()
+        self.generator.generate(input)
+        result = GenerationResult.success_result(
+            output_file=input.output_file,
+            sbom_format="cyclonedx",
+            spec_version="1.6",
+            generator_name="fake-generator",
+            validated=True,
+        )
+
+        with patch.object(cache_module, "MAX_ENTRIES", 2):
+            for age, key in enumerate(["old", "middle", "new"]):
+                self.cache.store(key, result)
+                os.utime(self.cache.directory / f"{key}.meta.json", (1000 + age, 1000 + age))
+            self.cache.store("newest", result)
+
+        self.assertFalse((self.cache.directory / "old.json").exists())
+        self.assertFalse((self.cache.directory / "middle.json").exists())
+        self.assertTrue((self.cache.directory / "new.json").exists())
+        self.assertTrue((self.cache.directory / "newest.json").exists())
+
+    def test_registry_restores_identical_generation(self):
+        registry = GeneratorRegistry(cache=self.cache)
+        registry.register(self.generator)
+
+        first = registry.generate(self._input())
+        Path(first.output_file).unlink()
+        second = registry.generate(self._input())
+
+        self.assertEqual(self.generator.runs, 1)
+        self.assertTrue(second.is_valid)
+        self.assertEqual(second.generator_name, "fake-generator")
+        self.assertEqual(json.loads(Path(second.output_file).read_text()), VALID_CYCLONEDX)
+
+        # A changed lock file is generated again
+        self.lock_file.write_text("version = 1\n")
+        registry.generate(self._input())
+        self.assertEqual(self.generator.runs, 2)
+
+    def test_registry_does_not_cache_invalid_sboms(self):
+        generator = FakeGenerator(sbom={"bomFormat": "CycloneDX", "specVersion": "1.6", "version": "not-a-number"})
+        registry = GeneratorRegistry(cache=self.cache)
+        registry.register(generator)
+
+        registry.generate(self._input())
+        registry.generate(self._input())
+
+        self.assertEqual(generator.runs, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,9 +14,13 @@ from sbomify_action._hash_enrichment import (
 )
 from sbomify_action._hash_enrichment.parsers import (
     CargoLockParser,
+    PackageLockParser,
     PipfileLockParser,
+    PnpmLockParser,
+    PoetryLockParser,
     PubspecLockParser,
     UvLockParser,
+    YarnLockParser,
 )
 
 
@@ -246,6 +250,359 @@ class TestPubspecLockParser:
         assert all(h.algorithm == HashAlgorithm.SHA256 for h in hashes)
 
 
+def _graph(packages):
+    """Map name@version -> (direct, sorted dependency names) for comparing parse_packages() results."""
+    return {f"{p.name}@{p.version}": (p.direct, sorted(name for name, _ in p.dependencies)) for p in packages}
+
+
+class TestParsePackages:
+    """Tests for the locked packages and dependencies extracted by the parsers."""
+
+    def test_uv_lock_follows_project_dependencies(self, tmp_path):
+        """The project's dependencies are direct; dev-only packages are dropped, requested extras kept."""
+        lock_file = tmp_path / "uv.lock"
+        lock_file.write_text(
+            """
+version = 1
+
+[[package]]
+name = "app"
+version = "0.1.0"
+source = { virtual = "." }
+dependencies = [{ name = "requests", extra = ["socks"] }]
+
+[package.dev-dependencies]
+dev = [{ name = "pytest" }]
+
+[[package]]
+name = "requests"
+version = "2.32.3"
+source = { registry = "https://pypi.org/simple" }
+dependencies = [{ name = "idna" }]
+
+[package.optional-dependencies]
+socks = [{ name = "pysocks" }]
+
+[[package]]
+name = "idna"
+version = "3.10"
+source = { registry = "https://pypi.org/simple" }
+
+[[package]]
+name = "pysocks"
+version = "1.7.1"
+source = { registry = "https://pypi.org/simple" }
+
+[[package]]
+name = "pytest"
+version = "8.3.4"
+source = { registry = "https://pypi.org/simple" }
+"""
+        )
+
+        graph = _graph(UvLockParser().parse_packages(lock_file))
+
+        assert graph == {
+            "requests@2.32.3": (True, ["idna", "pysocks"]),
+            "idna@3.10": (False, []),
+            "pysocks@1.7.1": (False, []),
+        }
+
+    def test_poetry_lock_skips_dev_packages(self, tmp_path):
+        """Dev groups are skipped; pyproject.toml provides the direct dependencies."""
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "app"\ndependencies = ["Django>=5"]\n')
+        lock_file = tmp_path / "poetry.lock"
+        lock_file.write_text(
+            """
+[[package]]
+name = "django"
+version = "5.1.1"
+groups = ["main"]
+
+[package.dependencies]
+asgiref = ">=3.8.1"
+sqlparse = ">=0.3.1"
+
+[[package]]
+name = "asgiref"
+version = "3.8.1"
+groups = ["main"]
+
+[[package]]
+name = "sqlparse"
+version = "0.5.1"
+groups = ["main"]
+
+[[package]]
+name = "pytest"
+version = "8.3.4"
+groups = ["dev"]
+"""
+        )
+
+        graph = _graph(PoetryLockParser().parse_packages(lock_file))
+
+        assert graph == {
+            "django@5.1.1": (True, ["asgiref", "sqlparse"]),
+            "asgiref@3.8.1": (False, []),
+            "sqlparse@0.5.1": (False, []),
+        }
+
+    def test_pipfile_lock_uses_default_section(self, tmp_path):
+        """Default packages are all direct; the develop section is left out."""
+        lock_file = tmp_path / "Pipfile.lock"
+        lock_file.write_text(
+            json.dumps(
+                {
+                    "default": {"django": {"version": "==5.1.1"}, "asgiref": {"version": "==3.8.1"}},
+                    "develop": {"pytest": {"version": "==8.3.4"}},
+                }
+            )
+        )
+
+        graph = _graph(PipfileLockParser().parse_packages(lock_file))
+
+        assert graph == {"django@5.1.1": (True, []), "asgiref@3.8.1": (True, [])}
+
+    def test_cargo_lock_workspace_members_are_the_project(self, tmp_path):
+        """Crates without a source are the project; versioned dependency entries select one version."""
+        lock_file = tmp_path / "Cargo.lock"
+        lock_file.write_text(
+            """
+version = 3
+
+[[package]]
+name = "app"
+version = "0.1.0"
+dependencies = ["serde", "rand 0.8.5"]
+
+[[package]]
+name = "serde"
+version = "1.0.193"
+source = "registry+https://github.com/rust-lang/crates.io-index"
+checksum = "abc"
+
+[[package]]
+name = "rand"
+version = "0.8.5"
+source = "registry+https://github.com/rust-lang/crates.io-index"
+dependencies = ["libc"]
+
+[[package]]
+name = "rand"
+version = "0.7.3"
+source = "registry+https://github.com/rust-lang/crates.io-index"
+
+[[package]]
+name = "libc"
+version = "0.2.150"
+source = "registry+https://github.com/rust-lang/crates.io-index"
+"""
+        )
+
+        packages = CargoLockParser().parse_packages(lock_file)
+        graph = _graph(packages)
+
+        assert graph["serde@1.0.193"] == (True, [])
+        assert graph["rand@0.8.5"] == (True, ["libc"])
+        assert graph["rand@0.7.3"] == (False, [])
+        assert "app@0.1.0" not in graph
+        rand = next(p for p in packages if p.version == "0.8.5")
+        assert rand.dependencies == [("libc", None)]
+
+    def test_package_lock_resolves_nested_node_modules(self, tmp_path):
+        """Dependencies resolve to the closest node_modules entry; dev packages are dropped."""
+        lock_file = tmp_path / "package-lock.json"
+        lock_file.write_text(
+            json.dumps(
+                {
+                    "lockfileVersion": 3,
+                    "packages": {
+                        "": {"name": "app", "dependencies": {"a": "^1.0.0"}, "devDependencies": {"jest": "^29"}},
+                        "node_modules/a": {"version": "1.0.0", "dependencies": {"b": "^2.0.0"}},
+                        "node_modules/a/node_modules/b": {"version": "2.0.0", "dependencies": {"c": "*"}},
+                        "node_modules/b": {"version": "1.0.0"},
+                        "node_modules/c": {"version": "3.0.0"},
+                        "node_modules/jest": {"version": "29.7.0", "dev": True},
+                    },
+                }
+            )
+        )
+
+        packages = PackageLockParser().parse_packages(lock_file)
+
+        assert _graph(packages) == {
+            "a@1.0.0": (True, ["b"]),
+            "b@2.0.0": (False, ["c"]),
+            "b@1.0.0": (False, []),
+            "c@3.0.0": (False, []),
+        }
+        a = next(p for p in packages if p.name == "a")
+        assert a.dependencies == [("b", "2.0.0")]
+
+    def test_package_lock_v1_uses_package_json(self, tmp_path):
+        """v1 lockfiles resolve "requires" and take direct dependencies from package.json."""
+        (tmp_path / "package.json").write_text(json.dumps({"dependencies": {"a": "^1.0.0"}}))
+        lock_file = tmp_path / "package-lock.json"
+        lock_file.write_text(
+            json.dumps(
+                {
+                    "lockfileVersion": 1,
+                    "dependencies": {
+                        "a": {"version": "1.0.0", "requires": {"b": "^1.0.0"}},
+                        "b": {"version": "1.0.0"},
+                        "jest": {"version": "29.7.0", "dev": True},
+                    },
+                }
+            )
+        )
+
+        assert _graph(PackageLockParser().parse_packages(lock_file)) == {
+            "a@1.0.0": (True, ["b"]),
+            "b@1.0.0": (False, []),
+        }
+
+    def test_yarn_v1_lock_resolves_specifiers(self, tmp_path):
+        """Dependency ranges resolve through entry headers; packages only devDependencies reach are dropped."""
+        (tmp_path / "package.json").write_text(
+            json.dumps({"dependencies": {"@scope/a": "^1.0.0"}, "devDependencies": {"jest": "^29.0.0"}})
+        )
+        lock_file = tmp_path / "yarn.lock"
+        lock_file.write_text(
+            """# THIS IS AN AUTOGENERATED FILE. DO NOT EDIT THIS FILE DIRECTLY.
+# yarn lockfile v1
+
+
+"@scope/a@^1.0.0":
+  version "1.2.0"
+  resolved "https://registry.yarnpkg.com/@scope/a/-/a-1.2.0.tgz"
+  integrity sha512-AAAA
+  dependencies:
+    b "^2.0.0"
+
+b@^2.0.0, b@^2.1.0:
+  version "2.1.0"
+
+jest@^29.0.0:
+  version "29.7.0"
+  dependencies:
+    b "^2.1.0"
+"""
+        )
+
+        packages = YarnLockParser().parse_packages(lock_file)
+
+        assert _graph(packages) == {"@scope/a@1.2.0": (True, ["b"]), "b@2.1.0": (False, [])}
+
+    def test_yarn_berry_lock_uses_workspace_dependencies(self, tmp_path):
+        """Without package.json, the workspace entry's dependencies are the direct ones."""
+        lock_file = tmp_path / "yarn.lock"
+        lock_file.write_text(
+            """# This file is generated by running "yarn install" inside your project.
+# Manual changes might be lost - proceed with caution!
+
+__metadata:
+  version: 6
+
+"app@workspace:.":
+  version: 0.0.0-use.local
+  resolution: "app@workspace:."
+  dependencies:
+    lodash: ^4.17.21
+  languageName: unknown
+  linkType: soft
+
+"lodash@npm:^4.17.21":
+  version: 4.17.21
+  resolution: "lodash@npm:4.17.21"
+  checksum: sha512-AAAA
+  languageName: node
+  linkType: hard
+"""
+        )
+
+        assert _graph(YarnLockParser().parse_packages(lock_file)) == {"lodash@4.17.21": (True, [])}
+
+    def test_pnpm_v9_lock_drops_dev_only_packages(self, tmp_path):
+        """Importer dependencies are direct; snapshots give the graph, including peer-suffixed versions."""
+        lock_file = tmp_path / "pnpm-lock.yaml"
+        lock_file.write_text(
+            """
+lockfileVersion: '9.0'
+importers:
+  .:
+    dependencies:
+      react-dom:
+        specifier: ^18.0.0
+        version: 18.2.0(react@18.2.0)
+    devDependencies:
+      vitest:
+        specifier: ^1.0.0
+        version: 1.6.0
+packages:
+  react-dom@18.2.0:
+    resolution: {integrity: sha512-AAAA}
+  react@18.2.0:
+    resolution: {integrity: sha512-BBBB}
+  vitest@1.6.0:
+    resolution: {integrity: sha512-CCCC}
+snapshots:
+  react-dom@18.2.0(react@18.2.0):
+    dependencies:
+      react: 18.2.0
+  react@18.2.0: {}
+  vitest@1.6.0: {}
+"""
+        )
+
+        assert _graph(PnpmLockParser().parse_packages(lock_file)) == {
+            "react-dom@18.2.0": (True, ["react"]),
+            "react@18.2.0": (False, []),
+        }
+
+    def test_pnpm_v6_lock_skips_dev_packages(self, tmp_path):
+        """v6 lockfiles mark dev packages and list single-project dependencies at the top level."""
+        lock_file = tmp_path / "pnpm-lock.yaml"
+        lock_file.write_text(
+            """
+lockfileVersion: '6.0'
+dependencies:
+  '@scope/a':
+    specifier: ^1.0.0
+    version: 1.0.0
+packages:
+  /@scope/a@1.0.0:
+    resolution: {integrity: sha512-AAAA}
+    dependencies:
+      b: 2.0.0
+    dev: false
+  /b@2.0.0:
+    resolution: {integrity: sha512-BBBB}
+    dev: false
+  /jest@29.7.0:
+    resolution: {integrity: sha512-CCCC}
+    dev: true
+"""
+        )
+
+        assert _graph(PnpmLockParser().parse_packages(lock_file)) == {
+            "@scope/a@1.0.0": (True, ["b"]),
+            "b@2.0.0": (False, []),
+        }
+
+    def test_pubspec_lock_marks_direct_packages(self):
+        """Direct main packages are direct; dev and SDK packages are left out."""
+        lock_file = Path("tests/test-data/pubspec.lock")
+        if not lock_file.exists():
+            pytest.skip("Test data file not found")
+
+        graph = _graph(PubspecLockParser().parse_packages(lock_file))
+
+        assert graph["adaptive_theme@3.7.2"] == (True, [])
+        assert graph["_fe_analyzer_shared@85.0.0"] == (False, [])
+        assert not any(key.startswith(("bloc_test@", "flutter@")) for key in graph)
+
+
 class TestHashEnricher:
     """Tests for HashEnricher class."""
 
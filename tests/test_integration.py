@@ -73,6 +73,39 @@ class TestIntegration(unittest.TestCase):
 
         # Verify output file was created
         self.assertTrue(os.path.exists("sbom_output.json"))
+        # Intermediate step files are only written with --keep-intermediates
+        self.assertFalse(os.path.exists("step_1.json"))
+
+    @patch.object(cli_main_module, "setup_dependencies")
+    @patch.object(cli_main_module, "initialize_sentry")
+    def test_keep_intermediates_writes_step_files(self, mock_sentry, mock_setup):
+        """Test that --keep-intermediates dumps the SBOM after each step."""
+        test_sbom = {"bomFormat": "CycloneDX", "specVersion": "1.6", "version": 1}
+        with open("test_sbom.json", "w") as f:
+            json.dump(test_sbom, f)
+
+        with patch.object(cli_main_module, "print_banner"):
+            result = self.runner.invoke(
+                cli,
+                [
+                    "--sbom-file",
+                    "test_sbom.json",
+                    "--component-version",
+                    "2.0.0",
+                    "--no-upload",
+                    "--no-augment",
+                    "--no-enrich",
+                    "--keep-intermediates",
+                ],
+            )
+
+        self.assertEqual(result.exit_code, 0, f"CLI failed with: {result.output}")
+        self.assertTrue(os.path.exists("step_1.json"))
+        with open("step_1.json") as f:
+            step_1 = json.load(f)
+        self.assertEqual(step_1["metadata"]["component"]["version"], "2.0.0")
+        with open("sbom_output.json") as f:
+            self.assertEqual(json.load(f)["metadata"]["component"]["version"], "2.0.0")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,148 @@
+"""Tests for the pluggable JSON codec layer."""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from sbomify_action import jsonio
+
+orjson = pytest.importorskip("orjson")
+
+TEST_DATA_DIR = Path(__file__).parent / "test-data"
+
+DOCUMENT = {
+    "bomFormat": "CycloneDX",
+    "components": [
+        {"name": "zlib", "version": "1.3", "hashes": [], "properties": {}},
+        {"name": "café", "description": "naïve   line", "score": 7.5, "count": 3, "flag": None},
+    ],
+    "empty": {},
+}
+
+DUMP_VARIANTS = [
+    {},
+    {"indent": 2},
+    {"indent": 4},
+    {"ensure_ascii": False},
+    {"indent": 2, "ensure_ascii": False},
+    {"separators": (",", ":")},
+    {"separators": (",", ":"), "sort_keys": True},
+    {"indent": 2, "sort_keys": True},
+]
+
+
+@pytest.fixture
+def orjson_codec():
+    previous = jsonio.set_codec("orjson")
+    yield
+    jsonio.set_codec(previous.name)
+
+
+class TestOrjsonCodecParity:
+    """The orjson codec produces byte-identical output to stdlib json."""
+
+    @pytest.mark.parametrize("kwargs", DUMP_VARIANTS)
+    def test_dumps_matches_stdlib(self, orjson_codec, kwargs):
+        assert jsonio.dumps(DOCUMENT, **kwargs) == json.dumps(DOCUMENT, **kwargs)
+
+    @pytest.mark.parametrize("kwargs", DUMP_VARIANTS)
+    def test_dumps_matches_stdlib_for_ascii_document(self, orjson_codec, kwargs):
+        document = {"name": "zlib", "items": [1, 2, {"a": "\x1f\x7f"}]}
+        assert jsonio.dumps(document, **kwargs) == json.dumps(document, **kwargs)
+
+    def test_dumps_matches_stdlib_for_real_sbom(self, orjson_codec):
+        data = json.loads((TEST_DATA_DIR / "alpine_3.21_syft.cdx.json").read_text(encoding="utf-8"))
+        for kwargs in DUMP_VARIANTS:
+            assert jsonio.dumps(data, **kwargs) == json.dumps(data, **kwargs)
+
+    def test_falls_back_for_unsupported_values(self, orjson_codec):
+        document = {1: "int key", "big": 2**70}
+        assert jsonio.dumps(document, indent=2) == json.dumps(document, indent=2)
+
+    def test_dump_writes_text(self, orjson_codec):
+        buffer = io.StringIO()
+        jsonio.dump(DOCUMENT, buffer, indent=2)
+        assert buffer.getvalue() == json.dumps(DOCUMENT, indent=2)
+
+
+class TestIterencode:
+    """iterencode() chunks concatenate to exactly what dumps() produces."""
+
+    @pytest.mark.parametrize("codec", ["stdlib", "orjson"])
+    @pytest.mark.parametrize("kwargs", DUMP_VARIANTS)
+    def test_chunks_match_stdlib(self, codec, kwargs):
+        previous = jsonio.set_codec(codec)
+        try:
+            assert "".join(jsonio.iterencode(DOCUMENT, **kwargs)) == json.dumps(DOCUMENT, **kwargs)
+        finally:
+            jsonio.set_codec(previous.name)
+
+    @pytest.mark.parametrize("document", [{}, [1, 2], "text", {1: "int key"}, {"empty": [], "tuple": (1, 2)}])
+    def test_edge_cases_match_stdlib(self, orjson_codec, document):
+        for kwargs in DUMP_VARIANTS:
+            assert "".join(jsonio.iterencode(document, **kwargs)) == json.dumps(document, **kwargs)
+
+    def test_splits_top_level_arrays_into_elements(self, orjson_codec):
+        chunks = list(jsonio.iterencode(DOCUMENT, indent=2))
+        zlib = [chunk for chunk in chunks if '"zlib"' in chunk]
+        cafe = [chunk for chunk in chunks if '"caf\\u00e9"' in chunk]
+        assert len(zlib) == 1 and len(cafe) == 1
+        assert zlib != cafe
+
+    def test_iterator_values_are_written_as_arrays(self, orjson_codec):
+        consumed = []
+
+        def elements():
+            for i in range(3):
+                consumed.append(i)
+                yield {"id": i}
+
+        chunks = jsonio.iterencode({"@graph": elements(), "none": iter(())}, indent=2)
+        assert consumed == []
+        expected = json.dumps({"@graph": [{"id": 0}, {"id": 1}, {"id": 2}], "none": []}, indent=2)
+        assert "".join(chunks) == expected
+        assert consumed == [0, 1, 2]
+
+
+class TestLoads:
+    """Parsing is codec independent."""
+
+    @pytest.mark.parametrize("codec", ["stdlib", "orjson"])
+    def test_load_text_and_binary(self, codec):
+        previous = jsonio.set_codec(codec)
+        try:
+            text = json.dumps(DOCUMENT)
+            assert jsonio.loads(text) == DOCUMENT
+            assert jsonio.load(io.StringIO(text)) == DOCUMENT
+            assert jsonio.load(io.BytesIO(text.encode("utf-8"))) == DOCUMENT
+        finally:
+            jsonio.set_codec(previous.name)
+
+    def test_orjson_falls_back_for_stdlib_only_input(self, orjson_codec):
+        assert jsonio.loads('{"n": Infinity}') == {"n": float("inf")}
+
+    def test_invalid_json_raises_stdlib_error(self, orjson_codec):
+        with pytest.raises(jsonio.JSONDecodeError):
+            jsonio.loads("{not json")
+        assert jsonio.JSONDecodeError is json.JSONDecodeError
+
+
+class TestCodecSelection:
+    """Codecs can be selected by name."""
+
+    def test_orjson_is_default_when_installed(self):
+        assert jsonio.get_codec().name == "orjson"
+
+    def test_set_codec_returns_previous(self):
+        previous = jsonio.set_codec("stdlib")
+        try:
+            assert jsonio.get_codec().name == "stdlib"
+        finally:
+            jsonio.set_codec(previous.name)
+        assert jsonio.get_codec().name == previous.name
+
+    def test_unknown_codec_rejected(self):
+        with pytest.raises(ValueError, match="Unknown or unavailable"):
+            jsonio.set_codec("simdjson")
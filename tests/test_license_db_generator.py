@@ -0,0 +1,241 @@
+"""Tests for the Linux distro license database generator."""
+
+import io
+import tarfile
+from unittest.mock import patch
+
+import pytest
+import zstandard
+
+from sbomify_action._enrichment.license_db_generator import (
+    DEBIAN_ARCHIVE_BASE,
+    group_deb_packages_by_source,
+    parse_deb_source,
+    process_deb_source_group,
+    read_deb_copyright,
+)
+
+DEP5_COPYRIGHT = """Format: https://www.debian.org/doc/packaging-manuals/copyright-format/1.0/
+
+Files: *
+Copyright: 2003-2023 LLVM Team
+License: Apache-2.0
+"""
+
+
+def _stanza(package: str, version: str = "1:15.0.7-1", source: str = "") -> dict:
+    stanza = {
+        "Package": package,
+        "Version": version,
+        "Filename": f"pool/main/l/llvm-toolchain-15/{package}_{version}_amd64.deb",
+        "Maintainer": "LLVM Packaging Team <pkg-llvm-team@lists.alioth.debian.org>",
+        "Description": "Modular compiler\n long description",
+    }
+    if source:
+        stanza["Source"] = source
+    return stanza
+
+
+class TestParseDebSource:
+    """Test resolving the source package of a binary stanza."""
+
+    def test_missing_source_field_uses_binary_name_and_version(self):
+        assert parse_deb_source({"Package": "apt", "Version": "2.6.1"}) == ("apt", "2.6.1")
+
+    def test_source_without_version_uses_binary_version(self):
+        stanza = {"Package": "libllvm15", "Version": "1:15.0.7-1", "Source": "llvm-toolchain-15"}
+        assert parse_deb_source(stanza) == ("llvm-toolchain-15", "1:15.0.7-1")
+
+    def test_source_with_explicit_version(self):
+        stanza = {"Package": "libfoo1", "Version": "1.2-3+b1", "Source": "foo (1.2-3)"}
+        assert parse_deb_source(stanza) == ("foo", "1.2-3")
+
+
+class TestGroupDebPackagesBySource:
+    """Test grouping binaries that share a source package."""
+
+    def test_groups_binaries_by_source_and_version(self):
+        packages = [
+            _stanza("libllvm15", source="llvm-toolchain-15"),
+            _stanza("apt", version="2.6.1"),
+            _stanza("llvm-15", source="llvm-toolchain-15"),
+            _stanza("clang-15", version="1:15.0.7-2", source="llvm-toolchain-15"),
+        ]
+
+        groups = group_deb_packages_by_source(packages)
+
+        assert set(groups) == {
+            ("llvm-toolchain-15", "1:15.0.7-1"),
+            ("llvm-toolchain-15", "1:15.0.7-2"),
+            ("apt", "2.6.1"),
+        }
+        assert [p["Package"] for p in groups[("llvm-toolchain-15", "1:15.0.7-1")]] == ["libllvm15", "llvm-15"]
+
+    def test_binary_named_after_source_comes_first(self):
+        packages = [
+            _stanza("libfoo1", version="1.0", source="foo"),
+            _stanza("foo", version="1.0"),
+        ]
+
+        groups = group_deb_packages_by_source(packages)
+
+        assert [p["Package"] for p in groups[("foo", "1.0")]] == ["foo", "libfoo1"]
+
+
+class TestProcessDebSourceGroup:
+    """Test that copyright is fetched once per source package."""
+
+    def test_fetches_copyright_once_and_fans_out_license(self):
+        members = [
+            _stanza("libllvm15", source="llvm-toolchain-15"),
+            _stanza("llvm-15", source="llvm-toolchain-15"),
+            _stanza("llvm-15-dev", source="llvm-toolchain-15"),
+        ]
+
+        with patch(
+            "sbomify_action._enrichment.license_db_generator.download_and_extract_deb",
+            return_value=DEP5_COPYRIGHT,
+        ) as mock_download:
+            results = process_deb_source_group(members, "debian", "12", DEBIAN_ARCHIVE_BASE)
+
+        assert mock_download.call_count == 1
+        assert [r.name for r in results] == ["libllvm15", "llvm-15", "llvm-15-dev"]
+        assert all(r.spdx == "Apache-2.0" for r in results)
+        assert results[0].purl.startswith("pkg:deb/debian/libllvm15@1:15.0.7-1")
+        assert results[0].description == "Modular compiler"
+
+    def test_falls_back_to_next_member_when_copyright_missing(self):
+        members = [
+            _stanza("libllvm15", source="llvm-toolchain-15"),
+            _stanza("llvm-15", source="llvm-toolchain-15"),
+        ]
+
+        with patch(
+            "sbomify_action._enrichment.license_db_generator.download_and_extract_deb",
+            side_effect=[None, DEP5_COPYRIGHT],
+        ) as mock_download:
+            results = process_deb_source_group(members, "ubuntu", "24.04", DEBIAN_ARCHIVE_BASE)
+
+        assert mock_download.call_count == 2
+        assert all(r and r.spdx == "Apache-2.0" for r in results)
+
+    def test_returns_none_for_every_member_without_license(self):
+        members = [
+            _stanza("libllvm15", source="llvm-toolchain-15"),
+            _stanza("llvm-15", source="llvm-toolchain-15"),
+        ]
+
+        with patch(
+            "sbomify_action._enrichment.license_db_generator.download_and_extract_deb",
+            return_value=None,
+        ):
+            results = process_deb_source_group(members, "debian", "12", DEBIAN_ARCHIVE_BASE)
+
+        assert results == [None, None]
+
+
+def _tar_bytes(files: dict, compression: str) -> bytes:
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:" + compression if compression in ("gz", "xz") else "w") as tar:
+        for name, content in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    data = buf.getvalue()
+    if compression == "zst":
+        data = zstandard.ZstdCompressor().compress(data)
+    return data
+
+
+def _ar_member(name: str, data: bytes) -> bytes:
+    header = f"{name + '/':<16}{0:<12}{0:<6}{0:<6}{100644:<8}{len(data):<10}`\n".encode("ascii")
+    return header + data + (b"\n" if len(data) % 2 else b"")
+
+
+def _build_deb(package: str, compression: str) -> bytes:
+    control = _tar_bytes({"./control": b"Package: " + package.encode() + b"\n" * 5000}, "gz")
+    data = _tar_bytes(
+        {
+            "./usr/bin/tool": b"\x7fELF" + b"\0" * 1000,
+            f"./usr/share/doc/{package}/copyright": DEP5_COPYRIGHT.encode(),
+            "./usr/share/zz-after": b"x" * 10,
+        },
+        compression,
+    )
+    ext = "" if compression == "none" else f".{compression}"
+    return (
+        b"!<arch>\n"
+        + _ar_member("debian-binary", b"2.0\n")
+        + _ar_member("control.tar.gz", control)
+        + _ar_member(f"data.tar{ext}", data)
+    )
+
+
+class _FakeResponse:
+    def __init__(self, body: bytes, status_code: int):
+        self.raw = io.BytesIO(body)
+        self.status_code = status_code
+        self.closed = False
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeSession:
+    """Serve a .deb from memory, optionally honouring Range requests."""
+
+    def __init__(self, body: bytes, supports_range: bool):
+        self.body = body
+        self.supports_range = supports_range
+        self.requested_ranges = []
+
+    def get(self, url, headers=None, timeout=None, stream=False):
+        range_header = (headers or {}).get("Range")
+        self.requested_ranges.append(range_header)
+        if not self.supports_range or not range_header:
+            return _FakeResponse(self.body, 200)
+        start, _, end = range_header.removeprefix("bytes=").partition("-")
+        return _FakeResponse(self.body[int(start) : int(end) + 1 if end else None], 206)
+
+
+class TestReadDebCopyright:
+    """Test in-process .deb copyright extraction."""
+
+    @pytest.mark.parametrize("compression", ["gz", "xz", "zst", "none"])
+    def test_extracts_copyright_with_range_requests(self, compression):
+        deb = _build_deb("zlib1g", compression)
+        session = _FakeSession(deb, supports_range=True)
+
+        with patch("sbomify_action._enrichment.license_db_generator.SESSION", session):
+            text = read_deb_copyright("https://example.invalid/zlib1g.deb", "zlib1g")
+
+        assert text == DEP5_COPYRIGHT
+        # Second request starts past the control.tar member
+        assert len(session.requested_ranges) == 2
+        data_offset = int(session.requested_ranges[1].removeprefix("bytes=").rstrip("-"))
+        assert deb[data_offset : data_offset + 8] == b"data.tar"
+
+    def test_extracts_copyright_without_range_support(self):
+        session = _FakeSession(_build_deb("zlib1g", "xz"), supports_range=False)
+
+        with patch("sbomify_action._enrichment.license_db_generator.SESSION", session):
+            text = read_deb_copyright("https://example.invalid/zlib1g.deb", "zlib1g:amd64")
+
+        assert text == DEP5_COPYRIGHT
+        assert len(session.requested_ranges) == 1
+
+    def test_returns_none_when_copyright_missing(self):
+        session = _FakeSession(_build_deb("zlib1g", "gz"), supports_range=True)
+
+        with patch("sbomify_action._enrichment.license_db_generator.SESSION", session):
+            assert read_deb_copyright("https://example.invalid/other.deb", "other") is None
+
+    def test_rejects_non_ar_payload(self):
+        session = _FakeSession(b"<html>not found</html>" + b" " * 200, supports_range=True)
+
+        with patch("sbomify_action._enrichment.license_db_generator.SESSION", session):
+            with pytest.raises(ValueError, match="Not a Debian archive"):
+                read_deb_copyright("https://example.invalid/zlib1g.deb", "zlib1g")
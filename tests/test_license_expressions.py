@@ -0,0 +1,82 @@
+"""Tests for the shared, memoized SPDX license-expression engine."""
+
+from unittest.mock import patch
+
+import pytest
+
+from sbomify_action._enrichment.license_expressions import (
+    SPDX_LICENSE_KEYS,
+    check_license_expressions,
+    clear_license_expression_cache,
+    is_known_license_expression,
+    parse_license_expression,
+    spdx_licensing,
+    unknown_license_keys,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    clear_license_expression_cache()
+    yield
+    clear_license_expression_cache()
+
+
+class TestFastPath:
+    """Plain SPDX identifiers are answered without parsing."""
+
+    def test_common_ids_in_key_set(self):
+        for key in ("MIT", "Apache-2.0", "GPL-2.0-or-later", "Classpath-exception-2.0"):
+            assert key in SPDX_LICENSE_KEYS
+
+    def test_plain_id_does_not_parse(self):
+        with patch.object(spdx_licensing, "parse", side_effect=AssertionError("parsed")):
+            assert is_known_license_expression("Apache-2.0")
+            assert unknown_license_keys("MIT") == frozenset()
+
+
+class TestParseMemo:
+    """Parsed expressions are memoized."""
+
+    def test_expression_parsed_once(self):
+        original_parse = spdx_licensing.parse
+        with patch.object(spdx_licensing, "parse", side_effect=original_parse) as mock_parse:
+            assert is_known_license_expression("MIT OR Apache-2.0")
+            calls_after_first = mock_parse.call_count
+            for _ in range(100):
+                assert is_known_license_expression("MIT OR Apache-2.0")
+        assert calls_after_first > 0
+        assert mock_parse.call_count == calls_after_first
+
+    def test_unknown_keys_reported(self):
+        assert unknown_license_keys("MIT AND Custom-Foo") == frozenset({"Custom-Foo"})
+        assert not is_known_license_expression("MIT AND Custom-Foo")
+
+    def test_unparseable_expression(self):
+        assert parse_license_expression("MIT AND (") is None
+        assert unknown_license_keys("MIT AND (") is None
+        assert not is_known_license_expression("MIT AND (")
+
+    def test_parsed_result_exposes_expression(self):
+        parsed = parse_license_expression("mit or apache-2.0")
+        assert str(parsed.expression) == "MIT OR Apache-2.0"
+        assert parsed.unknown_keys == frozenset()
+
+    def test_empty_string_is_not_known(self):
+        assert not is_known_license_expression("")
+
+
+class TestBatchApi:
+    """check_license_expressions resolves each distinct string once."""
+
+    def test_deduplicates_and_maps_results(self):
+        expressions = ["MIT", "Not-A-License", "MIT", "GPL-2.0-only WITH Classpath-exception-2.0"] * 1000
+
+        result = check_license_expressions(expressions)
+
+        assert result == {
+            "MIT": True,
+            "Not-A-License": False,
+            "GPL-2.0-only WITH Classpath-exception-2.0": True,
+        }
+        assert parse_license_expression.cache_info().currsize == 2
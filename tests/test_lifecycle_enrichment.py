@@ -17,10 +17,13 @@ from packageurl import PackageURL
 from sbomify_action._enrichment.lifecycle_data import (
     DISTRO_LIFECYCLE,
     PACKAGE_LIFECYCLE,
+    LifecycleIndex,
     extract_version_cycle,
     get_distro_lifecycle,
+    get_lifecycle_index,
     get_package_lifecycle,
     get_package_lifecycle_entry,
+    reset_lifecycle_index,
 )
 from sbomify_action._enrichment.sources.lifecycle import (
     LifecycleSource,
@@ -441,6 +444,63 @@ class TestGetPackageLifecycleEntry:
         assert entry is None
 
 
+# =============================================================================
+# Test Compiled Lifecycle Index
+# =============================================================================
+
+
+class TestLifecycleIndex:
+    """Test the compiled PACKAGE_LIFECYCLE lookup index."""
+
+    TABLE = {
+        "first": {
+            "name_patterns": ["tool", "tool-*"],
+            "purl_types": ["pypi"],
+            "cycles": {},
+        },
+        "second": {
+            "name_patterns": ["tool*", "other"],
+            "cycles": {},
+        },
+    }
+
+    def test_exact_and_glob_patterns_match(self):
+        index = LifecycleIndex(self.TABLE)
+        assert index.candidates("tool") == (0, 1)
+        assert index.candidates("tool-extra") == (0, 1)
+        assert index.candidates("toolbox") == (1,)
+        assert index.candidates("OTHER") == (1,)
+        assert index.candidates("unrelated") == ()
+
+    def test_table_order_is_priority(self):
+        index = LifecycleIndex(self.TABLE)
+        assert index.find(["tool"]) is self.TABLE["first"]
+
+    def test_purl_type_filter_falls_through_to_next_entry(self):
+        index = LifecycleIndex(self.TABLE)
+        assert index.find(["tool"], "pypi") is self.TABLE["first"]
+        assert index.find(["tool"], "npm") is self.TABLE["second"]
+
+    def test_matches_any_name_variant(self):
+        index = LifecycleIndex(self.TABLE)
+        assert index.find(["unrelated", "other"], "npm") is self.TABLE["second"]
+
+    def test_candidates_are_memoised(self):
+        index = LifecycleIndex(self.TABLE)
+        first = index.candidates("toolbox")
+        assert index.candidates("TOOLBOX") is first
+
+    def test_global_index_is_built_once(self):
+        reset_lifecycle_index()
+        assert get_lifecycle_index() is get_lifecycle_index()
+
+    def test_reset_clears_memoised_lookups(self):
+        get_package_lifecycle("python", "3.12.1")
+        assert get_package_lifecycle.cache_info().currsize > 0
+        reset_lifecycle_index()
+        assert get_package_lifecycle.cache_info().currsize == 0
+
+
 # =============================================================================
 # Test Get Package Lifecycle
 # =============================================================================
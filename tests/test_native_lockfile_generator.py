@@ -0,0 +1,166 @@
+"""Tests for the NativeLockfileGenerator plugin."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from sbomify_action._generation import GenerationInput, create_default_registry
+from sbomify_action._generation.generators import NativeLockfileGenerator
+from sbomify_action._generation.protocol import NATIVE_CYCLONEDX_VERSIONS, NATIVE_SPDX_VERSIONS
+from sbomify_action.tool_checks import _get_external_tools
+from sbomify_action.validation import validate_sbom_file
+
+UV_LOCK = """
+version = 1
+
+[[package]]
+name = "app"
+version = "0.1.0"
+source = { virtual = "." }
+dependencies = [{ name = "django" }]
+
+[[package]]
+name = "django"
+version = "5.2.5"
+source = { registry = "https://pypi.org/simple" }
+dependencies = [{ name = "asgiref" }]
+wheels = [{ url = "https://example.com/django-5.2.5-py3-none-any.whl", hash = "sha256:2b2ada0ee8a5ff743a40e2b9820d1f8e24c11bac9ae6469cd548f0057ea6ddcd" }]
+
+[[package]]
+name = "asgiref"
+version = "3.9.1"
+source = { registry = "https://pypi.org/simple" }
+wheels = [{ url = "https://example.com/asgiref-3.9.1-py3-none-any.whl", hash = "sha256:f3bba7092a48005b5f5bacd747d36ee4a5a61f4a269a6df590b43144355ebd2c" }]
+"""
+
+
+class TestNativeLockfileGenerator(unittest.TestCase):
+    """Tests for NativeLockfileGenerator."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.project = Path(self._tmp.name) / "my-app"
+        self.project.mkdir()
+        self.lock_file = self.project / "uv.lock"
+        self.lock_file.write_text(UV_LOCK)
+        self.output_file = str(Path(self._tmp.name) / "sbom.json")
+        self.generator = NativeLockfileGenerator()
+
+    def _generate(self, output_format="cyclonedx", spec_version=None, lock_file=None):
+        return self.generator.generate(
+            GenerationInput(
+                lock_file=str(lock_file or self.lock_file),
+                output_file=self.output_file,
+                output_format=output_format,
+                spec_version=spec_version,
+            )
+        )
+
+    def test_name_priority_and_command(self):
+        """The generator runs in-process before all external tools."""
+        self.assertEqual(self.generator.name, "native-lockfile")
+        self.assertEqual(self.generator.priority, 5)
+        self.assertEqual(self.generator.command, "")
+
+    def test_supports_parsed_lockfiles(self):
+        """Lockfiles with a hash enrichment parser are supported in both formats."""
+        for lock_file in ("uv.lock", "poetry.lock", "Pipfile.lock", "Cargo.lock", "package-lock.json"):
+            for output_format in ("cyclonedx", "spdx"):
+                with self.subTest(lock_file=lock_file, output_format=output_format):
+                    input = GenerationInput(lock_file=f"/path/{lock_file}", output_format=output_format)
+                    self.assertTrue(self.generator.supports(input))
+
+        self.assertFalse(self.generator.supports(GenerationInput(lock_file="/path/requirements.txt")))
+        self.assertFalse(self.generator.supports(GenerationInput(lock_file="/path/go.sum")))
+        self.assertFalse(self.generator.supports(GenerationInput(docker_image="alpine:3.18")))
+        self.assertFalse(
+            self.generator.supports(
+                GenerationInput(lock_file="/path/uv.lock", output_format="spdx", spec_version="3.0.1")
+            )
+        )
+
+    def test_generates_cyclonedx_with_purls_hashes_and_dependencies(self):
+        """The CycloneDX SBOM has PURLs, hashes and the dependency graph, without running a subprocess."""
+        with patch("subprocess.run") as mock_run:
+            result = self._generate()
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.spec_version, "1.6")
+        self.assertFalse(mock_run.called)
+
+        sbom = json.loads(Path(self.output_file).read_text())
+        self.assertEqual(sbom["metadata"]["component"]["name"], "my-app")
+        components = {c["name"]: c for c in sbom["components"]}
+        self.assertEqual(set(components), {"django", "asgiref"})
+        self.assertEqual(components["django"]["purl"], "pkg:pypi/django@5.2.5")
+        self.assertEqual(components["django"]["hashes"][0]["alg"], "SHA-256")
+
+        dependencies = {d["ref"]: d["dependsOn"] for d in sbom["dependencies"]}
+        self.assertEqual(dependencies["my-app-project"], ["pkg:pypi/django@5.2.5"])
+        self.assertEqual(dependencies["pkg:pypi/django@5.2.5"], ["pkg:pypi/asgiref@3.9.1"])
+        self.assertEqual(dependencies["pkg:pypi/asgiref@3.9.1"], [])
+
+    def test_output_validates_for_all_versions(self):
+        """Every supported spec version passes schema validation."""
+        versions = [("cyclonedx", v) for v in NATIVE_CYCLONEDX_VERSIONS] + [("spdx", v) for v in NATIVE_SPDX_VERSIONS]
+        for output_format, spec_version in versions:
+            with self.subTest(output_format=output_format, spec_version=spec_version):
+                result = self._generate(output_format, spec_version)
+                self.assertTrue(result.success)
+                validation = validate_sbom_file(self.output_file, output_format, spec_version)
+                self.assertTrue(validation.valid, validation.error_message)
+
+    def test_generates_spdx_relationships(self):
+        """The SPDX SBOM describes the project and records DEPENDS_ON relationships."""
+        result = self._generate("spdx")
+
+        self.assertTrue(result.success)
+        sbom = json.loads(Path(self.output_file).read_text())
+        names = {p["SPDXID"]: p["name"] for p in sbom["packages"]}
+        edges = {
+            (names[r["spdxElementId"]], names[r["relatedSpdxElement"]])
+            for r in sbom["relationships"]
+            if r["relationshipType"] == "DEPENDS_ON"
+        }
+        self.assertEqual(edges, {("my-app", "django"), ("django", "asgiref")})
+        django = next(p for p in sbom["packages"] if p["name"] == "django")
+        self.assertEqual(django["externalRefs"][0]["referenceLocator"], "pkg:pypi/django@5.2.5")
+        self.assertEqual(django["checksums"][0]["algorithm"], "SHA256")
+
+    def test_packages_nothing_depends_on_are_direct_without_project_entry(self):
+        """Lockfiles without the project's own requirements fall back to the graph's roots."""
+        lock_file = self.project / "Cargo.lock"
+        lock_file.write_text(
+            'version = 3\n\n[[package]]\nname = "rand"\nversion = "0.8.5"\nsource = "registry+x"\n'
+            'dependencies = ["libc"]\n\n[[package]]\nname = "libc"\nversion = "0.2.150"\nsource = "registry+x"\n'
+        )
+
+        result = self._generate(lock_file=lock_file)
+
+        self.assertTrue(result.success)
+        sbom = json.loads(Path(self.output_file).read_text())
+        dependencies = {d["ref"]: d["dependsOn"] for d in sbom["dependencies"]}
+        self.assertEqual(dependencies["my-app-project"], ["pkg:cargo/rand@0.8.5"])
+
+    def test_unreadable_lockfile_fails(self):
+        """A malformed lockfile is left to the external generators."""
+        self.lock_file.write_text("not [valid toml")
+
+        result = self._generate()
+
+        self.assertFalse(result.success)
+        self.assertIn("Could not read uv.lock", result.error_message)
+
+    def test_registered_first_and_not_listed_as_tool(self):
+        """The default registry tries it first; tool checks don't report it as missing."""
+        generators = create_default_registry().get_generators_for(GenerationInput(lock_file="/path/uv.lock"))
+
+        self.assertEqual(generators[0].name, "native-lockfile")
+        self.assertNotIn("", _get_external_tools())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@
 Tests for the SBOM processor plugin system.
 """
 
+import threading
 import unittest
 from unittest.mock import Mock, patch
 
@@ -492,7 +493,7 @@ class TestSbomifyReleasesProcessor(unittest.TestCase):
         tag_response = Mock()
         tag_response.ok = True
 
-        # Sequence: check exists, get ID after duplicate, get details, get details again for friendly name
+        # Sequence: check exists, then a fresh list after the duplicate error (details are served from it)
         mock_get.side_effect = [check_response, get_id_response, get_details_response, get_details_response]
         mock_post.side_effect = [create_response, tag_response]
 
@@ -525,6 +526,29 @@ class TestSbomifyReleasesProcessor(unittest.TestCase):
         self.assertFalse(result.success)
         self.assertIn("API connection failed", result.error_message)
 
+    def test_process_tags_releases_concurrently_in_order(self):
+        """Test several releases are processed at once and reported in input order."""
+        # Every release waits for the other two, which only completes when all three run at once
+        barrier = threading.Barrier(3, timeout=5)
+
+        def process_single_release(api_base_url, token, sbom_id, product_id, version):
+            barrier.wait()
+            return f"release-{version}"
+
+        input_obj = ProcessorInput(
+            sbom_id="sbom-123",
+            product_releases=["product-id:v1", "product-id:v2", "other-product:v3"],
+            api_base_url="https://api.test.com",
+            token="test-token",
+        )
+
+        with patch.object(self.processor, "_process_single_release", side_effect=process_single_release):
+            result = self.processor.process(input_obj)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.processed_items, 3)
+        self.assertEqual(result.metadata["release_ids"], ["release-v1", "release-v2", "release-v3"])
+
 
 class TestProcessorOrchestrator(unittest.TestCase):
     """Test ProcessorOrchestrator class."""
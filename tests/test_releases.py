@@ -5,9 +5,11 @@ These tests verify the shared releases API module which is used by
 the SbomifyReleasesProcessor.
 """
 
+import threading
 import unittest
 from unittest.mock import Mock, patch
 
+from sbomify_action._processors import releases_api
 from sbomify_action._processors.releases_api import (
     check_release_exists,
     create_release,
@@ -16,7 +18,9 @@ from sbomify_action._processors.releases_api import (
     get_release_id,
     get_release_id_by_name,
     tag_sbom_with_release,
+    tag_sboms_with_release,
 )
+from sbomify_action._upload.retry import RetryPolicy
 from sbomify_action.exceptions import APIError
 
 
@@ -42,10 +46,9 @@ class TestReleasesApi(unittest.TestCase):
 
         self.assertTrue(result)
         mock_get.assert_called_once()
+        # The product's whole release list is fetched, so other lookups can reuse it
         call_args = mock_get.call_args
-        self.assertIn("product_id", call_args[1]["params"])
-        self.assertEqual(call_args[1]["params"]["product_id"], "Gu9wem8mkX")
-        self.assertEqual(call_args[1]["params"]["version"], "v1.0.0")
+        self.assertEqual(call_args[1]["params"], {"product_id": "Gu9wem8mkX"})
 
     @patch("sbomify_action._processors.releases_api.requests.get")
     def test_check_release_exists_false(self, mock_get):
@@ -566,5 +569,235 @@ class TestReleasesApi(unittest.TestCase):
         self.assertNotIn("/api/v1/api/v1", actual_url, f"URL contains double /api/v1 prefix: {actual_url}")
 
 
+class TestReleaseIndex(unittest.TestCase):
+    """Test that release lookups share one release list per product."""
+
+    def setUp(self):
+        self.api_base_url = "https://api.test.com"
+        self.token = "test-token"
+
+    @staticmethod
+    def _list_response(items, next_url=None):
+        response = Mock()
+        response.ok = True
+        response.status_code = 200
+        response.json.return_value = {"items": items, "next": next_url}
+        return response
+
+    @patch("sbomify_action._processors.releases_api.requests.get")
+    def test_index_follows_pages(self, mock_get):
+        """Releases beyond the first page of the product's list are found."""
+        mock_get.side_effect = [
+            self._list_response([{"id": f"rel{i}", "version": f"v{i}"} for i in range(100)], next_url="page-2"),
+            self._list_response([{"id": "rel-last", "version": "v-last"}]),
+        ]
+
+        self.assertEqual(get_release_id(self.api_base_url, self.token, "prod-a", "v-last"), "rel-last")
+        self.assertEqual(get_release_id(self.api_base_url, self.token, "prod-a", "v1"), "rel1")
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(mock_get.call_args[1]["params"], {"product_id": "prod-a", "page": 2})
+
+    @patch("sbomify_action._processors.releases_api.requests.get")
+    def test_lookups_fetch_each_product_once(self, mock_get):
+        mock_get.return_value = self._list_response([{"id": "rel1", "version": "v1.0.0", "name": "v1.0.0"}])
+
+        self.assertTrue(check_release_exists(self.api_base_url, self.token, "prod-a", "v1.0.0"))
+        self.assertEqual(get_release_id(self.api_base_url, self.token, "prod-a", "v1.0.0"), "rel1")
+        self.assertEqual(get_release_id_by_name(self.api_base_url, self.token, "prod-a", "v1.0.0"), "rel1")
+        self.assertEqual(get_release_details(self.api_base_url, self.token, "prod-a", "v1.0.0")["id"], "rel1")
+        self.assertEqual(mock_get.call_count, 1)
+
+        get_release_id(self.api_base_url, self.token, "prod-b", "v1.0.0")
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(mock_get.call_args[1]["params"], {"product_id": "prod-b"})
+
+    @patch("sbomify_action._processors.releases_api.requests.post")
+    @patch("sbomify_action._processors.releases_api.requests.get")
+    def test_created_release_is_added_to_index(self, mock_get, mock_post):
+        mock_get.return_value = self._list_response([])
+        create_response = Mock()
+        create_response.ok = True
+        create_response.json.return_value = {"id": "new-rel"}
+        mock_post.return_value = create_response
+
+        self.assertFalse(check_release_exists(self.api_base_url, self.token, "prod-a", "v2.0.0"))
+        self.assertEqual(create_release(self.api_base_url, self.token, "prod-a", "v2.0.0"), "new-rel")
+
+        details = get_release_details(self.api_base_url, self.token, "prod-a", "v2.0.0")
+        self.assertEqual(details["id"], "new-rel")
+        self.assertEqual(details["name"], "v2.0.0")
+        mock_get.assert_called_once()
+
+    @patch("sbomify_action._processors.releases_api.requests.post")
+    @patch("sbomify_action._processors.releases_api.requests.get")
+    def test_duplicate_name_refetches_release_list(self, mock_get, mock_post):
+        mock_get.side_effect = [
+            self._list_response([]),
+            self._list_response([{"id": "rel-other", "version": "v3.0.0", "name": "v3.0.0"}]),
+        ]
+        duplicate_response = Mock()
+        duplicate_response.ok = False
+        duplicate_response.status_code = 400
+        duplicate_response.json.return_value = {"detail": "Duplicate", "error_code": "DUPLICATE_NAME"}
+        mock_post.return_value = duplicate_response
+
+        self.assertFalse(check_release_exists(self.api_base_url, self.token, "prod-a", "v3.0.0"))
+        # Created by another job since the list was fetched
+        self.assertEqual(create_release(self.api_base_url, self.token, "prod-a", "v3.0.0"), "rel-other")
+        self.assertEqual(mock_get.call_count, 2)
+
+
+class FakeReleasesAPI:
+    """Stand-in for the sbomify artifacts endpoints, used in place of requests.post."""
+
+    def __init__(self, bulk_supported=True, transient_failures=None, rejected=(), unsupported_status=405):
+        self.bulk_supported = bulk_supported
+        # Returned by the bulk endpoint when unsupported; a 404 has no JSON body (missing route)
+        self.unsupported_status = unsupported_status
+        # sbom_id -> number of 503 responses before the request succeeds
+        self.transient_failures = dict(transient_failures or {})
+        self.rejected = set(rejected)
+        self.tagged = []
+        self.bulk_requests = []
+        self.single_requests = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _response(status_code, body=None, json_body=True):
+        response = Mock()
+        response.status_code = status_code
+        response.ok = status_code < 400
+        if json_body:
+            response.headers = {"content-type": "application/json"}
+            response.json.return_value = body or {}
+        else:
+            response.headers = {"content-type": "text/html"}
+            response.json.side_effect = ValueError("not JSON")
+        return response
+
+    def post(self, url, headers=None, json=None, timeout=None):
+        with self._lock:
+            if url.endswith("/artifacts/bulk"):
+                self.bulk_requests.append(json["sbom_ids"])
+                if not self.bulk_supported:
+                    return self._response(self.unsupported_status, json_body=self.unsupported_status != 404)
+                if "unknown" in url:
+                    return self._response(404, {"detail": "Release not found"})
+                if self.rejected.intersection(json["sbom_ids"]):
+                    return self._response(403, {"detail": "Forbidden"})
+                self.tagged.extend(json["sbom_ids"])
+                return self._response(200)
+
+            sbom_id = json["sbom_id"]
+            self.single_requests.append(sbom_id)
+            if "unknown" in url:
+                return self._response(404, {"detail": "Release not found"})
+            if self.transient_failures.get(sbom_id, 0) > 0:
+                self.transient_failures[sbom_id] -= 1
+                return self._response(503)
+            if sbom_id in self.rejected:
+                return self._response(403, {"detail": "Forbidden"})
+            self.tagged.append(sbom_id)
+            return self._response(201)
+
+
+class TestTagSbomsWithRelease(unittest.TestCase):
+    """Test bulk and concurrent release tagging."""
+
+    def setUp(self):
+        self.api_base_url = "https://api.test.com"
+        self.token = "test-token"
+        self.policy = RetryPolicy(retries=2, backoff=0)
+        releases_api._bulk_tagging_unsupported.clear()
+        self.addCleanup(releases_api._bulk_tagging_unsupported.clear)
+
+    def _tag(self, api, sbom_ids):
+        with patch("sbomify_action._processors.releases_api.requests.post", side_effect=api.post):
+            tag_sboms_with_release(self.api_base_url, self.token, sbom_ids, "rel-1", policy=self.policy)
+
+    def test_uses_bulk_endpoint_in_batches(self):
+        api = FakeReleasesAPI()
+        sbom_ids = [f"sbom-{i}" for i in range(250)]
+
+        self._tag(api, sbom_ids)
+
+        self.assertEqual([len(batch) for batch in api.bulk_requests], [100, 100, 50])
+        self.assertEqual(api.tagged, sbom_ids)
+        self.assertEqual(api.single_requests, [])
+
+    def test_falls_back_to_single_requests_without_bulk_endpoint(self):
+        api = FakeReleasesAPI(bulk_supported=False)
+        sbom_ids = [f"sbom-{i}" for i in range(20)]
+
+        self._tag(api, sbom_ids + ["sbom-0"])
+        self._tag(api, ["sbom-20"])
+
+        self.assertEqual(sorted(api.tagged), sorted(sbom_ids + ["sbom-20"]))
+        # The missing endpoint is only probed once per API
+        self.assertEqual(len(api.bulk_requests), 1)
+
+    def test_missing_bulk_route_falls_back_without_remembering(self):
+        """A 404 may be temporary or specific to the release, so the endpoint is probed again next time."""
+        api = FakeReleasesAPI(bulk_supported=False, unsupported_status=404)
+
+        self._tag(api, ["sbom-1", "sbom-2"])
+        self._tag(api, ["sbom-3"])
+
+        self.assertEqual(sorted(api.tagged), ["sbom-1", "sbom-2", "sbom-3"])
+        self.assertEqual(len(api.bulk_requests), 2)
+        self.assertNotIn(self.api_base_url, releases_api._bulk_tagging_unsupported)
+
+    def test_unknown_release_raises(self):
+        """A 404 from the API for an unknown release is an error, not a missing bulk endpoint."""
+        api = FakeReleasesAPI()
+
+        with patch("sbomify_action._processors.releases_api.requests.post", side_effect=api.post):
+            with self.assertRaises(APIError) as cm:
+                tag_sboms_with_release(self.api_base_url, self.token, ["sbom-1"], "unknown", policy=self.policy)
+
+        self.assertIn("Release not found", str(cm.exception))
+        self.assertEqual(api.tagged, [])
+        self.assertNotIn(self.api_base_url, releases_api._bulk_tagging_unsupported)
+
+    def test_failed_batch_does_not_stop_later_batches(self):
+        """A batch rejected as a whole is tagged one by one, the other batches still in bulk."""
+        api = FakeReleasesAPI(rejected={"sbom-150"})
+        sbom_ids = [f"sbom-{i}" for i in range(250)]
+
+        with self.assertRaises(APIError) as cm:
+            self._tag(api, sbom_ids)
+
+        self.assertEqual(len(api.bulk_requests), 3)
+        self.assertEqual(sorted(api.tagged), sorted(set(sbom_ids) - {"sbom-150"}))
+        self.assertEqual(len(api.single_requests), 100)
+        self.assertIn("1 of 250", str(cm.exception))
+        self.assertIn("sbom-150", str(cm.exception))
+
+    def test_retries_transient_failures(self):
+        api = FakeReleasesAPI(bulk_supported=False, transient_failures={"sbom-1": 2})
+
+        self._tag(api, ["sbom-1", "sbom-2"])
+
+        self.assertEqual(sorted(api.tagged), ["sbom-1", "sbom-2"])
+        self.assertEqual(api.single_requests.count("sbom-1"), 3)
+
+    def test_reports_failures_after_tagging_the_rest(self):
+        api = FakeReleasesAPI(bulk_supported=False, rejected={"sbom-2"})
+
+        with self.assertRaises(APIError) as cm:
+            self._tag(api, ["sbom-1", "sbom-2", "sbom-3"])
+
+        self.assertEqual(sorted(api.tagged), ["sbom-1", "sbom-3"])
+        self.assertIn("1 of 3", str(cm.exception))
+        self.assertIn("sbom-2", str(cm.exception))
+
+    def test_no_sboms_makes_no_requests(self):
+        api = FakeReleasesAPI()
+
+        self._tag(api, [])
+
+        self.assertEqual(api.bulk_requests, [])
+
+
 if __name__ == "__main__":
     unittest.main()
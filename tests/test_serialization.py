@@ -1,5 +1,6 @@
 """Tests for the serialization module, including dependency graph sanitization."""
 
+import io
 import json
 
 import pytest
@@ -13,16 +14,22 @@ from sbomify_action.serialization import (
     SPDX_PACKAGE_PURPOSE_FIXES,
     _extract_component_info_from_purl,
     _fix_purl_encoding_bugs_in_json,
+    _get_cyclonedx_outputter,
     _is_invalid_purl,
+    _StreamingDocumentConverter,
+    fix_purl_encoding,
     link_root_dependencies,
     normalize_purl,
     restore_spdx_document_describes,
+    sanitize_cyclonedx_bom,
     sanitize_dependency_graph,
     sanitize_purls,
     sanitize_spdx_json_file,
     sanitize_spdx_licenses,
     sanitize_spdx_purls,
     serialize_cyclonedx_bom,
+    write_cyclonedx_bom,
+    write_spdx_document,
 )
 
 
@@ -332,6 +339,32 @@ class TestSerializeCycloneDxBom:
         assert '"bomFormat": "CycloneDX"' in result
         assert '"specVersion": "1.6"' in result
 
+    def test_write_matches_serialize(self):
+        """write_cyclonedx_bom() streams the same output serialize_cyclonedx_bom() returns."""
+        bom = Bom()
+        bom.components.add(Component(name="a", type=ComponentType.LIBRARY, version="1.0.0", bom_ref="a"))
+        bom.components.add(Component(name="b", type=ComponentType.LIBRARY, version="2.0.0", bom_ref="b"))
+
+        buffer = io.StringIO()
+        write_cyclonedx_bom(bom, buffer, "1.6")
+        assert buffer.getvalue() == serialize_cyclonedx_bom(bom, "1.6")
+
+    @pytest.mark.parametrize("spec_version", ["1.4", "1.5", "1.6", "1.7"])
+    def test_matches_public_outputter_api(self, spec_version):
+        """Serializing and writing produce the outputter's public output_as_string()."""
+        bom = Bom()
+        expected = _get_cyclonedx_outputter(spec_version)(bom).output_as_string()
+        buffer = io.StringIO()
+
+        write_cyclonedx_bom(bom, buffer, spec_version)
+
+        assert serialize_cyclonedx_bom(bom, spec_version) == expected
+        assert buffer.getvalue() == expected
+
+    def test_write_requires_version(self):
+        with pytest.raises(ValueError, match="spec_version is required"):
+            write_cyclonedx_bom(Bom(), io.StringIO(), None)
+
     def test_serialize_requires_version(self):
         """Test that serialization fails without version."""
         bom = Bom()
@@ -1610,6 +1643,120 @@ class TestFixPurlEncodingBugsInJson:
         assert data["purl"] == "pkg:npm/%40scope/pkg@1.0.0"
 
 
+class TestSanitizeCycloneDxBom:
+    """Tests for the single-pass CycloneDX sanitization visitor."""
+
+    def _bom(self) -> Bom:
+        from cyclonedx.model.license import DisjunctiveLicense, LicenseExpression
+        from packageurl import PackageURL
+
+        bom = Bom()
+        bom.metadata.component = Component(name="root-app", type=ComponentType.APPLICATION, bom_ref=BomRef("root"))
+        good = Component(
+            name="lodash",
+            version="4.17.21",
+            bom_ref=BomRef("pkg:npm/lodash@@4.17.21"),
+            purl=PackageURL.from_string("pkg:npm/lodash@4.17.21"),
+            licenses=[DisjunctiveLicense(id="Not-A-Real-License")],
+        )
+        local = Component(
+            name="local-pkg",
+            version="1.0.0",
+            bom_ref=BomRef("local"),
+            purl=PackageURL(type="npm", name="local-pkg", version="1.0.0", qualifiers={"vcs_url": "file:../x"}),
+            licenses=[LicenseExpression("MIT OR Custom-License")],
+        )
+        local.components.add(
+            Component(name="child", version="1.0", purl=PackageURL(type="npm", namespace="@@scope", name="child"))
+        )
+        bom.components.add(good)
+        bom.components.add(local)
+        dep = Dependency(ref=BomRef("pkg:npm/lodash@@4.17.21"), dependencies=[Dependency(ref=BomRef("missing-ref"))])
+        bom.dependencies.add(dep)
+        return bom
+
+    def test_applies_all_fixes(self):
+        bom = self._bom()
+
+        stats = sanitize_cyclonedx_bom(bom)
+
+        components = {c.name: c for c in bom.components}
+        assert stats.purls_cleared == 1
+        assert components["local-pkg"].purl is None
+        assert stats.licenses_sanitized == 2
+        assert [lic.name for lic in components["lodash"].licenses] == ["Not-A-Real-License"]
+        assert [lic.value for lic in components["local-pkg"].licenses] == ["MIT OR LicenseRef-Custom-License"]
+        # bom-ref and dependency ref encoding fixed consistently, no stub for it
+        assert stats.refs_normalized == 2
+        assert components["lodash"].bom_ref.value == "pkg:npm/lodash@4.17.21"
+        assert stats.stubs_added == 1
+        assert "missing-ref" in components
+        # Nested component PURL encoding fixed but not cleared
+        child = next(iter(components["local-pkg"].components))
+        assert str(child.purl) == "pkg:npm/%40scope/child"
+        # missing-ref is nested under lodash, so only lodash and local-pkg are top-level
+        root_dep = next(d for d in bom.dependencies if d.ref.value == "root")
+        assert {d.ref.value for d in root_dep.dependencies} == {"pkg:npm/lodash@4.17.21", "local"}
+        assert stats.root_dependencies_linked == 2
+
+    def test_matches_separate_functions(self):
+        """The single pass produces the same dependency graph as the separate steps."""
+        single = self._bom()
+        separate = self._bom()
+
+        sanitize_cyclonedx_bom(single)
+        sanitize_purls(separate)
+        fix_purl_encoding(separate)
+        sanitize_dependency_graph(separate)
+        link_root_dependencies(separate)
+
+        assert (
+            json.loads(serialize_cyclonedx_bom(single, "1.6"))["dependencies"]
+            == json.loads(serialize_cyclonedx_bom(separate, "1.6"))["dependencies"]
+        )
+
+    def test_flags_disable_fixes(self):
+        bom = self._bom()
+
+        stats = sanitize_cyclonedx_bom(bom, sanitize_purls=False, sanitize_licenses=False, fix_dependency_graph=False)
+
+        assert stats.purls_cleared == 0
+        assert stats.licenses_sanitized == 0
+        assert stats.stubs_added == 0
+        assert stats.root_dependencies_linked == 0
+        # Encoding fixes always apply
+        assert stats.refs_normalized == 2
+
+    def test_serialize_fixes_encoding_without_modifying_bom(self):
+        bom = self._bom()
+        sanitize_dependency_graph(bom)
+
+        output = serialize_cyclonedx_bom(bom, "1.6")
+
+        assert "@@" not in output
+        assert "%40%40" not in output
+        components = {c.name: c for c in bom.components}
+        assert components["lodash"].bom_ref.value == "pkg:npm/lodash@@4.17.21"
+
+    def test_serialize_fixes_refs_outside_components(self):
+        """Refs the sanitizer doesn't visit, like vulnerability targets, are fixed in the output."""
+        from cyclonedx.model.vulnerability import BomTarget, Vulnerability
+
+        bom = self._bom()
+        bom.vulnerabilities.add(
+            Vulnerability(
+                bom_ref="vuln-1",
+                id="CVE-2021-23337",
+                affects=[BomTarget(ref="pkg:npm/%40%40scope/lib@@1.0.0")],
+            )
+        )
+        sanitize_cyclonedx_bom(bom)
+
+        data = json.loads(serialize_cyclonedx_bom(bom, "1.6"))
+
+        assert data["vulnerabilities"][0]["affects"][0]["ref"] == "pkg:npm/%40scope/lib@1.0.0"
+
+
 class TestSanitizeSpdxLicenses:
     """Tests for sanitize_spdx_licenses with various invalid license formats."""
 
@@ -1972,3 +2119,61 @@ class TestRestoreSpdxDocumentDescribes:
         assert count == 0
         # File should not be rewritten
         assert spdx_file.read_text() == original
+
+
+class TestWriteSpdxDocument:
+    """Tests for streaming SPDX 2.x document output."""
+
+    def test_json_output_matches_spdx_tools(self, tmp_path):
+        from pathlib import Path
+
+        from spdx_tools.spdx.parser.parse_anything import parse_file
+        from spdx_tools.spdx.writer.write_anything import write_file
+
+        source = Path(__file__).parent / "test-data" / "alpine_3.21_syft.spdx.json"
+        document = parse_file(str(source))
+        assert document.packages and document.relationships
+
+        expected = tmp_path / "expected.json"
+        actual = tmp_path / "actual.json"
+        write_file(document, str(expected), validate=False)
+        write_spdx_document(document, str(actual))
+
+        assert actual.read_text(encoding="utf-8") == expected.read_text(encoding="utf-8")
+
+    def test_converter_streams_element_lists(self):
+        """spdx_tools still calls the overridden _get_property_value() hook.
+
+        If this fails, spdx_tools changed its internals and the lists are
+        built in full again; check the version pin in pyproject.toml.
+        """
+        from pathlib import Path
+        from types import GeneratorType
+
+        from spdx_tools.spdx.parser.parse_anything import parse_file
+
+        document = parse_file(str(Path(__file__).parent / "test-data" / "alpine_3.21_syft.spdx.json"))
+        data = _StreamingDocumentConverter().convert(document)
+
+        assert isinstance(data["packages"], GeneratorType)
+        assert isinstance(data["relationships"], GeneratorType)
+
+    def test_other_formats_use_spdx_tools(self, tmp_path):
+        from datetime import datetime, timezone
+
+        from spdx_tools.spdx.model import Actor, ActorType, CreationInfo, Document
+
+        document = Document(
+            creation_info=CreationInfo(
+                spdx_version="SPDX-2.3",
+                spdx_id="SPDXRef-DOCUMENT",
+                name="test",
+                document_namespace="https://example.com/test",
+                creators=[Actor(ActorType.TOOL, "test")],
+                created=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            )
+        )
+        output = tmp_path / "sbom.spdx"
+        write_spdx_document(document, str(output))
+
+        assert "SPDXVersion: SPDX-2.3" in output.read_text(encoding="utf-8")
@@ -18,6 +18,7 @@ from sbomify_action.spdx3 import (
     parse_spdx3_file,
     spdx3_license_from_string,
     spdx3_licenses_from_list,
+    spdx3_payload_to_dict,
     write_spdx3_file,
 )
 
@@ -177,6 +178,20 @@ class TestWriteSpdx3File(unittest.TestCase):
         self.assertEqual(data["@context"], "https://spdx.org/rdf/3.0.1/spdx-context.jsonld")
         self.assertIn("@graph", data)
 
+    def test_streamed_output_matches_payload_dict(self):
+        payload = parse_spdx3_file(str(TEST_DATA_DIR / "spdx3_multi_type.json"))
+
+        fd, path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        try:
+            write_spdx3_file(payload, path)
+            with open(path) as rf:
+                written = rf.read()
+        finally:
+            os.unlink(path)
+
+        self.assertEqual(written, json.dumps(spdx3_payload_to_dict(payload), indent=2))
+
 
 class TestHelpers(unittest.TestCase):
     """Tests for helper functions."""
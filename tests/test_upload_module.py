@@ -14,7 +14,10 @@ Tests cover:
 import json
 import os
 import tempfile
+import threading
+import time
 import unittest
+from email.parser import BytesParser
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -28,9 +31,48 @@ from sbomify_action._upload import (
     UploadResult,
     create_registry_with_sbomify,
 )
+from sbomify_action._upload.retry import MAX_BACKOFF, RetryPolicy
+from sbomify_action._upload.streaming import CHUNK_SIZE
+from sbomify_action._upload.upload_record import UploadRecord
 from sbomify_action.upload import upload_sbom, upload_to_all
 
 
+def _streaming_post(response, sent: list):
+    """Side effect for a mocked requests.post that reads the streamed request body."""
+
+    def post(url, **kwargs):
+        data = kwargs["data"]
+        sent.append(data if isinstance(data, bytes) else b"".join(data))
+        return response
+
+    return post
+
+
+def _form_fields(body: bytes, content_type: str) -> dict:
+    """Parse a multipart/form-data request body into a field name -> bytes mapping."""
+    message = BytesParser().parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode() + body)
+    return {
+        part.get_param("name", header="content-disposition"): part.get_payload(decode=True)
+        for part in message.get_payload()
+    }
+
+
+class _FakeDestination:
+    """Configured destination that runs a hook before reporting success."""
+
+    def __init__(self, name: str, before_upload=None):
+        self.name = name
+        self._before_upload = before_upload
+
+    def is_configured(self) -> bool:
+        return True
+
+    def upload(self, input: UploadInput) -> UploadResult:
+        if self._before_upload:
+            self._before_upload()
+        return UploadResult.success_result(destination_name=self.name)
+
+
 class TestUploadInput(unittest.TestCase):
     """Tests for UploadInput dataclass."""
 
@@ -217,6 +259,57 @@ class TestDestinationRegistry(unittest.TestCase):
             registry.upload(input, destination_name="unknown")
         self.assertIn("not found", str(ctx.exception))
 
+    def test_upload_all_runs_destinations_concurrently(self):
+        """Destinations upload at the same time and results keep registration order."""
+        # Each upload waits for the other one to start, which only works concurrently
+        barrier = threading.Barrier(2, timeout=5)
+        registry = DestinationRegistry()
+        registry.register(_FakeDestination("first", before_upload=lambda: (barrier.wait(), time.sleep(0.05))))
+        registry.register(_FakeDestination("second", before_upload=barrier.wait))
+
+        results = registry.upload_all(UploadInput(sbom_file="sbom.json", sbom_format="cyclonedx"))
+
+        self.assertEqual([r.destination_name for r in results], ["first", "second"])
+        self.assertTrue(all(r.success for r in results))
+
+    def test_upload_all_waits_for_slow_destination(self):
+        """A slow destination's result is reported, not replaced by a failure."""
+        registry = DestinationRegistry()
+        registry.register(_FakeDestination("slow", before_upload=lambda: time.sleep(0.2)))
+        registry.register(_FakeDestination("fast"))
+
+        results = registry.upload_all(UploadInput(sbom_file="sbom.json", sbom_format="cyclonedx"))
+
+        self.assertEqual([r.destination_name for r in results], ["slow", "fast"])
+        self.assertTrue(all(r.success for r in results))
+
+    def test_upload_all_limits_to_named_destinations(self):
+        """Only the named destinations are uploaded to, with results in the order given."""
+        uploaded = []
+        registry = DestinationRegistry()
+        for name in ("first", "second", "third"):
+            registry.register(_FakeDestination(name, before_upload=lambda name=name: uploaded.append(name)))
+        registry.register(SbomifyDestination())  # not configured
+
+        results = registry.upload_all(
+            UploadInput(sbom_file="sbom.json", sbom_format="cyclonedx"), destinations=["third", "sbomify", "first"]
+        )
+
+        self.assertEqual([r.destination_name for r in results], ["third", "sbomify", "first"])
+        self.assertEqual(sorted(uploaded), ["first", "third"])
+        self.assertTrue(results[0].success)
+        self.assertFalse(results[1].success)
+        self.assertIn("not configured", results[1].error_message)
+        self.assertTrue(results[2].success)
+
+    def test_upload_all_with_unknown_named_destination_raises(self):
+        registry = DestinationRegistry()
+        registry.register(_FakeDestination("first"))
+
+        with self.assertRaises(ValueError) as ctx:
+            registry.upload_all(UploadInput(sbom_file="sbom.json", sbom_format="cyclonedx"), destinations=["unknown"])
+        self.assertIn("not found", str(ctx.exception))
+
 
 class TestSbomifyDestination(unittest.TestCase):
     """Tests for SbomifyDestination."""
@@ -370,8 +463,8 @@ class TestSbomifyDestination(unittest.TestCase):
         self.assertIn("not found", result.error_message.lower())
 
     @patch("sbomify_action._upload.destinations.sbomify.requests.post")
-    def test_upload_duplicate_sbom_error(self, mock_post):
-        """Test upload with 409 DUPLICATE_ARTIFACT error returns specific error code and message."""
+    def test_upload_duplicate_sbom_is_success(self, mock_post):
+        """Test upload with 409 DUPLICATE_ARTIFACT is reported as a duplicate success."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
             json.dump({"bomFormat": "CycloneDX", "specVersion": "1.6"}, f)
             sbom_file = f.name
@@ -391,10 +484,9 @@ class TestSbomifyDestination(unittest.TestCase):
 
             result = dest.upload(input)
 
-            self.assertFalse(result.success)
-            self.assertEqual(result.error_code, "DUPLICATE_ARTIFACT")
-            self.assertIn("already exists", result.error_message)
-            self.assertIn("different version", result.error_message)
+            self.assertTrue(result.success)
+            self.assertTrue(result.duplicate)
+            self.assertIsNone(result.error_message)
         finally:
             Path(sbom_file).unlink()
 
@@ -610,8 +702,8 @@ class TestDependencyTrackDestination(unittest.TestCase):
         dest = DependencyTrackDestination(config=config)
         self.assertTrue(dest.is_configured())
 
-    @patch("sbomify_action._upload.destinations.dependency_track.requests.put")
-    def test_upload_success_with_project_id(self, mock_put):
+    @patch("sbomify_action._upload.destinations.dependency_track.requests.post")
+    def test_upload_success_with_project_id(self, mock_post):
         """Test successful upload with project ID."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
             json.dump({"bomFormat": "CycloneDX", "specVersion": "1.6"}, f)
@@ -621,7 +713,7 @@ class TestDependencyTrackDestination(unittest.TestCase):
             mock_response = Mock()
             mock_response.ok = True
             mock_response.json.return_value = {"token": "upload-token-123"}
-            mock_put.return_value = mock_response
+            mock_post.return_value = mock_response
 
             config = DependencyTrackConfig(
                 api_key="test-key",
@@ -638,15 +730,15 @@ class TestDependencyTrackDestination(unittest.TestCase):
             self.assertEqual(result.destination_name, "dependency-track")
 
             # Verify API call - URL is api_url + /v1/bom
-            mock_put.assert_called_once()
-            call_args = mock_put.call_args
+            mock_post.assert_called_once()
+            call_args = mock_post.call_args
             self.assertEqual(call_args[0][0], "https://dtrack.example.com/api/v1/bom")
             self.assertEqual(call_args[1]["headers"]["X-Api-Key"], "test-key")
         finally:
             Path(sbom_file).unlink()
 
-    @patch("sbomify_action._upload.destinations.dependency_track.requests.put")
-    def test_upload_success_with_name_version(self, mock_put):
+    @patch("sbomify_action._upload.destinations.dependency_track.requests.post")
+    def test_upload_success_with_name_version(self, mock_post):
         """Test successful upload with project name and version."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
             json.dump({"bomFormat": "CycloneDX", "specVersion": "1.6"}, f)
@@ -656,7 +748,8 @@ class TestDependencyTrackDestination(unittest.TestCase):
             mock_response = Mock()
             mock_response.ok = True
             mock_response.json.return_value = {"token": "upload-token-456"}
-            mock_put.return_value = mock_response
+            sent = []
+            mock_post.side_effect = _streaming_post(mock_response, sent)
 
             config = DependencyTrackConfig(
                 api_key="test-key",
@@ -676,12 +769,16 @@ class TestDependencyTrackDestination(unittest.TestCase):
 
             self.assertTrue(result.success)
 
-            # Verify payload contains projectName and projectVersion from UploadInput
-            call_args = mock_put.call_args
-            payload = call_args[1]["json"]
-            self.assertEqual(payload["projectName"], "my-project")
-            self.assertEqual(payload["projectVersion"], "1.0.0")
-            self.assertTrue(payload["autoCreate"])
+            # Verify form contains projectName and projectVersion from UploadInput
+            headers = mock_post.call_args[1]["headers"]
+            self.assertTrue(headers["Content-Type"].startswith("multipart/form-data; boundary="))
+            fields = _form_fields(sent[0], headers["Content-Type"])
+            self.assertEqual(fields["projectName"], b"my-project")
+            self.assertEqual(fields["projectVersion"], b"1.0.0")
+            self.assertEqual(fields["autoCreate"], b"true")
+            self.assertEqual(json.loads(fields["bom"]), {"bomFormat": "CycloneDX", "specVersion": "1.6"})
+            # Plain files are sent with a known length instead of chunked
+            self.assertEqual(mock_post.call_args[1]["data"].len, len(sent[0]))
         finally:
             Path(sbom_file).unlink()
 
@@ -942,8 +1039,8 @@ class TestSbomifyValidation(unittest.TestCase):
 class TestDependencyTrackErrors(unittest.TestCase):
     """Tests for Dependency Track error handling."""
 
-    @patch("sbomify_action._upload.destinations.dependency_track.requests.put")
-    def test_upload_connection_error(self, mock_put):
+    @patch("sbomify_action._upload.destinations.dependency_track.requests.post")
+    def test_upload_connection_error(self, mock_post):
         """Test upload with connection error."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
             json.dump({"bomFormat": "CycloneDX", "specVersion": "1.6"}, f)
@@ -952,7 +1049,7 @@ class TestDependencyTrackErrors(unittest.TestCase):
         try:
             import requests
 
-            mock_put.side_effect = requests.exceptions.ConnectionError("Connection failed")
+            mock_post.side_effect = requests.exceptions.ConnectionError("Connection failed")
 
             config = DependencyTrackConfig(
                 api_key="test-key",
@@ -969,8 +1066,8 @@ class TestDependencyTrackErrors(unittest.TestCase):
         finally:
             Path(sbom_file).unlink()
 
-    @patch("sbomify_action._upload.destinations.dependency_track.requests.put")
-    def test_upload_timeout_error(self, mock_put):
+    @patch("sbomify_action._upload.destinations.dependency_track.requests.post")
+    def test_upload_timeout_error(self, mock_post):
         """Test upload with timeout error."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
             json.dump({"bomFormat": "CycloneDX", "specVersion": "1.6"}, f)
@@ -979,7 +1076,7 @@ class TestDependencyTrackErrors(unittest.TestCase):
         try:
             import requests
 
-            mock_put.side_effect = requests.exceptions.Timeout("Request timed out")
+            mock_post.side_effect = requests.exceptions.Timeout("Request timed out")
 
             config = DependencyTrackConfig(
                 api_key="test-key",
@@ -996,8 +1093,8 @@ class TestDependencyTrackErrors(unittest.TestCase):
         finally:
             Path(sbom_file).unlink()
 
-    @patch("sbomify_action._upload.destinations.dependency_track.requests.put")
-    def test_upload_api_error(self, mock_put):
+    @patch("sbomify_action._upload.destinations.dependency_track.requests.post")
+    def test_upload_api_error(self, mock_post):
         """Test upload with API error response."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
             json.dump({"bomFormat": "CycloneDX", "specVersion": "1.6"}, f)
@@ -1008,7 +1105,7 @@ class TestDependencyTrackErrors(unittest.TestCase):
             mock_response.ok = False
             mock_response.status_code = 403
             mock_response.text = "Forbidden"
-            mock_put.return_value = mock_response
+            mock_post.return_value = mock_response
 
             config = DependencyTrackConfig(
                 api_key="test-key",
@@ -1091,7 +1188,8 @@ class TestSbomifyGzipCompression(unittest.TestCase):
             mock_response = Mock()
             mock_response.ok = True
             mock_response.json.return_value = {"sbom_id": "sbom-large"}
-            mock_post.return_value = mock_response
+            sent = []
+            mock_post.side_effect = _streaming_post(mock_response, sent)
 
             dest = SbomifyDestination(token="test-token", component_id="my-component")
             input = UploadInput(sbom_file=sbom_file, sbom_format="cyclonedx")
@@ -1103,7 +1201,7 @@ class TestSbomifyGzipCompression(unittest.TestCase):
             # Content-Encoding header must be set
             self.assertEqual(call_kwargs["headers"]["Content-Encoding"], "gzip")
             # Data is valid gzip that decompresses to original
-            decompressed = gzip.decompress(call_kwargs["data"])
+            decompressed = gzip.decompress(sent[0])
             self.assertEqual(decompressed, large_data.encode())
         finally:
             Path(sbom_file).unlink()
@@ -1122,55 +1220,340 @@ class TestSbomifyGzipCompression(unittest.TestCase):
             mock_response = Mock()
             mock_response.ok = True
             mock_response.json.return_value = {"sbom_id": "sbom-compressed"}
-            mock_post.return_value = mock_response
+            sent = []
+            mock_post.side_effect = _streaming_post(mock_response, sent)
 
             dest = SbomifyDestination(token="test-token", component_id="my-component")
             input = UploadInput(sbom_file=sbom_file, sbom_format="cyclonedx")
 
             dest.upload(input)
 
-            call_kwargs = mock_post.call_args[1]
-            self.assertLess(len(call_kwargs["data"]), len(large_data.encode()))
+            self.assertLess(len(sent[0]), len(large_data.encode()))
         finally:
             Path(sbom_file).unlink()
 
+    @patch("sbomify_action._upload.destinations.sbomify.GZIP_THRESHOLD", 100)
+    @patch("sbomify_action._upload.destinations.sbomify.requests.post")
+    def test_large_file_streamed_in_chunks(self, mock_post):
+        """Large files are compressed while streaming instead of being read into memory."""
+        import gzip
+
+        # Several read chunks worth of data
+        large_data = os.urandom(4 * CHUNK_SIZE).hex().encode()
+        with tempfile.NamedTemporaryFile(mode="wb", suffix=".json", delete=False) as f:
+            f.write(large_data)
+            sbom_file = f.name
+
+        try:
+            chunk_sizes = []
+
+            def post(url, **kwargs):
+                chunks = list(kwargs["data"])
+                chunk_sizes.extend(len(chunk) for chunk in chunks)
+                self.assertEqual(gzip.decompress(b"".join(chunks)), large_data)
+                return Mock(ok=True, json=Mock(return_value={"sbom_id": "sbom-streamed"}))
+
+            mock_post.side_effect = post
+
+            dest = SbomifyDestination(token="test-token", component_id="my-component")
+            result = dest.upload(UploadInput(sbom_file=sbom_file, sbom_format="cyclonedx"))
+
+            self.assertTrue(result.success)
+            self.assertGreater(len(chunk_sizes), 1)
+        finally:
+            os.unlink(sbom_file)
+
+
+class TestCompressedSbomFileUploads(unittest.TestCase):
+    """Tests for uploading gzip/zstd compressed SBOM files."""
+
+    SBOM = {"bomFormat": "CycloneDX", "specVersion": "1.6", "components": []}
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def _write(self, name: str, data: bytes) -> str:
+        path = Path(self.tmp_dir.name) / name
+        path.write_bytes(data)
+        return str(path)
+
     @patch("sbomify_action._upload.destinations.sbomify.requests.post")
-    def test_large_incompressible_data_sent_uncompressed(self, mock_post):
-        """When gzip produces larger output, send uncompressed."""
-        import os
-
-        dest = SbomifyDestination(token="test-token", component_id="test-component")
-
-        # Patch GZIP_THRESHOLD to 0 so the gzip compression path is exercised
-        with patch("sbomify_action._upload.destinations.sbomify.GZIP_THRESHOLD", 0):
-            # A tiny payload where gzip overhead makes output larger than input
-            fd, path = tempfile.mkstemp(suffix=".json")
-            try:
-                payload = b"a"
-                with os.fdopen(fd, "wb") as f:
-                    f.write(payload)
-
-                mock_response = Mock()
-                mock_response.ok = True
-                mock_response.json.return_value = {"sbom_id": "test-id"}
-                mock_post.return_value = mock_response
-
-                input_data = UploadInput(sbom_file=path, sbom_format="cyclonedx", validate_before_upload=False)
-                dest.upload(input_data)
-
-                # Verify the request was made
-                mock_post.assert_called_once()
-                call_kwargs = mock_post.call_args
-
-                # Should NOT have Content-Encoding: gzip since compressed would be larger
-                headers = call_kwargs.kwargs.get("headers", call_kwargs[1].get("headers", {}))
-                self.assertNotIn("Content-Encoding", headers)
-
-                # Data should be the original uncompressed bytes
-                sent_data = call_kwargs.kwargs.get("data", call_kwargs[1].get("data", b""))
-                self.assertEqual(sent_data, payload)
-            finally:
-                os.unlink(path)
+    def test_gzip_file_sent_as_is(self, mock_post):
+        """A gzip file is uploaded with Content-Encoding: gzip, without recompressing."""
+        import gzip
+
+        compressed = gzip.compress(json.dumps(self.SBOM).encode())
+        sbom_file = self._write("sbom.json.gz", compressed)
+        sent = []
+        mock_post.side_effect = _streaming_post(Mock(ok=True, json=Mock(return_value={"id": "sbom-gz"})), sent)
+
+        dest = SbomifyDestination(token="test-token", component_id="my-component")
+        result = dest.upload(UploadInput(sbom_file=sbom_file, sbom_format="cyclonedx", validate_before_upload=True))
+
+        self.assertTrue(result.success)
+        self.assertIsNone(result.validation_error)
+        call_kwargs = mock_post.call_args[1]
+        self.assertEqual(call_kwargs["headers"]["Content-Encoding"], "gzip")
+        self.assertEqual(sent[0], compressed)
+
+    @patch("sbomify_action._upload.destinations.sbomify.requests.post")
+    def test_zstd_file_recompressed_as_gzip(self, mock_post):
+        """A zstd file is streamed gzip-compressed, since the API only accepts gzip encoding."""
+        import gzip
+
+        import zstandard
+
+        raw = json.dumps(self.SBOM).encode()
+        sbom_file = self._write("sbom.json.zst", zstandard.ZstdCompressor().compress(raw))
+        sent = []
+        mock_post.side_effect = _streaming_post(Mock(ok=True, json=Mock(return_value={"id": "sbom-zst"})), sent)
+
+        dest = SbomifyDestination(token="test-token", component_id="my-component")
+        result = dest.upload(UploadInput(sbom_file=sbom_file, sbom_format="cyclonedx"))
+
+        self.assertTrue(result.success)
+        call_kwargs = mock_post.call_args[1]
+        self.assertEqual(call_kwargs["headers"]["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(sent[0]), raw)
+
+    @patch("sbomify_action._upload.destinations.dependency_track.requests.post")
+    def test_dependency_track_decompresses(self, mock_post):
+        """Dependency Track receives the decompressed BOM, streamed chunked."""
+        import gzip
+
+        raw = json.dumps(self.SBOM).encode()
+        sbom_file = self._write("sbom.json.gz", gzip.compress(raw))
+        sent = []
+        response = Mock(ok=True, status_code=200, json=Mock(return_value={"token": "t"}))
+        mock_post.side_effect = _streaming_post(response, sent)
+
+        config = DependencyTrackConfig(api_key="key", api_url="https://dtrack.example.com/api", project_id="p-1")
+        result = DependencyTrackDestination(config).upload(UploadInput(sbom_file=sbom_file, sbom_format="cyclonedx"))
+
+        self.assertTrue(result.success)
+        call_kwargs = mock_post.call_args[1]
+        self.assertIsNone(call_kwargs["data"].len)
+        fields = _form_fields(sent[0], call_kwargs["headers"]["Content-Type"])
+        self.assertEqual(fields["project"], b"p-1")
+        self.assertEqual(fields["autoCreate"], b"false")
+        self.assertEqual(fields["bom"], raw)
+
+
+class TestUploadRetries(unittest.TestCase):
+    """Tests for retrying failed uploads."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.sbom_file = str(Path(self.tmp_dir.name) / "sbom.json")
+        Path(self.sbom_file).write_text(json.dumps({"bomFormat": "CycloneDX", "specVersion": "1.6"}))
+
+    @staticmethod
+    def _response(status_code: int, body: dict | None = None, headers: dict | None = None) -> Mock:
+        return Mock(
+            ok=status_code < 400,
+            status_code=status_code,
+            headers=headers or {},
+            json=Mock(return_value=body or {}),
+            text="",
+        )
+
+    @patch("sbomify_action._upload.destinations.sbomify.requests.post")
+    def test_retries_retryable_status(self, mock_post):
+        """A 502 is retried with a fresh body and the same idempotency key."""
+        sent = []
+        responses = iter([self._response(502), self._response(201, {"id": "sbom-1"})])
+        mock_post.side_effect = lambda url, **kwargs: (sent.append(kwargs["data"]), next(responses))[1]
+
+        result = SbomifyDestination(token="t", component_id="c").upload(
+            UploadInput(sbom_file=self.sbom_file, sbom_format="cyclonedx", validate_before_upload=False)
+        )
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.sbom_id, "sbom-1")
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(sent[0], sent[1])
+        keys = {call.kwargs["headers"]["Idempotency-Key"] for call in mock_post.call_args_list}
+        self.assertEqual(len(keys), 1)
+        self.assertTrue(keys.pop().startswith("sha256:"))
+
+    @patch("sbomify_action._upload.destinations.sbomify.requests.post")
+    def test_gives_up_after_configured_retries(self, mock_post):
+        """Network errors are retried UPLOAD_RETRIES times before failing."""
+        import requests
+
+        mock_post.side_effect = requests.exceptions.ConnectionError("Connection failed")
+
+        with patch.dict(os.environ, {"UPLOAD_RETRIES": "2"}):
+            result = SbomifyDestination(token="t", component_id="c").upload(
+                UploadInput(sbom_file=self.sbom_file, sbom_format="cyclonedx", validate_before_upload=False)
+            )
+
+        self.assertFalse(result.success)
+        self.assertIn("connect", result.error_message.lower())
+        self.assertEqual(mock_post.call_count, 3)
+
+    @patch("sbomify_action._upload.destinations.sbomify.requests.post")
+    def test_client_errors_are_not_retried(self, mock_post):
+        """Errors that won't go away on their own fail immediately."""
+        mock_post.return_value = self._response(400, {"detail": "Bad SBOM"})
+
+        result = SbomifyDestination(token="t", component_id="c").upload(
+            UploadInput(sbom_file=self.sbom_file, sbom_format="cyclonedx", validate_before_upload=False)
+        )
+
+        self.assertFalse(result.success)
+        self.assertEqual(mock_post.call_count, 1)
+
+    @patch("sbomify_action._upload.destinations.dependency_track.requests.post")
+    def test_dependency_track_retries_timeouts(self, mock_post):
+        """Dependency Track uploads are retried too, streaming the file again."""
+        import requests
+
+        sent = []
+
+        def post(url, **kwargs):
+            sent.append(b"".join(kwargs["data"]))
+            if len(sent) == 1:
+                raise requests.exceptions.Timeout("Request timed out")
+            return self._response(200, {"token": "t"})
+
+        mock_post.side_effect = post
+        config = DependencyTrackConfig(api_key="key", api_url="https://dtrack.example.com/api", project_id="p-1")
+
+        result = DependencyTrackDestination(config).upload(
+            UploadInput(sbom_file=self.sbom_file, sbom_format="cyclonedx")
+        )
+
+        self.assertTrue(result.success)
+        self.assertEqual(len(sent), 2)
+        self.assertIn(Path(self.sbom_file).read_bytes(), sent[1])
+        # /v1/bom ignores it, so it isn't sent
+        self.assertNotIn("Idempotency-Key", mock_post.call_args.kwargs["headers"])
+
+    def test_delay_backs_off_and_honours_retry_after(self):
+        """Delays double per retry and respect the server's Retry-After."""
+        policy = RetryPolicy(retries=3, backoff=1.0)
+
+        self.assertEqual([policy.delay(n) for n in (1, 2, 3)], [1.0, 2.0, 4.0])
+        self.assertEqual(policy.delay(1, self._response(429, headers={"Retry-After": "10"})), 10.0)
+        self.assertEqual(policy.delay(1, self._response(503, headers={"Retry-After": "3600"})), MAX_BACKOFF)
+
+    def test_policy_from_env_ignores_invalid_values(self):
+        """Invalid settings fall back to the defaults."""
+        with patch.dict(os.environ, {"UPLOAD_RETRIES": "many", "UPLOAD_RETRY_BACKOFF": "-1"}):
+            policy = RetryPolicy.from_env()
+
+        self.assertEqual(policy.retries, 3)
+        self.assertEqual(policy.backoff, 0.0)
+
+
+class TestSkipUnchangedUploads(unittest.TestCase):
+    """Tests for skipping SBOMs that were uploaded before."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.sbom_file = Path(self.tmp_dir.name) / "sbom.json"
+        self.sbom_file.write_text(json.dumps({"bomFormat": "CycloneDX", "specVersion": "1.6"}))
+        self.dest = SbomifyDestination(token="t", component_id="c")
+        env = patch.dict(os.environ, {"UPLOAD_SKIP_UNCHANGED": "true"})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def _upload(self) -> UploadResult:
+        return self.dest.upload(
+            UploadInput(sbom_file=str(self.sbom_file), sbom_format="cyclonedx", validate_before_upload=False)
+        )
+
+    @patch("sbomify_action._upload.destinations.sbomify.requests.post")
+    def test_identical_sbom_is_skipped(self, mock_post):
+        """The second upload of identical content is skipped with the recorded SBOM ID."""
+        mock_post.return_value = Mock(ok=True, status_code=201, json=Mock(return_value={"id": "sbom-1"}))
+
+        first = self._upload()
+        second = self._upload()
+
+        self.assertFalse(first.duplicate)
+        self.assertTrue(second.success)
+        self.assertTrue(second.duplicate)
+        self.assertEqual(second.sbom_id, "sbom-1")
+        mock_post.assert_called_once()
+
+    @patch("sbomify_action._upload.destinations.sbomify.requests.post")
+    def test_changed_sbom_is_uploaded(self, mock_post):
+        """Different content is uploaded again."""
+        mock_post.return_value = Mock(ok=True, status_code=201, json=Mock(return_value={"id": "sbom-1"}))
+
+        self._upload()
+        self.sbom_file.write_text(json.dumps({"bomFormat": "CycloneDX", "specVersion": "1.6", "version": 2}))
+        result = self._upload()
+
+        self.assertFalse(result.duplicate)
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch("sbomify_action._upload.destinations.sbomify.requests.post")
+    def test_duplicate_artifact_is_not_recorded(self, mock_post):
+        """A 409 means the version has an SBOM, not this content, so the next run uploads again."""
+        mock_post.return_value = Mock(
+            ok=False,
+            status_code=409,
+            json=Mock(return_value={"error_code": "DUPLICATE_ARTIFACT", "sbom_id": "sbom-old"}),
+        )
+
+        first = self._upload()
+        self._upload()
+
+        self.assertTrue(first.duplicate)
+        self.assertEqual(first.sbom_id, "sbom-old")
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch("sbomify_action._upload.destinations.sbomify.requests.post")
+    def test_skipping_is_opt_in(self, mock_post):
+        """Without UPLOAD_SKIP_UNCHANGED, every upload is sent."""
+        mock_post.return_value = Mock(ok=True, status_code=201, json=Mock(return_value={"id": "sbom-1"}))
+
+        with patch.dict(os.environ):
+            del os.environ["UPLOAD_SKIP_UNCHANGED"]
+            self._upload()
+            result = self._upload()
+
+        self.assertFalse(result.duplicate)
+        self.assertEqual(mock_post.call_count, 2)
+
+    def test_record_merges_and_ignores_corrupt_files(self):
+        """The record keeps entries from other writers and survives a corrupt file."""
+        path = Path(self.tmp_dir.name) / "record" / "uploads.json"
+        path.parent.mkdir()
+        path.write_text("{not json")
+
+        record = UploadRecord(path)
+        self.assertIsNone(record.lookup("target", "sha256:a"))
+
+        record.remember("target", "sha256:a", "sbom-a")
+        UploadRecord(path).remember("target", "sha256:b", "sbom-b")
+
+        self.assertEqual(record.lookup("target", "sha256:a"), "sbom-a")
+        self.assertEqual(record.lookup("target", "sha256:b"), "sbom-b")
+        self.assertIsNone(record.lookup("other-target", "sha256:a"))
+
+    def test_record_is_pruned(self):
+        """Only the most recently recorded entries are kept, per target and in total."""
+        path = Path(self.tmp_dir.name) / "record" / "uploads.json"
+        record = UploadRecord(path)
+
+        with patch("sbomify_action._upload.upload_record.MAX_ENTRIES_PER_TARGET", 2):
+            with patch("sbomify_action._upload.upload_record.MAX_ENTRIES", 3):
+                for content_hash in ("sha256:a", "sha256:b", "sha256:c"):
+                    record.remember("first", content_hash, content_hash)
+                record.remember("second", "sha256:d", "sbom-d")
+                record.remember("third", "sha256:e", "sbom-e")
+
+        self.assertEqual(
+            json.loads(path.read_text()), {"second": {"sha256:d": "sbom-d"}, "third": {"sha256:e": "sbom-e"}}
+        )
+        self.assertIsNone(record.lookup("first", "sha256:c"))
 
 
 class TestSbomifyTimeout(unittest.TestCase):
@@ -4,10 +4,14 @@ import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from sbomify_action.validation import (
     ValidationResult,
     detect_sbom_format_and_version,
+    get_validator,
+    has_passed_validation,
+    iter_validation_errors,
     validate_sbom_data,
     validate_sbom_file,
     validate_sbom_file_auto,
@@ -371,6 +375,124 @@ class TestSchemaRegistry(unittest.TestCase):
         self.assertIsNotNone(retrieved)
 
 
+class TestCompiledValidators(unittest.TestCase):
+    """Tests for cached validators and fail-fast/full-report modes."""
+
+    def _bom(self, components):
+        return {"bomFormat": "CycloneDX", "specVersion": "1.6", "version": 1, "components": components}
+
+    def test_validator_cached_per_format_and_version(self):
+        """Test that validators are built once per (format, version)."""
+        self.assertIs(get_validator("cyclonedx", "1.6"), get_validator("cyclonedx", "1.6"))
+        self.assertIsNot(get_validator("cyclonedx", "1.6"), get_validator("cyclonedx", "1.5"))
+        self.assertIsNone(get_validator("cyclonedx", "9.9"))
+
+    def test_fail_fast_stops_at_first_error(self):
+        """Test that fail-fast mode reports only the first error."""
+        data = self._bom([{"type": "library", "version": "1"}, {"type": "library"}, {"type": "library", "name": 1}])
+        result = validate_sbom_data(data, "cyclonedx", "1.6")
+        self.assertFalse(result.valid)
+        self.assertEqual(len(result.errors), 1)
+        self.assertEqual(result.error_message, "'name' is a required property")
+        self.assertEqual(result.error_path, "components.0")
+
+    def test_full_report_collects_all_errors(self):
+        """Test that full-report mode collects every error."""
+        data = self._bom([{"type": "library", "version": "1"}, {"type": "library"}, {"type": "library", "name": 1}])
+        result = validate_sbom_data(data, "cyclonedx", "1.6", fail_fast=False)
+        self.assertFalse(result.valid)
+        self.assertEqual(len(result.errors), 3)
+        self.assertEqual(result.errors[0], (result.error_message, result.error_path))
+        self.assertEqual([path for _, path in result.errors], ["components.0", "components.1", "components.2.name"])
+
+    def test_iter_validation_errors_is_lazy(self):
+        """Test that errors are streamed rather than collected up front."""
+        data = self._bom([{"type": "library", "version": str(i)} for i in range(5)])
+        errors = iter_validation_errors(data, "cyclonedx", "1.6")
+        self.assertEqual(next(errors).message, "'name' is a required property")
+        self.assertEqual(len(list(errors)), 4)
+
+    def test_unique_items_detects_duplicates(self):
+        """Test that duplicate components are rejected."""
+        component = {"type": "library", "name": "zlib", "version": "1.3"}
+        result = validate_sbom_data(self._bom([component, dict(component)]), "cyclonedx", "1.6")
+        self.assertFalse(result.valid)
+        self.assertIn("non-unique elements", result.error_message)
+
+    def test_unique_items_keeps_json_schema_equality(self):
+        """Test that booleans and numbers are distinct, while equal numbers match."""
+        validator = get_validator("cyclonedx", "1.6")
+        schema = {"uniqueItems": True}
+        self.assertTrue(validator.evolve(schema=schema).is_valid([1, True, {"a": 0}, {"a": False}]))
+        self.assertFalse(validator.evolve(schema=schema).is_valid([1, 1.0]))
+        self.assertFalse(validator.evolve(schema=schema).is_valid([{"a": [1, {"b": 2}]}, {"a": [1, {"b": 2}]}]))
+
+    def test_large_component_list_validates_quickly(self):
+        """Test that uniqueItems on large component arrays is not quadratic."""
+        components = [{"type": "library", "name": f"pkg-{i}", "version": "1.0"} for i in range(5000)]
+        result = validate_sbom_data(self._bom(components), "cyclonedx", "1.6")
+        self.assertTrue(result.valid)
+
+
+class TestValidationCache(unittest.TestCase):
+    """Tests for skipping validation of unchanged SBOM contents."""
+
+    VALID_BOM = {"bomFormat": "CycloneDX", "specVersion": "1.6", "version": 1, "components": []}
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def _write(self, name, data):
+        path = Path(self.tmp_dir.name) / name
+        path.write_text(json.dumps(data))
+        return str(path)
+
+    def test_unchanged_content_validated_once(self):
+        """Test that identical bytes are only validated once, even under another file name."""
+        first = self._write("step_2.json", self.VALID_BOM)
+        second = self._write("step_3.json", self.VALID_BOM)
+
+        with patch("sbomify_action.validation.validate_sbom_data", wraps=validate_sbom_data) as mock_validate:
+            self.assertTrue(validate_sbom_file_auto(first).valid)
+            self.assertTrue(validate_sbom_file_auto(second).valid)
+            self.assertTrue(validate_sbom_file(second, "cyclonedx", "1.6").valid)
+
+        self.assertEqual(mock_validate.call_count, 1)
+        self.assertTrue(has_passed_validation(second))
+
+    def test_changed_content_is_revalidated(self):
+        """Test that modified contents are validated again."""
+        path = self._write("sbom.json", self.VALID_BOM)
+        self.assertTrue(validate_sbom_file_auto(path).valid)
+
+        self._write("sbom.json", {**self.VALID_BOM, "components": [{"type": "library"}]})
+
+        self.assertFalse(has_passed_validation(path))
+        self.assertFalse(validate_sbom_file_auto(path).valid)
+
+    def test_failures_are_not_cached(self):
+        """Test that invalid SBOMs are validated (and fail) every time."""
+        path = self._write("sbom.json", {**self.VALID_BOM, "components": [{"type": "library"}]})
+
+        with patch("sbomify_action.validation.validate_sbom_data", wraps=validate_sbom_data) as mock_validate:
+            self.assertFalse(validate_sbom_file_auto(path).valid)
+            self.assertFalse(validate_sbom_file_auto(path).valid)
+
+        self.assertEqual(mock_validate.call_count, 2)
+        self.assertFalse(has_passed_validation(path))
+
+    def test_cache_key_includes_spec_version(self):
+        """Test that passing one spec version doesn't skip validation against another."""
+        path = self._write("sbom.json", self.VALID_BOM)
+        self.assertTrue(validate_sbom_file(path, "cyclonedx", "1.6").valid)
+
+        with patch("sbomify_action.validation.validate_sbom_data", wraps=validate_sbom_data) as mock_validate:
+            validate_sbom_file(path, "cyclonedx", "1.5")
+
+        mock_validate.assert_called_once()
+
+
 class TestValidationWithRealSchemas(unittest.TestCase):
     """Tests using real schema files from the project."""
 
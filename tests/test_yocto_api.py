@@ -9,6 +9,7 @@ from sbomify_action._yocto.api import (
     get_or_create_component,
     list_components,
     patch_component_visibility,
+    sample_components,
 )
 from sbomify_action.exceptions import APIError, PlanLimitError
 
@@ -53,6 +54,46 @@ class TestListComponents:
         assert result == {"pkg1": "c1", "pkg2": "c2"}
         assert mock_get.call_count == 2
 
+    @patch("sbomify_action._yocto.api.requests.get")
+    def test_pages_fetched_concurrently_when_count_known(self, mock_get):
+        def get(url, headers, params, timeout):
+            page = params["page"]
+            resp = MagicMock()
+            resp.ok = True
+            resp.json.return_value = {
+                "items": [{"id": f"c{page}", "name": f"pkg{page}"}],
+                "count": 250,
+                "next": "more" if page < 3 else None,
+            }
+            return resp
+
+        mock_get.side_effect = get
+
+        result = list_components(API_BASE, TOKEN)
+
+        assert result == {"pkg1": "c1", "pkg2": "c2", "pkg3": "c3"}
+        assert sorted(c.kwargs["params"]["page"] for c in mock_get.call_args_list) == [1, 2, 3]
+
+    @patch("sbomify_action._yocto.api.requests.get")
+    def test_follows_next_after_counted_pages(self, mock_get):
+        """Components added while listing show up as an extra page."""
+
+        def get(url, headers, params, timeout):
+            page = params["page"]
+            resp = MagicMock()
+            resp.ok = True
+            resp.json.return_value = {
+                "items": [{"id": f"c{page}", "name": f"pkg{page}"}],
+                "count": 150,
+                "next": "more" if page < 3 else None,
+            }
+            return resp
+
+        mock_get.side_effect = get
+
+        result = list_components(API_BASE, TOKEN)
+        assert result == {"pkg1": "c1", "pkg2": "c2", "pkg3": "c3"}
+
     @patch("sbomify_action._yocto.api.requests.get")
     def test_empty_response(self, mock_get):
         mock_resp = MagicMock()
@@ -103,6 +144,37 @@ class TestListComponents:
             list_components(API_BASE, TOKEN)
 
 
+class TestSampleComponents:
+    @patch("sbomify_action._yocto.api.requests.get")
+    def test_count_and_first_page(self, mock_get):
+        mock_resp = MagicMock()
+        mock_resp.ok = True
+        mock_resp.json.return_value = {"items": [{"id": "c1", "name": "busybox"}], "count": 42}
+        mock_get.return_value = mock_resp
+
+        assert sample_components(API_BASE, TOKEN) == (42, {"busybox": "c1"})
+        mock_get.assert_called_once()
+        assert mock_get.call_args.kwargs["params"]["page"] == 1
+
+    @patch("sbomify_action._yocto.api.requests.get")
+    def test_pagination_total(self, mock_get):
+        mock_resp = MagicMock()
+        mock_resp.ok = True
+        mock_resp.json.return_value = {"items": [], "pagination": {"total": 7}}
+        mock_get.return_value = mock_resp
+
+        assert sample_components(API_BASE, TOKEN) == (7, {})
+
+    @patch("sbomify_action._yocto.api.requests.get")
+    def test_count_not_reported(self, mock_get):
+        mock_resp = MagicMock()
+        mock_resp.ok = True
+        mock_resp.json.return_value = {"items": [], "next": None}
+        mock_get.return_value = mock_resp
+
+        assert sample_components(API_BASE, TOKEN) == (None, {})
+
+
 class TestCreateComponent:
     @patch("sbomify_action._yocto.api.requests.post")
     def test_success(self, mock_post):
@@ -8,7 +8,7 @@ from pathlib import Path
 import pytest
 import zstandard
 
-from sbomify_action._yocto.archive import _detect_archive_type, extract_archive
+from sbomify_action._yocto.archive import _detect_archive_type, extract_archive, iter_archive_documents
 from sbomify_action.exceptions import FileProcessingError
 
 YOCTO_TEST_DATA = Path(__file__).parent / "test-data" / "yocto"
@@ -124,3 +124,38 @@ class TestExtractArchive:
                 data = json.load(fh)
             assert data.get("spdxVersion") == "SPDX-2.2"
             break
+
+
+class TestIterArchiveDocuments:
+    @pytest.mark.parametrize("suffix, create", [("tar.gz", _create_tar_gz), ("tar.zst", _create_tar_zst)])
+    def test_streams_spdx_members(self, tmp_path, suffix, create):
+        archive = str(tmp_path / f"test.spdx.{suffix}")
+        create(archive, str(YOCTO_TEST_DATA))
+
+        documents = dict(iter_archive_documents(archive))
+
+        expected = {f.name: f.read_bytes() for f in YOCTO_TEST_DATA.glob("*.spdx.json")}
+        assert documents == expected
+        # Nothing is extracted next to the archive
+        assert sorted(os.listdir(tmp_path)) == [f"test.spdx.{suffix}"]
+
+    def test_archive_not_found(self):
+        with pytest.raises(FileProcessingError, match="Archive not found"):
+            list(iter_archive_documents("/nonexistent/path.spdx.tar.zst"))
+
+    def test_no_spdx_files(self, tmp_path):
+        readme = tmp_path / "readme.txt"
+        readme.write_text("hello")
+        archive = str(tmp_path / "empty.tar.gz")
+        with tarfile.open(archive, "w:gz") as tar:
+            tar.add(str(readme), arcname="readme.txt")
+
+        with pytest.raises(FileProcessingError, match="No .spdx.json files found"):
+            list(iter_archive_documents(archive))
+
+    def test_corrupt_archive(self, tmp_path):
+        archive = tmp_path / "broken.spdx.tar.zst"
+        archive.write_bytes(b"not a zstd stream")
+
+        with pytest.raises(FileProcessingError, match="Failed to read archive"):
+            list(iter_archive_documents(str(archive)))
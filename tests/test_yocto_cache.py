@@ -0,0 +1,93 @@
+"""Tests for the Yocto pipeline's local state."""
+
+import json
+
+from sbomify_action._yocto.cache import ComponentCache, PackageManifest
+from sbomify_action._yocto.models import YoctoPackage
+
+
+def _package(name="busybox", version="1.36.1", sha256="abc") -> YoctoPackage:
+    return YoctoPackage(
+        name=name,
+        version=version,
+        spdx_file=f"{name}.spdx.json",
+        document_namespace=f"http://spdx.org/spdxdocs/{name}",
+        sha256=sha256,
+    )
+
+
+class TestPackageManifest:
+    def test_lookup_after_save(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        manifest = PackageManifest("scope", path)
+        assert manifest.lookup(_package()) is None
+
+        manifest.record(_package(), "sbom-1")
+        manifest.save()
+
+        assert PackageManifest("scope", path).lookup(_package()) == "sbom-1"
+
+    def test_changed_packages_are_not_found(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        manifest = PackageManifest("scope", path)
+        manifest.record(_package(), "sbom-1")
+        manifest.save()
+
+        reloaded = PackageManifest("scope", path)
+        assert reloaded.lookup(_package(version="1.37.0")) is None
+        assert reloaded.lookup(_package(sha256="def")) is None
+        assert PackageManifest("other-scope", path).lookup(_package()) is None
+
+    def test_packages_processed_with_other_settings_are_not_found(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        manifest = PackageManifest("scope", path, settings={"augment": False, "enrich": False})
+        manifest.record(_package(), "sbom-1")
+        manifest.save()
+
+        assert PackageManifest("scope", path, settings={"augment": False, "enrich": True}).lookup(_package()) is None
+        assert (
+            PackageManifest("scope", path, settings={"augment": False, "enrich": False}).lookup(_package()) == "sbom-1"
+        )
+
+    def test_save_merges_with_other_runs(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        first = PackageManifest("scope", path)
+        second = PackageManifest("scope", path)
+        first.record(_package("busybox"), "sbom-1")
+        second.record(_package("zlib"), "sbom-2")
+        first.save()
+        second.save()
+
+        reloaded = PackageManifest("scope", path)
+        assert reloaded.lookup(_package("busybox")) == "sbom-1"
+        assert reloaded.lookup(_package("zlib")) == "sbom-2"
+
+    def test_unreadable_manifest_is_empty(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        path.write_text("{not json")
+
+        manifest = PackageManifest("scope", path)
+        assert manifest.lookup(_package()) is None
+        manifest.record(_package(), "sbom-1")
+        manifest.save()
+
+        assert json.loads(path.read_text())["scope"]["busybox"]["sbom_id"] == "sbom-1"
+
+
+class TestComponentCache:
+    def test_store_and_reload(self, tmp_path):
+        path = tmp_path / "components.json"
+        assert ComponentCache("https://api", "token", path).components is None
+
+        ComponentCache("https://api", "token", path).store({"busybox": "c1"})
+
+        assert ComponentCache("https://api", "token", path).components == {"busybox": "c1"}
+        assert ComponentCache("https://api", "other-token", path).components is None
+        assert "token" not in path.read_text()
+
+    def test_store_replaces_mapping(self, tmp_path):
+        path = tmp_path / "components.json"
+        ComponentCache("https://api", "token", path).store({"busybox": "c1", "zlib": "c2"})
+        ComponentCache("https://api", "token", path).store({"busybox": "c1"})
+
+        assert ComponentCache("https://api", "token", path).components == {"busybox": "c1"}
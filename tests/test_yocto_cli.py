@@ -105,6 +105,31 @@ class TestYoctoCli:
         assert config.augment is True
         assert config.enrich is True
 
+    @patch("sbomify_action._yocto.pipeline.run_yocto_pipeline")
+    def test_stream_flag(self, mock_pipeline, tmp_path):
+        archive = _make_tar_gz(tmp_path)
+        mock_pipeline.return_value = YoctoPipelineResult()
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["--token", "t", "yocto", archive, "--release", "prod:1.0", "--stream"])
+        assert result.exit_code == 0
+
+        config = mock_pipeline.call_args[0][0]
+        assert config.stream is True
+        assert config.incremental is False
+
+    @patch("sbomify_action._yocto.pipeline.run_yocto_pipeline")
+    def test_incremental_flag(self, mock_pipeline, tmp_path):
+        archive = _make_tar_gz(tmp_path)
+        mock_pipeline.return_value = YoctoPipelineResult()
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["--token", "t", "yocto", archive, "--release", "prod:1.0", "--incremental"])
+        assert result.exit_code == 0
+
+        config = mock_pipeline.call_args[0][0]
+        assert config.incremental is True
+
     @patch("sbomify_action._yocto.pipeline.run_yocto_pipeline")
     def test_api_base_url(self, mock_pipeline, tmp_path):
         archive = _make_tar_gz(tmp_path)
@@ -1,8 +1,12 @@
 """Tests for Yocto SPDX parser and package discovery."""
 
+import hashlib
 import json
 import shutil
+import tarfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -13,6 +17,8 @@ from sbomify_action._yocto.parser import (
     _is_rootfs_manifest,
     _is_spdx_22,
     discover_packages,
+    discover_packages_from_archive,
+    load_package_document,
 )
 from sbomify_action.exceptions import FileProcessingError
 
@@ -72,11 +78,14 @@ class TestCategorizeDocument:
 
 class TestComputeSha256:
     def test_deterministic(self):
-        """Same content should produce same hash regardless of key order."""
-        assert _compute_sha256({"b": 2, "a": 1}) == _compute_sha256({"a": 1, "b": 2})
+        assert _compute_sha256(b'{"a": 1}') == _compute_sha256(b'{"a": 1}')
 
     def test_different_content(self):
-        assert _compute_sha256({"x": 1}) != _compute_sha256({"x": 2})
+        assert _compute_sha256(b'{"x": 1}') != _compute_sha256(b'{"x": 2}')
+
+    def test_hashes_raw_bytes(self):
+        content = (YOCTO_TEST_DATA / "busybox.spdx.json").read_bytes()
+        assert _compute_sha256(content) == hashlib.sha256(content).hexdigest()
 
 
 class TestDiscoverPackages:
@@ -159,3 +168,59 @@ class TestDiscoverPackages:
         packages = discover_packages(str(tmp_path))
         assert len(packages) == 1
         assert packages[0].name == "good-pkg"
+
+    def test_parallel_discovery_matches_serial(self, tmp_path, monkeypatch):
+        """Large builds are scanned in worker processes with the same result."""
+        dest = tmp_path / "spdx"
+        shutil.copytree(YOCTO_TEST_DATA, dest)
+        (dest / "bad.spdx.json").write_text("not json{{{")
+        serial = discover_packages(str(dest))
+
+        monkeypatch.setattr("sbomify_action._yocto.parser.PARALLEL_DISCOVERY_MIN_FILES", 1)
+        with patch("sbomify_action._yocto.parser.ProcessPoolExecutor", wraps=ProcessPoolExecutor) as pool:
+            parallel = discover_packages(str(dest))
+
+        pool.assert_called_once()
+        assert parallel == serial
+        busybox = next(p for p in parallel if p.name == "busybox")
+        assert busybox.sha256 == hashlib.sha256((dest / "busybox.spdx.json").read_bytes()).hexdigest()
+
+
+class TestDiscoverPackagesFromArchive:
+    def test_matches_extracted_discovery(self, tmp_path):
+        archive = tmp_path / "image.spdx.tar.gz"
+        with tarfile.open(archive, "w:gz") as tar:
+            for f in YOCTO_TEST_DATA.glob("*.spdx.json"):
+                tar.add(f, arcname=f"spdx/{f.name}")
+        dest = tmp_path / "spdx"
+        shutil.copytree(YOCTO_TEST_DATA, dest)
+
+        streamed = discover_packages_from_archive(str(archive))
+        extracted = discover_packages(str(dest))
+
+        assert [(p.name, p.version, p.sha256) for p in streamed] == [(p.name, p.version, p.sha256) for p in extracted]
+        busybox = next(p for p in streamed if p.name == "busybox")
+        assert busybox.spdx_file == "spdx/busybox.spdx.json"
+        assert load_package_document(busybox) == json.loads((YOCTO_TEST_DATA / "busybox.spdx.json").read_text())
+
+    def test_skips_invalid_json(self, tmp_path):
+        (tmp_path / "bad.spdx.json").write_text("not json{{{")
+        valid = {"spdxVersion": "SPDX-2.2", "name": "good-pkg", "packages": [{"versionInfo": "1.0"}]}
+        (tmp_path / "good-pkg.spdx.json").write_text(json.dumps(valid))
+        archive = tmp_path / "image.spdx.tar.gz"
+        with tarfile.open(archive, "w:gz") as tar:
+            for name in ("bad.spdx.json", "good-pkg.spdx.json"):
+                tar.add(tmp_path / name, arcname=name)
+
+        packages = discover_packages_from_archive(str(archive))
+        assert [p.name for p in packages] == ["good-pkg"]
+
+    def test_only_recipes(self, tmp_path):
+        recipe = tmp_path / "recipe-busybox.spdx.json"
+        shutil.copy(YOCTO_TEST_DATA / "recipe-busybox.spdx.json", recipe)
+        archive = tmp_path / "image.spdx.tar.gz"
+        with tarfile.open(archive, "w:gz") as tar:
+            tar.add(recipe, arcname=recipe.name)
+
+        with pytest.raises(FileProcessingError, match="No package SBOMs found"):
+            discover_packages_from_archive(str(archive))
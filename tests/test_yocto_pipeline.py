@@ -3,14 +3,19 @@
 import json
 import shutil
 import tarfile
+import threading
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+from sbomify_action._enrichment.registry import SourceRegistry
 from sbomify_action._upload.result import UploadResult
+from sbomify_action._yocto.cache import ComponentCache
 from sbomify_action._yocto.models import YoctoConfig, YoctoPipelineResult
+from sbomify_action._yocto.parser import discover_packages_from_archive
 from sbomify_action._yocto.pipeline import _process_single_package, run_yocto_pipeline
+from sbomify_action.compression import read_sbom_bytes
 from sbomify_action.exceptions import APIError, ConfigurationError, PlanLimitError
 
 YOCTO_TEST_DATA = Path(__file__).parent / "test-data" / "yocto"
@@ -46,21 +51,25 @@ class TestProcessSinglePackage:
         mock_upload.return_value = UploadResult.success_result(destination_name="sbomify", sbom_id="sbom-123")
         config = _make_config(str(tmp_path / "dummy.tar.gz"))
 
-        result = _process_single_package("busybox", spdx_file, "comp-1", config)
-        assert result == "sbom-123"
+        assert _process_single_package("busybox", spdx_file, "comp-1", config) == ("sbom-123", False)
 
     @patch("sbomify_action._yocto.pipeline.upload_sbom")
-    def test_duplicate_artifact_returns_none(self, mock_upload, tmp_path):
+    def test_duplicate_artifact_without_id_returns_none(self, mock_upload, tmp_path):
         spdx_file = str(YOCTO_TEST_DATA / "busybox.spdx.json")
-        mock_upload.return_value = UploadResult.failure_result(
-            destination_name="sbomify",
-            error_message="Duplicate",
-            error_code="DUPLICATE_ARTIFACT",
+        mock_upload.return_value = UploadResult.success_result(destination_name="sbomify", duplicate=True)
+        config = _make_config(str(tmp_path / "dummy.tar.gz"))
+
+        assert _process_single_package("busybox", spdx_file, "comp-1", config) == (None, True)
+
+    @patch("sbomify_action._yocto.pipeline.upload_sbom")
+    def test_duplicate_artifact_with_id_returns_existing_id(self, mock_upload, tmp_path):
+        spdx_file = str(YOCTO_TEST_DATA / "busybox.spdx.json")
+        mock_upload.return_value = UploadResult.success_result(
+            destination_name="sbomify", sbom_id="sbom-old", duplicate=True
         )
         config = _make_config(str(tmp_path / "dummy.tar.gz"))
 
-        result = _process_single_package("busybox", spdx_file, "comp-1", config)
-        assert result is None
+        assert _process_single_package("busybox", spdx_file, "comp-1", config) == ("sbom-old", True)
 
     @patch("sbomify_action._yocto.pipeline.upload_sbom")
     def test_upload_failure_raises(self, mock_upload, tmp_path):
@@ -97,8 +106,7 @@ class TestProcessSinglePackage:
         mock_upload.return_value = UploadResult.success_result(destination_name="sbomify", sbom_id="sbom-456")
         config = _make_config(str(tmp_path / "dummy.tar.gz"), augment=True)
 
-        result = _process_single_package("busybox", spdx_file, "comp-1", config)
-        assert result == "sbom-456"
+        assert _process_single_package("busybox", spdx_file, "comp-1", config) == ("sbom-456", False)
         mock_augment.assert_called_once()
 
     @patch("sbomify_action._yocto.pipeline.upload_sbom")
@@ -113,14 +121,13 @@ class TestProcessSinglePackage:
         mock_upload.return_value = UploadResult.success_result(destination_name="sbomify", sbom_id="sbom-789")
         config = _make_config(str(tmp_path / "dummy.tar.gz"), enrich=True)
 
-        result = _process_single_package("busybox", spdx_file, "comp-1", config)
-        assert result == "sbom-789"
+        assert _process_single_package("busybox", spdx_file, "comp-1", config) == ("sbom-789", False)
         mock_enrich.assert_called_once()
 
 
 class TestRunYoctoPipeline:
     @patch("sbomify_action._yocto.pipeline.inject_yocto_purls_spdx22")
-    @patch("sbomify_action._yocto.pipeline.tag_sbom_with_release")
+    @patch("sbomify_action._yocto.pipeline.tag_sboms_with_release")
     @patch("sbomify_action._yocto.pipeline.create_release")
     @patch("sbomify_action._yocto.pipeline.upload_sbom")
     @patch("sbomify_action._yocto.pipeline.list_components")
@@ -142,7 +149,7 @@ class TestRunYoctoPipeline:
         # inject_yocto_purls_spdx22 should be called once per discovered package
         assert mock_inject.call_count == result.packages_found
 
-    @patch("sbomify_action._yocto.pipeline.tag_sbom_with_release")
+    @patch("sbomify_action._yocto.pipeline.tag_sboms_with_release")
     @patch("sbomify_action._yocto.pipeline.create_release")
     @patch("sbomify_action._yocto.pipeline.upload_sbom")
     @patch("sbomify_action._yocto.pipeline.list_components")
@@ -163,7 +170,8 @@ class TestRunYoctoPipeline:
         assert result.components_created == 3
         assert result.errors == 0
         assert result.release_id == "release-001"
-        assert mock_tag.call_count == 3
+        mock_tag.assert_called_once()
+        assert len(mock_tag.call_args.args[2]) == 3
 
     @patch("sbomify_action._yocto.pipeline.upload_sbom")
     @patch("sbomify_action._yocto.pipeline.list_components")
@@ -201,7 +209,7 @@ class TestRunYoctoPipeline:
             mock_goc.return_value = ("comp-1", True)
             with patch("sbomify_action._yocto.pipeline.create_release") as mock_rel:
                 mock_rel.return_value = "rel-1"
-                with patch("sbomify_action._yocto.pipeline.tag_sbom_with_release"):
+                with patch("sbomify_action._yocto.pipeline.tag_sboms_with_release"):
                     result = run_yocto_pipeline(config)
 
         assert result.packages_found == 3
@@ -216,11 +224,7 @@ class TestRunYoctoPipeline:
         config = _make_config(archive)
 
         mock_list.return_value = {"busybox": "c1", "base-files": "c2", "zlib": "c3"}
-        mock_upload.return_value = UploadResult.failure_result(
-            destination_name="sbomify",
-            error_message="Duplicate",
-            error_code="DUPLICATE_ARTIFACT",
-        )
+        mock_upload.return_value = UploadResult.success_result(destination_name="sbomify", duplicate=True)
 
         with patch("sbomify_action._yocto.pipeline.get_or_create_component") as mock_goc:
             mock_goc.side_effect = lambda url, tok, name, cache: (cache.get(name, "x"), False)
@@ -230,11 +234,42 @@ class TestRunYoctoPipeline:
         assert result.sboms_uploaded == 0
         assert result.errors == 0
 
+    @patch("sbomify_action._yocto.pipeline.tag_sboms_with_release")
+    @patch("sbomify_action._yocto.pipeline.create_release")
+    @patch("sbomify_action._yocto.pipeline.upload_sbom")
+    @patch("sbomify_action._yocto.pipeline.list_components")
+    def test_existing_sboms_are_tagged_but_not_recorded(
+        self, mock_list, mock_upload, mock_create_release, mock_tag, tmp_path
+    ):
+        """Existing SBOMs are tagged, but their content may differ, so they're processed again next run."""
+        archive = _make_tar_gz(tmp_path)
+        mock_list.return_value = {"busybox": "c1", "base-files": "c2", "zlib": "c3"}
+        mock_create_release.return_value = "release-001"
+
+        def upload(sbom_file, component_id, **kwargs):
+            return UploadResult.success_result(
+                destination_name="sbomify", sbom_id=f"existing-{component_id}", duplicate=True
+            )
+
+        mock_upload.side_effect = upload
+        first = run_yocto_pipeline(_make_config(archive, incremental=True))
+
+        assert first.sboms_skipped == 0
+        assert mock_tag.call_args.args[2] == ["existing-c2", "existing-c1", "existing-c3"]
+
+        mock_upload.reset_mock()
+        with patch("sbomify_action._yocto.pipeline.sample_components", return_value=(3, {"base-files": "c2"})):
+            second = run_yocto_pipeline(_make_config(archive, release_version="1.0.1", incremental=True))
+
+        assert second.sboms_unchanged == 0
+        assert mock_upload.call_count == 3
+
     @patch("sbomify_action._yocto.pipeline.upload_sbom")
     @patch("sbomify_action._yocto.pipeline.list_components")
     def test_plan_limit_stops_early(self, mock_list, mock_upload, tmp_path):
         archive = _make_tar_gz(tmp_path)
-        config = _make_config(archive)
+        # One worker processes packages in order, so exactly one runs after the first
+        config = _make_config(archive, workers=1)
 
         mock_list.return_value = {}
         # First package succeeds, then plan limit hit on second
@@ -252,7 +287,7 @@ class TestRunYoctoPipeline:
             mock_goc.side_effect = goc_side_effect
             with patch("sbomify_action._yocto.pipeline.create_release") as mock_rel:
                 mock_rel.return_value = "rel-1"
-                with patch("sbomify_action._yocto.pipeline.tag_sbom_with_release"):
+                with patch("sbomify_action._yocto.pipeline.tag_sboms_with_release"):
                     result = run_yocto_pipeline(config)
 
         assert result.errors == 1
@@ -260,6 +295,316 @@ class TestRunYoctoPipeline:
         # Should have stopped after 2nd package, not processed all 3
         assert mock_goc.call_count == 2
 
+    @patch("sbomify_action._yocto.pipeline.tag_sboms_with_release")
+    @patch("sbomify_action._yocto.pipeline.create_release")
+    @patch("sbomify_action._yocto.pipeline.upload_sbom")
+    @patch("sbomify_action._yocto.pipeline.list_components")
+    def test_packages_processed_concurrently_in_stable_order(
+        self, mock_list, mock_upload, mock_create_release, mock_tag, tmp_path
+    ):
+        archive = _make_tar_gz(tmp_path)
+        config = _make_config(archive, workers=3)
+
+        mock_list.return_value = {"busybox": "c1", "base-files": "c2", "zlib": "c3"}
+        mock_create_release.return_value = "release-001"
+        # Every upload waits for the other two, which only completes when all three run at once
+        barrier = threading.Barrier(3, timeout=5)
+
+        def upload(sbom_file, component_id, **kwargs):
+            barrier.wait()
+            return UploadResult.success_result(destination_name="sbomify", sbom_id=f"sbom-{component_id}")
+
+        mock_upload.side_effect = upload
+        result = run_yocto_pipeline(config)
+
+        assert result.sboms_uploaded == 3
+        assert result.errors == 0
+        # SBOMs are tagged in package order (base-files, busybox, zlib), whichever finished first
+        assert mock_tag.call_args.args[2] == ["sbom-c2", "sbom-c1", "sbom-c3"]
+
+    @patch("sbomify_action._yocto.pipeline.tag_sboms_with_release")
+    @patch("sbomify_action._yocto.pipeline.create_release")
+    @patch("sbomify_action._yocto.pipeline.upload_sbom")
+    @patch("sbomify_action._yocto.pipeline.enrich_sbom")
+    @patch("sbomify_action._yocto.pipeline.list_components")
+    def test_enrichment_prefetched_once_with_shared_enricher(
+        self, mock_list, mock_enrich, mock_upload, mock_create_release, mock_tag, tmp_path
+    ):
+        archive = _make_tar_gz(tmp_path)
+        config = _make_config(archive, enrich=True)
+
+        mock_list.return_value = {"busybox": "c1", "base-files": "c2", "zlib": "c3"}
+        mock_upload.return_value = UploadResult.success_result(destination_name="sbomify", sbom_id="sbom-001")
+        mock_create_release.return_value = "release-001"
+        enrichers = []
+
+        def fake_enrich(input_file, output_file, **kwargs):
+            enrichers.append(kwargs["enricher"])
+            shutil.copy(input_file, output_file)
+
+        mock_enrich.side_effect = fake_enrich
+        fetched = []
+
+        def fake_fetch(purl, session, merge_results=True):
+            fetched.append(str(purl))
+            return None
+
+        with patch.object(SourceRegistry, "fetch_metadata", side_effect=fake_fetch):
+            result = run_yocto_pipeline(config)
+
+        assert result.sboms_uploaded == 3
+        # One enricher serves every package, and each distinct PURL was looked up once
+        assert len(enrichers) == 3
+        assert all(enricher is enrichers[0] for enricher in enrichers)
+        assert fetched
+        assert len(fetched) == len(set(fetched))
+        assert all(enrichers[0].fetch_metadata(purl) is None for purl in fetched)
+
+    @patch("sbomify_action._yocto.pipeline.extract_archive")
+    @patch("sbomify_action._yocto.pipeline.tag_sboms_with_release")
+    @patch("sbomify_action._yocto.pipeline.create_release")
+    @patch("sbomify_action._yocto.pipeline.upload_sbom")
+    @patch("sbomify_action._yocto.pipeline.enrich_sbom_document")
+    @patch("sbomify_action._yocto.pipeline.list_components")
+    def test_stream_mode_processes_documents_in_memory(
+        self, mock_list, mock_enrich, mock_upload, mock_create_release, mock_tag, mock_extract, tmp_path
+    ):
+        archive = _make_tar_gz(tmp_path)
+        config = _make_config(archive, stream=True, enrich=True)
+
+        mock_list.return_value = {"busybox": "c1", "base-files": "c2", "zlib": "c3"}
+        mock_create_release.return_value = "release-001"
+        uploaded = {}
+
+        def upload(sbom_file, component_id, **kwargs):
+            # The upload reads a compressed temporary file holding the processed document
+            uploaded[component_id] = (sbom_file, json.loads(read_sbom_bytes(sbom_file)))
+            return UploadResult.success_result(destination_name="sbomify", sbom_id=f"sbom-{component_id}")
+
+        mock_upload.side_effect = upload
+        discovered = []
+
+        def discover(archive_path):
+            discovered.extend(discover_packages_from_archive(archive_path))
+            return discovered
+
+        with (
+            patch.object(SourceRegistry, "fetch_metadata", return_value=None),
+            patch("sbomify_action._yocto.pipeline.discover_packages_from_archive", side_effect=discover),
+        ):
+            result = run_yocto_pipeline(config)
+
+        assert result.sboms_uploaded == 3
+        assert result.errors == 0
+        mock_extract.assert_not_called()
+        # Documents are released as their packages are processed
+        assert len(discovered) == 3
+        assert all(pkg.content is None for pkg in discovered)
+        assert mock_enrich.call_count == 3
+        sbom_file, busybox = uploaded["c1"]
+        assert sbom_file.endswith(".gz")
+        assert not Path(sbom_file).exists()
+        assert busybox["name"] == "busybox"
+        # Yocto PURLs were injected in memory
+        refs = [ref["referenceLocator"] for pkg in busybox["packages"] for ref in pkg.get("externalRefs", [])]
+        assert any(ref.startswith("pkg:yocto/") for ref in refs)
+
+    @patch("sbomify_action._yocto.pipeline.tag_sboms_with_release")
+    @patch("sbomify_action._yocto.pipeline.create_release")
+    @patch("sbomify_action._yocto.pipeline.upload_sbom")
+    @patch("sbomify_action._yocto.pipeline.list_components")
+    def test_incremental_run_reuses_unchanged_packages(
+        self, mock_list, mock_upload, mock_create_release, mock_tag, tmp_path
+    ):
+        mock_list.return_value = {"busybox": "c1", "base-files": "c2", "zlib": "c3"}
+        mock_create_release.return_value = "release-001"
+
+        def upload(sbom_file, component_id, **kwargs):
+            return UploadResult.success_result(destination_name="sbomify", sbom_id=f"sbom-{component_id}")
+
+        mock_upload.side_effect = upload
+        first = run_yocto_pipeline(_make_config(_make_tar_gz(tmp_path), incremental=True))
+        assert first.sboms_uploaded == 3
+
+        # Next build: zlib changed, the other packages are identical
+        rebuild = tmp_path / "rebuild"
+        rebuild.mkdir()
+        archive = str(rebuild / "test.spdx.tar.gz")
+        with tarfile.open(archive, "w:gz") as tar:
+            for f in YOCTO_TEST_DATA.glob("*.spdx.json"):
+                if f.name == "zlib.spdx.json":
+                    data = json.loads(f.read_text())
+                    data["comment"] = "rebuilt"
+                    changed = rebuild / f.name
+                    changed.write_text(json.dumps(data))
+                    tar.add(str(changed), arcname=f.name)
+                else:
+                    tar.add(str(f), arcname=f.name)
+        mock_upload.reset_mock()
+        mock_tag.reset_mock()
+
+        with patch(
+            "sbomify_action._yocto.pipeline.sample_components", return_value=(3, {"base-files": "c2"})
+        ) as mock_sample:
+            second = run_yocto_pipeline(_make_config(archive, release_version="1.0.1", incremental=True))
+
+        # The component list cached by the first run is revalidated, not fetched again
+        mock_sample.assert_called_once()
+        mock_list.assert_called_once()
+        assert second.sboms_uploaded == 1
+        assert second.sboms_unchanged == 2
+        assert [c.kwargs["component_id"] for c in mock_upload.call_args_list] == ["c3"]
+        # Unchanged packages are still tagged into the new release, in package order
+        assert mock_tag.call_args.args[2] == ["sbom-c2", "sbom-c1", "sbom-c3"]
+
+    @patch("sbomify_action._yocto.pipeline.sample_components")
+    @patch("sbomify_action._yocto.pipeline.upload_sbom")
+    @patch("sbomify_action._yocto.pipeline.list_components")
+    def test_component_cache_refreshed_when_count_changes(self, mock_list, mock_upload, mock_sample, tmp_path):
+        archive = _make_tar_gz(tmp_path)
+        mock_list.return_value = {"busybox": "c1", "base-files": "c2"}
+        mock_upload.return_value = UploadResult.success_result(destination_name="sbomify", duplicate=True)
+        mock_sample.return_value = (4, {})  # someone added a component since the last run
+
+        with patch("sbomify_action._yocto.pipeline.get_or_create_component") as mock_goc:
+            mock_goc.side_effect = lambda api, token, name, cache: (cache.setdefault(name, f"new-{name}"), False)
+            run_yocto_pipeline(_make_config(archive, incremental=True))
+            # The two cached components no longer match the workspace's four
+            mock_list.return_value = {"busybox": "c1", "base-files": "c2", "zlib": "c3", "other": "c4"}
+            run_yocto_pipeline(_make_config(archive, incremental=True))
+
+        assert mock_list.call_count == 2
+        mock_sample.assert_called_once()
+        assert mock_goc.call_args.args[3] == mock_list.return_value
+
+    @patch("sbomify_action._yocto.pipeline.sample_components")
+    @patch("sbomify_action._yocto.pipeline.upload_sbom")
+    @patch("sbomify_action._yocto.pipeline.list_components")
+    def test_component_cache_refreshed_when_ids_change(self, mock_list, mock_upload, mock_sample, tmp_path):
+        archive = _make_tar_gz(tmp_path)
+        mock_list.return_value = {"busybox": "c1", "base-files": "c2", "zlib": "c3"}
+        mock_upload.return_value = UploadResult.success_result(destination_name="sbomify", duplicate=True)
+        run_yocto_pipeline(_make_config(archive, incremental=True))
+
+        # zlib was deleted and created again: same count, another ID
+        mock_list.return_value = {"busybox": "c1", "base-files": "c2", "zlib": "c9"}
+        mock_sample.return_value = (3, {"zlib": "c9"})
+        mock_upload.reset_mock()
+        run_yocto_pipeline(_make_config(archive, release_version="1.0.1", incremental=True))
+
+        assert mock_list.call_count == 2
+        assert "c9" in [c.kwargs["component_id"] for c in mock_upload.call_args_list]
+
+    @patch("sbomify_action._yocto.pipeline.tag_sboms_with_release")
+    @patch("sbomify_action._yocto.pipeline.create_release")
+    @patch("sbomify_action._yocto.pipeline.upload_sbom")
+    @patch("sbomify_action._yocto.pipeline.list_components")
+    def test_deleted_component_is_listed_again_and_retried(
+        self, mock_list, mock_upload, mock_create_release, mock_tag, tmp_path
+    ):
+        """A cached component that no longer exists is replaced from a fresh listing, also in the cache."""
+        archive = _make_tar_gz(tmp_path)
+        cache = ComponentCache(API_BASE, TOKEN)
+        cache.store({"busybox": "gone", "base-files": "c2", "zlib": "c3"})
+        mock_list.return_value = {"busybox": "c1", "base-files": "c2", "zlib": "c3"}
+        mock_create_release.return_value = "release-001"
+
+        def upload(sbom_file, component_id, **kwargs):
+            if component_id == "gone":
+                return UploadResult.failure_result(
+                    destination_name="sbomify",
+                    error_message="The specified component does not exist.",
+                    error_code="COMPONENT_NOT_FOUND",
+                )
+            return UploadResult.success_result(destination_name="sbomify", sbom_id=f"sbom-{component_id}")
+
+        mock_upload.side_effect = upload
+        with patch(
+            "sbomify_action._yocto.pipeline.sample_components", return_value=(3, {"base-files": "c2"})
+        ) as mock_sample:
+            result = run_yocto_pipeline(_make_config(archive, incremental=True))
+
+        mock_sample.assert_called_once()
+        mock_list.assert_called_once()
+        assert result.errors == 0
+        assert result.sboms_uploaded == 3
+        assert mock_tag.call_args.args[2] == ["sbom-c2", "sbom-c1", "sbom-c3"]
+        assert ComponentCache(API_BASE, TOKEN).components == mock_list.return_value
+
+    @patch("sbomify_action._yocto.pipeline.tag_sboms_with_release")
+    @patch("sbomify_action._yocto.pipeline.create_release")
+    @patch("sbomify_action._yocto.pipeline.upload_sbom")
+    @patch("sbomify_action._yocto.pipeline.list_components")
+    def test_no_incremental_uploads_everything(self, mock_list, mock_upload, mock_create_release, mock_tag, tmp_path):
+        archive = _make_tar_gz(tmp_path)
+        mock_list.return_value = {"busybox": "c1", "base-files": "c2", "zlib": "c3"}
+        mock_upload.return_value = UploadResult.success_result(destination_name="sbomify", sbom_id="sbom-001")
+        mock_create_release.return_value = "release-001"
+
+        run_yocto_pipeline(_make_config(archive, incremental=True))
+        result = run_yocto_pipeline(_make_config(archive, incremental=False))
+
+        assert result.sboms_uploaded == 3
+        assert result.sboms_unchanged == 0
+        assert mock_upload.call_count == 6
+
+    @patch("sbomify_action._yocto.pipeline.tag_sboms_with_release")
+    @patch("sbomify_action._yocto.pipeline.create_release")
+    @patch("sbomify_action._yocto.pipeline.upload_sbom")
+    @patch("sbomify_action._yocto.pipeline.list_components")
+    def test_incremental_state_is_scoped_to_the_token(
+        self, mock_list, mock_upload, mock_create_release, mock_tag, tmp_path
+    ):
+        archive = _make_tar_gz(tmp_path)
+        mock_list.return_value = {"busybox": "c1", "base-files": "c2", "zlib": "c3"}
+        mock_upload.return_value = UploadResult.success_result(destination_name="sbomify", sbom_id="sbom-001")
+        mock_create_release.return_value = "release-001"
+
+        run_yocto_pipeline(_make_config(archive, incremental=True))
+        result = run_yocto_pipeline(_make_config(archive, incremental=True, token="other-workspace-token"))
+
+        assert result.sboms_unchanged == 0
+        assert mock_upload.call_count == 6
+
+    @patch("sbomify_action._yocto.pipeline.augment_sbom_from_file")
+    @patch("sbomify_action._yocto.pipeline.tag_sboms_with_release")
+    @patch("sbomify_action._yocto.pipeline.create_release")
+    @patch("sbomify_action._yocto.pipeline.upload_sbom")
+    @patch("sbomify_action._yocto.pipeline.list_components")
+    def test_changed_settings_reprocess_unchanged_packages(
+        self, mock_list, mock_upload, mock_create_release, mock_tag, mock_augment, tmp_path
+    ):
+        archive = _make_tar_gz(tmp_path)
+        mock_list.return_value = {"busybox": "c1", "base-files": "c2", "zlib": "c3"}
+        mock_upload.return_value = UploadResult.success_result(destination_name="sbomify", sbom_id="sbom-001")
+        mock_create_release.return_value = "release-001"
+        mock_augment.side_effect = lambda input_file, output_file, **kwargs: shutil.copy(input_file, output_file)
+
+        with patch("sbomify_action._yocto.pipeline.sample_components", return_value=(3, {"base-files": "c2"})):
+            run_yocto_pipeline(_make_config(archive, incremental=True))
+            result = run_yocto_pipeline(_make_config(archive, augment=True, incremental=True))
+
+        assert result.sboms_uploaded == 3
+        assert result.sboms_unchanged == 0
+        assert mock_augment.call_count == 3
+
+    @patch("sbomify_action._yocto.pipeline.upload_sbom")
+    @patch("sbomify_action._yocto.pipeline.list_components")
+    def test_plan_limit_cancels_queued_packages(self, mock_list, mock_upload, tmp_path):
+        archive = _make_tar_gz(tmp_path)
+        config = _make_config(archive, workers=2)
+
+        mock_list.return_value = {}
+
+        with patch("sbomify_action._yocto.pipeline.get_or_create_component") as mock_goc:
+            mock_goc.side_effect = PlanLimitError("Maximum 200 components reached")
+            result = run_yocto_pipeline(config)
+
+        # At most the two packages already running hit the limit; the third never starts
+        assert 1 <= mock_goc.call_count <= 2
+        assert result.errors == mock_goc.call_count
+        mock_upload.assert_not_called()
+
     @patch("sbomify_action._yocto.pipeline.patch_component_visibility")
     @patch("sbomify_action._yocto.pipeline.upload_sbom")
     @patch("sbomify_action._yocto.pipeline.list_components")
@@ -281,7 +626,7 @@ class TestRunYoctoPipeline:
             mock_goc.side_effect = goc_side_effect
             with patch("sbomify_action._yocto.pipeline.create_release") as mock_rel:
                 mock_rel.return_value = "rel-1"
-                with patch("sbomify_action._yocto.pipeline.tag_sbom_with_release"):
+                with patch("sbomify_action._yocto.pipeline.tag_sboms_with_release"):
                     run_yocto_pipeline(config)
 
         # Visibility should only be patched for newly created components (2), not cached ones (1)
@@ -303,7 +648,7 @@ class TestRunYoctoPipeline:
             mock_goc.return_value = ("comp-1", True)
             with patch("sbomify_action._yocto.pipeline.create_release") as mock_rel:
                 mock_rel.return_value = "rel-1"
-                with patch("sbomify_action._yocto.pipeline.tag_sbom_with_release"):
+                with patch("sbomify_action._yocto.pipeline.tag_sboms_with_release"):
                     run_yocto_pipeline(config)
 
         mock_patch_vis.assert_not_called()
@@ -313,7 +658,7 @@ class TestRunYoctoPipeline:
     @patch("sbomify_action._yocto.pipeline.list_components")
     def test_plan_limit_does_not_call_visibility_after_stop(self, mock_list, mock_upload, mock_patch_vis, tmp_path):
         archive = _make_tar_gz(tmp_path)
-        config = _make_config(archive, visibility="public")
+        config = _make_config(archive, visibility="public", workers=1)
 
         mock_list.return_value = {}
         mock_upload.return_value = UploadResult.success_result(destination_name="sbomify", sbom_id="sbom-001")
@@ -329,7 +674,7 @@ class TestRunYoctoPipeline:
             mock_goc.side_effect = goc_side_effect
             with patch("sbomify_action._yocto.pipeline.create_release") as mock_rel:
                 mock_rel.return_value = "rel-1"
-                with patch("sbomify_action._yocto.pipeline.tag_sbom_with_release"):
+                with patch("sbomify_action._yocto.pipeline.tag_sboms_with_release"):
                     result = run_yocto_pipeline(config)
 
         # Visibility patched only for the first successful component
@@ -7,9 +7,11 @@ from packageurl import PackageURL
 
 from sbomify_action._yocto.purl import (
     _has_yocto_purl_spdx22,
+    collect_purls_spdx22,
     generate_yocto_purl,
     inject_yocto_purls_spdx3,
     inject_yocto_purls_spdx22,
+    inject_yocto_purls_spdx22_data,
 )
 
 # ---------------------------------------------------------------------------
@@ -270,6 +272,20 @@ class TestInjectYoctoPurlsSpdx22:
         assert ref["referenceLocator"] == "pkg:yocto/busybox@1.36.1"
 
 
+# ===================================================================
+# TestInjectYoctoPurlsSpdx22Data
+# ===================================================================
+
+
+class TestInjectYoctoPurlsSpdx22Data:
+    def test_injects_in_memory(self):
+        data = deepcopy(SPDX22_BASE)
+
+        assert inject_yocto_purls_spdx22_data(data) == 1
+        assert inject_yocto_purls_spdx22_data(data) == 0
+        assert data["packages"][0]["externalRefs"][0]["referenceLocator"] == "pkg:yocto/busybox@1.36.1"
+
+
 # ===================================================================
 # TestInjectYoctoPurlsSpdx3
 # ===================================================================
@@ -393,3 +409,39 @@ class TestInjectYoctoPurlsSpdx3:
         assert count == 1
         result = json.loads(tmp_path.joinpath("test.spdx.json").read_text())
         assert result["@graph"][1]["packageUrl"] == "pkg:yocto/busybox"
+
+
+# ===================================================================
+# TestCollectPurlsSpdx22
+# ===================================================================
+
+
+class TestCollectPurlsSpdx22:
+    def test_deduplicates_across_documents_in_order(self, tmp_path):
+        def doc(*purls):
+            data = deepcopy(SPDX22_BASE)
+            data["packages"][0]["externalRefs"] = [
+                {"referenceCategory": "PACKAGE-MANAGER", "referenceType": "purl", "referenceLocator": purl}
+                for purl in purls
+            ]
+            return data
+
+        first = _write_json(tmp_path, doc("pkg:yocto/busybox@1.36.1", "pkg:yocto/glibc@2.39"), "a.spdx.json")
+        second = _write_json(tmp_path, doc("pkg:yocto/glibc@2.39", "pkg:yocto/zlib@1.3"), "b.spdx.json")
+
+        assert collect_purls_spdx22([first, second]) == [
+            "pkg:yocto/busybox@1.36.1",
+            "pkg:yocto/glibc@2.39",
+            "pkg:yocto/zlib@1.3",
+        ]
+
+    def test_ignores_other_refs_and_unreadable_files(self, tmp_path):
+        data = deepcopy(SPDX22_BASE)
+        data["packages"][0]["externalRefs"] = [
+            {"referenceCategory": "SECURITY", "referenceType": "cpe23Type", "referenceLocator": "cpe:2.3:a:x:y:1"}
+        ]
+        path = _write_json(tmp_path, data)
+        broken = tmp_path / "broken.spdx.json"
+        broken.write_text("{not json")
+
+        assert collect_purls_spdx22([path, str(broken), str(tmp_path / "missing.spdx.json")]) == []